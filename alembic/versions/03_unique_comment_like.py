@@ -0,0 +1,44 @@
+"""unique_comment_like
+
+Revision ID: 03
+Revises: 02
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '03'
+down_revision: Union[str, None] = '02'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Удаляем повторные лайки, которые могли появиться при параллельных запросах,
+    # и пересчитываем рейтинг комментариев.
+    op.execute(
+        """
+        DELETE FROM associationusercomment a
+        USING associationusercomment b
+        WHERE a.left_id = b.left_id AND a.right_id = b.right_id AND a.id > b.id
+        """
+    )
+    op.execute(
+        """
+        UPDATE commentfeed c
+        SET rating = (
+            SELECT count(*) FROM associationusercomment a WHERE a.right_id = c.id
+        )
+        """
+    )
+    op.create_unique_constraint(
+        'uq_user_comment_like', 'associationusercomment', ['left_id', 'right_id']
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_user_comment_like', 'associationusercomment', type_='unique')
@@ -0,0 +1,118 @@
+"""fk_indexes
+
+Revision ID: 04
+Revises: 03
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '04'
+down_revision: Union[str, None] = '03'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Составные индексы под фильтры get_multi: выборка по внешнему ключу с сортировкой по id.
+INDEXES: tuple[tuple[str, str, list[str]], ...] = (
+    ('ix_usertabit_company_id', 'usertabit', ['company_id', 'id']),
+    ('ix_problem_company_id', 'problem', ['company_id', 'id']),
+    ('ix_messagefeed_problem_id', 'messagefeed', ['problem_id', 'id']),
+    ('ix_commentfeed_message_id', 'commentfeed', ['message_id', 'id']),
+    ('ix_meeting_problem_id', 'meeting', ['problem_id', 'id']),
+    ('ix_task_problem_id', 'task', ['problem_id', 'id']),
+    ('ix_taguser_company_id', 'taguser', ['company_id']),
+    ('ix_associationuserproblem_right_id', 'associationuserproblem', ['right_id', 'left_id']),
+    ('ix_associationusermeeting_right_id', 'associationusermeeting', ['right_id', 'left_id']),
+    ('ix_associationusertask_right_id', 'associationusertask', ['right_id', 'left_id']),
+    ('ix_associationusercomment_right_id', 'associationusercomment', ['right_id', 'left_id']),
+    ('ix_associationusertags_right_id', 'associationusertags', ['right_id', 'left_id']),
+    ('ix_fileproblem_problem_id', 'fileproblem', ['problem_id']),
+    ('ix_filemeeting_meeting_id', 'filemeeting', ['meeting_id']),
+    ('ix_filetask_task_id', 'filetask', ['task_id']),
+    ('ix_filemessage_message_id', 'filemessage', ['message_id']),
+)
+
+# Таблицы с первичным ключом только по id, на которых миграции 01 и 02 создали
+# дублирующие его ограничения уникальности.
+PK_DUPLICATE_TABLES: tuple[str, ...] = (
+    'associationusertask',
+    'commentfeed',
+    'company',
+    'department',
+    'filemeeting',
+    'filemessage',
+    'fileproblem',
+    'filetask',
+    'landingpage',
+    'licensetype',
+    'meeting',
+    'messagefeed',
+    'problem',
+    'taguser',
+    'task',
+    'votingbyuser',
+    'votingfeed',
+)
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+    # Имена ограничений из миграции 02 сгенерированы БД, поэтому ищем их по столбцам.
+    # Ограничение, на индекс которого опирается внешний ключ, не удаляем.
+    op.execute(
+        f"""
+        DO $$
+        DECLARE
+            duplicate record;
+        BEGIN
+            FOR duplicate IN
+                SELECT u.conrelid::regclass AS table_name, u.conname
+                FROM pg_constraint u
+                JOIN pg_constraint pk ON pk.conrelid = u.conrelid AND pk.contype = 'p'
+                WHERE u.contype = 'u'
+                    AND u.conkey = pk.conkey
+                    AND u.conrelid::regclass::text IN (
+                        {', '.join(f"'{table}'" for table in PK_DUPLICATE_TABLES)}
+                    )
+                    AND NOT EXISTS (
+                        SELECT 1 FROM pg_constraint fk
+                        WHERE fk.contype = 'f' AND fk.conindid = u.conindid
+                    )
+            LOOP
+                EXECUTE format(
+                    'ALTER TABLE %s DROP CONSTRAINT %I', duplicate.table_name, duplicate.conname
+                );
+            END LOOP;
+        END
+        $$;
+        """
+    )
+
+
+def downgrade() -> None:
+    # Восстанавливаем по одному ограничению уникальности id на таблицу, как в миграции 01.
+    for table in PK_DUPLICATE_TABLES:
+        op.execute(
+            f"""
+            DO $$
+            BEGIN
+                IF NOT EXISTS (
+                    SELECT 1 FROM pg_constraint u
+                    JOIN pg_constraint pk ON pk.conrelid = u.conrelid AND pk.contype = 'p'
+                    WHERE u.conrelid = '{table}'::regclass
+                        AND u.contype = 'u'
+                        AND u.conkey = pk.conkey
+                ) THEN
+                    ALTER TABLE {table} ADD CONSTRAINT {table}_id_key UNIQUE (id);
+                END IF;
+            END
+            $$;
+            """
+        )
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
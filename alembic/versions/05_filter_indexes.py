@@ -0,0 +1,57 @@
+"""filter_indexes
+
+Revision ID: 05
+Revises: 04
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '05'
+down_revision: Union[str, None] = '04'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Индексы под фильтры CRUDBase.filter_fields: btree для сравнений, IN и BETWEEN.
+BTREE_INDEXES: tuple[tuple[str, str, list[str]], ...] = (
+    ('ix_task_problem_id_date_completion', 'task', ['problem_id', 'date_completion']),
+    ('ix_problem_company_id_status', 'problem', ['company_id', 'status']),
+    (
+        'ix_usertabit_company_id_current_department_id',
+        'usertabit',
+        ['company_id', 'current_department_id'],
+    ),
+)
+
+# Триграммные индексы под фильтры __ilike. Создаются только миграцией: моделям они
+# не объявлены, так как требуют расширения pg_trgm.
+TRIGRAM_INDEXES: tuple[tuple[str, str, str], ...] = (
+    ('ix_problem_name_trgm', 'problem', 'name'),
+    ('ix_task_name_trgm', 'task', 'name'),
+    ('ix_usertabit_surname_trgm', 'usertabit', 'surname'),
+)
+
+
+def upgrade() -> None:
+    for name, table, columns in BTREE_INDEXES:
+        op.create_index(name, table, columns)
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, table, column in TRIGRAM_INDEXES:
+        op.create_index(
+            name,
+            table,
+            [column],
+            postgresql_using='gin',
+            postgresql_ops={column: 'gin_trgm_ops'},
+        )
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(TRIGRAM_INDEXES):
+        op.drop_index(name, table_name=table)
+    for name, table, _ in reversed(BTREE_INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,52 @@
+"""token_sessions
+
+Revision ID: 07
+Revises: 06
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '07'
+down_revision: Union[str, None] = '06'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'tokensession',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('jti_hash', sa.String(length=64), nullable=False),
+        sa.Column('user_id', sa.Uuid(), nullable=False),
+        sa.Column('expires_at', postgresql.TIMESTAMP(timezone=True), nullable=False),
+        sa.Column('revoked_at', postgresql.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column(
+            'created_at',
+            postgresql.TIMESTAMP(timezone=True),
+            server_default=sa.text('now()'),
+            nullable=False,
+        ),
+        sa.Column(
+            'updated_at',
+            postgresql.TIMESTAMP(timezone=True),
+            server_default=sa.text('now()'),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('jti_hash'),
+    )
+    op.create_index('ix_tokensession_user_id', 'tokensession', ['user_id'])
+    op.create_index('ix_tokensession_expires_at', 'tokensession', ['expires_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tokensession_expires_at', table_name='tokensession')
+    op.drop_index('ix_tokensession_user_id', table_name='tokensession')
+    op.drop_table('tokensession')
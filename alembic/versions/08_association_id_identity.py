@@ -0,0 +1,33 @@
+"""association_id_identity
+
+Revision ID: 08
+Revises: 07
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '08'
+down_revision: Union[str, None] = '07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('associationuserproblem', 'associationusermeeting')
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN id ADD GENERATED BY DEFAULT AS IDENTITY')
+        op.execute(
+            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+            f'coalesce(max(id), 0) + 1, false) FROM {table}'
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN id DROP IDENTITY')
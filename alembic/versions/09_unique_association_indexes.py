@@ -0,0 +1,43 @@
+"""unique_association_indexes
+
+Revision ID: 09
+Revises: 08
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '09'
+down_revision: Union[str, None] = '08'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Индексы (right_id, left_id) ассоциаций становятся уникальными: на них опирается
+# INSERT ... ON CONFLICT DO NOTHING при синхронизации связей (sync_associations).
+INDEXES: tuple[tuple[str, str], ...] = (
+    ('ix_associationuserproblem_right_id', 'associationuserproblem'),
+    ('ix_associationusermeeting_right_id', 'associationusermeeting'),
+    ('ix_associationusertask_right_id', 'associationusertask'),
+    ('ix_associationusertags_right_id', 'associationusertags'),
+)
+
+
+def upgrade() -> None:
+    for name, table in INDEXES:
+        op.execute(
+            f'DELETE FROM {table} AS duplicate USING {table} AS kept '
+            'WHERE duplicate.right_id = kept.right_id AND duplicate.left_id = kept.left_id '
+            'AND duplicate.id > kept.id'
+        )
+        op.drop_index(name, table_name=table)
+        op.create_index(name, table, ['right_id', 'left_id'], unique=True)
+
+
+def downgrade() -> None:
+    for name, table in INDEXES:
+        op.drop_index(name, table_name=table)
+        op.create_index(name, table, ['right_id', 'left_id'])
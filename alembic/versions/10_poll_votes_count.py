@@ -0,0 +1,75 @@
+"""poll_votes_count
+
+Revision ID: 10
+Revises: 09
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '10'
+down_revision: Union[str, None] = '09'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Число голосов хранится в варианте и изменяется вместе с голосом.
+    op.add_column(
+        'votingfeed',
+        sa.Column('votes_count', sa.Integer(), server_default='0', nullable=False),
+    )
+    # Названия вариантов уникальны в пределах голосования, а не во всей таблице.
+    op.alter_column(
+        'votingfeed',
+        'name',
+        type_=sa.String(length=255),
+        existing_type=sa.String(length=30),
+        existing_nullable=False,
+    )
+    op.drop_constraint('votingfeed_name_key', 'votingfeed', type_='unique')
+    op.create_unique_constraint('uq_poll_option_name', 'votingfeed', ['message_id', 'name'])
+
+    # Голос хранит id треда, чтобы один пользователь голосовал в треде один раз.
+    op.add_column('votingbyuser', sa.Column('message_id', sa.Integer(), nullable=True))
+    op.execute(
+        'UPDATE votingbyuser SET message_id = votingfeed.message_id '
+        'FROM votingfeed WHERE votingfeed.id = votingbyuser.voting_id'
+    )
+    op.execute(
+        'DELETE FROM votingbyuser AS duplicate USING votingbyuser AS kept '
+        'WHERE duplicate.user_id = kept.user_id AND duplicate.message_id = kept.message_id '
+        'AND duplicate.id < kept.id'
+    )
+    op.alter_column('votingbyuser', 'message_id', nullable=False)
+    op.create_foreign_key(None, 'votingbyuser', 'messagefeed', ['message_id'], ['id'])
+    op.create_unique_constraint('uq_user_poll_vote', 'votingbyuser', ['user_id', 'message_id'])
+    op.create_index('ix_votingbyuser_voting_id', 'votingbyuser', ['voting_id'])
+
+    op.execute(
+        'UPDATE votingfeed SET votes_count = votes.count '
+        'FROM (SELECT voting_id, count(*) AS count FROM votingbyuser GROUP BY voting_id) AS votes '
+        'WHERE votingfeed.id = votes.voting_id'
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_votingbyuser_voting_id', table_name='votingbyuser')
+    op.drop_constraint('uq_user_poll_vote', 'votingbyuser', type_='unique')
+    op.drop_constraint('votingbyuser_message_id_fkey', 'votingbyuser', type_='foreignkey')
+    op.drop_column('votingbyuser', 'message_id')
+    op.drop_constraint('uq_poll_option_name', 'votingfeed', type_='unique')
+    op.alter_column(
+        'votingfeed',
+        'name',
+        type_=sa.String(length=30),
+        existing_type=sa.String(length=255),
+        existing_nullable=False,
+    )
+    op.create_unique_constraint('votingfeed_name_key', 'votingfeed', ['name'])
+    op.drop_column('votingfeed', 'votes_count')
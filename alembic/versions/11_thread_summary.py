@@ -0,0 +1,85 @@
+"""thread_summary
+
+Revision ID: 11
+Revises: 10
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import fastapi_users_db_sqlalchemy
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '11'
+down_revision: Union[str, None] = '10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Сводка треда хранится в самом треде и изменяется вместе с комментариями.
+    op.add_column(
+        'messagefeed',
+        sa.Column('comments_count', sa.Integer(), server_default='0', nullable=False),
+    )
+    op.add_column(
+        'messagefeed',
+        sa.Column('last_comment_at', postgresql.TIMESTAMP(timezone=True), nullable=True),
+    )
+    op.add_column(
+        'messagefeed',
+        sa.Column(
+            'last_comment_owner_id', fastapi_users_db_sqlalchemy.generics.GUID(), nullable=True
+        ),
+    )
+    op.add_column(
+        'messagefeed',
+        sa.Column(
+            'last_activity_at',
+            postgresql.TIMESTAMP(timezone=True),
+            server_default=sa.text('now()'),
+            nullable=False,
+        ),
+    )
+    op.create_foreign_key(
+        None, 'messagefeed', 'usertabit', ['last_comment_owner_id'], ['id']
+    )
+    op.execute(
+        """
+        UPDATE messagefeed SET
+            comments_count = summary.comments_count,
+            last_comment_at = summary.last_comment_at,
+            last_comment_owner_id = summary.last_comment_owner_id
+        FROM (
+            SELECT DISTINCT ON (message_id)
+                message_id,
+                count(*) OVER (PARTITION BY message_id) AS comments_count,
+                created_at AS last_comment_at,
+                owner_id AS last_comment_owner_id
+            FROM commentfeed
+            ORDER BY message_id, id DESC
+        ) AS summary
+        WHERE messagefeed.id = summary.message_id
+        """
+    )
+    op.execute('UPDATE messagefeed SET last_activity_at = coalesce(last_comment_at, created_at)')
+    op.create_index(
+        'ix_messagefeed_problem_id_last_activity_at',
+        'messagefeed',
+        ['problem_id', sa.text('last_activity_at DESC'), 'id'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_messagefeed_problem_id_last_activity_at', table_name='messagefeed')
+    op.drop_constraint(
+        'messagefeed_last_comment_owner_id_fkey', 'messagefeed', type_='foreignkey'
+    )
+    op.drop_column('messagefeed', 'last_activity_at')
+    op.drop_column('messagefeed', 'last_comment_owner_id')
+    op.drop_column('messagefeed', 'last_comment_at')
+    op.drop_column('messagefeed', 'comments_count')
@@ -0,0 +1,58 @@
+"""full_text_search
+
+Revision ID: 12
+Revises: 11
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '12'
+down_revision: Union[str, None] = '11'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Таблица, индексируемые столбцы с весами; tsvector строится конфигурациями russian и simple.
+SEARCH_COLUMNS: dict[str, tuple[tuple[str, str], ...]] = {
+    'problem': (('name', 'A'), ('description', 'C')),
+    'messagefeed': (('text', 'B'),),
+    'commentfeed': (('text', 'D'),),
+}
+
+
+def search_vector(columns: tuple[tuple[str, str], ...]) -> str:
+    """Выражение генерируемого столбца search_vector."""
+    return ' || '.join(
+        f"setweight(to_tsvector('{config}'::regconfig, coalesce({column}, '')), '{weight}')"
+        for column, weight in columns
+        for config in ('russian', 'simple')
+    )
+
+
+def upgrade() -> None:
+    # Генерируемый столбец вычисляется для существующих строк при добавлении.
+    for table, columns in SEARCH_COLUMNS.items():
+        op.add_column(
+            table,
+            sa.Column(
+                'search_vector',
+                postgresql.TSVECTOR(),
+                sa.Computed(search_vector(columns), persisted=True),
+                nullable=True,
+            ),
+        )
+        op.create_index(
+            f'ix_{table}_search_vector', table, ['search_vector'], postgresql_using='gin'
+        )
+
+
+def downgrade() -> None:
+    for table in SEARCH_COLUMNS:
+        op.drop_index(f'ix_{table}_search_vector', table_name=table)
+        op.drop_column(table, 'search_vector')
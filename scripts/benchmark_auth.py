@@ -0,0 +1,80 @@
+"""
+Замер накладных расходов аутентификации пользователя компании на один запрос.
+
+Скрипт выпускает access-token для пользователя из БД, указанной в настройках (.env),
+и многократно проверяет его так же, как зависимость current_user: каждая итерация
+открывает новую сессию и контекст запроса и вызывает JWTStrategyTabit.read_token.
+Замер выполняется дважды: без кэша пользователей (каждый запрос читает пользователя,
+компанию и лицензию из БД) и с кэшем (src.users.cache).
+
+Пример:
+    python -m scripts.benchmark_auth --email user@example.com -n 2000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from fastapi_users_db_sqlalchemy import SQLAlchemyUserDatabase
+from sqlalchemy import select
+
+from src.api.v1.auth.jwt import get_jwt_strategy
+from src.api.v1.auth.managers import UserManager
+from src.database.sc_db_session import async_session
+from src.request_context import RequestContext, request_context
+from src.users.cache import user_cache
+from src.users.models import UserTabit
+
+
+async def measure(token: str, requests: int, use_cache: bool) -> list[float]:
+    """
+    Возвращает время проверки токена в микросекундах для каждого запроса.
+
+    Параметры:
+        token: access-token пользователя;
+        requests: число запросов;
+        use_cache: использовать ли кэш пользователей.
+    """
+    strategy = get_jwt_strategy()
+    timings = []
+    user_cache.clear()
+    for _ in range(requests):
+        if not use_cache:
+            user_cache.clear()
+        context_token = request_context.set(RequestContext())
+        started = time.perf_counter()
+        async with async_session() as session:
+            user = await strategy.read_token(
+                token, UserManager(SQLAlchemyUserDatabase(session, UserTabit))
+            )
+        timings.append((time.perf_counter() - started) * 1_000_000)
+        request_context.reset(context_token)
+        assert user is not None
+    return timings
+
+
+async def main(email: str | None, requests: int) -> None:
+    """Выпускает токен и печатает результаты замеров."""
+    async with async_session() as session:
+        query = select(UserTabit)
+        if email:
+            query = query.where(UserTabit.email == email)
+        user = (await session.scalars(query.limit(1))).first()
+    if user is None:
+        raise SystemExit('Пользователь не найден')
+    token = await get_jwt_strategy().write_token(user, is_access=True)
+    for title, use_cache in (('без кэша', False), ('с кэшем', True)):
+        timings = sorted(await measure(token, requests, use_cache))
+        print(
+            f'{title}: медиана {statistics.median(timings):.0f} мкс, '
+            f'p95 {timings[int(len(timings) * 0.95) - 1]:.0f} мкс'
+        )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Замер накладных расходов аутентификации')
+    parser.add_argument('--email', help='email пользователя компании (по умолчанию любой)')
+    parser.add_argument('-n', '--requests', type=int, default=1_000, help='число запросов')
+    arguments = parser.parse_args()
+    asyncio.run(main(arguments.email, arguments.requests))
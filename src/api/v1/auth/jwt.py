@@ -3,7 +3,7 @@ from typing import Any, Optional
 from uuid import UUID
 
 import jwt
-from fastapi import HTTPException, status
+from fastapi import HTTPException, Response, status
 from fastapi.responses import JSONResponse
 from fastapi_users import FastAPIUsers, exceptions, models
 from fastapi_users.authentication import (
@@ -22,11 +22,20 @@ from fastapi_users.manager import BaseUserManager, UserManagerDependency
 from fastapi_users.schemas import model_dump
 from makefun import with_signature
 from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.v1.auth.managers import get_admin_manager, get_user_manager
+from src.api.v1.auth.managers import TokenRevoked, get_admin_manager, get_user_manager
 from src.api.v1.auth.protocol import StrategyT, TransportT
 from src.config import settings
 from src.tabit_management.models import TabitAdminUser
+from src.token_sessions.constants import TOKEN_CLAIM_JTI
+from src.token_sessions.service import token_session_store
+from src.users.constants import (
+    TOKEN_CLAIM_COMPANY_ID,
+    TOKEN_CLAIM_IS_ACTIVE,
+    TOKEN_CLAIM_ROLE,
+    TOKEN_CLAIM_VERSION,
+)
 from src.users.models import UserTabit
 
 
@@ -71,18 +80,61 @@ class AuthenticationBackendTabit(AuthenticationBackend):
     transport: TransportT
 
     async def login_with_refresh(
-        self, strategy: StrategyT[models.UP, models.ID], user: models.UP
+        self,
+        strategy: StrategyT[models.UP, models.ID],
+        user: models.UP,
+        session: AsyncSession,
+        refresh_token: str | None = None,
     ) -> JSONResponse:
         """
         Передаст токены из стратегии в транспорт.
+        При входе в систему создаёт сессию refresh-токена, при обновлении токенов переводит
+        сессию предъявленного refresh-токена на новую пару (src.token_sessions). Если
+        refresh-токен отозван или уже использован, выбросит 401-ошибку.
         :param strategy: стратегия JWT-токенов, по которой будут создаваться токены;
         :param user: экземпляр модели пользователей (запись из БД) для которого будут создаваться
-            токены.
+            токены;
+        :param session: асинхронная сессия SQLAlchemy;
+        :param refresh_token: предъявленный refresh-токен (None - вход в систему).
         """
-        token_access = await strategy.write_token(user, is_access=True)
-        token_refresh = await strategy.write_token(user, is_access=False)
+        jti = token_session_store.new_jti()
+        if refresh_token is None:
+            await token_session_store.open(
+                session, jti, user.id, strategy.lifetime_seconds_refresh
+            )
+        else:
+            old_jti = strategy.read_claims(refresh_token).get(TOKEN_CLAIM_JTI)
+            if (
+                old_jti is None
+                or await token_session_store.rotate(
+                    session, old_jti, jti, strategy.lifetime_seconds_refresh
+                )
+                != user.id
+            ):
+                raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
+        token_access = await strategy.write_token(user, is_access=True, jti=jti)
+        token_refresh = await strategy.write_token(user, is_access=False, jti=jti)
         return await self.transport.get_login_response_with_refresh(token_access, token_refresh)
 
+    async def logout(
+        self,
+        strategy: StrategyT[models.UP, models.ID],
+        user: models.UP,
+        token: str,
+        session: AsyncSession | None = None,
+    ) -> Response:
+        """
+        Отзовёт сессию токена и подготовит ответ на выход из системы.
+        :param strategy: стратегия JWT-токенов;
+        :param user: пользователь, выходящий из системы;
+        :param token: access-токен пользователя;
+        :param session: асинхронная сессия SQLAlchemy, через которую отзывается сессия токена.
+        """
+        jti = strategy.read_claims(token).get(TOKEN_CLAIM_JTI)
+        if session is not None and jti is not None:
+            await token_session_store.revoke(session, jti)
+        return await super().logout(strategy, user, token)
+
 
 class JWTStrategyTabit(JWTStrategy):
     """JWT-стратегия сервиса Tabit."""
@@ -124,6 +176,10 @@ class JWTStrategyTabit(JWTStrategy):
         """
         Проверит является ли переданный токен access-token или refresh-token и валиден ли он.
         Вернет экземпляр модели пользователя (запись из БД), которому был выдан этот токен.
+        Токен пользователя компании с версией меньше текущей версии токенов пользователя
+        считается отозванным. Пользователь с совпадающей версией берётся из кэша
+        пользователей без запроса к БД. Access-токен отозванной сессии (выход из системы)
+        не принимается.
         :param token: переданный токен;
         :param user_manager: менеджер управления пользователями;
         :param distinguishing_feature:
@@ -144,13 +200,29 @@ class JWTStrategyTabit(JWTStrategy):
                 return None
         except jwt.PyJWTError:
             return None
+        jti = data.get(TOKEN_CLAIM_JTI)
+        if (
+            jti is not None
+            and distinguishing_feature == settings.jwt_distinguishing_feature_access_token
+            and await token_session_store.is_revoked(user_manager.user_db.session, jti)
+        ):
+            return None
         try:
             parsed_id = user_manager.parse_id(user_id)
-            return await user_manager.get(parsed_id)
-        except (exceptions.UserNotExists, exceptions.InvalidID):
+            return await user_manager.get_for_request(parsed_id, data.get(TOKEN_CLAIM_VERSION, 0))
+        except (exceptions.UserNotExists, exceptions.InvalidID, TokenRevoked):
             return None
 
-    async def write_token(self, user: models.UP, is_access: bool | None = None) -> str:
+    def read_claims(self, token: str) -> dict[str, Any]:
+        """
+        Вернет полезную нагрузку токена, уже проверенного read_token.
+        :param token: токен.
+        """
+        return decode_jwt(token, self.decode_key, self.token_audience, algorithms=[self.algorithm])
+
+    async def write_token(
+        self, user: models.UP, is_access: bool | None = None, jti: str | None = None
+    ) -> str:
         """
         Подготовит данные для создания access-token или refresh-token и, после его создания,
         вернет его.
@@ -160,11 +232,27 @@ class JWTStrategyTabit(JWTStrategy):
             - None - по умолчанию - стандартный функционал библиотеки;
             - True - создаст access-token;
             - False - создаст refresh-token.
+        :param jti: идентификатор сессии пары токенов (src.token_sessions).
+        В токены пользователей компаний добавляются подписанные утверждения: id компании,
+        роль, активность и версия токенов пользователя. Смена роли или активности
+        увеличивает версию, поэтому утверждения верны, пока read_token принимает токен по
+        версии: по ним клиент и другие сервисы решают вопросы доступа без запроса к API.
         """
         data = {
             'sub': str(user.id),
             'aud': self.token_audience,
         }
+        if isinstance(user, UserTabit):
+            data.update(
+                {
+                    TOKEN_CLAIM_COMPANY_ID: user.company_id,
+                    TOKEN_CLAIM_ROLE: user.role.name,
+                    TOKEN_CLAIM_IS_ACTIVE: user.is_active,
+                    TOKEN_CLAIM_VERSION: user.token_version,
+                }
+            )
+        if jti is not None:
+            data[TOKEN_CLAIM_JTI] = jti
         lifetime_seconds = self.lifetime_seconds
         if is_access is not None:
             distinguishing_feature = (
@@ -1,16 +1,33 @@
 import re
 from http import HTTPStatus
+from typing import Any, Optional
 
 from fastapi import Depends, HTTPException, Request
-from fastapi_users import BaseUserManager, UUIDIDMixin, models, schemas
+from fastapi.security import OAuth2PasswordRequestForm
+from fastapi_users import BaseUserManager, UUIDIDMixin, exceptions, models, schemas
+from sqlalchemy import select
 
 from src.api.v1.auth.access_to_db import get_admin_db, get_user_db
+from src.api.v1.auth.password import password_hasher
+from src.companies.models import Company
 from src.constants import PATTERN_PASSWORD, TEXT_ERROR_INVALID_PASSWORD
-from src.tabit_management.models import TabitAdminUser
+from src.request_context import get_request_context
+from src.tabit_management.models import LicenseType, TabitAdminUser
+from src.users.cache import UserCacheEntry, user_cache
+from src.users.constants import TOKEN_REVOKING_FIELDS
+from src.users.models import UserTabit
+
+
+class TokenRevoked(exceptions.FastAPIUsersException):
+    """Версия токена меньше текущей версии токенов пользователя: токен отозван."""
 
 
 class BaseTabitUserManager(UUIDIDMixin, BaseUserManager):
-    """Базовый менеджер управления пользователями."""
+    """
+    Базовый менеджер управления пользователями.
+    Хэширование и проверка паролей при создании, обновлении и аутентификации выполняются
+    в пуле password_hasher, чтобы не блокировать цикл событий.
+    """
 
     async def validate_password(
         self,
@@ -24,6 +41,66 @@ class BaseTabitUserManager(UUIDIDMixin, BaseUserManager):
                 detail=TEXT_ERROR_INVALID_PASSWORD,
             )
 
+    async def get_for_request(self, user_id: models.ID, token_version: int = 0) -> models.UP:
+        """
+        Возвращает пользователя, которому выдан токен текущего запроса.
+        Если пользователь не существует, выбрасывает UserNotExists.
+        Версия токена проверяется только у пользователей компаний (UserManager).
+        """
+        return await self.get(user_id)
+
+    async def create(
+        self,
+        user_create: schemas.UC,
+        safe: bool = False,
+        request: Optional[Request] = None,
+    ) -> models.UP:
+        """Создаёт пользователя, хэшируя пароль в пуле password_hasher."""
+        await self.validate_password(user_create.password, user_create)
+        if await self.user_db.get_by_email(user_create.email) is not None:
+            raise exceptions.UserAlreadyExists()
+        user_dict = (
+            user_create.create_update_dict()
+            if safe
+            else user_create.create_update_dict_superuser()
+        )
+        user_dict['hashed_password'] = await password_hasher.hash(user_dict.pop('password'))
+        created_user = await self.user_db.create(user_dict)
+        await self.on_after_register(created_user, request)
+        return created_user
+
+    async def authenticate(self, credentials: OAuth2PasswordRequestForm) -> Optional[models.UP]:
+        """
+        Аутентифицирует пользователя по email и паролю, проверяя пароль в пуле
+        password_hasher. Устаревший хэш пароля обновляется.
+        """
+        try:
+            user = await self.get_by_email(credentials.username)
+        except exceptions.UserNotExists:
+            # Хэшируем пароль и для несуществующего пользователя, чтобы время ответа
+            # не выдавало наличие email в системе.
+            await password_hasher.hash(credentials.password)
+            return None
+        verified, updated_password_hash = await password_hasher.verify_and_update(
+            credentials.password, user.hashed_password
+        )
+        if not verified:
+            return None
+        if updated_password_hash is not None:
+            await self.user_db.update(user, {'hashed_password': updated_password_hash})
+        return user
+
+    async def _update(self, user: models.UP, update_dict: dict[str, Any]) -> models.UP:
+        """Обновляет пользователя, хэшируя новый пароль в пуле password_hasher."""
+        password = update_dict.get('password')
+        if password is not None:
+            await self.validate_password(password, user)
+            update_dict = {
+                **{field: value for field, value in update_dict.items() if field != 'password'},
+                'hashed_password': await password_hasher.hash(password),
+            }
+        return await super()._update(user, update_dict)
+
     async def on_after_register(self, user: TabitAdminUser, request: Request | None = None):
         """Действия после успешной регистрации пользователя."""
         # TODO: Какие действия нужны после успешной регистрации?
@@ -37,6 +114,63 @@ class AdminManager(BaseTabitUserManager):
 class UserManager(BaseTabitUserManager):
     """Менеджер управления пользователями сервиса от компаний."""
 
+    async def get_for_request(self, user_id: models.ID, token_version: int = 0) -> UserTabit:
+        """
+        Возвращает пользователя, которому выдан токен текущего запроса.
+        Пользователь, его компания и лицензия компании загружаются одним запросом
+        и сохраняются в контексте запроса (src.request_context), откуда их читают
+        остальные зависимости и валидаторы. Повторная аутентификация в том же запросе
+        не обращается к БД.
+        Если в кэше пользователей (src.users.cache) есть запись с той же версией токена,
+        объекты берутся из неё без запроса к БД. Если версия токена не совпадает
+        с версией пользователя в БД, выбрасывает TokenRevoked.
+        """
+        context = get_request_context()
+        if context.user is not None and context.user.id == user_id:
+            return context.user
+        entry = user_cache.get(user_id, token_version)
+        if entry is not None:
+            context.user, context.company, context.license = await entry.restore(
+                self.user_db.session
+            )
+            return context.user
+        generation = user_cache.generation
+        row = (
+            await self.user_db.session.execute(
+                select(UserTabit, Company, LicenseType)
+                .join(Company, Company.id == UserTabit.company_id)
+                .outerjoin(LicenseType, LicenseType.id == Company.license_id)
+                .where(UserTabit.id == user_id)
+            )
+        ).first()
+        if row is None:
+            raise exceptions.UserNotExists()
+        if row.UserTabit.token_version != token_version:
+            raise TokenRevoked()
+        user_cache.put(UserCacheEntry.from_objects(*row), generation)
+        context.user, context.company, context.license = row
+        return context.user
+
+    async def revoke_tokens(self, user: UserTabit) -> UserTabit:
+        """
+        Отзывает все выданные пользователю токены: увеличивает версию токенов в БД.
+
+        Параметры:
+            user: пользователь компании.
+        """
+        return await self.user_db.update(user, {'token_version': UserTabit.token_version + 1})
+
+    async def _update(self, user: UserTabit, update_dict: dict[str, Any]) -> UserTabit:
+        """
+        Обновляет пользователя. Смена роли или деактивация отзывают выданные ему токены.
+        """
+        if any(
+            field in update_dict and update_dict[field] != getattr(user, field)
+            for field in TOKEN_REVOKING_FIELDS
+        ):
+            update_dict = {**update_dict, 'token_version': UserTabit.token_version + 1}
+        return await super()._update(user, update_dict)
+
 
 async def get_admin_manager(admin_db=Depends(get_admin_db)):
     """Корутина, возвращающая объект класса AdminManager."""
@@ -0,0 +1,151 @@
+"""
+Модуль хэширования и проверки паролей вне цикла событий.
+
+Содержит:
+- PasswordHasherMetrics: счётчики задач хэширования и глубины очереди.
+- AsyncPasswordHelper: асинхронная обёртка PasswordHelper, выполняющая хэширование в
+  ограниченном пуле потоков или процессов.
+- password_hasher: общий на процесс хэшер, настроенный по Settings.
+"""
+
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Literal, Sequence, TypeVar
+
+from fastapi_users.password import PasswordHelper
+
+from src.config import settings
+from src.users.constants import PASSWORD_HASH_CHUNK_SIZE
+
+T = TypeVar('T')
+
+password_helper = PasswordHelper()
+
+
+def _hash(password: str) -> str:
+    """Хэширует пароль. Выполняется в пуле."""
+    return password_helper.hash(password)
+
+
+def _hash_chunk(passwords: Sequence[str]) -> list[str]:
+    """Хэширует порцию паролей. Выполняется в пуле."""
+    return [password_helper.hash(password) for password in passwords]
+
+
+def _verify_and_update(plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+    """Проверяет пароль и при необходимости возвращает обновлённый хэш. Выполняется в пуле."""
+    return password_helper.verify_and_update(plain_password, hashed_password)
+
+
+@dataclass
+class PasswordHasherMetrics:
+    """
+    Накопленные метрики хэшера паролей.
+
+    Поля:
+        tasks: сколько задач отправлено в пул;
+        in_flight: задач в пуле сейчас (выполняются и ждут свободного воркера);
+        max_queue_depth: максимальное число задач, ожидавших свободного воркера;
+        task_seconds_total: суммарное время задач с учётом ожидания в очереди;
+        task_seconds_max: максимальное время задачи с учётом ожидания в очереди.
+    """
+
+    tasks: int = 0
+    in_flight: int = 0
+    max_queue_depth: int = 0
+    task_seconds_total: float = 0
+    task_seconds_max: float = 0
+
+
+class AsyncPasswordHelper:
+    """
+    Хэширует и проверяет пароли в ограниченном пуле, не блокируя цикл событий.
+    Argon2 и bcrypt освобождают GIL, поэтому пула потоков достаточно; пул процессов
+    нужен, если хэширование должно занимать другие ядра независимо от GIL.
+    Пул создаётся при первом обращении.
+    """
+
+    def __init__(self, executor_type: Literal['thread', 'process'], workers: int) -> None:
+        self.executor_type = executor_type
+        self.workers = workers
+        self.metrics = PasswordHasherMetrics()
+        self._executor: Executor | None = None
+
+    @property
+    def executor(self) -> Executor:
+        """Пул, в котором выполняется хэширование."""
+        if self._executor is None:
+            executor_class = (
+                ProcessPoolExecutor if self.executor_type == 'process' else ThreadPoolExecutor
+            )
+            self._executor = executor_class(max_workers=self.workers)
+        return self._executor
+
+    @property
+    def queue_depth(self) -> int:
+        """Число задач, ожидающих свободного воркера."""
+        return max(self.metrics.in_flight - self.workers, 0)
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        """Выполняет функцию в пуле, обновляя метрики."""
+        self.metrics.tasks += 1
+        self.metrics.in_flight += 1
+        self.metrics.max_queue_depth = max(self.metrics.max_queue_depth, self.queue_depth)
+        start = time.perf_counter()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.metrics.in_flight -= 1
+            self.metrics.task_seconds_total += elapsed
+            self.metrics.task_seconds_max = max(self.metrics.task_seconds_max, elapsed)
+
+    async def hash(self, password: str) -> str:
+        """Возвращает хэш пароля."""
+        return await self._run(_hash, password)
+
+    async def verify_and_update(
+        self, plain_password: str, hashed_password: str
+    ) -> tuple[bool, str | None]:
+        """
+        Проверяет пароль по хэшу. Возвращает результат проверки и новый хэш, если
+        хэш нужно обновить на более стойкий, иначе None.
+        """
+        return await self._run(_verify_and_update, plain_password, hashed_password)
+
+    async def hash_many(self, passwords: Sequence[str]) -> list[str]:
+        """
+        Хэширует пароли порциями по PASSWORD_HASH_CHUNK_SIZE, чтобы сократить накладные
+        расходы на постановку задач в пул. Возвращает хэши в порядке переданных паролей.
+        """
+        chunks = await asyncio.gather(
+            *(
+                self._run(_hash_chunk, passwords[start : start + PASSWORD_HASH_CHUNK_SIZE])
+                for start in range(0, len(passwords), PASSWORD_HASH_CHUNK_SIZE)
+            )
+        )
+        return [hashed for chunk in chunks for hashed in chunk]
+
+    def get_metrics(self) -> dict[str, Any]:
+        """
+        Возвращает настройки пула, текущую глубину очереди и накопленные метрики.
+
+        Поля ответа:
+            executor: тип пула (thread или process);
+            workers: число воркеров пула;
+            queue_depth: задач, ожидающих свободного воркера сейчас;
+            а так же поля PasswordHasherMetrics.
+        """
+        return {
+            'executor': self.executor_type,
+            'workers': self.workers,
+            'queue_depth': self.queue_depth,
+            **asdict(self.metrics),
+        }
+
+
+password_hasher = AsyncPasswordHelper(
+    settings.password_hash_executor, settings.password_hash_workers
+)
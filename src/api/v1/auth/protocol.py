@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import Generic, Protocol
+from typing import Any, Generic, Protocol
 
 from fastapi.responses import JSONResponse
 from fastapi_users import models
@@ -10,6 +10,8 @@ from fastapi_users.manager import BaseUserManager
 class StrategyT(Protocol, Generic[models.UP, models.ID]):
     """Протокол для аннотирования стратегии."""
 
+    lifetime_seconds_refresh: int | None
+
     async def read_token(
         self,
         token: str | None,
@@ -17,8 +19,10 @@ class StrategyT(Protocol, Generic[models.UP, models.ID]):
         distinguishing_feature: str | None,
     ) -> models.UP | None: ...  # pragma: no cover
 
+    def read_claims(self, token: str) -> dict[str, Any]: ...  # pragma: no cover
+
     async def write_token(
-        self, user: models.UP, is_access: bool | None
+        self, user: models.UP, is_access: bool | None, jti: str | None = None
     ) -> str: ...  # pragma: no cover
 
     async def destroy_token(self, token: str, user: models.UP) -> None: ...  # pragma: no cover
@@ -39,9 +39,11 @@ class Summary:
     TABIT_COMPANY_EMPLOYEES_UPDATE: str = 'Изменить данные сотрудника компании'
     TABIT_COMPANY_EMPLOYEES_DELETE: str = 'Удалить сотрудника компании'
     TABIT_COMPANY_EMPLOYEES_IMPORT: str = 'Импортировать список сотрудников компании'
+    TABIT_COMPANY_EMPLOYEES_BULK_CREATE: str = 'Массово добавить сотрудников компании из файла'
 
     COMPANY_USER_AUTH_LOGIN: str = 'Авторизация'
     COMPANY_USER_AUTH_LOGOUT: str = 'Выход из система'
+    COMPANY_USER_AUTH_LOGOUT_ALL: str = 'Выход из системы на всех устройствах'
     COMPANY_USER_AUTH_REFRESH_TOKEN: str = 'Обновить токен'
 
 
@@ -99,6 +101,10 @@ class Description:
 
     COMPANY_USER_AUTH_LOGIN: str = 'Авторизация пользователя сервиса.'
     COMPANY_USER_AUTH_LOGOUT: str = 'Авторизация пользователя сервиса.'
+    COMPANY_USER_AUTH_LOGOUT_ALL: str = (
+        'Выход пользователя сервиса из системы на всех устройствах: все выданные ему '
+        'access и refresh токены больше не принимаются.'
+    )
     COMPANY_USER_AUTH_REFRESH_TOKEN: str = (
         'Для обновления в токенов необходимо в заголовке Authorization передать refresh-token, '
         'вместо access-token. В ответ вернет два новых токена. Доступно только пользователя '
@@ -5,6 +5,7 @@ from .landing_page import router as landing_page_router
 from .problem_feeds import router as problem_feeds_router
 from .problem_meetings import router as meeting_router
 from .problems import router as problems_router
+from .search import router as search_router
 from .surveys import router as surveys_router
 from .tabit_admin_auth import router as tabit_admin_auth_router
 from .tabit_management import router as tabit_management_router
@@ -27,5 +28,6 @@ __all__ = [
     'companies_management_router',
     'tabit_management_router',
     'tabit_admin_auth_router',
+    'search_router',
     'surveys_router',
 ]
@@ -1,9 +1,10 @@
 """Модуль роутеров для пользователя-админа компании."""
 
-from typing import List, Sequence
+from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Response, UploadFile, status
+from fastapi.responses import StreamingResponse
 from fastapi_users.manager import BaseUserManager
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -15,19 +16,25 @@ from src.api.v1.constants import Summary
 from src.api.v1.validator import validator_check_object_exists
 from src.api.v1.validators.company_validators import (
     check_department_name_duplicate,
-    check_slug_duplicate,
     validate_password,
     validate_user_not_exists,
 )
+from src.companies.cache import company_cache
 from src.companies.crud import company_crud, company_departments_crud
 from src.companies.schemas import (
+    BulkEmployeesResponseSchema,
     CompanyDepartmentCreateSchema,
     CompanyDepartmentResponseSchema,
     CompanyDepartmentUpdateSchema,
     CompanyEmployeeUpdateSchema,
     CompanyResponseSchema,
+    EmployeeFilterSchema,
 )
-from src.database.db_depends import get_async_session
+from src.companies.service import bulk_create_employees
+from src.constants import TOTAL_COUNT_HEADER
+from src.database.db_depends import get_async_read_session, get_async_session
+from src.pagination import CountMode
+from src.request_context import get_request_context
 from src.users.crud.user import user_crud
 from src.users.schemas import UserCreateSchema, UserReadSchema
 from src.utils.email_service.email_schema import EmailCreateSchema
@@ -73,7 +80,11 @@ async def get_company(
       "updated_at": "2025-02-18T13:34:06.541Z"
     }
     Если компании не существует вернет ответ со статусом 404.
+    Компания пользователя берётся из контекста запроса без повторного обращения к БД.
     """
+    company = get_request_context().get_company()
+    if company is not None and company.slug == company_slug:
+        return company
     return await company_crud.get_by_slug(session=session, obj_slug=company_slug, raise_404=True)
 
 
@@ -110,7 +121,7 @@ async def get_all_departments(
     ]
     Если отделов нет вернет пустой список.
     """
-    company = await validator_check_object_exists(session, company_crud, object_slug=company_slug)
+    company = await company_cache.get(session, company_slug)
     return await company_departments_crud.get_multi(
         session=session, filters={'company_id': company.id}
     )
@@ -150,22 +161,14 @@ async def create_department(
         "company_id": 0
       }
     """
-    company = await validator_check_object_exists(session, company_crud, object_slug=company_slug)
+    company = await company_cache.get(session, company_slug)
     object_name = object_in.model_dump()['name']
     await check_department_name_duplicate(
         company_id=company.id, department_name=object_name, session=session
     )
-    db_obj = await company_departments_crud.create(
-        session=session, obj_in=object_in, auto_commit=False
+    return await company_departments_crud.create_with_slug(
+        session, object_in, object_name, company_id=company.id
     )
-    session.expunge(db_obj)
-    db_obj.company_id = company.id
-    slug = await check_slug_duplicate(db_obj=db_obj, session=session)
-    db_obj.slug = slug
-    session.add(db_obj)
-    await session.commit()
-    await session.refresh(db_obj)
-    return db_obj
 
 
 @router.post(
@@ -176,12 +179,12 @@ async def create_department(
 async def import_departments(
     company_slug: str,
     session: AsyncSession = Depends(get_async_session),
-) -> Sequence[bytes]:
+) -> StreamingResponse:
     """
     Импортирует список отделов компании.
     Доступно только пользователю-админу компании.
     Проверяет существует ли компания и после, передает id компании для фильтрации списка.
-    После записывет данные в файл.
+    Файл формируется потоково, без ограничения на число отделов.
     В пути принимает 'company_slug' - значение `slug` компании.
     Параметры декоратора:
         path: URL-адрес, который будет использоваться для этой операции.
@@ -189,13 +192,12 @@ async def import_departments(
     Параметры функции:
         company_slug: значение `slug` компании.
         session: асинхронная сессия.
-    Вернет файл .txt с данными отделов.
+    Вернет файл .csv с данными отделов.
     """
-    company = await validator_check_object_exists(session, company_crud, object_slug=company_slug)
-    departments_list = await company_departments_crud.get_multi(
-        session=session, filters={'company_id': company.id}
+    company = await company_cache.get(session, company_slug)
+    return await company_crud.get_export(
+        session, company_departments_crud, {'company_id': company.id}, 'departments_list'
     )
-    return await company_crud.get_import(objects_in=departments_list, file_name='departments_list')
 
 
 @router.get(
@@ -232,7 +234,7 @@ async def get_department(
       }
     Если отдела нет вернет ответ со статусом 404.
     """
-    await validator_check_object_exists(session, company_crud, object_slug=company_slug)
+    await company_cache.get(session, company_slug)
     return await company_departments_crud.get_or_404(session=session, obj_id=department_id)
 
 
@@ -275,22 +277,18 @@ async def update_department(
       }
     Если отдел не найден вернет ответ со статусом 404.
     """
-    company = await validator_check_object_exists(session, company_crud, object_slug=company_slug)
+    company = await company_cache.get(session, company_slug)
     object_name = object_in.model_dump()['name']
     await check_department_name_duplicate(
         company_id=company.id, department_name=object_name, session=session
     )
     db_object = await company_departments_crud.get_or_404(session, obj_id=department_id)
-    update_obj = await company_departments_crud.update(
-        session, db_obj=db_object, obj_in=object_in, auto_commit=False
+    slug = await company_departments_crud.allocate_slug(
+        session, object_name or db_object.name, db_obj=db_object
+    )
+    return await company_departments_crud.update(
+        session, db_obj=db_object, obj_in=object_in.model_copy(update={'slug': slug})
     )
-    session.expunge(update_obj)
-    slug = await check_slug_duplicate(db_obj=update_obj, session=session)
-    update_obj.slug = slug
-    session.add(update_obj)
-    await session.commit()
-    await session.refresh(update_obj)
-    return update_obj
 
 
 @router.delete(
@@ -320,7 +318,7 @@ async def delete_department(
     При успешной транзакции вернет ответ со статусом 204.
     Если компания или отдел не найдены ответ со статусом 404.
     """
-    await validator_check_object_exists(session, company_crud, object_slug=company_slug)
+    await company_cache.get(session, company_slug)
     department = await validator_check_object_exists(
         session, company_departments_crud, object_id=department_id
     )
@@ -337,7 +335,9 @@ async def delete_department(
 )
 async def get_all_employees(
     company_slug: str,
-    session: AsyncSession = Depends(get_async_session),
+    response: Response,
+    filters: EmployeeFilterSchema = Query(),
+    session: AsyncSession = Depends(get_async_read_session),
 ) -> List[UserReadSchema]:
     """
     Получает список всех сотрудников компании.
@@ -350,6 +350,9 @@ async def get_all_employees(
         summary: краткое описание.
     Параметры функции:
         company_slug: значение `slug` компании.
+        response: объект ответа, в заголовок X-Total-Count передаётся число сотрудников.
+        filters: фильтры по фамилии (surname__ilike), отделам (current_department_id__in)
+            и ролям (role__in).
         session: асинхронная сессия.
     Приуспешной транзакции вернет JSON, пример:
     [
@@ -380,8 +383,14 @@ async def get_all_employees(
     ]
     Если сотрудников нет, пустой список.
     """
-    company = await validator_check_object_exists(session, company_crud, object_slug=company_slug)
-    return await user_crud.get_multi(session, filters={'company_id': company.id})
+    company = await company_cache.get(session, company_slug)
+    employees, total = await user_crud.get_page(
+        session,
+        filters={**filters.model_dump(exclude_none=True), 'company_id': company.id},
+        count_mode=CountMode.EXACT,
+    )
+    response.headers[TOTAL_COUNT_HEADER] = str(total)
+    return employees
 
 
 @router.post(
@@ -437,13 +446,62 @@ async def create_company_employee(
     }
     Если пользователь уже существует или пароль не соответствует требованиям ответ со статусом 400.
     """
-    await validator_check_object_exists(session, company_crud, object_slug=company_slug)
+    await company_cache.get(session, company_slug)
     await validate_user_not_exists(create_data, user_manager)
     await validate_password(create_data, user_manager)
     created_user = await user_manager.create(create_data)
     return created_user
 
 
+@router.post(
+    '/{company_slug}/employees/bulk',
+    response_model=BulkEmployeesResponseSchema,
+    status_code=status.HTTP_200_OK,
+    summary=Summary.TABIT_COMPANY_EMPLOYEES_BULK_CREATE,
+)
+async def bulk_create_company_employees(
+    company_slug: str,
+    file: UploadFile,
+    user_manager: BaseUserManager = Depends(get_user_manager),
+    session: AsyncSession = Depends(get_async_session),
+) -> BulkEmployeesResponseSchema:
+    """
+    Массово создает сотрудников компании из файла.
+    Доступно только пользователю-админу компании.
+    Проверяет существует ли компания. Если нет, вернется ответ со статусом 404.
+    В пути принимает 'company_slug' - значение `slug` компании.
+    Принимает файл .csv с заголовком или .jsonl (по объекту на строку) с полями схемы
+    UserCreateSchema; company_id берется из компании в пути.
+    Строки с ошибками не сохраняются, остальные сотрудники создаются.
+    Параметры декоратора:
+        path: URL-адрес, который будет использоваться для этой операции.
+        response_model: тип, который будет использоваться для ответа: Pydantic-схема.
+        summary: краткое описание.
+    Параметры функции:
+        company_slug: значение `slug` компании.
+        file: файл со списком сотрудников.
+        user_manager: менеджер для пользователей.
+        session: асинхронная сессия.
+    Вернет JSON, пример:
+    {
+      "created_count": 1,
+      "created_ids": ["3fa85f64-5717-4562-b3fc-2c963f66afa6"],
+      "errors": [
+        {
+          "row": 2,
+          "email": "user@example.com",
+          "errors": ["Пользователь с данным email уже существует."]
+        }
+      ]
+    }
+    Если формат файла не поддерживается, ответ со статусом 400.
+    """
+    company = await company_cache.get(session, company_slug)
+    return await bulk_create_employees(
+        session, user_manager, company.id, await file.read(), file.filename
+    )
+
+
 @router.post(
     '/{company_slug}/employees/import',
     status_code=status.HTTP_200_OK,
@@ -452,11 +510,12 @@ async def create_company_employee(
 async def import_employees(
     company_slug: str,
     session: AsyncSession = Depends(get_async_session),
-) -> Sequence[bytes]:
+) -> StreamingResponse:
     """
     Импортирует список сотрудников компании.
     Доступно только пользователю-админу компании.
     Проверяет существует ли компания и после, передает id компании для фильтрации списка.
+    Файл формируется потоково, без ограничения на число сотрудников.
     В пути принимает 'company_slug' - значение `slug` компании.
     Параметры декоратора:
         path: URL-адрес, который будет использоваться для этой операции.
@@ -464,11 +523,12 @@ async def import_employees(
     Параметры функции:
         company_slug: значение `slug` компании.
         session: асинхронная сессия.
-    Вернет файл .txt с данными сотрудников.
+    Вернет файл .csv с данными сотрудников.
     """
-    company = await validator_check_object_exists(session, company_crud, object_slug=company_slug)
-    employees_list = await user_crud.get_multi(session, filters={'company_id': company.id})
-    return await company_crud.get_import(objects_in=employees_list, file_name='employees_list')
+    company = await company_cache.get(session, company_slug)
+    return await company_crud.get_export(
+        session, user_crud, {'company_id': company.id}, 'employees_list'
+    )
 
 
 @router.get(
@@ -523,7 +583,7 @@ async def get_employee(
     }
     Если сотрудник не найден ответ со статусом 404.
     """
-    await validator_check_object_exists(session, company_crud, object_slug=company_slug)
+    await company_cache.get(session, company_slug)
     return await user_crud.get_or_404(session=session, obj_id=uuid)
 
 
@@ -583,7 +643,7 @@ async def update_company_employee(
     }
     Если сотрудник не найден ответ со статусом 404.
     """
-    await validator_check_object_exists(session, company_crud, object_slug=company_slug)
+    await company_cache.get(session, company_slug)
     await validator_check_object_exists(session, user_crud, object_id=uuid)
     await validate_user_not_exists(user_data=object_in, user_manager=user_manager)
     await validate_password(user_data=object_in, user_manager=user_manager)
@@ -622,7 +682,7 @@ async def delete_company_employee(
     При успешной транзакции вернет ответ со статусом 204.
     Если компания или отдел не найдены ответ со статусом 404.
     """
-    await validator_check_object_exists(session, company_crud, object_slug=company_slug)
+    await company_cache.get(session, company_slug)
     await validator_check_object_exists(session, user_crud, object_id=uuid)
     user = await user_manager.get(uuid)
     await user_manager.delete(user)
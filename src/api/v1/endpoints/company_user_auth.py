@@ -3,6 +3,7 @@ from fastapi.responses import JSONResponse
 from fastapi.security import OAuth2PasswordRequestForm
 from fastapi_users import BaseUserManager, models
 from fastapi_users.authentication import Strategy
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.v1.auth.dependencies import (
     get_current_user_refresh_token,
@@ -10,11 +11,12 @@ from src.api.v1.auth.dependencies import (
     tabit_user,
 )
 from src.api.v1.auth.jwt import jwt_auth_backend_user
-from src.api.v1.auth.managers import get_user_manager
+from src.api.v1.auth.managers import UserManager, get_user_manager
 from src.api.v1.auth.protocol import StrategyT
 from src.api.v1.auth.schema_token import TokenReadSchemas
 from src.api.v1.constants import Description, Summary
 from src.api.v1.validator import check_user_is_active
+from src.database.db_depends import get_async_session
 from src.tabit_management.models import TabitAdminUser
 
 router = APIRouter()
@@ -30,6 +32,7 @@ async def login(
     credentials: OAuth2PasswordRequestForm = Depends(),
     user_manager: BaseUserManager[models.UP, models.ID] = Depends(get_user_manager),
     strategy: StrategyT[models.UP, models.ID] = Depends(jwt_auth_backend_user.get_strategy),
+    session: AsyncSession = Depends(get_async_session),
 ) -> JSONResponse:
     """
     Авторизация пользователей сервиса.
@@ -43,6 +46,7 @@ async def login(
         credentials: данные возвращаемые из формы запроса.
         user_manager: менеджер управления пользователей сервиса, вызывается через зависимости.
         strategy: стратегия получения токена.
+        session: асинхронная сессия SQLAlchemy.
     Вернет JSON, пример:
         {
             "access_token": "<зашифрованная строка>",
@@ -52,12 +56,9 @@ async def login(
     """
     user = await user_manager.authenticate(credentials)
     check_user_is_active(user)
-    return await jwt_auth_backend_user.login_with_refresh(strategy, user)  # type: ignore[misc]
+    return await jwt_auth_backend_user.login_with_refresh(strategy, user, session)  # type: ignore[misc]
 
 
-# Cо стороны backend не реализованны какие либо действия при logout пользователя.
-# Идет пустой ответ со статусом 204.
-# TODO: Либо упростить (возвращает None, status_code=204), либо добавить логику в backend.
 @router.post(
     '/logout',
     summary=Summary.COMPANY_USER_AUTH_LOGOUT,
@@ -66,21 +67,56 @@ async def login(
 async def logout(
     user_token: tuple[models.UP, str] = Depends(get_current_user_token),
     strategy: Strategy[models.UP, models.ID] = Depends(jwt_auth_backend_user.get_strategy),
+    session: AsyncSession = Depends(get_async_session),
 ) -> Response:
     """
     Выход из системы пользователей сервиса.
+    Отзывает сессию токена: access и refresh токены этой пары больше не принимаются,
+    токены других устройств пользователя остаются действительными.
 
     Параметры декоратора:
         path: присвоен не явно. URL-адрес, который будет использоваться для этой операции.
         summary: краткое описание.
         description: подробное описание.
     Параметры функции:
-        user_and_access_token: : получение пользователя и его access-токена через зависимость из
+        user_token: получение пользователя и его access-токена через зависимость из
             данных запроса.
         strategy: стратегия получения токена.
+        session: асинхронная сессия SQLAlchemy.
     """
     user, token = user_token
-    return await jwt_auth_backend_user.logout(strategy, user, token)
+    return await jwt_auth_backend_user.logout(strategy, user, token, session)
+
+
+@router.post(
+    '/logout-all',
+    summary=Summary.COMPANY_USER_AUTH_LOGOUT_ALL,
+    description=Description.COMPANY_USER_AUTH_LOGOUT_ALL,
+)
+async def logout_all(
+    user_token: tuple[models.UP, str] = Depends(get_current_user_token),
+    user_manager: UserManager = Depends(get_user_manager),
+    strategy: Strategy[models.UP, models.ID] = Depends(jwt_auth_backend_user.get_strategy),
+    session: AsyncSession = Depends(get_async_session),
+) -> Response:
+    """
+    Выход из системы пользователей сервиса на всех устройствах.
+    Отзывает все выданные пользователю access и refresh токены, увеличивая версию токенов.
+
+    Параметры декоратора:
+        path: присвоен не явно. URL-адрес, который будет использоваться для этой операции.
+        summary: краткое описание.
+        description: подробное описание.
+    Параметры функции:
+        user_token: получение пользователя и его access-токена через зависимость из
+            данных запроса.
+        user_manager: менеджер управления пользователей сервиса, вызывается через зависимости.
+        strategy: стратегия получения токена.
+        session: асинхронная сессия SQLAlchemy.
+    """
+    user, token = user_token
+    await user_manager.revoke_tokens(user)
+    return await jwt_auth_backend_user.logout(strategy, user, token, session)
 
 
 @router.post(
@@ -92,6 +128,7 @@ async def logout(
 async def refresh_token_tabit_admin(
     user_and_refresh_token: tuple[TabitAdminUser, str] = Depends(get_current_user_refresh_token),
     strategy: StrategyT[models.UP, models.ID] = Depends(jwt_auth_backend_user.get_strategy),
+    session: AsyncSession = Depends(get_async_session),
 ) -> JSONResponse:
     """
     Обновление токенов для пользователя сервиса.
@@ -108,6 +145,7 @@ async def refresh_token_tabit_admin(
         user_and_refresh_token: получение пользователя и его refresh-токена через зависимость из
             данных запроса.
         strategy: стратегия получения токена.
+        session: асинхронная сессия SQLAlchemy.
     Вернет JSON, пример:
         {
             "access_token": "<зашифрованная строка>",
@@ -115,9 +153,11 @@ async def refresh_token_tabit_admin(
             "token_type": "bearer"
         }
     """
-    user, _ = user_and_refresh_token
+    user, refresh_token = user_and_refresh_token
     check_user_is_active(user)
-    return await jwt_auth_backend_user.login_with_refresh(strategy, user)  # type: ignore[misc]
+    return await jwt_auth_backend_user.login_with_refresh(  # type: ignore[misc]
+        strategy, user, session, refresh_token
+    )
 
 
 # TODO: реализовать нормальное восстановление пароля, если забыл
@@ -1,16 +1,14 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.v1.auth.dependencies import current_user_tabit
-from src.api.v1.validators import (
-    check_comment_and_message_feed,
-    check_comment_has_likes_from_user,
-    check_comment_owner,
-    get_access_to_comments,
-    get_access_to_feeds,
-)
-from src.database.db_depends import get_async_session
-from src.problems.crud import comment_crud, message_feed_crud
+from src.api.v1.validators import check_comment_owner, check_message_feed_owner, get_feed_access
+from src.database.db_depends import get_async_read_session, get_async_session
+from src.pagination import CountMode, paginate
+from src.problems.constants import FEED_EVENTS_MEDIA_TYPE, VALID_FEED_EVENTS_DISABLED
+from src.problems.crud import comment_crud, message_feed_crud, voting_crud
+from src.problems.events import feed_broker
 from src.problems.schemas import (
     CommentCreate,
     CommentRead,
@@ -18,40 +16,103 @@ from src.problems.schemas import (
     FeedsFilterSchema,
     MessageFeedCreate,
     MessageFeedRead,
+    MessageFeedSummaryRead,
+    PollCreate,
+    PollRead,
+    ThreadsFilterSchema,
+    VoteCreate,
 )
+from src.users.crud.user import user_crud
 from src.users.models import UserTabit
 
 router = APIRouter()
 
 
+@router.get(
+    '/events',
+    summary='Подписаться на события ленты проблемы (Server-Sent Events).',
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def stream_problem_events(
+    company_slug: str,
+    problem_id: int,
+    session: AsyncSession = Depends(get_async_read_session),
+    user: UserTabit = Depends(current_user_tabit),
+) -> StreamingResponse:
+    """
+    Поток событий ленты проблемы в формате Server-Sent Events: создание тредов и
+    комментариев, лайки комментариев. Событие содержит тип и id изменённых объектов.
+    Сессия используется только для проверки доступа и не удерживается потоком.
+    Если клиент не успевает читать события, поток закрывается, и клиент должен
+    переподключиться. Если события отключены, возвращается HTTP 503.
+
+    Параметры:
+        company_slug: path-параметр, слаг компании;
+        problem_id: path-параметр, id запрашиваемой проблемы;
+        session: асинхронная сессия SQLAlchemy;
+        user: объект пользователя, сделавшего запрос к API.
+    Доступ только для сотрудников компаний.
+    """
+    await get_feed_access(session, user.company_id, company_slug, problem_id)
+    if not feed_broker.is_listening:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=VALID_FEED_EVENTS_DISABLED
+        )
+    return StreamingResponse(
+        feed_broker.stream(problem_id),
+        media_type=FEED_EVENTS_MEDIA_TYPE,
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
+
+
 @router.get(
     '/thread',
     summary='Получить список всех тредов по проблеме.',
-    response_model=list[MessageFeedRead],
+    response_model=list[MessageFeedSummaryRead],
     status_code=status.HTTP_200_OK,
 )
 async def get_all_threads(
     company_slug: str,
     problem_id: int,
-    query_params: FeedsFilterSchema = Depends(),
-    session: AsyncSession = Depends(get_async_session),
+    response: Response,
+    query_params: ThreadsFilterSchema = Depends(),
+    session: AsyncSession = Depends(get_async_read_session),
     user: UserTabit = Depends(current_user_tabit),
-) -> list[MessageFeedRead]:
+) -> list[MessageFeedSummaryRead]:
     """
-    Получает список всех тредов по проблеме.
+    Получает список всех тредов по проблеме со сводкой: число комментариев, дата и автор
+    последнего комментария. Сводка хранится в самом треде и читается тем же запросом,
+    что и страница тредов; авторы тредов и последних комментариев страницы загружаются
+    одним запросом.
 
     Параметры:
         company_slug: path-параметр, слаг компании;
         problem_id: path-параметр, id запрашиваемой проблемы;
-        query_params: схема, содержащая данные для ограничения выброки;
+        response: объект ответа, в заголовки X-Next-Cursor и X-Total-Count передаются
+            курсор следующей страницы и общее число объектов;
+        query_params: схема, содержащая данные для ограничения выброки и сортировки;
         session: асинхронная сессия SQLAlchemy;
         user: объект пользователя, сделавшего запрос к API.
     Доступ только для сотрудников компаний.
     """
-    await get_access_to_feeds(user.company_id, company_slug, problem_id, session)
-    return await message_feed_crud.get_multi(
-        session, query_params.skip, query_params.limit, filters={'problem_id': problem_id}
+    await get_feed_access(session, user.company_id, company_slug, problem_id)
+    threads = await paginate(
+        message_feed_crud,
+        session,
+        response,
+        query_params,
+        filters={'problem_id': problem_id},
+        order_by=[query_params.ordering] if query_params.ordering else None,
+        company_id=user.company_id,
+        count_mode=CountMode.EXACT,
+    )
+    loader = user_crud.short_loader(session)
+    await loader.load_many(
+        key for thread in threads for key in (thread.owner_id, thread.last_comment_owner_id)
     )
+    await loader.attach(threads, 'owner_id', 'author')
+    return await loader.attach(threads, 'last_comment_owner_id', 'last_comment_author')
 
 
 @router.post(
@@ -79,8 +140,10 @@ async def create_problem_thread(
         user: объект пользователя, сделавшего запрос к API.
     Доступ только для сотрудников компаний.
     """
-    await get_access_to_feeds(user.company_id, company_slug, problem_id, session)
-    return await message_feed_crud.create(session, create_data, problem_id, user.id)
+    await get_feed_access(session, user.company_id, company_slug, problem_id)
+    message_feed = await message_feed_crud.create(session, create_data, problem_id, user.id)
+    message_feed.author = user
+    return message_feed
 
 
 @router.get(
@@ -93,26 +156,37 @@ async def get_thread_comments(
     company_slug: str,
     problem_id: int,
     thread_id: int,
+    response: Response,
     query_params: FeedsFilterSchema = Depends(),
-    session: AsyncSession = Depends(get_async_session),
+    session: AsyncSession = Depends(get_async_read_session),
     user: UserTabit = Depends(current_user_tabit),
 ) -> list[CommentRead]:
     """
-    Получить все комментарии треда.
+    Получить все комментарии треда. Авторы комментариев страницы встраиваются в ответ
+    и загружаются одним запросом.
 
     Параметры:
         company_slug: path-параметр, слаг компании;
         problem_id: path-параметр, id запрашиваемой проблемы;
         thread_id: path-параметр, id запрашиваемого треда;
+        response: объект ответа, в заголовки X-Next-Cursor и X-Total-Count передаются
+            курсор следующей страницы и общее число объектов;
         query_params: схема, содержащая данные для ограничения выброки;
         session: асинхронная сессия SQLAlchemy;
         user: объект пользователя, сделавшего запрос к API.
     Доступ только для сотрудников компаний.
     """
-    await get_access_to_comments(user.company_id, company_slug, problem_id, thread_id, session)
-    return await comment_crud.get_multi(
-        session, query_params.skip, query_params.limit, filters={'message_id': thread_id}
+    await get_feed_access(session, user.company_id, company_slug, problem_id, thread_id)
+    comments = await paginate(
+        comment_crud,
+        session,
+        response,
+        query_params,
+        filters={'message_id': thread_id},
+        company_id=user.company_id,
+        count_mode=CountMode.EXACT,
     )
+    return await user_crud.short_loader(session).attach(comments, 'owner_id', 'author')
 
 
 @router.post(
@@ -141,8 +215,10 @@ async def create_thread_comment(
         user: объект пользователя, сделавшего запрос к API.
     Доступ только для сотрудников компаний.
     """
-    await get_access_to_comments(user.company_id, company_slug, problem_id, thread_id, session)
-    return await comment_crud.create(session, create_data, thread_id, user.id)
+    await get_feed_access(session, user.company_id, company_slug, problem_id, thread_id)
+    comment = await comment_crud.create(session, create_data, thread_id, user.id)
+    comment.author = user
+    return comment
 
 
 @router.patch(
@@ -173,10 +249,14 @@ async def update_thread_comment(
         user: объект пользователя, сделавшего запрос к API.
     Доступ только для сотрудников компаний.
     """
-    await get_access_to_comments(user.company_id, company_slug, problem_id, thread_id, session)
-    comment = await check_comment_and_message_feed(comment_id, thread_id, session)
+    access = await get_feed_access(
+        session, user.company_id, company_slug, problem_id, thread_id, comment_id
+    )
+    comment = access.comment
     await check_comment_owner(comment, user.id)
-    return await comment_crud.update(session, comment, update_data)
+    comment = await comment_crud.update(session, comment, update_data)
+    comment.author = user
+    return comment
 
 
 @router.delete(
@@ -204,8 +284,10 @@ async def delete_thread_comment(
         user: объект пользователя, сделавшего запрос к API.
     Доступ только для сотрудников компаний.
     """
-    await get_access_to_comments(user.company_id, company_slug, problem_id, thread_id, session)
-    comment = await check_comment_and_message_feed(comment_id, thread_id, session)
+    access = await get_feed_access(
+        session, user.company_id, company_slug, problem_id, thread_id, comment_id
+    )
+    comment = access.comment
     await check_comment_owner(comment, user.id)
     await comment_crud.remove(session, comment)
 
@@ -235,11 +317,11 @@ async def like_a_comment(
         user: объект пользователя, сделавшего запрос к API.
     Доступ только для сотрудников компаний.
     """
-    await get_access_to_comments(user.company_id, company_slug, problem_id, thread_id, session)
-    comment = await check_comment_and_message_feed(comment_id, thread_id, session)
-    await check_comment_has_likes_from_user(user.id, comment_id, session, like_mode=True)
-    await check_comment_owner(comment, user.id, like_mode=True)
-    await comment_crud.like(comment, user.id, session)
+    access = await get_feed_access(
+        session, user.company_id, company_slug, problem_id, thread_id, comment_id
+    )
+    await check_comment_owner(access.comment, user.id, like_mode=True)
+    await comment_crud.like(comment_id, user.id, session)
 
 
 @router.get(
@@ -267,8 +349,128 @@ async def unlike_a_comment(
         user: объект пользователя, сделавшего запрос к API.
     Доступ только для сотрудников компаний.
     """
-    await get_access_to_comments(user.company_id, company_slug, problem_id, thread_id, session)
-    comment = await check_comment_and_message_feed(comment_id, thread_id, session)
-    await check_comment_owner(comment, user.id, like_mode=True)
-    user_comment_obj = await check_comment_has_likes_from_user(user.id, comment_id, session)
-    await comment_crud.unlike(user_comment_obj, comment, session)
+    access = await get_feed_access(
+        session, user.company_id, company_slug, problem_id, thread_id, comment_id
+    )
+    await check_comment_owner(access.comment, user.id, like_mode=True)
+    await comment_crud.unlike(comment_id, user.id, session)
+
+
+@router.post(
+    '/{thread_id}/poll',
+    summary='Начать голосование в треде.',
+    response_model=PollRead,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_thread_poll(
+    company_slug: str,
+    problem_id: int,
+    thread_id: int,
+    create_data: PollCreate,
+    session: AsyncSession = Depends(get_async_session),
+    user: UserTabit = Depends(current_user_tabit),
+) -> PollRead:
+    """
+    Создание голосования в треде.
+
+    Параметры:
+        company_slug: path-параметр, слаг компании;
+        problem_id: path-параметр, id запрашиваемой проблемы;
+        thread_id: path-параметр, id запрашиваемого треда;
+        create_data: объект схемы с вариантами голосования;
+        session: асинхронная сессия SQLAlchemy;
+        user: объект пользователя, сделавшего запрос к API.
+    Доступ только для автора треда.
+    """
+    access = await get_feed_access(session, user.company_id, company_slug, problem_id, thread_id)
+    await check_message_feed_owner(access.message_feed, user.id)
+    return await voting_crud.create_poll(session, thread_id, create_data.options)
+
+
+@router.get(
+    '/{thread_id}/poll',
+    summary='Получить результаты голосования в треде.',
+    response_model=PollRead,
+    status_code=status.HTTP_200_OK,
+)
+async def get_thread_poll(
+    company_slug: str,
+    problem_id: int,
+    thread_id: int,
+    session: AsyncSession = Depends(get_async_read_session),
+    user: UserTabit = Depends(current_user_tabit),
+) -> PollRead:
+    """
+    Получить результаты голосования в треде и выбор текущего пользователя.
+
+    Параметры:
+        company_slug: path-параметр, слаг компании;
+        problem_id: path-параметр, id запрашиваемой проблемы;
+        thread_id: path-параметр, id запрашиваемого треда;
+        session: асинхронная сессия SQLAlchemy;
+        user: объект пользователя, сделавшего запрос к API.
+    Доступ только для сотрудников компаний.
+    """
+    await get_feed_access(session, user.company_id, company_slug, problem_id, thread_id)
+    return await voting_crud.get_results(session, thread_id, user.id)
+
+
+@router.post(
+    '/{thread_id}/poll/vote',
+    summary='Проголосовать или изменить голос в треде.',
+    response_model=PollRead,
+    status_code=status.HTTP_200_OK,
+)
+async def vote_in_thread_poll(
+    company_slug: str,
+    problem_id: int,
+    thread_id: int,
+    vote_data: VoteCreate,
+    session: AsyncSession = Depends(get_async_session),
+    user: UserTabit = Depends(current_user_tabit),
+) -> PollRead:
+    """
+    Голос за вариант голосования в треде. Повторный голос за другой вариант
+    изменяет выбор пользователя.
+
+    Параметры:
+        company_slug: path-параметр, слаг компании;
+        problem_id: path-параметр, id запрашиваемой проблемы;
+        thread_id: path-параметр, id запрашиваемого треда;
+        vote_data: объект схемы с id выбранного варианта;
+        session: асинхронная сессия SQLAlchemy;
+        user: объект пользователя, сделавшего запрос к API.
+    Доступ только для сотрудников компаний.
+    """
+    await get_feed_access(session, user.company_id, company_slug, problem_id, thread_id)
+    await voting_crud.vote(session, thread_id, vote_data.option_id, user.id)
+    return await voting_crud.get_results(session, thread_id, user.id)
+
+
+@router.delete(
+    '/{thread_id}/poll/vote',
+    summary='Отозвать свой голос в треде.',
+    response_model=PollRead,
+    status_code=status.HTTP_200_OK,
+)
+async def unvote_in_thread_poll(
+    company_slug: str,
+    problem_id: int,
+    thread_id: int,
+    session: AsyncSession = Depends(get_async_session),
+    user: UserTabit = Depends(current_user_tabit),
+) -> PollRead:
+    """
+    Отозвать свой голос в голосовании треда.
+
+    Параметры:
+        company_slug: path-параметр, слаг компании;
+        problem_id: path-параметр, id запрашиваемой проблемы;
+        thread_id: path-параметр, id запрашиваемого треда;
+        session: асинхронная сессия SQLAlchemy;
+        user: объект пользователя, сделавшего запрос к API.
+    Доступ только для сотрудников компаний.
+    """
+    await get_feed_access(session, user.company_id, company_slug, problem_id, thread_id)
+    await voting_crud.unvote(session, thread_id, user.id)
+    return await voting_crud.get_results(session, thread_id, user.id)
@@ -41,10 +41,10 @@ async def meetings(
     Возвращаемое значение:
         Список объектов MeetingResponseSchema.
     """
-    await check_company_exists(company_slug, session)
-    await check_problem_exists(problem_id, session)
+    company = await check_company_exists(company_slug, session)
+    await check_problem_exists(problem_id, session, company.id)
     filters = {'problem_id': problem_id}
-    return await meeting_crud.get_multi(session, filters=filters)
+    return await meeting_crud.get_multi(session, filters=filters, company_id=company.id)
 
 
 @router.post(
@@ -72,11 +72,12 @@ async def create_meeting(
     Возвращаемое значение:
         Объект MeetingResponseSchema.
     """
-    await check_company_exists(company_slug, session)
-    await check_problem_exists(problem_id, session)
+    company = await check_company_exists(company_slug, session)
+    await check_problem_exists(problem_id, session, company.id)
     await check_meeting_title_unique(meeting.title, session)
     await check_meeting_date_available(meeting.date_meeting, session)
     meeting_data = meeting.model_dump()
+    meeting_data['problem_id'] = problem_id
     members = meeting.members or []
     created_meeting = await meeting_crud.create_with_members(
         session=session, meeting_data=meeting_data, members=members
@@ -109,9 +110,9 @@ async def get_meeting(
     Возвращаемое значение:
         Объект MeetingResponseSchema.
     """
-    await check_company_exists(company_slug, session)
-    await check_problem_exists(problem_id, session)
-    return await meeting_crud.get_or_404(session, meeting_id)
+    company = await check_company_exists(company_slug, session)
+    await check_problem_exists(problem_id, session, company.id)
+    return await meeting_crud.get_or_404(session, meeting_id, company_id=company.id)
 
 
 @router.patch(
@@ -141,11 +142,11 @@ async def update_meeting(
     Возвращаемое значение:
         Объект MeetingResponseSchema.
     """
-    await check_company_exists(company_slug, session)
-    await check_problem_exists(problem_id, session)
+    company = await check_company_exists(company_slug, session)
+    await check_problem_exists(problem_id, session, company.id)
     await check_meeting_title_unique(meeting.title, session)
     await check_meeting_date_available(meeting.date_meeting, session)
-    return await meeting_crud.update_meeting(session, meeting_id, meeting.model_dump())
+    return await meeting_crud.update_meeting(session, meeting_id, meeting.model_dump(), company.id)
 
 
 @router.delete(
@@ -171,6 +172,6 @@ async def delete_meeting(
     Возвращаемое значение:
         None.
     """
-    await check_company_exists(company_slug, session)
-    await check_problem_exists(problem_id, session)
-    await meeting_crud.delete_meeting(session, meeting_id)
+    company = await check_company_exists(company_slug, session)
+    await check_problem_exists(problem_id, session, company.id)
+    await meeting_crud.delete_meeting(session, meeting_id, company.id)
@@ -1,11 +1,12 @@
 from typing import List
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.v1.validators.problems_validators import check_company_exists
 from src.database.db_depends import get_async_session
 from src.problems.crud.problems import problem_crud
+from src.problems.schemas import ProblemFilterSchema
 from src.problems.schemas.problem import (
     ProblemCreateSchema,
     ProblemResponseSchema,
@@ -22,20 +23,26 @@ router = APIRouter()
     summary='Получить список всех проблем',
     status_code=status.HTTP_200_OK,
 )
-async def get_all_problems(company_slug: str, session: AsyncSession = Depends(get_async_session)):
+async def get_all_problems(
+    company_slug: str,
+    filters: ProblemFilterSchema = Query(),
+    session: AsyncSession = Depends(get_async_session),
+):
     """Получает список всех проблем.
 
     Назначение:
         Возвращает список всех проблем для указанной компании.
     Параметры:
         company_slug: Уникальный идентификатор компании.
+        filters: Фильтры по названию (name__ilike), статусам (status__in) и типам (type__in).
         session: Асинхронная сессия SQLAlchemy.
     Возвращаемое значение:
         Список объектов ProblemResponseSchema.
     """
-    await check_company_exists(company_slug, session)
-    filters = {'company_slug': company_slug}
-    return await problem_crud.get_multi(session, filters=filters)
+    company = await check_company_exists(company_slug, session)
+    return await problem_crud.get_multi(
+        session, filters=filters.model_dump(exclude_none=True), company_id=company.id
+    )
 
 
 @router.post(
@@ -61,8 +68,9 @@ async def create_problem(
     Возвращаемое значение:
         Созданный объект ProblemResponseSchema.
     """
-    await check_company_exists(company_slug, session)
+    company = await check_company_exists(company_slug, session)
     problem_data = problem.model_dump()
+    problem_data['company_id'] = company.id
     members = problem.members or []
     created_problem = await problem_crud.create_problem_with_members(
         session=session, problem_data=problem_data, members=members
@@ -93,8 +101,8 @@ async def get_problem(
     Возвращаемое значение:
         Объект ProblemResponseSchema.
     """
-    await check_company_exists(company_slug, session)
-    return await problem_crud.get_or_404(session, problem_id)
+    company = await check_company_exists(company_slug, session)
+    return await problem_crud.get_or_404(session, problem_id, company_id=company.id)
 
 
 @router.patch(
@@ -122,8 +130,8 @@ async def update_problem(
     Возвращаемое значение:
         Обновленный объект ProblemResponseSchema.
     """
-    await check_company_exists(company_slug, session)
-    return await problem_crud.update_problem(session, problem_id, problem)
+    company = await check_company_exists(company_slug, session)
+    return await problem_crud.update_problem(session, problem_id, problem, company.id)
 
 
 @router.delete(
@@ -147,5 +155,5 @@ async def delete_problem(
     Возвращаемое значение:
         None
     """
-    await check_company_exists(company_slug, session)
-    await problem_crud.delete_problem(session, problem_id)
+    company = await check_company_exists(company_slug, session)
+    await problem_crud.delete_problem(session, problem_id, company.id)
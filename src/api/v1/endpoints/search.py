@@ -0,0 +1,48 @@
+from fastapi import APIRouter, Depends, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.v1.auth.dependencies import current_user_tabit
+from src.api.v1.validators import get_user_company
+from src.constants import NEXT_CURSOR_HEADER
+from src.database.db_depends import get_async_read_session
+from src.problems.schemas import SearchQuerySchema, SearchResultRead
+from src.problems.search import search_feeds
+from src.users.models import UserTabit
+
+router = APIRouter()
+
+
+@router.get(
+    '/{company_slug}/search',
+    summary='Полнотекстовый поиск по проблемам, тредам и комментариям компании.',
+    response_model=list[SearchResultRead],
+    status_code=status.HTTP_200_OK,
+)
+async def search_company_feeds(
+    company_slug: str,
+    response: Response,
+    query_params: SearchQuerySchema = Depends(),
+    session: AsyncSession = Depends(get_async_read_session),
+    user: UserTabit = Depends(current_user_tabit),
+) -> list[SearchResultRead]:
+    """
+    Ищет слова запроса в названиях и описаниях проблем, тредах и комментариях компании
+    пользователя. Результаты отсортированы по релевантности и содержат фрагменты текста
+    с выделенными совпадениями.
+
+    Параметры:
+        company_slug: path-параметр, слаг компании;
+        response: объект ответа, в заголовок X-Next-Cursor передаётся курсор следующей
+            страницы;
+        query_params: схема с поисковым запросом и параметрами пагинации;
+        session: асинхронная сессия SQLAlchemy;
+        user: объект пользователя, сделавшего запрос к API.
+    Доступ только для сотрудников компаний.
+    """
+    company = await get_user_company(session, user.company_id, company_slug)
+    results, next_cursor = await search_feeds(
+        session, company.id, query_params.q, query_params.limit, query_params.cursor
+    )
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return results
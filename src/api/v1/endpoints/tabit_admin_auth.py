@@ -229,6 +229,7 @@ router.include_router(  # форгот и резет пассворд
 async def refresh_token_tabit_admin(
     user_and_refresh_token: tuple[TabitAdminUser, str] = Depends(get_current_admin_refresh_token),
     strategy: StrategyT[models.UP, models.ID] = Depends(jwt_auth_backend_admin.get_strategy),
+    session: AsyncSession = Depends(get_async_session),
 ) -> JSONResponse:
     """
     Обновление токенов для администраторов сервиса.
@@ -245,6 +246,7 @@ async def refresh_token_tabit_admin(
         user_and_refresh_token: получение администратора и его refresh-токена через зависимость из
             данных запроса.
         strategy: стратегия получения токена.
+        session: асинхронная сессия SQLAlchemy.
     Вернет JSON, пример:
         {
             "access_token": "<зашифрованная строка>",
@@ -252,9 +254,11 @@ async def refresh_token_tabit_admin(
             "token_type": "bearer"
         }
     """
-    user, _ = user_and_refresh_token
+    user, refresh_token = user_and_refresh_token
     check_user_is_active(user)
-    return await jwt_auth_backend_admin.login_with_refresh(strategy, user)  # type: ignore[misc]
+    return await jwt_auth_backend_admin.login_with_refresh(  # type: ignore[misc]
+        strategy, user, session, refresh_token
+    )
 
 
 @router.post(
@@ -303,6 +307,7 @@ async def login(
     credentials: OAuth2PasswordRequestForm = Depends(),
     user_manager: BaseUserManager[models.UP, models.ID] = Depends(get_admin_manager),
     strategy: StrategyT[models.UP, models.ID] = Depends(jwt_auth_backend_admin.get_strategy),
+    session: AsyncSession = Depends(get_async_session),
 ) -> JSONResponse:
     """
     Авторизация администраторов сервиса.
@@ -316,6 +321,7 @@ async def login(
         credentials: данные возвращаемые из формы запроса.
         user_manager: менеджер управления администраторов сервиса, вызывается через зависимости.
         strategy: стратегия получения токена.
+        session: асинхронная сессия SQLAlchemy.
     Вернет JSON, пример:
         {
             "access_token": "<зашифрованная строка>",
@@ -325,12 +331,9 @@ async def login(
     """
     user = await user_manager.authenticate(credentials)
     check_user_is_active(user)
-    return await jwt_auth_backend_admin.login_with_refresh(strategy, user)  # type: ignore[misc]
+    return await jwt_auth_backend_admin.login_with_refresh(strategy, user, session)  # type: ignore[misc]
 
 
-# Cо стороны backend не реализованны какие либо действия при logout пользователя.
-# Идет пустой ответ со статусом 204.
-# TODO: Либо упростить (возвращает None, status_code=204), либо добавить логику в backend.
 @router.post(
     '/logout',
     summary=Summary.TABIT_ADMIN_AUTH_LOGOUT,
@@ -339,9 +342,11 @@ async def login(
 async def logout(
     user_and_access_token: tuple[models.UP, str] = Depends(get_current_admin_token),
     strategy: Strategy[models.UP, models.ID] = Depends(jwt_auth_backend_admin.get_strategy),
+    session: AsyncSession = Depends(get_async_session),
 ) -> Response:
     """
     Выход из системы администраторов сервиса.
+    Отзывает сессию токена: access и refresh токены этой пары больше не принимаются.
 
     Параметры декоратора:
         path: присвоен не явно. URL-адрес, который будет использоваться для этой операции.
@@ -351,6 +356,7 @@ async def logout(
         user_and_access_token: : получение администратора и его access-токена через зависимость из
             данных запроса.
         strategy: стратегия получения токена.
+        session: асинхронная сессия SQLAlchemy.
     """
     user, token = user_and_access_token
-    return await jwt_auth_backend_admin.logout(strategy, user, token)
+    return await jwt_auth_backend_admin.logout(strategy, user, token, session)
@@ -1,15 +1,19 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
 from fastapi_users.manager import BaseUserManager
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.v1.auth.dependencies import current_admin_tabit
+from src.api.v1.auth.dependencies import current_admin_tabit, current_superuser
 from src.api.v1.auth.managers import get_user_manager
+from src.api.v1.auth.password import password_hasher
 from src.api.v1.validators import (
     check_telegram_username_for_duplicates,
 )
+from src.companies.cache import company_cache
 from src.database.db_depends import get_async_session
+from src.database.engine import get_pool_metrics
+from src.pagination import CountMode, paginate
 from src.tabit_management.crud.admin_company import admin_company_crud
 from src.tabit_management.crud.admin_user import admin_user_crud
 from src.tabit_management.schemas.admin_company import (
@@ -30,12 +34,15 @@ router = APIRouter()
     summary='Получить общую информацию по компаниям.',
 )
 async def get_all_info(
+    response: Response,
     session: AsyncSession = Depends(get_async_session),
     query_params: CompanyFilterSchema = Depends(),
 ) -> list[AdminCompanyResponseSchema]:
     """
     Получает список компаний с фильтрацией, пагинацией и сортировкой.
     Параметры:
+        response: Объект ответа, в заголовок X-Next-Cursor передаётся курсор следующей страницы,
+            в X-Total-Count - оценка общего числа компаний.
         session: Асинхронная сессия SQLAlchemy.
         query_params: Схема обрабатывающая query-параметры для пагинации, сортировки и фильтрации.
     Возвращаемое значение:
@@ -43,7 +50,60 @@ async def get_all_info(
 
     Эндпоинт доступен только админам сервиса.
     """
-    return await admin_company_crud.get_multi(session, query_params.skip, query_params.limit)
+    return await paginate(
+        admin_company_crud, session, response, query_params, count_mode=CountMode.ESTIMATED
+    )
+
+
+@router.get(
+    '/db-pool',
+    response_model=dict[str, int | float],
+    dependencies=[Depends(current_superuser)],
+    summary='Получить состояние пула соединений с БД.',
+)
+async def get_db_pool_metrics() -> dict[str, int | float]:
+    """
+    Возвращает состояние пула соединений с БД текущего воркера и накопленные метрики
+    выдачи соединений: число выдач, суммарное и максимальное время ожидания, число таймаутов.
+    Используется для подбора числа воркеров uvicorn и размера пула под max_connections Postgres.
+
+    Эндпоинт доступен только суперпользователю сервиса.
+    """
+    return get_pool_metrics()
+
+
+@router.get(
+    '/password-hasher',
+    response_model=dict[str, str | int | float],
+    dependencies=[Depends(current_superuser)],
+    summary='Получить состояние пула хэширования паролей.',
+)
+async def get_password_hasher_metrics() -> dict[str, str | int | float]:
+    """
+    Возвращает настройки пула хэширования паролей текущего воркера, глубину очереди задач
+    и накопленные метрики: число задач, максимальную глубину очереди, суммарное и
+    максимальное время задачи. Растущая очередь означает, что password_hash_workers
+    не хватает для текущего числа входов.
+
+    Эндпоинт доступен только суперпользователю сервиса.
+    """
+    return password_hasher.get_metrics()
+
+
+@router.get(
+    '/company-cache',
+    response_model=dict[str, int | float],
+    dependencies=[Depends(current_superuser)],
+    summary='Получить счётчики кэша компаний.',
+)
+async def get_company_cache_metrics() -> dict[str, int | float]:
+    """
+    Возвращает счётчики кэша компаний по slug текущего воркера: размер, попадания,
+    промахи, долю попаданий и число инвалидаций.
+
+    Эндпоинт доступен только суперпользователю сервиса.
+    """
+    return company_cache.get_metrics()
 
 
 @router.get(
@@ -53,12 +113,15 @@ async def get_all_info(
     summary='Получить информацию по всем сотрудникам компаний.',
 )
 async def get_all_staff(
+    response: Response,
     session: AsyncSession = Depends(get_async_session),
     query_params: UserFilterSchema = Depends(),
 ) -> list[CompanyAdminReadSchema]:
     """
     Получает список сотрудников компаний с фильтрацией, пагинацией и сортировкой.
     Параметры:
+        response: Объект ответа, в заголовок X-Next-Cursor передаётся курсор следующей страницы,
+            в X-Total-Count - оценка общего числа сотрудников.
         session: Асинхронная сессия SQLAlchemy.
         query_params: Схема обрабатывающая query-параметры для пагинации, сортировки и фильтрации.
     Возвращаемое значение:
@@ -66,7 +129,9 @@ async def get_all_staff(
 
     Эндпоинт доступен только админам сервиса.
     """
-    return await admin_user_crud.get_multi(session, query_params.skip, query_params.limit)
+    return await paginate(
+        admin_user_crud, session, response, query_params, count_mode=CountMode.ESTIMATED
+    )
 
 
 @router.post(
@@ -4,25 +4,29 @@
 
 from http import HTTPStatus
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from src.api.v1.auth.dependencies import current_admin_tabit
 from src.api.v1.constants import Description, Summary
-from src.api.v1.utilities import generate_company_slug
 from src.api.v1.validator import validator_check_object_exists
 from src.api.v1.validators.tabit_management_companies_validators import (
     validate_company_slug,
     validate_license_exists,
 )
+from src.companies.cache import company_cache
 from src.companies.crud import company_crud
+from src.companies.models import Company
 from src.companies.schemas import (
     CompanyCreateSchema,
     CompanyResponseSchema,
     CompanyUpdateSchema,
 )
 from src.companies.schemas.company import CompanyTypeFilterSchema
-from src.database.db_depends import get_async_session
+from src.constants import TOTAL_COUNT_HEADER
+from src.database.db_depends import get_async_read_session, get_async_session
+from src.pagination import CountMode
 
 router = APIRouter()
 
@@ -35,7 +39,8 @@ router = APIRouter()
     description=Description.TABIT_MANAGEMENT_COMPANY_LIST,
 )
 async def get_companies(
-    session: AsyncSession = Depends(get_async_session),
+    response: Response,
+    session: AsyncSession = Depends(get_async_read_session),
     filters: CompanyTypeFilterSchema = Depends(),
 ) -> list[CompanyResponseSchema]:
     """
@@ -48,13 +53,18 @@ async def get_companies(
         summary: краткое описание.
         description: подробное описание.
     Параметры функции:
+        response: объект ответа, в заголовок X-Total-Count передаётся число компаний
+            (оценка по статистике таблицы, если фильтр не задан).
         session: асинхронная сессия через зависимость.
     """
-    return await company_crud.get_multi(
+    companies, total = await company_crud.get_page(
         session,
         filters=filters.model_dump(exclude_unset=True),
         order_by=[filters.ordering] if filters.ordering else None,
+        count_mode=CountMode.ESTIMATED,
     )
+    response.headers[TOTAL_COUNT_HEADER] = str(total)
+    return companies
 
 
 @router.post(
@@ -86,10 +96,8 @@ async def create_company(
 
     if company.slug:
         await validate_company_slug(session, company.slug)
-    else:
-        company.slug = await generate_company_slug(session, company.name)
-
-    return await company_crud.create(session, company)
+        return await company_crud.create(session, company)
+    return await company_crud.create_with_slug(session, company, company.name)
 
 
 @router.patch(
@@ -127,7 +135,9 @@ async def update_company(
         )
         object_in = object_in.model_copy(update={'end_license_time': end_license_time})
 
-    return await company_crud.update(session, company, object_in)
+    company = await company_crud.update(session, company, object_in)
+    await company_cache.invalidate(session, company_slug)
+    return company
 
 
 @router.delete(
@@ -154,5 +164,12 @@ async def delete_company(
         user_id: уникальный идентификатор компании `slug`, указанный в path.
         session: асинхронная сессия через зависимость.
     """
-    company = await validator_check_object_exists(session, company_crud, object_slug=company_slug)
+    # Сотрудники удаляются каскадно вместе с компанией, поэтому загружаются явно.
+    company = await validator_check_object_exists(
+        session,
+        company_crud,
+        object_slug=company_slug,
+        options=[selectinload(Company.employees)],
+    )
     await company_crud.remove(session, company)
+    await company_cache.invalidate(session, company_slug)
@@ -2,8 +2,10 @@ from fastapi import APIRouter, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.v1.validators.tabit_management_licenses_validators import validate_license_name
-from src.database.db_depends import get_async_session
+from src.database.db_depends import get_async_read_session, get_async_session
+from src.pagination import CountMode
 from src.tabit_management.constants import (
+    DEFAULT_PAGE,
     SUMMARY_CREATE_LICENSE,
     SUMMARY_DELETE_LICENSE,
     SUMMARY_GET_LICENSE,
@@ -31,7 +33,7 @@ router = APIRouter()
     summary=SUMMARY_GET_LICENSES,
 )
 async def get_licenses(
-    session: AsyncSession = Depends(get_async_session),
+    session: AsyncSession = Depends(get_async_read_session),
     filters: LicenseTypeFilterSchema = Depends(),
 ) -> LicenseTypeListResponseSchema:
     """
@@ -43,22 +45,40 @@ async def get_licenses(
 
     Returns:
         LicenseTypeListResponseSchema: Объект со списком лицензий,
-        общим числом записей, текущей страницей и размером страницы.
+        общим числом записей, текущей страницей, размером страницы
+        и курсором следующей страницы.
+
+    Первая страница и страницы по курсору выбираются без OFFSET, остальные номера
+    страниц обрабатываются через OFFSET для обратной совместимости.
+    Общее число лицензий с учётом фильтров считается тем же запросом, что и страница.
     """
-    licenses = await license_type_crud.get_multi(
-        session=session,
-        skip=filters.page_size * (filters.page - 1),
-        limit=filters.page_size,
-        filters=filters.model_dump(exclude_unset=True),
-        order_by=[filters.ordering] if filters.ordering else None,
-    )
-    total_count = await license_type_crud.get_total_count(session)
+    order_by = [filters.ordering] if filters.ordering else None
+    next_cursor = None
+    if filters.cursor or filters.page == DEFAULT_PAGE:
+        licenses, next_cursor, total_count = await license_type_crud.get_page_by_cursor(
+            session=session,
+            cursor=filters.cursor,
+            limit=filters.page_size,
+            filters=filters.model_dump(exclude_unset=True),
+            order_by=order_by,
+            count_mode=CountMode.EXACT,
+        )
+    else:
+        licenses, total_count = await license_type_crud.get_page(
+            session=session,
+            skip=filters.page_size * (filters.page - 1),
+            limit=filters.page_size,
+            filters=filters.model_dump(exclude_unset=True),
+            order_by=order_by,
+            count_mode=CountMode.EXACT,
+        )
 
     return LicenseTypeListResponseSchema(
         items=licenses,
         total=total_count,
         page=filters.page,
         page_size=filters.page_size,
+        next_cursor=next_cursor,
     )
 
 
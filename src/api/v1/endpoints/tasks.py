@@ -1,9 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.database.db_depends import get_async_session
+from src.api.v1.validators.meeting_validators import check_problem_exists
+from src.api.v1.validators.problems_validators import check_company_exists
+from src.database.db_depends import get_async_read_session, get_async_session
+from src.problems.constants import MAX_BULK_TASKS, TITLE_BULK_TASKS
 from src.problems.crud.task_crud import task_crud
 from src.problems.models.enums import StatusTask
+from src.problems.schemas import TaskFilterSchema
 from src.problems.schemas.task import (
     TaskCreateSchema,
     TaskResponseSchema,
@@ -13,6 +17,21 @@ from src.problems.schemas.task import (
 router = APIRouter()
 
 
+def prepare_task(task: TaskCreateSchema, problem_id: int) -> TaskCreateSchema:
+    """
+    Заполняет служебные поля создаваемой задачи: автора, статус и проблему.
+
+    TODO: Заменить фиктивного пользователя на реального (current_user).
+    """
+    task_data = task.model_dump()
+    task_data['owner_id'] = task.owner_id or (
+        '3fa85f64-5717-4562-b3fc-2c963f66af66'  # TODO: Заменить на реального пользователя
+    )
+    task_data['status'] = StatusTask.NEW
+    task_data['problem_id'] = problem_id
+    return TaskCreateSchema(**task_data)
+
+
 @router.get(
     '/{company_slug}/problems/{problem_id}/tasks',
     response_model=list[TaskResponseSchema],
@@ -23,7 +42,8 @@ router = APIRouter()
 async def get_tasks(
     company_slug: str,
     problem_id: int,
-    session: AsyncSession = Depends(get_async_session),
+    filters: TaskFilterSchema = Query(),
+    session: AsyncSession = Depends(get_async_read_session),
 ) -> list[TaskResponseSchema]:
     """
     Возвращает информацию о всех задачах проблемы.
@@ -31,11 +51,15 @@ async def get_tasks(
     Args:
         company_slug: Уникальный идентификатор компании
         problem_id: Идентификатор проблемы
+        filters: Фильтры по названию, статусам и дате завершения
         session: Сессия базы данных
     Возвращаемое значение:
         Объект TaskResponseSchema.
     """
-    tasks = await task_crud.get_by_company_and_problem(session, company_slug, problem_id)
+    company = await check_company_exists(company_slug, session)
+    tasks = await task_crud.get_by_company_and_problem(
+        session, company.id, problem_id, filters.model_dump(exclude_none=True)
+    )
     if not tasks:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Задачи не найдены')
     return tasks
@@ -72,13 +96,41 @@ async def create_task(
            - Убедиться, что пользователь имеет доступ к компании и проблеме.
            - Проверить, что пользователь может создавать задачи в данной компании.
     """
-    task_data = task.model_dump()
-    task_data['owner_id'] = (
-        '3fa85f64-5717-4562-b3fc-2c963f66af66'  # TODO: Заменить на реального пользователя
-    )
-    task_data['status'] = StatusTask.NEW
-    task_data['problem_id'] = problem_id
-    return await task_crud.create(session, TaskCreateSchema(**task_data))
+    return await task_crud.create(session, prepare_task(task, problem_id))
+
+
+@router.post(
+    '/{company_slug}/problems/{problem_id}/tasks/bulk',
+    response_model=list[TaskResponseSchema],
+    response_model_exclude_none=True,
+    summary='Создать несколько задач',
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_tasks(
+    company_slug: str,
+    problem_id: int,
+    tasks: list[TaskCreateSchema] = Body(
+        ..., min_length=1, max_length=MAX_BULK_TASKS, title=TITLE_BULK_TASKS
+    ),
+    session: AsyncSession = Depends(get_async_session),
+) -> list[TaskResponseSchema]:
+    """Массовое создание задач.
+
+    Назначение:
+        Создаёт до MAX_BULK_TASKS задач проблемы в одной транзакции: задачи вставляются
+        одним запросом, исполнители и файлы - пакетными запросами. Если не удалось
+        создать хотя бы одну задачу, не создаётся ни одна.
+    Args:
+        company_slug: Уникальный идентификатор компании.
+        problem_id: ID проблемы.
+        tasks: Данные создаваемых задач.
+        session: Асинхронная сессия SQLAlchemy.
+    Возвращаемое значение:
+        Список объектов TaskResponseSchema в порядке переданных задач.
+    """
+    company = await check_company_exists(company_slug, session)
+    await check_problem_exists(problem_id, session, company.id)
+    return await task_crud.create_many(session, [prepare_task(task, problem_id) for task in tasks])
 
 
 @router.get(
@@ -106,7 +158,8 @@ async def get_task(
     Raises:
         HTTPException: Если задача не найдена
     """
-    task = await task_crud.get_task_by_id(session, company_slug, problem_id, task_id)
+    company = await check_company_exists(company_slug, session)
+    task = await task_crud.get_task_by_id(session, company.id, problem_id, task_id)
     if not task:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Задача не найдена')
     return task  # type: ignore
@@ -143,9 +196,8 @@ async def update_task(
     Raises:
         HTTPException: Если задача не найдена
     """
-    task = await task_crud.get_task_by_id(
-        session, company_slug, problem_id, task_id, as_object=True
-    )
+    company = await check_company_exists(company_slug, session)
+    task = await task_crud.get_task_by_id(session, company.id, problem_id, task_id, as_object=True)
     if not task:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Задача не найдена')
     return await task_crud.update(session, task, task_update)  # type: ignore
@@ -163,7 +215,6 @@ async def delete_task(
     session: AsyncSession = Depends(get_async_session),
 ) -> None:
     """Удаляет задачу."""
-    task = await task_crud.get_task_by_id(
-        session, company_slug, problem_id, task_id, as_object=True
-    )
+    company = await check_company_exists(company_slug, session)
+    task = await task_crud.get_task_by_id(session, company.id, problem_id, task_id, as_object=True)
     await task_crud.remove(session, task)
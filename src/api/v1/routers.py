@@ -10,6 +10,7 @@ from src.api.v1.endpoints import (
     meeting_router,
     problem_feeds_router,
     problems_router,
+    search_router,
     surveys_router,
     tabit_admin_auth_router,
     tabit_management_router,
@@ -42,6 +43,7 @@ main_router.include_router(task_router, tags=['Tasks'])
 main_router.include_router(
     problem_feeds_router, prefix='/{company_slug}/problems/{problem_id}', tags=['Problems Feeds']
 )
+main_router.include_router(search_router, tags=['Search'])
 # TODO Дописать Companies Surveys Endpoints
 main_router.include_router(landing_page_router, prefix='/landing', tags=['Landing Page'])
 
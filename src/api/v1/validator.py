@@ -3,10 +3,12 @@
 """
 
 from http import HTTPStatus
+from typing import Sequence
 from uuid import UUID
 
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.base import ExecutableOption
 
 from src.api.v1.constants import TextError
 from src.constants import TEXT_ERROR_NOT_FOUND
@@ -19,12 +21,16 @@ async def validator_check_object_exists(
     object_id: int | UUID | None = None,
     object_slug: str | None = None,
     message: str = TEXT_ERROR_NOT_FOUND,
+    options: Sequence[ExecutableOption] | None = None,
 ):
-    """Проверит наличие и вернет объект из таблицы по id или slug."""
+    """
+    Проверит наличие и вернет объект из таблицы по id или slug.
+    В options можно передать опции загрузки связей объекта.
+    """
     object_model = (
-        await model_crud.get_or_404(session, object_id)
+        await model_crud.get_or_404(session, object_id, options=options)
         if object_id
-        else (await model_crud.get_by_slug(session, object_slug, raise_404=True))
+        else (await model_crud.get_by_slug(session, object_slug, raise_404=True, options=options))
     )
     return object_model
 
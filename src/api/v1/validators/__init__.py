@@ -1,17 +1,17 @@
 from .problem_feeds_validators import (
-    check_comment_and_message_feed,
-    check_comment_has_likes_from_user,
+    FeedAccess,
     check_comment_owner,
-    get_access_to_comments,
-    get_access_to_feeds,
+    check_message_feed_owner,
+    get_feed_access,
+    get_user_company,
 )
 from .tabit_management_validators import check_telegram_username_for_duplicates
 
 __all__ = [
-    'check_comment_and_message_feed',
-    'check_comment_has_likes_from_user',
+    'FeedAccess',
     'check_comment_owner',
+    'check_message_feed_owner',
     'check_telegram_username_for_duplicates',
-    'get_access_to_comments',
-    'get_access_to_feeds',
+    'get_feed_access',
+    'get_user_company',
 ]
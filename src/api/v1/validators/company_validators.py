@@ -7,13 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.v1.auth.managers import get_user_manager
 from src.api.v1.constants import TextError
-from src.api.v1.utilities import generate_unique_slug
-from src.companies.constants import (
-    ATTEMPTS,
-    SLUG_NOT_GENERATED,
-)
-from src.companies.crud import company_crud, company_departments_crud
-from src.companies.models import Company, Department
+from src.companies.crud import company_departments_crud
 from src.constants import TEXT_ERROR_EXISTS_EMAIL, TEXT_ERROR_INVALID_PASSWORD
 from src.database.db_depends import get_async_session
 from src.users.schemas import UserCreateSchema
@@ -44,32 +38,6 @@ async def check_department_name_duplicate(
         )
 
 
-async def check_slug_duplicate(
-    db_obj: Department | Company,
-    session: AsyncSession = Depends(get_async_session),
-) -> str:
-    """
-    Метод проверки и формирования `slug` объектов Company или Department.
-    Args:
-        db_obj (Department | Company): объект отдела или компании.
-        session (AsyncSession): Асинхронная сессия SQLAlchemy.
-    Raises:
-        OSError: Если за определенное количество попыток ATTEMPTS уникальный
-        `slug` не удается сгенерировать вызывается ошибка.
-    """
-    db_obj.slug = db_obj.name
-    for _ in range(ATTEMPTS):
-        crud = company_departments_crud if isinstance(db_obj, Department) else company_crud
-        db_objects = await crud.get_multi(session=session, filters={'slug': db_obj.slug})
-        if not db_objects:
-            return db_obj.slug
-        db_obj.slug = generate_unique_slug(db_obj.slug)
-        db_objects = await crud.get_multi(session=session, filters={'slug': db_obj.slug})
-        if not db_objects:
-            return db_obj.slug
-    raise OSError(SLUG_NOT_GENERATED)
-
-
 async def validate_user_not_exists(
     user_data: UserCreateSchema,
     user_manager: BaseUserManager = Depends(get_user_manager),
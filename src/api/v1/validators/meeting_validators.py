@@ -10,14 +10,18 @@ from src.problems.crud.meeting import meeting_crud
 from src.problems.crud.problems import problem_crud
 
 
-async def check_problem_exists(problem_id: int, session: AsyncSession):
+async def check_problem_exists(
+    problem_id: int, session: AsyncSession, company_id: int | None = None
+):
     """Проверяет существование проблемы по ID.
 
     Назначение:
-        Валидирует, что проблема существует в базе данных по заданному ID.
+        Валидирует, что проблема существует в базе данных по заданному ID
+        и, если передан company_id, принадлежит этой компании.
     Параметры:
         problem_id: Целое число, представляющее ID проблемы для проверки.
         session: Асинхронная сессия базы данных.
+        company_id: ID компании, которой должна принадлежать проблема.
     Возвращаемое значение:
         Проверенная проблема, если она существует.
     Исключения:
@@ -25,7 +29,7 @@ async def check_problem_exists(problem_id: int, session: AsyncSession):
     """
 
     try:
-        await problem_crud.get_or_404(session, problem_id)
+        await problem_crud.get_or_404(session, problem_id, company_id=company_id)
     except HTTPException:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=ERROR_PROBLEM_NOT_FOUND)
 
@@ -1,88 +1,121 @@
+from dataclasses import dataclass
+from uuid import UUID
+
 from fastapi import HTTPException, status
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.companies.crud import company_crud
+from src.companies.models import Company
+from src.constants import TEXT_ERROR_NOT_FOUND
 from src.problems.constants import (
     VALID_COMMENT_NOT_OWNER,
     VALID_LIKE_OWN_COMMENT,
-    VALID_NOT_LIKED_COMMENT,
-    VALID_REPEATED_LIKE,
+    VALID_POLL_NOT_OWNER,
     VALID_WRONG_COMMENT,
     VALID_WRONG_COMPANY,
     VALID_WRONG_MESSAGE_FEED,
     VALID_WRONG_PROBLEM,
 )
-from src.problems.crud import (
-    comment_crud,
-    message_feed_crud,
-    problem_crud,
-    user_comment_association_crud,
-)
-from src.problems.models import AssociationUserComment, CommentFeed
+from src.problems.models import CommentFeed, MessageFeed, Problem
+from src.request_context import get_context_company
 
 
-async def check_user_company(
-    user_company_id: int, company_slug: str, session: AsyncSession
-) -> None:
+@dataclass
+class FeedAccess:
     """
-    Валидатор, проверяющий соответствие компании юзера и запрошенной компании.
+    Объекты, загруженные при проверке доступа к тредам и комментариям.
 
-    Параметры:
-        user_company_id: значение company_id в объекте пользователя;
-        company_slug: path-параметр, соответствующий slug запрашиваемой компании.
+    Поля:
+        company: компания пользователя;
+        problem: запрошенная проблема;
+        message_feed: запрошенный тред (если запрашивался);
+        comment: запрошенный комментарий (если запрашивался).
     """
 
-    company = await company_crud.get_or_404(session, user_company_id)
-    if company.slug != company_slug:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=VALID_WRONG_COMPANY)
+    company: Company
+    problem: Problem
+    message_feed: MessageFeed | None = None
+    comment: CommentFeed | None = None
 
 
-async def check_company_problem(
-    user_company_id: int, problem_id: int, session: AsyncSession
-) -> None:
-    """
-    Валидатор, проверяющий соответствие связанной с проблемой компанией и компанией юзера.
-
-    Параметры:
-        user_company_id: значение company_id в объекте пользователя;
-        problem_id: path-параметр, соответствующий id запрашиваемой проблемы.
-    """
-    problem = await problem_crud.get_or_404(session, problem_id)
-    if problem.company_id != user_company_id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=VALID_WRONG_PROBLEM)
+def _raise_not_found(obj, detail: str = TEXT_ERROR_NOT_FOUND) -> None:
+    """Выбросит HTTP 404, если объект не был найден."""
+    if obj is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
 
 
-async def check_message_feed_and_problem(
-    message_feed_id: int, problem_id: int, session: AsyncSession
-) -> None:
+async def get_user_company(
+    session: AsyncSession, user_company_id: int, company_slug: str
+) -> Company:
     """
-    Валидатор, проверяющий принадлежность запрошенного треда к запрошенной проблеме.
+    Возвращает компанию пользователя из контекста запроса (src.request_context).
+    Если компания не найдена - HTTP 404, если её slug не совпадает с запрошенным - HTTP 403.
 
     Параметры:
-        message_feed_id: path-параметр, соответствующий id запрашиваемого треда;
-        problem_id: path-параметр, соответствующий id запрашиваемой проблемы.
+        session: асинхронная сессия SQLAlchemy;
+        user_company_id: значение company_id в объекте пользователя;
+        company_slug: path-параметр, соответствующий slug запрашиваемой компании.
     """
-    message_feed = await message_feed_crud.get_or_404(session, message_feed_id)
-    if message_feed.problem_id != problem_id:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=VALID_WRONG_MESSAGE_FEED)
+    company = await get_context_company(session, user_company_id)
+    _raise_not_found(company)
+    if company.slug != company_slug:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=VALID_WRONG_COMPANY)
+    return company
 
 
-async def check_comment_and_message_feed(
-    comment_id: int, message_feed_id: int, session: AsyncSession
-):
-    """
-    Валидатор, проверяющий принадлежность запрошенного комментария к запрошенному треду.
+async def get_feed_access(
+    session: AsyncSession,
+    user_company_id: int,
+    company_slug: str,
+    problem_id: int,
+    message_feed_id: int | None = None,
+    comment_id: int | None = None,
+) -> FeedAccess:
+    """
+    Проверяет доступ пользователя к цепочке компания -> проблема -> тред -> комментарий
+    и возвращает загруженные объекты.
+
+    Компания пользователя берётся из контекста запроса (src.request_context), куда она
+    загружена при аутентификации. Проблема, тред и комментарий загружаются одним
+    SELECT-запросом: тред и комментарий присоединяются к проблеме через LEFT JOIN по
+    первичному ключу, поэтому запрос возвращает не более одной строки. Порядок проверок:
+        1) компания пользователя не найдена - HTTP 404;
+        2) slug компании пользователя не совпадает с запрошенным - HTTP 403;
+        3) проблема не найдена - HTTP 404, проблема чужой компании - HTTP 403;
+        4) тред не найден или не относится к проблеме - HTTP 404;
+        5) комментарий не найден или не относится к треду - HTTP 404.
 
     Параметры:
-        comment_id: path-параметр, соответствующий id запрашиваемого комментария;
-        message_feed_id: path-параметр, соответствующий id запрашиваемого треда.
-
-    Возвращает объект комментария в случае прохождения проверки.
-    """
-    comment = await comment_crud.get_or_404(session, comment_id)
-    if comment.message_id != message_feed_id:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=VALID_WRONG_COMMENT)
-    return comment
+        session: асинхронная сессия SQLAlchemy;
+        user_company_id: значение company_id в объекте пользователя;
+        company_slug: path-параметр, соответствующий slug запрашиваемой компании;
+        problem_id: path-параметр, соответствующий id запрашиваемой проблемы;
+        message_feed_id: path-параметр, соответствующий id запрашиваемого треда;
+        comment_id: path-параметр, соответствующий id запрашиваемого комментария.
+    """
+    company = await get_user_company(session, user_company_id, company_slug)
+    query = select(Problem).select_from(Problem).where(Problem.id == problem_id)
+    if message_feed_id is not None:
+        query = query.add_columns(MessageFeed).outerjoin(
+            MessageFeed, MessageFeed.id == message_feed_id
+        )
+    if comment_id is not None:
+        query = query.add_columns(CommentFeed).outerjoin(CommentFeed, CommentFeed.id == comment_id)
+    row = (await session.execute(query)).first()
+
+    _raise_not_found(row)
+    access = FeedAccess(company, *row)
+    if access.problem.company_id != user_company_id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=VALID_WRONG_PROBLEM)
+    if message_feed_id is not None:
+        _raise_not_found(access.message_feed)
+        if access.message_feed.problem_id != problem_id:
+            _raise_not_found(None, VALID_WRONG_MESSAGE_FEED)
+    if comment_id is not None:
+        _raise_not_found(access.comment)
+        if access.comment.message_id != message_feed_id:
+            _raise_not_found(None, VALID_WRONG_COMMENT)
+    return access
 
 
 async def check_comment_owner(
@@ -113,56 +146,15 @@ async def check_comment_owner(
             )
 
 
-async def get_access_to_feeds(
-    user_company_id: int, company_slug: str, problem_id: int, session: AsyncSession
-) -> None:
-    """
-    Комбинация валидаторов check_user_company и check_company_problem.
-    Используется для доступа к тредам.
-    """
-    await check_user_company(user_company_id, company_slug, session)
-    await check_company_problem(user_company_id, problem_id, session)
-
-
-async def get_access_to_comments(
-    user_company_id: int,
-    company_slug: str,
-    problem_id: int,
-    message_feed_id: int,
-    session: AsyncSession,
-) -> None:
-    """
-    Комбинация валидаторов check_user_company, check_company_problem и
-    check_message_feed_and_problem. Используется для доступа к комментариям.
-    """
-    await get_access_to_feeds(user_company_id, company_slug, problem_id, session)
-    await check_message_feed_and_problem(message_feed_id, problem_id, session)
-
-
-async def check_comment_has_likes_from_user(
-    user_id: int, comment_id: int, session: AsyncSession, like_mode: bool = False
-) -> AssociationUserComment | None:
+async def check_message_feed_owner(message_feed: MessageFeed, user_id: UUID) -> None:
     """
-    Валидатор, проверяющий, наличие лайка комментария от активного юзера.
-    Работает в двух режимах, в зависимости от параметра like_mode:
-        1) True: если запись о лайке обнаружена, то выбрасывается ошибка HTTP 400.
-        2) False: если запись о лайке не обнаружена, то выбрасывается ошибка HTTP 400.
-           В этом варианте возвращается объект модели AssociationUserComment.
+    Валидатор, сверяющий автора треда и текущего пользователя: если пользователь не
+    является автором треда, выбрасывается ошибка HTTP 403. Нужно для проверки
+    возможности начать голосование в треде.
 
     Параметры:
-        user_id: UUID пользователя, сделавшего запрос к API;
-        comment_id: path-параметр, соответствующий id запрашиваемого комментария;
-        like_mode: опциональный параметр, определяет способ применения валидатора.
+        message_feed: объект треда MessageFeed;
+        user_id: UUID пользователя, сделавшего запрос к API.
     """
-    if like_mode:
-        if await user_comment_association_crud.get(comment_id, user_id, session):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST, detail=VALID_REPEATED_LIKE
-            )
-    else:
-        user_comment_obj = await user_comment_association_crud.get(comment_id, user_id, session)
-        if not user_comment_obj:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST, detail=VALID_NOT_LIKED_COMMENT
-            )
-        return user_comment_obj
+    if message_feed.owner_id != user_id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=VALID_POLL_NOT_OWNER)
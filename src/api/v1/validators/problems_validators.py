@@ -1,13 +1,10 @@
-from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.companies.crud.company import company_crud
+from src.companies.cache import CompanyCacheEntry, company_cache
 from src.problems.constants import ERROR_COMPANY_NOT_FOUND
 
 
-# TODO Вместо get_by_company_slug можно использовать метод базового crud
-# get_by_slug если исправть как описано в src/companies/crud/company
-async def check_company_exists(company_slug: str, session: AsyncSession):
+async def check_company_exists(company_slug: str, session: AsyncSession) -> CompanyCacheEntry:
     """Проверяет существование компании по slug.
 
     Назначение:
@@ -16,10 +13,9 @@ async def check_company_exists(company_slug: str, session: AsyncSession):
         company_slug: Строка, представляющая slug компании для проверки.
         session: Асинхронная сессия базы данных.
     Возвращаемое значение:
-        Проверенная компания, если она существует.
+        Сведения о компании из кэша компаний по slug, если она существует.
     Исключения:
         HTTPException: Если компания не найдена.
     """
 
-    if not await company_crud.get_by_company_slug(session, company_slug):
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=ERROR_COMPANY_NOT_FOUND)
+    return await company_cache.get(session, company_slug, message=ERROR_COMPANY_NOT_FOUND)
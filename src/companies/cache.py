@@ -0,0 +1,272 @@
+"""
+Модуль кэша компаний по slug.
+
+Содержит:
+- CompanyCacheEntry: сведения о компании, которые нужны эндпоинтам с company_slug в пути.
+- CompanySlugCache: LRU-кэш с TTL внутри процесса с поддержкой межпроцессной инвалидации
+  через Postgres LISTEN/NOTIFY (src.database.listener).
+- company_cache: общий на процесс кэш, настроенный по Settings.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from src.companies.constants import COMPANY_CACHE_CHANNEL
+from src.companies.models import Company
+from src.config import settings
+from src.constants import TEXT_ERROR_NOT_FOUND
+from src.database.listener import PgListener
+from src.logger import logger
+from src.request_context import get_request_context
+from src.users.cache import user_cache
+
+
+@dataclass(frozen=True)
+class CompanyCacheEntry:
+    """
+    Сведения о компании, хранимые в кэше.
+
+    Поля:
+        id: идентификатор компании;
+        slug: slug компании;
+        is_active: активна ли лицензия компании;
+        license_id: ссылка на тип лицензии;
+        max_admins_count: максимальное кол-во администраторов;
+        max_employees_count: максимальное кол-во сотрудников;
+        end_license_time: дата окончания действия лицензии.
+    """
+
+    id: int
+    slug: str
+    is_active: bool
+    license_id: Optional[int]
+    max_admins_count: int
+    max_employees_count: int
+    end_license_time: Optional[datetime]
+
+    @classmethod
+    def from_company(cls, company: Company) -> 'CompanyCacheEntry':
+        """Создаёт запись по загруженному объекту компании."""
+        return cls(
+            company.id,
+            company.slug,
+            company.is_active,
+            company.license_id,
+            company.max_admins_count,
+            company.max_employees_count,
+            company.end_license_time,
+        )
+
+
+class CompanySlugCache:
+    """
+    LRU-кэш компаний по slug с ограниченным временем жизни записей.
+
+    Компания пользователя, загруженная при аутентификации (src.request_context),
+    берётся из контекста запроса без обращения к кэшу.
+
+    Одновременные промахи по одному slug выполняют один запрос к БД. Если во время запроса
+    кэш был инвалидирован, результат не сохраняется, чтобы не вернуть в кэш устаревшие
+    данные. Отсутствующие компании не кэшируются.
+
+    Пока соединение LISTEN потеряно, инвалидации других воркеров не доходят, поэтому при
+    потере и при восстановлении подписки кэш очищается целиком.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._entries: OrderedDict[str, tuple[float, CompanyCacheEntry]] = OrderedDict()
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._lock_users: dict[str, int] = {}
+        self._generation = 0
+        self._listener = PgListener(
+            COMPANY_CACHE_CHANNEL, self._on_notify, self._reset, self._reset
+        )
+
+    def _get_fresh(self, slug: str) -> CompanyCacheEntry | None:
+        """Возвращает неустаревшую запись кэша и отмечает её как недавно использованную."""
+        cached = self._entries.get(slug)
+        if cached is None:
+            return None
+        expires_at, entry = cached
+        if expires_at <= time.monotonic():
+            del self._entries[slug]
+            return None
+        self._entries.move_to_end(slug)
+        return entry
+
+    def _put(self, entry: CompanyCacheEntry) -> None:
+        """Сохраняет запись, вытесняя давно не использованные сверх maxsize."""
+        self._entries[entry.slug] = (time.monotonic() + self.ttl, entry)
+        self._entries.move_to_end(entry.slug)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def _load(self, session: AsyncSession, slug: str) -> CompanyCacheEntry | None:
+        """Загружает сведения о компании из БД."""
+        row = (
+            await session.execute(
+                select(
+                    Company.id,
+                    Company.slug,
+                    Company.is_active,
+                    Company.license_id,
+                    Company.max_admins_count,
+                    Company.max_employees_count,
+                    Company.end_license_time,
+                ).where(Company.slug == slug)
+            )
+        ).first()
+        return CompanyCacheEntry(*row) if row else None
+
+    def _release_lock(self, slug: str) -> None:
+        """
+        Снимает учёт задачи, ожидавшей или удерживавшей блокировку загрузки slug.
+        Блокировка удаляется, только когда её не ждёт ни одна задача: по locked()
+        этого не узнать, так как между release() и пробуждением ожидающей задачи
+        блокировка свободна, и новая задача создала бы вторую блокировку того же slug.
+        """
+        users = self._lock_users[slug] - 1
+        if users:
+            self._lock_users[slug] = users
+        else:
+            del self._lock_users[slug]
+            del self._locks[slug]
+
+    async def get(
+        self,
+        session: AsyncSession,
+        slug: str,
+        raise_404: bool = True,
+        message: str = TEXT_ERROR_NOT_FOUND,
+    ) -> CompanyCacheEntry | None:
+        """
+        Возвращает сведения о компании по slug из кэша или из БД.
+        Если компания не найдена и raise_404 = True, выбрасывает 404-ошибку, иначе
+        возвращает None.
+
+        Параметры:
+            session: асинхронная сессия SQLAlchemy, через которую выполняется запрос к БД;
+            slug: slug компании;
+            raise_404: выбрасывать ли 404-ошибку, если компания не найдена;
+            message: текст 404-ошибки.
+        """
+        context_company = get_request_context().get_company()
+        if context_company is not None and context_company.slug == slug:
+            return CompanyCacheEntry.from_company(context_company)
+        entry = self._get_fresh(slug)
+        if entry is None:
+            lock = self._locks.setdefault(slug, asyncio.Lock())
+            self._lock_users[slug] = self._lock_users.get(slug, 0) + 1
+            try:
+                async with lock:
+                    entry = self._get_fresh(slug)
+                    if entry is None:
+                        self.misses += 1
+                        generation = self._generation
+                        entry = await self._load(session, slug)
+                        if entry is not None and generation == self._generation:
+                            self._put(entry)
+                    else:
+                        self.hits += 1
+            finally:
+                self._release_lock(slug)
+        else:
+            self.hits += 1
+        if entry is None and raise_404:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=message)
+        return entry
+
+    def invalidate_local(self, *slugs: str) -> None:
+        """
+        Удаляет записи из кэша текущего процесса вместе с сотрудниками этих компаний
+        в кэше пользователей (src.users.cache).
+        """
+        self._generation += 1
+        self.invalidations += 1
+        for slug in slugs:
+            self._entries.pop(slug, None)
+        user_cache.invalidate_company(*slugs)
+
+    async def invalidate(self, session: AsyncSession, *slugs: str) -> None:
+        """
+        Инвалидирует записи компаний после фиксации их изменения или удаления.
+        Если включена межпроцессная инвалидация (company_cache_listen), отправляет NOTIFY
+        остальным воркерам отдельным соединением, не затрагивая транзакцию сессии.
+
+        Параметры:
+            session: асинхронная сессия SQLAlchemy, по подключению которой отправляется NOTIFY;
+            slugs: slug изменённых компаний.
+        """
+        self.invalidate_local(*slugs)
+        if settings.company_cache_listen:
+            async with session.bind.begin() as connection:
+                for slug in slugs:
+                    await connection.execute(select(func.pg_notify(COMPANY_CACHE_CHANNEL, slug)))
+
+    def clear(self) -> None:
+        """Очищает кэш текущего процесса."""
+        self._generation += 1
+        self._entries.clear()
+
+    def _reset(self) -> None:
+        """
+        Очищает кэш текущего процесса вместе с кэшем пользователей, если инвалидации
+        других воркеров могли быть пропущены.
+        """
+        self.invalidations += 1
+        self.clear()
+        user_cache.clear()
+
+    def _on_notify(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        """Обработчик NOTIFY от других воркеров."""
+        self.invalidate_local(payload)
+
+    async def start_listener(self, async_engine: AsyncEngine) -> None:
+        """
+        Подписывается на канал COMPANY_CACHE_CHANNEL через отдельное соединение asyncpg,
+        которое восстанавливается после потери до вызова stop_listener.
+        """
+        await self._listener.start(async_engine)
+        logger.info(f'Кэш компаний подписан на канал {COMPANY_CACHE_CHANNEL}')
+
+    async def stop_listener(self) -> None:
+        """Отписывается от канала и закрывает соединение подписки."""
+        await self._listener.stop()
+
+    def get_metrics(self) -> dict[str, int | float]:
+        """
+        Возвращает счётчики кэша.
+
+        Поля ответа:
+            size, maxsize: текущее и максимальное число записей;
+            ttl: время жизни записи в секундах;
+            hits, misses: попадания и промахи;
+            hit_rate: доля попаданий;
+            invalidations: число инвалидаций.
+        """
+        requests = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'ttl': self.ttl,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / requests if requests else 0,
+            'invalidations': self.invalidations,
+        }
+
+
+company_cache = CompanySlugCache(settings.company_cache_size, settings.company_cache_ttl_seconds)
@@ -2,8 +2,6 @@
 Константы для моделей компании, департамента и сотрудника отдела.
 """
 
-import string
-
 ERROR_INVALID_PASSWORD: str = 'Пароль не соответвует требованиям.'
 ERROR_USER_ALREADY_EXISTS: str = 'Пользователь с данным email уже существует.'
 ERROR_USER_NOT_EXISTS: str = 'Пользователь с таким UUID не существует.'
@@ -23,14 +21,37 @@ TEST_ERROR_LICENSE_FIELDS: str = (
     'Поля начала действия лицензии и тип лицензии заполняются одновременно.'
 )
 TEST_ERROR_UNIQUE_NAME_SURNAME = 'Имя и фамилия не могут совпадать!'
-SHORT_SYMBOLS = string.ascii_letters
-GENERATED_SLUG_SUFFIX_RANGE = 3
-ATTEMPTS = 100
-SLUG_NOT_GENERATED = (
-    f'Сделано {ATTEMPTS} попыток, но сгенерировать slug не удалось. Попробуйте снова.'
+# Выгрузка сотрудников и отделов
+EXPORT_EXCLUDED_FIELDS: tuple[str, ...] = (
+    'created_at',
+    'updated_at',
+    'hashed_password',
+    'token_version',
 )
+EXPORT_MEDIA_TYPE: str = 'text/csv; charset=utf-8'
+
+# Канал NOTIFY для инвалидации кэша компаний по slug
+COMPANY_CACHE_CHANNEL: str = 'company_cache_invalidation'
+
+# Массовое добавление сотрудников
+BULK_EMPLOYEES_BATCH_SIZE: int = 500
+BULK_EMPLOYEES_CSV_SUFFIX: str = '.csv'
+BULK_EMPLOYEES_JSON_SUFFIXES: tuple[str, ...] = ('.jsonl', '.ndjson')
+BULK_EMPLOYEES_EXCLUDED_FIELDS: set[str] = {'password', 'is_active', 'is_superuser', 'is_verified'}
+ERROR_BULK_FILE_FORMAT: str = 'Поддерживаются только файлы .csv и .jsonl (JSON lines).'
+ERROR_BULK_FILE_ENCODING: str = 'Файл должен быть в кодировке UTF-8.'
+ERROR_BULK_ROW_FORMAT: str = 'Строка не является JSON-объектом.'
+ERROR_BULK_DUPLICATE_EMAIL: str = 'Email повторяется в файле.'
+ERROR_BULK_EMPLOYEES_LIMIT: str = 'Превышено максимальное количество сотрудников компании.'
+ERROR_BULK_INSERT: str = 'Пакет не сохранён: нарушено ограничение БД.'
+
 # Фильтрация и сортировка для лицензии
 FILTER_NAME_DESCRIPTION = 'Фильтр по названию компании'
 SORTING_DESCRIPTION = (
     "Сортировка по полю (name, created_at, updated_at). '-' означает сортировку в обратном порядке"
 )
+
+# Фильтрация списка сотрудников
+FILTER_SURNAME_DESCRIPTION: str = 'Часть фамилии сотрудника (без учёта регистра)'
+FILTER_DEPARTMENT_IN_DESCRIPTION: str = 'Один из id отделов'
+FILTER_ROLE_IN_DESCRIPTION: str = 'Одна из ролей сотрудника'
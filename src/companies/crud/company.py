@@ -1,50 +1,76 @@
 """Модуль CRUD для компании."""
 
+import codecs
+import csv
+import io
 from datetime import datetime
-from typing import Any, List
+from typing import Any, AsyncIterator
 
-from fastapi.responses import FileResponse
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Column
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
 from sqlalchemy.future import select
 
+from src.companies.constants import EXPORT_EXCLUDED_FIELDS, EXPORT_MEDIA_TYPE
 from src.companies.models import Company
-from src.crud import CRUDBase
+from src.crud import CRUDBase, SlugCreateMixin
 from src.tabit_management.models import LicenseType
 
 
-class CRUDCompany(CRUDBase):
+class CRUDCompany(SlugCreateMixin, CRUDBase):
     """CRUD операции для модели компании."""
 
-    async def get_import(
+    async def get_export(
         self,
-        objects_in: List,
+        session: AsyncSession,
+        model_crud: CRUDBase,
+        filters: dict[str, Any],
         file_name: str,
-    ) -> Any:
+    ) -> StreamingResponse:
         """
-        Импортирует записи в файл .txt.
+        Потоково выгружает записи модели в CSV.
+        Строки читаются из БД серверным курсором порциями и сразу кодируются в CSV, поэтому
+        расход памяти не зависит от числа записей, а временные файлы не создаются.
+        Поля из EXPORT_EXCLUDED_FIELDS в выгрузку не попадают.
         Параметры метода:
-            objects_in: список объектов для импорта
-            file_name: имя импортируемого файла без расширения.
+            session: асинхронная сессия, по подключению которой открывается сессия выгрузки;
+            model_crud: CRUD выгружаемой модели;
+            filters: фильтры выгружаемых записей;
+            file_name: имя выгружаемого файла без расширения.
         """
-        with open(f'{file_name}.txt', 'w') as file:
-            count = 0
-            table_titles = []
-            for entity in objects_in:
-                entity_string = []
-                for key, value in entity.__dict__.items():
-                    if key not in (
-                        '_sa_instance_state',
-                        'updated_at',
-                        'created_at',
-                        'hashed_password',
-                    ):
-                        entity_string.append(str(value))
-                        table_titles.append(key)
-                if count == 0:
-                    file.write(f'{"  ".join(table_titles)}\n')
-                file.write(f'{"  ".join(entity_string)}\n')
-                count += 1
-        return FileResponse(path=f'{file_name}.txt', filename=f'{file_name}.txt')
+        columns = [
+            column
+            for column in model_crud.model.__table__.columns
+            if column.key not in EXPORT_EXCLUDED_FIELDS
+        ]
+        return StreamingResponse(
+            self._generate_csv(session.bind, model_crud, columns, filters),
+            media_type=EXPORT_MEDIA_TYPE,
+            headers={'Content-Disposition': f'attachment; filename="{file_name}.csv"'},
+        )
+
+    @staticmethod
+    async def _generate_csv(
+        bind: AsyncEngine | AsyncConnection,
+        model_crud: CRUDBase,
+        columns: list[Column],
+        filters: dict[str, Any],
+    ) -> AsyncIterator[bytes]:
+        """
+        Генератор CSV: заголовок, затем по одному блоку байт на каждую порцию строк из БД.
+        Использует собственную сессию, так как сессия эндпоинта закрывается до отправки
+        ответа.
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(column.key for column in columns)
+        yield codecs.BOM_UTF8 + buffer.getvalue().encode()
+        async with AsyncSession(bind) as session:
+            async for rows in model_crud.stream(session, columns, filters):
+                buffer.seek(0)
+                buffer.truncate()
+                writer.writerows(rows)
+                yield buffer.getvalue().encode()
 
     # TODO Этот метод был создан, чтобы исключить изменения в базовом crud, в методе get_by_slug
     # Было принято решение покf не менять метод get_by_slug, а создать этот метод
@@ -66,7 +92,7 @@ class CRUDCompany(CRUDBase):
         company = await session.execute(select(Company).where(Company.slug == company_slug))
         return company.scalar_one_or_none()
 
-    async def is_company_slug_exists(self, session: AsyncSession, slug: str) -> None:
+    async def is_company_slug_exists(self, session: AsyncSession, slug: str) -> bool:
         """
         Проверяет, существует ли компания с указанным slug.
 
@@ -77,9 +103,23 @@ class CRUDCompany(CRUDBase):
         Returns:
             bool: True, если компания с таким slug уже существует, иначе False.
         """
-        result = await session.execute(select(Company).where(Company.slug == slug))
+        result = await session.execute(select(Company.id).where(Company.slug == slug))
         return result.scalar_one_or_none() is not None
 
+    async def get_employees_limit_for_update(self, session: AsyncSession, company_id: int) -> int:
+        """
+        Возвращает максимальное число сотрудников компании, блокируя строку компании
+        (SELECT ... FOR UPDATE) до конца транзакции. Параллельные массовые добавления
+        сотрудников одной компании выполняются по очереди и не превышают лимит.
+
+        Параметры:
+            session: асинхронная сессия SQLAlchemy;
+            company_id: id компании.
+        """
+        return await session.scalar(
+            select(Company.max_employees_count).where(Company.id == company_id).with_for_update()
+        )
+
     async def save_end_license_time(
         self, session: AsyncSession, company_start_license_time: datetime, license_id: int
     ) -> datetime:
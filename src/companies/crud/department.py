@@ -1,10 +1,10 @@
 """Модуль CRUD для отдела."""
 
 from src.companies.models import Department
-from src.crud import CRUDBase
+from src.crud import CRUDBase, SlugCreateMixin
 
 
-class CRUDCompanyDepartments(CRUDBase):
+class CRUDCompanyDepartments(SlugCreateMixin, CRUDBase):
     """CRUD операций для модели отделов компании."""
 
     pass
@@ -49,7 +49,8 @@ class Company(BaseTabitModel):
 
     Связи (атрибут - Модель):
         departments - Department;
-        employees - UserTabit;
+        employees - UserTabit: не загружается по умолчанию (lazy='raise'), при необходимости
+            запрашивается явно через selectinload(Company.employees);
         license - LicenseType;
         tags_users - TagUser: админ от компании может придумывать свои тэги для пользователей.
         problems - Problem: связь к созданным проблемам, определенной компании;
@@ -63,7 +64,7 @@ class Company(BaseTabitModel):
         back_populates='company', cascade='all, delete'
     )
     employees: Mapped[List['UserTabit']] = relationship(
-        back_populates='company', cascade='all, delete', lazy='selectin'
+        back_populates='company', cascade='all, delete', lazy='raise'
     )
     problems: Mapped[List['Problem']] = relationship(
         back_populates='company', cascade='all, delete-orphan'
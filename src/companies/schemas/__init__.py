@@ -1,4 +1,6 @@
 from src.companies.schemas.company import (  # noqa: F401
+    BulkEmployeeErrorSchema,
+    BulkEmployeesResponseSchema,
     CompanyCreateSchema,
     CompanyDepartmentCreateSchema,
     CompanyDepartmentResponseSchema,
@@ -7,4 +9,5 @@ from src.companies.schemas.company import (  # noqa: F401
     CompanyResponseSchema,
     CompanyUpdateForUserSchema,
     CompanyUpdateSchema,
+    EmployeeFilterSchema,
 )
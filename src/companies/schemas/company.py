@@ -4,6 +4,7 @@
 
 from datetime import datetime
 from typing import Literal, Optional, Self
+from uuid import UUID
 
 from pydantic import (
     BaseModel,
@@ -16,7 +17,10 @@ from pydantic import (
 from pydantic_extra_types.phone_numbers import PhoneNumber
 
 from src.companies.constants import (
+    FILTER_DEPARTMENT_IN_DESCRIPTION,
     FILTER_NAME_DESCRIPTION,
+    FILTER_ROLE_IN_DESCRIPTION,
+    FILTER_SURNAME_DESCRIPTION,
     SORTING_DESCRIPTION,
     TITLE_LICENSE_ID_COMPANY,
     TITLE_LOGO_COMPANY,
@@ -49,6 +53,7 @@ from src.users.constants import (
     title_surname_user,
     title_telegram_username_user,
 )
+from src.users.models.enum import RoleUserTabit
 from src.users.schemas import UserUpdateSchema
 
 
@@ -191,6 +196,24 @@ class CompanyTypeFilterSchema(BaseModel):
     ] = Field(None, description=SORTING_DESCRIPTION)
 
 
+class EmployeeFilterSchema(BaseModel):
+    """
+    Схема фильтрации списка сотрудников компании.
+    Имена полей соответствуют ключам CRUDBase._apply_filters (поле__оператор).
+
+    Attributes:
+        surname__ilike (Optional[str]): Часть фамилии.
+        current_department_id__in (Optional[list[int]]): id отделов.
+        role__in (Optional[list[RoleUserTabit]]): Роли сотрудников.
+    """
+
+    surname__ilike: Optional[str] = Field(None, description=FILTER_SURNAME_DESCRIPTION)
+    current_department_id__in: Optional[list[int]] = Field(
+        None, description=FILTER_DEPARTMENT_IN_DESCRIPTION
+    )
+    role__in: Optional[list[RoleUserTabit]] = Field(None, description=FILTER_ROLE_IN_DESCRIPTION)
+
+
 class CompanyDepartmentUpdateSchema(BaseModel):
     """Схема для обновления данных об отделе."""
 
@@ -293,3 +316,31 @@ class UserCompanyUpdateSchema(BaseModel):
         validate_name_characters(self.name)
         validate_surname_characters(self.surname)
         return self
+
+
+class BulkEmployeeErrorSchema(BaseModel):
+    """
+    Схема ошибки строки файла массового добавления сотрудников.
+    Параметры:
+        row: номер строки файла (для CSV без учёта заголовка), начиная с 1.
+        email: email из строки, если он был указан.
+        errors: список ошибок строки.
+    """
+
+    row: int
+    email: Optional[str] = None
+    errors: list[str]
+
+
+class BulkEmployeesResponseSchema(BaseModel):
+    """
+    Схема отчёта о массовом добавлении сотрудников.
+    Параметры:
+        created_count: число созданных сотрудников.
+        created_ids: id созданных сотрудников.
+        errors: ошибки по строкам, которые не были сохранены.
+    """
+
+    created_count: int = 0
+    created_ids: list[UUID] = []
+    errors: list[BulkEmployeeErrorSchema] = []
@@ -0,0 +1,171 @@
+"""Сервисные функции компаний."""
+
+from fastapi import HTTPException
+from fastapi_users.manager import BaseUserManager
+from pydantic import ValidationError
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.v1.auth.password import password_hasher
+from src.companies.constants import (
+    BULK_EMPLOYEES_BATCH_SIZE,
+    BULK_EMPLOYEES_EXCLUDED_FIELDS,
+    ERROR_BULK_DUPLICATE_EMAIL,
+    ERROR_BULK_EMPLOYEES_LIMIT,
+    ERROR_BULK_INSERT,
+    ERROR_BULK_ROW_FORMAT,
+    ERROR_USER_ALREADY_EXISTS,
+)
+from src.companies.crud import company_crud
+from src.companies.schemas import BulkEmployeeErrorSchema, BulkEmployeesResponseSchema
+from src.companies.utils import read_employees_file
+from src.logger import logger
+from src.users.crud.user import user_crud
+from src.users.schemas import UserCreateSchema
+
+
+async def bulk_create_employees(
+    session: AsyncSession,
+    user_manager: BaseUserManager,
+    company_id: int,
+    content: bytes,
+    file_name: str,
+) -> BulkEmployeesResponseSchema:
+    """
+    Массово добавляет сотрудников компании из файла CSV или JSON lines.
+
+    Порядок работы:
+        1. каждая строка проверяется схемой UserCreateSchema и правилами пароля, повторы
+           email внутри файла отклоняются;
+        2. занятые email отсекаются одним запросом WHERE lower(email) = ANY(:emails);
+        3. пароли хэшируются в пуле password_hasher, не блокируя цикл событий;
+        4. строка компании блокируется, лимит max_employees_count (0 - без ограничения)
+           проверяется один раз на пакет;
+        5. сотрудники добавляются пакетами по BULK_EMPLOYEES_BATCH_SIZE запросом
+           INSERT ... RETURNING, каждый пакет - в своей точке сохранения.
+    Строки с ошибками не сохраняются и попадают в отчёт, остальные фиксируются одной
+    транзакцией.
+
+    Параметры:
+        session: асинхронная сессия SQLAlchemy;
+        user_manager: менеджер пользователей, проверяющий пароль;
+        company_id: id компании;
+        content: содержимое файла;
+        file_name: имя файла, по расширению которого определяется формат.
+    Возвращаемое значение:
+        Отчёт с id созданных сотрудников и ошибками по строкам.
+    """
+    report = BulkEmployeesResponseSchema()
+    candidates: list[tuple[int, UserCreateSchema]] = []
+    seen_emails: set[str] = set()
+    for row, data in read_employees_file(content, file_name):
+        if data is None:
+            report.errors.append(BulkEmployeeErrorSchema(row=row, errors=[ERROR_BULK_ROW_FORMAT]))
+            continue
+        email = data.get('email')
+        try:
+            user = UserCreateSchema.model_validate({**data, 'company_id': company_id})
+            await user_manager.validate_password(user.password, user)
+        except ValidationError as e:
+            report.errors.append(
+                BulkEmployeeErrorSchema(
+                    row=row,
+                    email=email,
+                    errors=[
+                        f'{".".join(map(str, error["loc"]))}: {error["msg"]}'
+                        for error in e.errors()
+                    ],
+                )
+            )
+            continue
+        except HTTPException as e:
+            report.errors.append(BulkEmployeeErrorSchema(row=row, email=email, errors=[e.detail]))
+            continue
+        if user.email.lower() in seen_emails:
+            report.errors.append(
+                BulkEmployeeErrorSchema(row=row, email=email, errors=[ERROR_BULK_DUPLICATE_EMAIL])
+            )
+            continue
+        seen_emails.add(user.email.lower())
+        candidates.append((row, user))
+
+    if candidates:
+        existing_emails = await user_crud.get_existing_emails(session, seen_emails)
+        for row, user in candidates:
+            if user.email.lower() in existing_emails:
+                report.errors.append(
+                    BulkEmployeeErrorSchema(
+                        row=row, email=user.email, errors=[ERROR_USER_ALREADY_EXISTS]
+                    )
+                )
+        candidates = [
+            (row, user) for row, user in candidates if user.email.lower() not in existing_emails
+        ]
+    if candidates:
+        hashed_passwords = await password_hasher.hash_many(
+            [user.password for _, user in candidates]
+        )
+        await _insert_in_batches(session, company_id, candidates, hashed_passwords, report)
+        await session.commit()
+    report.errors.sort(key=lambda error: error.row)
+    return report
+
+
+async def _insert_in_batches(
+    session: AsyncSession,
+    company_id: int,
+    candidates: list[tuple[int, UserCreateSchema]],
+    hashed_passwords: list[str],
+    report: BulkEmployeesResponseSchema,
+) -> None:
+    """
+    Добавляет проверенных сотрудников пакетами, соблюдая лимит сотрудников компании,
+    и дополняет отчёт созданными id и ошибками.
+    """
+    limit = await company_crud.get_employees_limit_for_update(session, company_id)
+    remaining = limit - await user_crud.count_by_company(session, company_id) if limit else None
+    for start in range(0, len(candidates), BULK_EMPLOYEES_BATCH_SIZE):
+        batch = candidates[start : start + BULK_EMPLOYEES_BATCH_SIZE]
+        passwords = hashed_passwords[start : start + BULK_EMPLOYEES_BATCH_SIZE]
+        if remaining is not None:
+            allowed = max(remaining, 0)
+            report.errors.extend(
+                BulkEmployeeErrorSchema(
+                    row=row, email=user.email, errors=[ERROR_BULK_EMPLOYEES_LIMIT]
+                )
+                for row, user in batch[allowed:]
+            )
+            batch = batch[:allowed]
+        if not batch:
+            continue
+        rows = [
+            {
+                **user.model_dump(exclude=BULK_EMPLOYEES_EXCLUDED_FIELDS),
+                'hashed_password': hashed_password,
+            }
+            for (_, user), hashed_password in zip(batch, passwords)
+        ]
+        try:
+            async with session.begin_nested():
+                created = await user_crud.bulk_create(session, rows)
+        except IntegrityError as e:
+            logger.error(f'{ERROR_BULK_INSERT} {e}')
+            report.errors.extend(
+                BulkEmployeeErrorSchema(row=row, email=user.email, errors=[ERROR_BULK_INSERT])
+                for row, user in batch
+            )
+            continue
+        created_ids = {email.lower(): user_id for user_id, email in created}
+        for row, user in batch:
+            user_id = created_ids.get(user.email.lower())
+            if user_id is None:
+                report.errors.append(
+                    BulkEmployeeErrorSchema(
+                        row=row, email=user.email, errors=[ERROR_USER_ALREADY_EXISTS]
+                    )
+                )
+            else:
+                report.created_ids.append(user_id)
+        report.created_count += len(created)
+        if remaining is not None:
+            remaining -= len(created)
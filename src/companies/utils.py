@@ -0,0 +1,52 @@
+"""Вспомогательные функции для компаний."""
+
+import csv
+import io
+import json
+from pathlib import Path
+from typing import Any, Iterator
+
+from fastapi import HTTPException, status
+
+from src.companies.constants import (
+    BULK_EMPLOYEES_CSV_SUFFIX,
+    BULK_EMPLOYEES_JSON_SUFFIXES,
+    ERROR_BULK_FILE_ENCODING,
+    ERROR_BULK_FILE_FORMAT,
+)
+
+
+def read_employees_file(
+    content: bytes, file_name: str
+) -> Iterator[tuple[int, dict[str, Any] | None]]:
+    """
+    Разбирает файл массового добавления сотрудников в CSV (с заголовком) или JSON lines.
+    Формат определяется по расширению имени файла. Возвращает пары (номер строки, данные);
+    для строк, которые не удалось разобрать как JSON-объект, вместо данных возвращается None.
+    Пустые значения CSV не передаются, чтобы поля получили значения по умолчанию.
+
+    Параметры:
+        content: содержимое файла;
+        file_name: имя файла.
+    """
+    suffix = Path(file_name or '').suffix.lower()
+    if suffix != BULK_EMPLOYEES_CSV_SUFFIX and suffix not in BULK_EMPLOYEES_JSON_SUFFIXES:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=ERROR_BULK_FILE_FORMAT)
+    try:
+        text = content.decode('utf-8-sig')
+    except UnicodeDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=ERROR_BULK_FILE_ENCODING
+        )
+    if suffix == BULK_EMPLOYEES_CSV_SUFFIX:
+        for number, row in enumerate(csv.DictReader(io.StringIO(text)), start=1):
+            yield number, {key: value for key, value in row.items() if key and value}
+        return
+    for number, line in enumerate(text.splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError:
+            row = None
+        yield number, row if isinstance(row, dict) else None
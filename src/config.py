@@ -1,5 +1,7 @@
 import os
 from pathlib import Path
+from typing import Any, Literal
+from uuid import uuid4
 
 from dotenv import load_dotenv
 from fastapi_mail import ConnectionConfig
@@ -24,6 +26,55 @@ class Settings(BaseSettings):
     port_bd_postgres: str = os.getenv('PORT_BD_POSTGRES')
     log_level: str = os.getenv('LOG_LEVEL')
 
+    # Пул соединений с БД. Суммарное число соединений со всех воркеров uvicorn
+    # (workers * (db_pool_size + db_max_overflow)) должно быть меньше max_connections Postgres.
+    db_pool_size: int = 10  # Постоянные соединения пула.
+    db_max_overflow: int = 10  # Дополнительные соединения сверх db_pool_size при пиковой нагрузке.
+    db_pool_timeout: float = 30  # Сколько секунд ждать свободное соединение.
+    db_pool_recycle: int = 1_800  # Пересоздавать соединения старше указанного числа секунд.
+    db_pool_pre_ping: bool = True  # Проверять соединение перед выдачей из пула.
+    db_statement_cache_size: int = 100  # Размер кэша подготовленных запросов asyncpg.
+    # Работа через pgbouncer в режиме transaction: отключает кэш подготовленных запросов
+    # и задаёт им уникальные имена.
+    db_pgbouncer: bool = False
+
+    # Реплика для чтения. Если хост не задан, чтение идёт с основной БД.
+    replica_db_host: str | None = None
+    replica_port_bd_postgres: str | None = None  # По умолчанию порт основной БД.
+    # Сколько секунд после записи запросы клиента на чтение идут в основную БД.
+    db_read_your_writes_seconds: int = 5
+
+    # Пул для хэширования и проверки паролей вне цикла событий. Argon2 и bcrypt освобождают
+    # GIL, поэтому по умолчанию используется пул потоков.
+    password_hash_executor: Literal['thread', 'process'] = 'thread'
+    password_hash_workers: int = 4  # Максимум одновременно хэшируемых паролей на воркер.
+
+    # Соединения LISTEN кэша компаний и событий лент (src.database.listener).
+    listen_check_seconds: float = 30  # Как часто проверять соединение подписки.
+    listen_reconnect_seconds: float = 5  # Пауза перед повторной подпиской после потери.
+
+    # Кэш компаний по slug внутри процесса.
+    company_cache_size: int = 1_024  # Максимальное число компаний в кэше.
+    company_cache_ttl_seconds: float = 60  # Время жизни записи кэша.
+    # Инвалидация кэша на всех воркерах через LISTEN/NOTIFY (только для asyncpg).
+    company_cache_listen: bool = False
+
+    # События лент проблем через LISTEN/NOTIFY и Server-Sent Events (только для asyncpg).
+    feed_events_listen: bool = False
+    feed_events_queue_size: int = 100  # Событий в очереди одного клиента до его отключения.
+    feed_events_keepalive_seconds: float = 15  # Пауза, после которой клиенту шлётся keepalive.
+
+    # Кэш пользователей компаний по id и версии токена внутри процесса.
+    user_cache_size: int = 4_096  # Максимальное число пользователей в кэше.
+    user_cache_ttl_seconds: float = 30  # Время жизни записи кэша.
+
+    # Хранилище сессий refresh-токенов.
+    token_revoked_filter_bits: int = 1 << 20  # Размер фильтра Блума отозванных jti в битах.
+    token_revoked_filter_hashes: int = 7  # Число хэш-функций фильтра Блума.
+    token_session_sync_seconds: float = 10  # Как часто подгружать отзывы других воркеров.
+    token_session_purge_seconds: float = 600  # Как часто удалять истекшие сессии.
+    token_session_purge_batch_size: int = 1_000  # Строк в одном пакете удаления.
+
     jwt_secret: SecretStr = 'SUPERSECRETKEY'
     jwt_lifetime_seconds: int = 3_600  # 1 час.
     jwt_lifetime_seconds_refresh: int = 86_400  # 24 часа.
@@ -59,6 +110,33 @@ class Settings(BaseSettings):
             f'/{self.postgres_db}'
         )
 
+    @property
+    def replica_database_url(self) -> str | None:
+        if not self.replica_db_host:
+            return None
+        return (
+            f'{self.db_type}+{self.db_api}://'
+            f'{self.postgres_user}:{self.postgres_password}@'
+            f'{self.replica_db_host}:{self.replica_port_bd_postgres or self.port_bd_postgres}'
+            f'/{self.postgres_db}'
+        )
+
+    @property
+    def database_connect_args(self) -> dict[str, Any]:
+        """Аргументы подключения драйвера БД (кэш и имена подготовленных запросов asyncpg)."""
+        if self.db_api != 'asyncpg':
+            return {}
+        if self.db_pgbouncer:
+            return {
+                'statement_cache_size': 0,
+                'prepared_statement_cache_size': 0,
+                'prepared_statement_name_func': lambda: f'__asyncpg_{uuid4()}__',
+            }
+        return {
+            'statement_cache_size': self.db_statement_cache_size,
+            'prepared_statement_cache_size': self.db_statement_cache_size,
+        }
+
     model_config = ConfigDict(env_file='.env', extra='ignore')
 
 
@@ -1,3 +1,4 @@
+import string
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -20,6 +21,10 @@ LENGTH_SMALL_NAME: int = 30
 LENGTH_TELEGRAM_USERNAME: int = 100
 LENGTH_FILE_LINK: int = 2048
 LENGTH_SLUG: int = 25
+LENGTH_POLL_OPTION: int = 255
+
+# Полнотекстовый поиск
+SEARCH_CONFIGS: tuple[str, ...] = ('russian', 'simple')  # Конфигурации tsvector и tsquery
 
 # Проверяет наличие символов в обоих регистрах, числел и минимальную длину 8 символов
 PATTERN_PASSWORD: str = rf'^(?=.*[a-z])(?=.*[A-Z])(?=.*\d)[A-Za-z\d]{{{MIN_LENGTH_PASSWORD},}}$'
@@ -37,6 +42,20 @@ TEXT_ERROR_INVALID_PASSWORD: str = (
 DEFAULT_SKIP: int = 0  # Значение по умолчанию для пропуска записей
 DEFAULT_LIMIT: int = 100  # Ограничение количества записей
 DEFAULT_AUTO_COMMIT: bool = True  # для crud
+DEFAULT_YIELD_PER: int = 1_000  # Размер порции строк при потоковом чтении
+NEXT_CURSOR_HEADER: str = 'X-Next-Cursor'  # Заголовок ответа с курсором следующей страницы
+TOTAL_COUNT_HEADER: str = 'X-Total-Count'  # Заголовок ответа с общим числом объектов
+TITLE_CURSOR: str = 'Курсор следующей страницы'
+FILTER_OPERATOR_SEPARATOR: str = '__'  # Разделитель поля и оператора фильтра: name__ilike
+FILTER_LIKE_ESCAPE: str = '\\'  # Экранирующий символ шаблона ILIKE
+SLUG_CANDIDATES: int = 8  # Число вариантов slug, проверяемых одним запросом
+SLUG_SUFFIX_LENGTH: int = 4  # Длина случайного суффикса slug: name-a1b2
+SLUG_SUFFIX_SYMBOLS: str = string.ascii_lowercase + string.digits
+SLUG_ALLOCATION_ATTEMPTS: int = 3  # Попыток вставки при конфликте slug с параллельным запросом
+
+# Чтение с реплики
+PRIMARY_DB_COOKIE: str = 'tabit_primary_until'  # До какого времени читать из основной БД.
+WRITE_METHODS: tuple[str, ...] = ('POST', 'PUT', 'PATCH', 'DELETE')
 
 TEXT_ERROR_NOT_FOUND: str = 'Объект не найден'
 TEXT_ERROR_UNIQUE: str = 'Ошибка уникальности. Такой объект уже существует.'
@@ -48,6 +67,9 @@ TEXT_ERROR_SERVER_UPDATE: str = 'Ошибка сервера при обновл
 TEXT_ERROR_SERVER_UPDATE_LOG: str = 'Ошибка при обновлении'
 TEXT_ERROR_SERVER_DELETE: str = 'Ошибка сервера при удалении объекта.'
 TEXT_ERROR_SERVER_DELETE_LOG: str = 'Ошибка при удалении'
+TEXT_ERROR_INVALID_CURSOR: str = 'Некорректный курсор пагинации.'
+TEXT_ERROR_INVALID_FILTER: str = 'Фильтр {} не поддерживается.'
+TEXT_ERROR_SLUG_NOT_GENERATED: str = 'Не удалось подобрать свободный slug. Попробуйте снова.'
 
 TEXT_ERROR_EXISTS_EMAIL: str = 'Пользователь с такой электронной почтой уже существует.'
 TEXT_ERROR_INVALID_PASSWORD: str = 'Не корректный пароль'
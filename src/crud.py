@@ -6,28 +6,68 @@
 - Константу DEFAULT_AUTO_COMMIT для управления автокоммитом.
 - Функции для фильтрации и сортировки запросов:
   apply_filters, apply_order_by.
+- Словарь FILTER_OPERATORS с операторами фильтров вида поле__оператор.
 - Класс CRUDBase с асинхронными методами get, get_or_404, get_multi,
-  create, update и delete.
+  get_multi_by_cursor, get_page, get_page_by_cursor, stream, create, update и delete.
+- Миксины UserCreateMixin (создание пользователя) и SlugCreateMixin (подбор свободного
+  slug и создание объекта с ним).
+- Класс BatchLoader для пакетной загрузки связанных объектов страницы одним запросом.
+
+Связи моделей по умолчанию не загружаются; у сотрудников компании, участников проблем,
+встреч и задач и авторов лент ленивая загрузка запрещена (lazy='raise'). Методы чтения
+принимают параметр options с опциями загрузки (selectinload, joinedload и т.д.), через
+который эндпоинт явно запрашивает нужные ему связи.
+
+Модели, принадлежащие компании, объявляют в CRUD-классе путь tenant_path до столбца
+company_id; методы чтения с переданным company_id ограничивают выборку этой компанией.
 """
 
+import random
+from datetime import date, datetime, timedelta
+from enum import Enum
 from http import HTTPStatus
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+)
 from uuid import UUID
 
 from fastapi import HTTPException, status
 from fastapi.encoders import jsonable_encoder
 from fastapi_users import BaseUserManager, exceptions, models, schemas
-from sqlalchemy import select
+from slugify import slugify
+from sqlalchemy import ARRAY, Row, String, and_, any_, bindparam, func, or_, select, text, tuple_
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import Select
+from sqlalchemy.sql.base import ExecutableOption
 from starlette.requests import Request
 
 from src.constants import (
     DEFAULT_AUTO_COMMIT,
     DEFAULT_LIMIT,
     DEFAULT_SKIP,
+    DEFAULT_YIELD_PER,
+    FILTER_LIKE_ESCAPE,
+    FILTER_OPERATOR_SEPARATOR,
+    LENGTH_SLUG,
+    SLUG_ALLOCATION_ATTEMPTS,
+    SLUG_CANDIDATES,
+    SLUG_SUFFIX_LENGTH,
+    SLUG_SUFFIX_SYMBOLS,
     TEXT_ERROR_EXISTS_EMAIL,
+    TEXT_ERROR_INVALID_CURSOR,
+    TEXT_ERROR_INVALID_FILTER,
     TEXT_ERROR_INVALID_PASSWORD,
     TEXT_ERROR_NOT_FOUND,
     TEXT_ERROR_SERVER_CREATE,
@@ -36,22 +76,58 @@ from src.constants import (
     TEXT_ERROR_SERVER_DELETE_LOG,
     TEXT_ERROR_SERVER_UPDATE,
     TEXT_ERROR_SERVER_UPDATE_LOG,
+    TEXT_ERROR_SLUG_NOT_GENERATED,
     TEXT_ERROR_UNIQUE,
     TEXT_ERROR_UNIQUE_CREATE_LOG,
     TEXT_ERROR_UNIQUE_UPDATE_LOG,
 )
 from src.logger import logger
+from src.pagination import CountMode, decode_cursor, encode_cursor
 
 ModelType = TypeVar('ModelType')
 CreateSchemaType = TypeVar('CreateSchemaType')
 UpdateSchemaType = TypeVar('UpdateSchemaType')
 
 
+def _escape_like(value: str) -> str:
+    """Экранирует спецсимволы шаблона LIKE, чтобы значение искалось как подстрока."""
+    for char in (FILTER_LIKE_ESCAPE, '%', '_'):
+        value = value.replace(char, FILTER_LIKE_ESCAPE + char)
+    return value
+
+
+# Оператор фильтра -> функция (столбец, значение) -> условие WHERE. Значения всегда
+# передаются в запрос параметрами.
+FILTER_OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
+    'gt': lambda column, value: column > value,
+    'gte': lambda column, value: column >= value,
+    'lt': lambda column, value: column < value,
+    'lte': lambda column, value: column <= value,
+    'in': lambda column, value: column.in_(value),
+    'ilike': lambda column, value: column.ilike(
+        f'%{_escape_like(value)}%', escape=FILTER_LIKE_ESCAPE
+    ),
+    'between': lambda column, value: column.between(*value),
+}
+
+
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     """
     Универсальный базовый класс для CRUD операций.
+
+    Атрибуты класса:
+        tenant_path: путь от модели до столбца с id компании-владельца: имена связей,
+            по которым выполняется JOIN, и имя столбца последним элементом, например
+            ('problem', 'company_id'). Пустой кортеж - модель не привязана к компании.
+        filter_fields: белый список фильтров с операторами: {поле: (операторы, ...)}.
+            Фильтры вида поле__оператор (FILTER_OPERATORS) принимаются только для
+            перечисленных здесь полей и операторов. Под каждое поле должен быть индекс:
+            btree для gt, gte, lt, lte, in и between, триграммный GIN (pg_trgm) для ilike.
     """
 
+    tenant_path: tuple[str, ...] = ()
+    filter_fields: dict[str, tuple[str, ...]] = {}
+
     def __init__(self, model: Type[ModelType]):
         """
         Инициализирует CRUD-класс с указанной моделью.
@@ -61,24 +137,41 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         self.model = model
 
-    async def get(self, session: AsyncSession, obj_id: int | str | UUID) -> Optional[ModelType]:
+    async def get(
+        self,
+        session: AsyncSession,
+        obj_id: int | str | UUID,
+        options: Sequence[ExecutableOption] | None = None,
+        company_id: int | None = None,
+    ) -> Optional[ModelType]:
         """
         Получает объект по ID (int, str или UUID).
 
         Возвращает объект модели или None, если он не найден.
+        Связи, перечисленные в options (например, selectinload(Company.employees)),
+        загружаются вместе с объектом.
+        Если передан company_id, объект другой компании не возвращается (см. tenant_path).
         """
-        result = await session.execute(select(self.model).where(self.model.id == obj_id))
+        query = self._apply_options(select(self.model).where(self.model.id == obj_id), options)
+        query = self._apply_tenant(query, company_id)
+        result = await session.execute(query)
         return result.scalars().first()
 
     async def get_or_404(
-        self, session: AsyncSession, obj_id: int | UUID, message: str = TEXT_ERROR_NOT_FOUND
+        self,
+        session: AsyncSession,
+        obj_id: int | UUID,
+        message: str = TEXT_ERROR_NOT_FOUND,
+        options: Sequence[ExecutableOption] | None = None,
+        company_id: int | None = None,
     ) -> ModelType:
         """
         Получает объект по ID или выбрасывает 404-ошибку.
 
-        Возвращает объект или HTTPException(404), если не найден.
+        Возвращает объект или HTTPException(404), если не найден
+        или принадлежит не компании company_id.
         """
-        obj = await self.get(session, obj_id)
+        obj = await self.get(session, obj_id, options, company_id)
         if not obj:
             # TODO: Здесь и далее по коду избавиться от литералов, упаковать всё в константы.
             # Константы хранить в отдельном файле.
@@ -91,6 +184,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         obj_slug: str,
         raise_404: bool = False,
         message: str = TEXT_ERROR_NOT_FOUND,
+        options: Sequence[ExecutableOption] | None = None,
     ) -> Optional[ModelType]:
         """
         Получает объект по полю slug.
@@ -98,7 +192,8 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Возвращает объект модели или None, если он не найден.
         Если параметр raise_404 = True, тогда выбрасывает 404-ошибку, если не найден.
         """
-        result = await session.execute(select(self.model).where(self.model.slug == obj_slug))
+        query = self._apply_options(select(self.model).where(self.model.slug == obj_slug), options)
+        result = await session.execute(query)
         obj_model = result.scalars().first()
         if not obj_model and raise_404:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=message)
@@ -111,20 +206,24 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         limit: int = DEFAULT_LIMIT,
         filters: Optional[Dict[str, Any]] = None,
         order_by: list[str] | None = None,
+        options: Sequence[ExecutableOption] | None = None,
+        company_id: int | None = None,
     ) -> List[ModelType]:
         """
         Получает список объектов с пагинацией, фильтрацией и сортировкой.
 
         Назначение:
             Извлекает из БД ограниченный набор объектов, пропуская skip.
-            При filters накладывается WHERE (apply_filters),
-            при order_by — ORDER BY (apply_order_by).
+            При filters накладывается WHERE (apply_filters), сортировка - по order_by
+            с `id` последним полем (_apply_order_by), чтобы страницы не пересекались.
         Параметры:
             session: Асинхронная сессия SQLAlchemy.
             skip: Число записей для пропуска.
             limit: Максимальное число записей.
             filters: Словарь {имя_поля: значение} для фильтрации.
             order_by: Список полей для сортировки; '-' в начале для убывания.
+            options: Опции загрузки связей, например [selectinload(Company.employees)].
+            company_id: id компании, которой ограничивается выборка (см. tenant_path).
         Возвращаемое значение:
             Список объектов модели.
         Пример:
@@ -138,20 +237,189 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                 order_by=order
             )
         """
-        query = select(self.model)
+        query = self._select(filters, company_id, options)
+        query = self._apply_order_by(query, order_by or [])
+        query = query.offset(skip).limit(limit)
+        result = await session.execute(query)
+        return result.scalars().all()
 
-        if filters:
-            valid_filters = {key: value for key, value in filters.items() if value is not None}
+    async def get_multi_by_cursor(
+        self,
+        session: AsyncSession,
+        cursor: str | None = None,
+        limit: int = DEFAULT_LIMIT,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: list[str] | None = None,
+        options: Sequence[ExecutableOption] | None = None,
+        company_id: int | None = None,
+    ) -> tuple[List[ModelType], str | None]:
+        """
+        Получает список объектов с курсорной (keyset) пагинацией.
 
-            if valid_filters:
-                query = self._apply_filters(query, valid_filters)
+        Назначение:
+            В отличие от get_multi не использует OFFSET: условие продолжения строится
+            по значениям полей сортировки последнего объекта предыдущей страницы,
+            поэтому стоимость запроса не зависит от номера страницы.
+            К полям сортировки всегда добавляется `id`, чтобы порядок был однозначным.
+        Параметры:
+            session: Асинхронная сессия SQLAlchemy.
+            cursor: Курсор, полученный на предыдущей странице; None - первая страница.
+            limit: Максимальное число записей.
+            filters: Словарь {имя_поля: значение} для фильтрации.
+            order_by: Список полей для сортировки; '-' в начале для убывания.
+            options: Опции загрузки связей, например [selectinload(Company.employees)].
+            company_id: id компании, которой ограничивается выборка (см. tenant_path).
+        Возвращаемое значение:
+            Кортеж (список объектов модели, курсор следующей страницы или None).
+        Пример:
+            items, next_cursor = await comment_crud.get_multi_by_cursor(
+                session=session,
+                cursor=query_params.cursor,
+                limit=10,
+                filters={'message_id': 1},
+            )
+        """
+        order_by, order_columns = self._get_cursor_order(order_by)
+        query = self._select(filters, company_id, options)
+        query = self._apply_cursor_page(query, cursor, order_by, order_columns, limit)
+        result = await session.execute(query)
+        return self._split_cursor_page(result.scalars().all(), order_by, order_columns, limit)
 
-        if order_by:
-            query = self._apply_order_by(query, order_by)
+    async def get_page(
+        self,
+        session: AsyncSession,
+        skip: int = DEFAULT_SKIP,
+        limit: int = DEFAULT_LIMIT,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: list[str] | None = None,
+        options: Sequence[ExecutableOption] | None = None,
+        company_id: int | None = None,
+        count_mode: CountMode = CountMode.EXACT,
+    ) -> tuple[List[ModelType], int]:
+        """
+        Получает страницу объектов (как get_multi) вместе с общим числом объектов выборки.
 
+        Назначение:
+            В режиме CountMode.EXACT общее число считается тем же запросом, что и страница,
+            оконной функцией count(*) OVER (), с учётом фильтров и компании.
+            В режиме CountMode.ESTIMATED для выборки без условий WHERE число берётся
+            из статистики таблицы (pg_class.reltuples), а страница выбирается без подсчёта;
+            для выборки с условиями или таблицы без статистики используется EXACT.
+        Параметры:
+            session: Асинхронная сессия SQLAlchemy.
+            skip: Число записей для пропуска.
+            limit: Максимальное число записей.
+            filters: Словарь {имя_поля: значение} для фильтрации.
+            order_by: Список полей для сортировки; '-' в начале для убывания.
+            options: Опции загрузки связей.
+            company_id: id компании, которой ограничивается выборка (см. tenant_path).
+            count_mode: Способ подсчёта общего числа объектов.
+        Возвращаемое значение:
+            Кортеж (список объектов модели, общее число объектов).
+        """
+        query = self._select(filters, company_id, options)
+        total = await self._get_estimated_total(session, query, count_mode)
+        query = self._apply_order_by(query, order_by or [])
         query = query.offset(skip).limit(limit)
+        if total is not None:
+            result = await session.execute(query)
+            return result.scalars().all(), total
+        result = await session.execute(query.add_columns(self._total_column()))
+        objects, total = self._split_total(result.all())
+        if total is None:
+            total = await self._count(session, filters, company_id) if skip else 0
+        return objects, total
+
+    async def get_page_by_cursor(
+        self,
+        session: AsyncSession,
+        cursor: str | None = None,
+        limit: int = DEFAULT_LIMIT,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: list[str] | None = None,
+        options: Sequence[ExecutableOption] | None = None,
+        company_id: int | None = None,
+        count_mode: CountMode = CountMode.EXACT,
+    ) -> tuple[List[ModelType], str | None, int]:
+        """
+        Получает страницу объектов по курсору (как get_multi_by_cursor) вместе с общим
+        числом объектов выборки.
+
+        Назначение:
+            Общее число считается так же, как в get_page. Для страниц после первой
+            count(*) OVER () вычисляется в подзапросе без условия курсора, который
+            соединяется с таблицей по id, поэтому число не зависит от позиции курсора.
+        Параметры:
+            session: Асинхронная сессия SQLAlchemy.
+            cursor: Курсор, полученный на предыдущей странице; None - первая страница.
+            limit: Максимальное число записей.
+            filters: Словарь {имя_поля: значение} для фильтрации.
+            order_by: Список полей для сортировки; '-' в начале для убывания.
+            options: Опции загрузки связей.
+            company_id: id компании, которой ограничивается выборка (см. tenant_path).
+            count_mode: Способ подсчёта общего числа объектов.
+        Возвращаемое значение:
+            Кортеж (список объектов модели, курсор следующей страницы или None,
+            общее число объектов).
+        """
+        order_by, order_columns = self._get_cursor_order(order_by)
+        query = self._select(filters, company_id, options)
+        total = await self._get_estimated_total(session, query, count_mode)
+        if total is None and cursor:
+            counted = self._select(
+                filters, company_id, columns=(self.model.id, self._total_column())
+            ).subquery()
+            query = self._apply_options(
+                select(self.model, counted.c.total).join(counted, counted.c.id == self.model.id),
+                options,
+            )
+        elif total is None:
+            query = query.add_columns(self._total_column())
+        query = self._apply_cursor_page(query, cursor, order_by, order_columns, limit)
         result = await session.execute(query)
-        return result.scalars().all()
+        if total is None:
+            objects, total = self._split_total(result.all())
+            if total is None:
+                total = await self._count(session, filters, company_id) if cursor else 0
+        else:
+            objects = result.scalars().all()
+        objects, next_cursor = self._split_cursor_page(objects, order_by, order_columns, limit)
+        return objects, next_cursor, total
+
+    async def stream(
+        self,
+        session: AsyncSession,
+        columns: Sequence[Any] | None = None,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: list[str] | None = None,
+        yield_per: int = DEFAULT_YIELD_PER,
+        company_id: int | None = None,
+    ) -> AsyncIterator[Sequence[Row]]:
+        """
+        Потоково читает строки модели через серверный курсор.
+
+        Назначение:
+            Для выгрузок произвольного размера: строки приходят из БД порциями по yield_per,
+            поэтому расход памяти не зависит от числа записей. Вместо ORM-объектов
+            выбираются только указанные колонки.
+        Параметры:
+            session: Асинхронная сессия SQLAlchemy. Занята до окончания чтения.
+            columns: Колонки модели для выборки; по умолчанию - все колонки таблицы.
+            filters: Словарь {имя_поля: значение} для фильтрации.
+            order_by: Список полей для сортировки; '-' в начале для убывания.
+            yield_per: Размер порции строк.
+            company_id: id компании, которой ограничивается выборка (см. tenant_path).
+        Возвращаемое значение:
+            Асинхронный итератор порций строк (Row).
+        Пример:
+            async for rows in user_crud.stream(session, filters={'company_id': 1}):
+                ...
+        """
+        query = self._select(filters, company_id, columns=columns or self.model.__table__.columns)
+        query = self._apply_order_by(query, order_by or [])
+        result = await session.stream(query.execution_options(yield_per=yield_per))
+        async for partition in result.partitions():
+            yield partition
 
     async def create(
         self,
@@ -248,31 +516,277 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                 detail=TEXT_ERROR_SERVER_DELETE,
             )
 
+    def _select(
+        self,
+        filters: Optional[Dict[str, Any]],
+        company_id: int | None,
+        options: Sequence[ExecutableOption] | None = None,
+        columns: Sequence[Any] | None = None,
+    ) -> Select:
+        """
+        Строит запрос выборки модели с фильтрами и ограничением компанией.
+
+        Параметры:
+            filters: Словарь {имя_поля: значение}; значения None пропускаются.
+            company_id: id компании, которой ограничивается выборка (см. tenant_path).
+            options: Опции загрузки связей.
+            columns: Колонки для выборки; по умолчанию выбираются объекты модели.
+        Возвращаемое значение:
+            SQLAlchemy Select без сортировки и ограничения числа строк.
+        """
+        if columns is None:
+            query = self._apply_options(select(self.model), options)
+        else:
+            query = select(*columns).select_from(self.model)
+        query = self._apply_tenant(query, company_id)
+        if filters:
+            valid_filters = {key: value for key, value in filters.items() if value is not None}
+            if valid_filters:
+                query = self._apply_filters(query, valid_filters)
+        return query
+
+    @staticmethod
+    def _total_column() -> Any:
+        """Колонка с общим числом строк выборки до LIMIT/OFFSET."""
+        return func.count().over().label('total')
+
+    @staticmethod
+    def _split_total(rows: Sequence[Row]) -> tuple[List[Any], int | None]:
+        """
+        Разделяет строки (объект, total) на список объектов и общее число.
+        Для пустой страницы общее число неизвестно и возвращается None.
+        """
+        return [row[0] for row in rows], rows[0].total if rows else None
+
+    async def _count(
+        self, session: AsyncSession, filters: Optional[Dict[str, Any]], company_id: int | None
+    ) -> int:
+        """Считает объекты выборки отдельным запросом COUNT(*)."""
+        query = self._select(filters, company_id, columns=(self.model.id,))
+        result = await session.execute(select(func.count()).select_from(query.subquery()))
+        return result.scalar_one()
+
+    async def _get_estimated_total(
+        self, session: AsyncSession, query: Select, count_mode: CountMode
+    ) -> int | None:
+        """
+        Возвращает оценку числа строк таблицы модели по статистике pg_class.reltuples.
+
+        Оценка возвращается только в режиме CountMode.ESTIMATED и только для запроса
+        без условий WHERE: статистика описывает всю таблицу и не учитывает фильтры.
+        Если статистика ещё не собрана (reltuples < 0), возвращается None.
+        """
+        if count_mode is not CountMode.ESTIMATED or query.whereclause is not None:
+            return None
+        result = await session.execute(
+            text('SELECT reltuples FROM pg_class WHERE oid = CAST(:table_name AS regclass)'),
+            {'table_name': self.model.__tablename__},
+        )
+        reltuples = result.scalar_one_or_none()
+        if reltuples is None or reltuples < 0:
+            return None
+        return int(reltuples)
+
+    @staticmethod
+    def _apply_options(query: Select, options: Sequence[ExecutableOption] | None) -> Select:
+        """
+        Добавляет к запросу опции загрузки связей.
+
+        Параметры:
+            query: Исходный SQLAlchemy Select.
+            options: Опции загрузки (selectinload, joinedload, raiseload и т.д.) или None.
+        Возвращаемое значение:
+            Запрос с опциями загрузки.
+        """
+        if options:
+            query = query.options(*options)
+        return query
+
+    def _apply_tenant(self, query: Select, company_id: int | None) -> Select:
+        """
+        Ограничивает запрос объектами компании company_id.
+
+        Назначение:
+            Для моделей с tenant_path присоединяет связи из пути (JOIN) и добавляет
+            условие WHERE <столбец company_id> = company_id. Запрос выбирает только
+            объекты компании и использует индекс по столбцу компании.
+        Параметры:
+            query: Исходный SQLAlchemy Select.
+            company_id: id компании; None - запрос не ограничивается.
+        Возвращаемое значение:
+            Обновлённый запрос.
+        Пример:
+            tenant_path = ('message', 'problem', 'company_id')
+            # FROM commentfeed JOIN messagefeed ... JOIN problem ...
+            # WHERE problem.company_id = :company_id
+        """
+        if company_id is None or not self.tenant_path:
+            return query
+        *relationships, column_name = self.tenant_path
+        entity = self.model
+        for relationship_name in relationships:
+            relationship = getattr(entity, relationship_name)
+            query = query.join(relationship)
+            entity = relationship.property.mapper.class_
+        return query.where(getattr(entity, column_name) == company_id)
+
     def _apply_filters(self, query: Select, filters: dict[str, Any]) -> Select:
         """
-        Добавляет простые условия равенства (WHERE) к запросу на основе словаря.
+        Добавляет условия (WHERE) к запросу на основе словаря.
 
         Назначение:
-            Фильтрует результат по полям self.model. Если поля нет в модели,
-            он игнорируется.
+            Фильтрует результат по полям self.model. Ключ без оператора - условие
+            равенства; если поля нет в модели, он игнорируется. Ключ вида
+            поле__оператор (gt, gte, lt, lte, in, ilike, between) применяется, только
+            если поле и оператор разрешены в filter_fields, иначе - HTTP 400.
         Параметры:
             query: Исходный SQLAlchemy Select.
-            filters: Словарь вида {имя_поля: значение}.
+            filters: Словарь вида {имя_поля[__оператор]: значение}; для in - список
+                значений, для between - пара (от, до).
         Возвращаемое значение:
             Обновлённый запрос c наложенными условиями.
         Пример:
-            filters = {'status': 'active', 'user_id': 10}
+            filters = {'status__in': ['Новая', 'В работе'], 'date_completion__gte': date}
             query = select(self.model)
             query = self._apply_filters(query, filters)
-            # WHERE model.status='active' AND model.user_id=10
+            # WHERE model.status IN (...) AND model.date_completion >= :date_completion
         """
-        # TODO: Добавить поддержку операций >, <, LIKE, IN, BETWEEN и т.д.
-        for field_name, field_value in filters.items():
+        for key, field_value in filters.items():
+            field_name, _, operator = key.partition(FILTER_OPERATOR_SEPARATOR)
             column = getattr(self.model, field_name, None)
-            if column is not None:
-                query = query.where(column == field_value)
+            if not operator:
+                if column is not None:
+                    query = query.where(column == field_value)
+                continue
+            if operator not in self.filter_fields.get(field_name, ()):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=TEXT_ERROR_INVALID_FILTER.format(key),
+                )
+            query = query.where(FILTER_OPERATORS[operator](column, field_value))
         return query
 
+    def _get_cursor_order(
+        self, order_by: list[str] | None
+    ) -> tuple[list[str], list[tuple[Any, bool]]]:
+        """
+        Возвращает поля сортировки для курсора (без `id`) и пары (столбец, по убыванию ли),
+        к которым последним добавлен `id`, чтобы порядок был однозначным.
+        """
+        order_by = [field for field in order_by or [] if field.lstrip('-') != 'id']
+        return order_by, self._get_order_columns(order_by) + [(self.model.id, False)]
+
+    def _apply_cursor_page(
+        self,
+        query: Select,
+        cursor: str | None,
+        order_by: list[str],
+        order_columns: list[tuple[Any, bool]],
+        limit: int,
+    ) -> Select:
+        """
+        Добавляет к запросу условие курсора, сортировку и LIMIT на одну строку больше
+        страницы, чтобы узнать, есть ли следующая страница.
+        """
+        if cursor:
+            values = decode_cursor(cursor, order_by)
+            query = self._apply_cursor(query, order_columns, values)
+        query = query.order_by(
+            *(column.desc() if desc else column.asc() for column, desc in order_columns)
+        )
+        return query.limit(limit + 1)
+
+    @staticmethod
+    def _split_cursor_page(
+        objects: Sequence[Any],
+        order_by: list[str],
+        order_columns: list[tuple[Any, bool]],
+        limit: int,
+    ) -> tuple[List[Any], str | None]:
+        """Отрезает лишний объект страницы и кодирует по последнему объекту курсор."""
+        if len(objects) <= limit:
+            return objects, None
+        objects = objects[:limit]
+        next_cursor = encode_cursor(
+            order_by, [getattr(objects[-1], column.key) for column, _ in order_columns]
+        )
+        return objects, next_cursor
+
+    def _get_order_columns(self, order_by: list[str]) -> list[tuple[Any, bool]]:
+        """
+        Сопоставляет имена полей сортировки со столбцами модели.
+
+        Возвращает список пар (столбец, по убыванию ли). Поля, которых нет в модели,
+        игнорируются.
+        """
+        order_columns = []
+        for field_name in order_by:
+            desc = field_name.startswith('-')
+            actual_field_name = field_name[1:] if desc else field_name
+            column = getattr(self.model, actual_field_name, None)
+            if column is not None:
+                order_columns.append((column, desc))
+        return order_columns
+
+    def _apply_cursor(
+        self, query: Select, order_columns: list[tuple[Any, bool]], values: list[Any]
+    ) -> Select:
+        """
+        Добавляет к запросу условие продолжения выборки после значений из курсора.
+
+        Назначение:
+            Если все поля сортируются в одном направлении, строит сравнение кортежей
+            (a, b, id) > (:a, :b, :id), которое Postgres выполняет по составному индексу.
+            Иначе строит эквивалентную цепочку OR с учётом направления каждого поля.
+        Параметры:
+            query: Исходный SQLAlchemy Select.
+            order_columns: Список пар (столбец, по убыванию ли).
+            values: Значения полей сортировки последнего объекта предыдущей страницы.
+        Возвращаемое значение:
+            Обновлённый запрос с условием продолжения.
+        """
+        columns = [column for column, _ in order_columns]
+        try:
+            if len(values) != len(columns):
+                raise ValueError
+            values = [
+                self._restore_cursor_value(column, value) for column, value in zip(columns, values)
+            ]
+        except (TypeError, ValueError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail=TEXT_ERROR_INVALID_CURSOR
+            )
+        directions = {desc for _, desc in order_columns}
+        if len(directions) == 1:
+            row, row_values = tuple_(*columns), tuple_(*values)
+            return query.where(row < row_values if directions.pop() else row > row_values)
+        conditions = []
+        for index, (column, desc) in enumerate(order_columns):
+            equal = [columns[i] == values[i] for i in range(index)]
+            conditions.append(
+                and_(*equal, column < values[index] if desc else column > values[index])
+            )
+        return query.where(or_(*conditions))
+
+    @staticmethod
+    def _restore_cursor_value(column: Any, value: Any) -> Any:
+        """Приводит значение из курсора (JSON) к python-типу столбца."""
+        try:
+            python_type = column.type.python_type
+        except NotImplementedError:
+            return value
+        if value is None:
+            return value
+        if python_type is datetime:
+            return datetime.fromisoformat(value)
+        if python_type is date:
+            return date.fromisoformat(value)
+        if python_type is timedelta:
+            return timedelta(seconds=value)
+        if issubclass(python_type, (UUID, Enum)):
+            return python_type(value)
+        return value
+
     def _apply_order_by(self, query: Select, order_by: list[str]) -> Select:
         """
         Добавляет сортировку (ORDER BY) к запросу, поддерживая '-' для убывания.
@@ -280,27 +794,110 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Назначение:
             Упорядочивает результат по указанным полям модели. Если поле
             начинается с '-', применяется сортировка по убыванию. Если
-            поля нет в модели, он игнорируется.
+            поля нет в модели, он игнорируется. Если среди полей нет `id`, он
+            добавляется последним, как в режиме курсора, чтобы порядок строк с
+            равными значениями не менялся между страницами OFFSET.
         Параметры:
             query: Исходный SQLAlchemy Select.
             order_by: Список имён полей; '-' в начале означает DESC.
         Возвращаемое значение:
             Обновлённый запрос с сортировкой.
         Пример:
-            order = ['-created_at', 'id']
+            order = ['-created_at']
             query = select(self.model)
             query = self._apply_order_by(query, order)
             # ORDER BY model.created_at DESC, model.id ASC
         """
-        for field_name in order_by:
-            desc = field_name.startswith('-')
-            actual_field_name = field_name[1:] if desc else field_name
-            column = getattr(self.model, actual_field_name, None)
-            if column is not None:
-                query = query.order_by(column.desc() if desc else column.asc())
+        order_columns = self._get_order_columns(order_by)
+        if not any(column is self.model.id for column, _ in order_columns):
+            order_columns.append((self.model.id, False))
+        for column, desc in order_columns:
+            query = query.order_by(column.desc() if desc else column.asc())
         return query
 
 
+class BatchLoader:
+    """
+    Пакетный загрузчик строк модели по ключу (в духе DataLoader).
+
+    Назначение:
+        Собирает ключи со всех объектов страницы (автор комментария, исполнители задачи,
+        участники встречи и т.д.), убирает повторы и загружает недостающие строки одним
+        запросом SELECT ... WHERE key = ANY(:keys). Загруженные строки кешируются на время
+        жизни загрузчика, поэтому повторные обращения к тем же ключам не обращаются к БД.
+        Загрузчик создаётся на запрос и не переживает сессию.
+    Параметры:
+        session: Асинхронная сессия SQLAlchemy.
+        model: Модель загружаемых строк.
+        columns: Загружаемые колонки модели; по умолчанию - все колонки таблицы.
+        key: Имя колонки-ключа, по умолчанию id.
+    Пример:
+        loader = BatchLoader(session, UserTabit, (UserTabit.id, UserTabit.name))
+        await loader.attach(comments, 'owner_id', 'author')
+        await loader.attach(tasks, 'executors', 'executors_info')
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        model: Type[Any],
+        columns: Sequence[Any] | None = None,
+        key: str = 'id',
+    ):
+        self.session = session
+        self.key_column = getattr(model, key)
+        columns = list(columns or model.__table__.columns)
+        if not any(column.key == self.key_column.key for column in columns):
+            columns.insert(0, self.key_column)
+        self.columns = columns
+        self._cache: dict[Any, Row | None] = {}
+
+    async def load_many(self, keys: Iterable[Any]) -> dict[Any, Row | None]:
+        """
+        Возвращает строки по ключам: {ключ: строка или None, если строки нет}.
+        Ключи, которых ещё нет в кеше, загружаются одним запросом.
+        """
+        keys = list(dict.fromkeys(key for key in keys if key is not None))
+        missing = [key for key in keys if key not in self._cache]
+        if missing:
+            query = select(*self.columns).where(
+                self.key_column == any_(bindparam('keys', missing, ARRAY(self.key_column.type)))
+            )
+            self._cache.update(dict.fromkeys(missing))
+            for row in await self.session.execute(query):
+                self._cache[getattr(row, self.key_column.key)] = row
+        return {key: self._cache[key] for key in keys}
+
+    async def attach(
+        self, objects: Sequence[Any], key_field: str, target_field: str
+    ) -> Sequence[Any]:
+        """
+        Загружает строки для всех объектов одним запросом и записывает их в атрибут
+        target_field каждого объекта.
+
+        Параметры:
+            objects: Объекты страницы.
+            key_field: Атрибут объекта с ключом или списком ключей.
+            target_field: Атрибут, в который записывается строка (для списка ключей -
+                список найденных строк в том же порядке). Не должен совпадать с именем
+                связи модели.
+        Возвращаемое значение:
+            Те же объекты.
+        """
+        values = [getattr(obj, key_field) for obj in objects]
+        loaded = await self.load_many(
+            key
+            for value in values
+            for key in (value if isinstance(value, (list, tuple, set)) else (value,))
+        )
+        for obj, value in zip(objects, values):
+            if isinstance(value, (list, tuple, set)):
+                setattr(obj, target_field, [loaded[key] for key in value if loaded.get(key)])
+            else:
+                setattr(obj, target_field, loaded.get(value))
+        return objects
+
+
 class UserCreateMixin:
     """
     Миксин для CRUD. Добавляет метод для создания пользователя.
@@ -335,3 +932,100 @@ class UserCreateMixin:
                 },
             )
         return created_user
+
+
+class SlugCreateMixin:
+    """
+    Миксин для CRUD моделей с уникальным полем slug (компании, отделы).
+
+    Свободный slug подбирается одним запросом SELECT slug ... WHERE slug = ANY(:candidates)
+    среди SLUG_CANDIDATES вариантов, а объект создаётся вставкой
+    INSERT ... ON CONFLICT (slug) DO NOTHING: если параллельный запрос успел занять тот же
+    slug, подбор повторяется (не более SLUG_ALLOCATION_ATTEMPTS раз).
+    """
+
+    @staticmethod
+    def _slug_candidates(name: str, current_slug: str | None = None) -> list[str]:
+        """
+        Возвращает варианты slug для названия: сам slug названия и варианты со случайным
+        суффиксом вида name-a1b2, укладывающиеся в LENGTH_SLUG символов. Текущий slug
+        объекта, подходящий к названию, идёт первым, чтобы не менять его без надобности.
+        """
+        base_slug = slugify(name, max_length=LENGTH_SLUG)
+        prefix = slugify(name, max_length=LENGTH_SLUG - SLUG_SUFFIX_LENGTH - 1)
+        prefix = f'{prefix}-' if prefix else ''
+        candidates = [base_slug] if base_slug else []
+        if current_slug and current_slug != base_slug:
+            if current_slug.startswith(prefix) and (
+                len(current_slug) == len(prefix) + SLUG_SUFFIX_LENGTH
+            ):
+                candidates.insert(0, current_slug)
+        while len(candidates) < SLUG_CANDIDATES:
+            suffix = ''.join(random.choices(SLUG_SUFFIX_SYMBOLS, k=SLUG_SUFFIX_LENGTH))
+            candidates.append(prefix + suffix)
+        return candidates
+
+    async def allocate_slug(self, session: AsyncSession, name: str, db_obj: Any = None) -> str:
+        """
+        Подбирает свободный slug для названия одним запросом к БД.
+
+        Параметры:
+            session: асинхронная сессия SQLAlchemy;
+            name: название объекта, из которого формируется slug;
+            db_obj: изменяемый объект; его собственный slug считается свободным и
+                сохраняется, если подходит к новому названию.
+        Возвращаемое значение:
+            Первый незанятый вариант slug. Если заняты все варианты - 409-ошибка.
+        """
+        candidates = self._slug_candidates(name, db_obj.slug if db_obj is not None else None)
+        query = select(self.model.slug).where(
+            self.model.slug == any_(bindparam('candidates', candidates, ARRAY(String)))
+        )
+        if db_obj is not None:
+            query = query.where(self.model.id != db_obj.id)
+        taken = set((await session.scalars(query)).all())
+        for candidate in candidates:
+            if candidate not in taken:
+                return candidate
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail=TEXT_ERROR_SLUG_NOT_GENERATED
+        )
+
+    async def create_with_slug(
+        self, session: AsyncSession, obj_in: CreateSchemaType, name: str, **fields: Any
+    ):
+        """
+        Создаёт объект со свободным slug, подобранным по названию.
+        Переданный в схеме slug не используется.
+
+        Параметры:
+            session: асинхронная сессия SQLAlchemy;
+            obj_in: данные объекта;
+            name: название объекта, из которого формируется slug;
+            fields: значения полей, которых нет в схеме (например, company_id).
+        Возвращаемое значение:
+            Созданный объект. При нарушении других ограничений - 400-ошибка.
+        """
+        values = {**obj_in.model_dump(exclude={'slug'}), **fields}
+        for _ in range(SLUG_ALLOCATION_ATTEMPTS):
+            slug = await self.allocate_slug(session, name)
+            try:
+                db_obj = await session.scalar(
+                    insert(self.model)
+                    .values(**values, slug=slug)
+                    .on_conflict_do_nothing(index_elements=[self.model.slug])
+                    .returning(self.model)
+                )
+            except IntegrityError as e:
+                await session.rollback()
+                logger.error(f'{TEXT_ERROR_UNIQUE_CREATE_LOG} {self.model.__name__}: {e}')
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=TEXT_ERROR_UNIQUE,
+                )
+            if db_obj is not None:
+                await session.commit()
+                return db_obj
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail=TEXT_ERROR_SLUG_NOT_GENERATED
+        )
@@ -19,6 +19,7 @@ from src.problems.models import (
     VotingFeed,
 )
 from src.tabit_management.models import LandingPage, LicenseType, TabitAdminUser
+from src.token_sessions.models import TokenSession
 from src.users.models import AssociationUserTags, TagUser, UserTabit
 
 __all__ = [
@@ -46,4 +47,5 @@ __all__ = [
     'FileMeeting',
     'FileTask',
     'FileMessage',
+    'TokenSession',
 ]
@@ -4,9 +4,9 @@ from datetime import datetime
 from typing import Annotated, Optional
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, Integer, String, Text, func
-from sqlalchemy.dialects.postgresql import TIMESTAMP
-from sqlalchemy.orm import mapped_column
+from sqlalchemy import Computed, ForeignKey, Identity, Integer, String, Text, func
+from sqlalchemy.dialects.postgresql import TIMESTAMP, TSVECTOR
+from sqlalchemy.orm import MappedColumn, mapped_column
 
 from src.constants import (
     LENGTH_FILE_LINK,
@@ -14,10 +14,13 @@ from src.constants import (
     LENGTH_NAME_USER,
     LENGTH_SLUG,
     LENGTH_SMALL_NAME,
+    SEARCH_CONFIGS,
     ZERO,
 )
 
-int_pk = Annotated[int, mapped_column(primary_key=True, unique=True)]
+int_pk = Annotated[int, mapped_column(primary_key=True)]
+# Для составных первичных ключей: id остаётся уникальным сам по себе.
+int_pk_unique = Annotated[int, mapped_column(primary_key=True, unique=True)]
 name_field = Annotated[str, mapped_column(String(LENGTH_NAME_USER))]
 patronymic_field = Annotated[Optional[str], mapped_column(String(LENGTH_NAME_USER), nullable=True)]
 license_name_field = Annotated[str, mapped_column(String(LENGTH_NAME_USER), unique=True)]
@@ -47,3 +50,23 @@ comment_rating = Annotated[int, mapped_column(Integer, nullable=False, default=Z
 int_pk_autoincrement = Annotated[
     int, mapped_column(primary_key=True, unique=True, autoincrement=True)
 ]
+# id, заполняемый столбцом GENERATED BY DEFAULT AS IDENTITY (см. миграцию 08).
+int_pk_identity = Annotated[int, mapped_column(Identity(), primary_key=True, unique=True)]
+
+
+def search_vector_column(*columns: tuple[str, str]) -> MappedColumn:
+    """
+    Генерируемый (STORED) столбец tsvector для полнотекстового поиска по столбцам таблицы.
+    Каждый столбец разбирается всеми конфигурациями SEARCH_CONFIGS: russian находит
+    другие формы слова, simple - слова как есть (имена, коды, латиница). Столбец не
+    загружается вместе с объектом (deferred).
+
+    Параметры:
+        columns: пары (имя столбца, вес 'A'-'D'); вес учитывается при ранжировании.
+    """
+    vectors = ' || '.join(
+        f"setweight(to_tsvector('{config}'::regconfig, coalesce({column}, '')), '{weight}')"
+        for column, weight in columns
+        for config in SEARCH_CONFIGS
+    )
+    return mapped_column(TSVECTOR, Computed(vectors, persisted=True), deferred=True)
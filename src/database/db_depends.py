@@ -1,14 +1,77 @@
+import time
 from typing import Any, AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import sessionmaker
+from starlette.requests import Request
 
 from src.config import settings
+from src.constants import PRIMARY_DB_COOKIE, WRITE_METHODS
+from src.database.engine import engine, read_engine
+from src.logger import logger
 
-engine = create_async_engine(settings.database_url)
 AsyncSessionLocal = sessionmaker(engine, class_=AsyncSession)
+AsyncReadSessionLocal = sessionmaker(read_engine, class_=AsyncSession)
 
 
 async def get_async_session() -> AsyncGenerator[AsyncSession, Any]:
     async with AsyncSessionLocal() as async_session:
         yield async_session
+
+
+def primary_required(request: Request) -> bool:
+    """
+    Вернёт True, если клиент недавно выполнял запись и должен читать из основной БД.
+    Время окончания «липкости» выставляет ReadYourWritesMiddleware в cookie PRIMARY_DB_COOKIE.
+    """
+    try:
+        return float(request.cookies.get(PRIMARY_DB_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+
+async def get_async_read_session(request: Request) -> AsyncGenerator[AsyncSession, Any]:
+    """
+    Сессия для эндпоинтов, которые только читают данные.
+
+    Работает с репликой (settings.replica_db_host). Использует основную БД, если:
+        - реплика не настроена;
+        - клиент недавно выполнял запись (read-your-writes, см. ReadYourWritesMiddleware);
+        - к реплике не удалось подключиться.
+    """
+    if read_engine is engine or primary_required(request):
+        async_session = AsyncSessionLocal()
+    else:
+        async_session = AsyncReadSessionLocal()
+        try:
+            await async_session.connection()
+        except (DBAPIError, OSError) as error:
+            logger.warning(f'Реплика БД недоступна, чтение из основной БД: {error}')
+            await async_session.close()
+            async_session = AsyncSessionLocal()
+    async with async_session:
+        yield async_session
+
+
+class ReadYourWritesMiddleware:
+    """
+    Middleware, закрепляющий клиента за основной БД после успешной записи.
+
+    После успешного запроса с методом из WRITE_METHODS выставляет cookie PRIMARY_DB_COOKIE
+    со временем, до которого get_async_read_session читает из основной БД, чтобы клиент
+    сразу видел свои изменения, даже если реплика ещё не догнала основную БД.
+    """
+
+    async def __call__(self, request: Request, call_next, *args, **kwargs):
+        response = await call_next(request)
+        if (
+            read_engine is not engine
+            and request.method in WRITE_METHODS
+            and response.status_code < 400
+        ):
+            window = settings.db_read_your_writes_seconds
+            response.set_cookie(
+                PRIMARY_DB_COOKIE, str(time.time() + window), max_age=window, httponly=True
+            )
+        return response
@@ -0,0 +1,116 @@
+"""
+Модуль с единственным на процесс движком БД и пулом соединений.
+
+Содержит:
+- PoolMetrics: счётчики выдачи соединений из пула и ожидания свободного соединения.
+- MeteredQueuePool: пул соединений, собирающий PoolMetrics.
+- create_engine: фабрика асинхронного движка с настройками пула из Settings.
+- engine: общий движок, используемый db_depends.py и sc_db_session.py.
+- read_engine: движок реплики для чтения; если реплика не настроена, совпадает с engine.
+- get_pool_metrics: текущее состояние пула и накопленные метрики.
+"""
+
+import time
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+from src.config import settings
+
+
+@dataclass
+class PoolMetrics:
+    """
+    Накопленные метрики пула соединений.
+
+    Поля:
+        checkouts: сколько раз соединение выдавалось из пула;
+        checkout_seconds_total: суммарное время получения соединения (ожидание и подключение);
+        checkout_seconds_max: максимальное время получения соединения;
+        timeouts: сколько раз соединение не было получено за db_pool_timeout.
+    """
+
+    checkouts: int = 0
+    checkout_seconds_total: float = 0
+    checkout_seconds_max: float = 0
+    timeouts: int = 0
+
+
+class MeteredQueuePool(AsyncAdaptedQueuePool):
+    """Пул соединений, замеряющий время получения соединения."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        elapsed = time.perf_counter() - start
+        self.metrics.checkouts += 1
+        self.metrics.checkout_seconds_total += elapsed
+        self.metrics.checkout_seconds_max = max(self.metrics.checkout_seconds_max, elapsed)
+        return connection
+
+    def recreate(self) -> 'MeteredQueuePool':
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+def create_engine(database_url: str | None = None, **kwargs: Any) -> AsyncEngine:
+    """
+    Создаёт асинхронный движок с пулом соединений, настроенным по Settings.
+
+    Параметры:
+        database_url: URL БД, по умолчанию settings.database_url;
+        kwargs: дополнительные аргументы create_async_engine, переопределяющие настройки.
+    """
+    options: dict[str, Any] = {
+        'poolclass': MeteredQueuePool,
+        'pool_size': settings.db_pool_size,
+        'max_overflow': settings.db_max_overflow,
+        'pool_timeout': settings.db_pool_timeout,
+        'pool_recycle': settings.db_pool_recycle,
+        'pool_pre_ping': settings.db_pool_pre_ping,
+        'connect_args': settings.database_connect_args,
+    }
+    options.update(kwargs)
+    return create_async_engine(database_url or settings.database_url, **options)
+
+
+engine = create_engine()
+read_engine = (
+    create_engine(settings.replica_database_url) if settings.replica_database_url else engine
+)
+
+
+def get_pool_metrics(async_engine: AsyncEngine = engine) -> dict[str, Any]:
+    """
+    Возвращает состояние пула соединений движка и накопленные метрики.
+
+    Поля ответа:
+        pool_size, max_overflow: настройки пула;
+        checked_out: соединений выдано сейчас;
+        checked_in: свободных соединений в пуле;
+        overflow: текущее число соединений сверх pool_size (может быть отрицательным,
+            пока пул не заполнен);
+        а так же поля PoolMetrics.
+    """
+    pool = async_engine.sync_engine.pool
+    metrics = getattr(pool, 'metrics', PoolMetrics())
+    return {
+        'pool_size': pool.size(),
+        'max_overflow': pool._max_overflow,
+        'checked_out': pool.checkedout(),
+        'checked_in': pool.checkedin(),
+        'overflow': pool.overflow(),
+        **asdict(metrics),
+    }
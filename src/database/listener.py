@@ -0,0 +1,145 @@
+"""
+Модуль подписки на канал Postgres LISTEN с переподключением.
+
+Содержит:
+- PgListener: отдельное соединение asyncpg с подпиской на канал NOTIFY и фоновой
+  задачей, которая следит за соединением и восстанавливает подписку после его потери.
+
+Используется кэшем компаний (src.companies.cache) и брокером событий лент
+(src.problems.events).
+"""
+
+import asyncio
+from contextlib import suppress
+from typing import Any, Callable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from src.config import settings
+from src.logger import logger
+
+
+class PgListener:
+    """
+    Подписка на канал NOTIFY через отдельное соединение asyncpg.
+
+    Потеря соединения обнаруживается обработчиком завершения соединения asyncpg, а
+    «зависшее» соединение - проверочным запросом раз в listen_check_seconds. После потери
+    вызывается on_lost (уведомления, пришедшие до переподключения, потеряны), и задача
+    пытается подключиться заново раз в listen_reconnect_seconds; после восстановления
+    подписки вызывается on_restored. Соединение открывается к основной БД, так как
+    реплики не получают NOTIFY.
+    """
+
+    def __init__(
+        self,
+        channel: str,
+        on_notify: Callable[[Any, int, str, str], None],
+        on_lost: Optional[Callable[[], None]] = None,
+        on_restored: Optional[Callable[[], None]] = None,
+    ) -> None:
+        self.channel = channel
+        self.on_notify = on_notify
+        self.on_lost = on_lost
+        self.on_restored = on_restored
+        self._engine: Optional[AsyncEngine] = None
+        self._connection: Optional[AsyncConnection] = None
+        self._driver_connection: Any = None
+        self._lost: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def is_listening(self) -> bool:
+        """Действует ли подписка на канал."""
+        return self._connection is not None
+
+    def _on_termination(self, connection: Any) -> None:
+        """Обработчик завершения соединения asyncpg."""
+        self._lost.set()
+
+    async def _connect(self) -> None:
+        """Открывает соединение и подписывается на канал."""
+        connection = await self._engine.connect()
+        try:
+            raw_connection = await connection.get_raw_connection()
+            driver_connection = raw_connection.driver_connection
+            await driver_connection.add_listener(self.channel, self.on_notify)
+            driver_connection.add_termination_listener(self._on_termination)
+        except Exception:
+            await self._discard(connection)
+            raise
+        self._connection = connection
+        self._driver_connection = driver_connection
+        self._lost.clear()
+
+    @staticmethod
+    async def _discard(connection: AsyncConnection) -> None:
+        """Закрывает потерянное соединение, не возвращая его в пул."""
+        with suppress(Exception):
+            await connection.invalidate()
+        with suppress(Exception):
+            await connection.close()
+
+    async def _check(self) -> None:
+        """Проверяет соединение запросом; при ошибке или таймауте считает его потерянным."""
+        try:
+            await self._driver_connection.execute(
+                'SELECT 1', timeout=settings.listen_check_seconds
+            )
+        except Exception as error:
+            logger.error(f'Соединение подписки на канал {self.channel} не отвечает: {error}')
+            self._lost.set()
+
+    async def _supervise(self) -> None:
+        """Следит за соединением подписки и восстанавливает её после потери."""
+        while True:
+            try:
+                await asyncio.wait_for(self._lost.wait(), settings.listen_check_seconds)
+            except TimeoutError:
+                await self._check()
+                continue
+            if self._connection is not None:
+                connection, self._connection = self._connection, None
+                self._driver_connection = None
+                logger.error(f'Потеряно соединение подписки на канал {self.channel}')
+                if self.on_lost is not None:
+                    self.on_lost()
+                await self._discard(connection)
+            await asyncio.sleep(settings.listen_reconnect_seconds)
+            try:
+                await self._connect()
+            except Exception as error:
+                logger.error(f'Не удалось подписаться на канал {self.channel}: {error}')
+                continue
+            logger.info(f'Подписка на канал {self.channel} восстановлена')
+            if self.on_restored is not None:
+                self.on_restored()
+
+    async def start(self, async_engine: AsyncEngine) -> None:
+        """
+        Подписывается на канал и запускает задачу, следящую за соединением. Если БД
+        недоступна, ошибка записывается в лог и подписка повторяется в фоне.
+        """
+        self._engine = async_engine
+        self._lost = asyncio.Event()
+        try:
+            await self._connect()
+        except Exception as error:
+            logger.error(f'Не удалось подписаться на канал {self.channel}: {error}')
+            self._lost.set()
+        self._task = asyncio.create_task(self._supervise())
+
+    async def stop(self) -> None:
+        """Останавливает задачу, отписывается от канала и закрывает соединение."""
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        if self._connection is None:
+            return
+        connection, self._connection = self._connection, None
+        driver_connection, self._driver_connection = self._driver_connection, None
+        driver_connection.remove_termination_listener(self._on_termination)
+        await driver_connection.remove_listener(self.channel, self.on_notify)
+        await connection.close()
@@ -1,9 +1,7 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import scoped_session, sessionmaker
 
-from src.config import settings
-
-engine = create_async_engine(settings.database_url)
+from src.database.engine import engine
 
 async_session = sessionmaker(
     engine,
@@ -1,17 +1,48 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
 from src.api.v1.routers import main_router
+from src.companies.cache import company_cache
 from src.config import settings
+from src.database.db_depends import ReadYourWritesMiddleware
+from src.database.engine import engine
+from src.database.sc_db_session import async_session
 from src.logger import LoggingMiddleware
+from src.problems.events import feed_broker
+from src.request_context import RequestContextMiddleware
 from src.scripts import application_management
+from src.token_sessions.service import token_session_store
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Подписывает кэш компаний на межпроцессную инвалидацию и брокер событий лент на
+    канал NOTIFY, если они включены, и запускает обслуживание хранилища сессий
+    refresh-токенов.
+    """
+    if settings.company_cache_listen:
+        await company_cache.start_listener(engine)
+    if settings.feed_events_listen:
+        await feed_broker.start_listener(engine)
+    token_session_store.start(async_session)
+    yield
+    await token_session_store.stop()
+    await company_cache.stop_listener()
+    await feed_broker.stop_listener()
+
 
 app_v1 = FastAPI(
     title=settings.app_title,
     description=settings.description,
     version=settings.version,
     swagger_ui_parameters={'filter': True},
+    lifespan=lifespan,
 )
 app_v1.middleware('http')(LoggingMiddleware())  # Add logging requests feature as middleware
+app_v1.middleware('http')(ReadYourWritesMiddleware())  # Чтение из основной БД после записи
+app_v1.middleware('http')(RequestContextMiddleware())  # Пользователь и компания на запрос
 app_v1.include_router(main_router)
 
 
@@ -1 +1,162 @@
-# global module e.g. pagination
+"""
+Модуль курсорной (keyset) пагинации.
+
+Содержит функции для кодирования и декодирования непрозрачного курсора, перечисление
+CountMode со способами подсчёта общего числа объектов и функцию paginate,
+выбирающую режим пагинации по query-параметрам.
+Курсор хранит значения полей сортировки (и `id`) последнего объекта страницы,
+а так же сам порядок сортировки, для которого курсор был выдан.
+"""
+
+import base64
+import binascii
+import json
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any, Optional, Sequence
+
+from fastapi import HTTPException, Response, status
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.base import ExecutableOption
+
+from src.constants import NEXT_CURSOR_HEADER, TEXT_ERROR_INVALID_CURSOR, TOTAL_COUNT_HEADER
+
+if TYPE_CHECKING:
+    from src.crud import CRUDBase
+
+
+class CountMode(StrEnum):
+    """
+    Способ подсчёта общего числа объектов списка.
+
+    EXACT - точное число тем же запросом, что и страница (count(*) OVER ()).
+    ESTIMATED - оценка по статистике таблицы (pg_class.reltuples) для больших таблиц;
+    применяется только к выборкам без фильтров, иначе используется EXACT.
+    """
+
+    EXACT = 'exact'
+    ESTIMATED = 'estimated'
+
+
+def encode_cursor(order_by: list[str], values: list[Any]) -> str:
+    """
+    Кодирует значения последнего объекта страницы в непрозрачный курсор.
+
+    Параметры:
+        order_by: Список полей сортировки, для которого выдаётся курсор.
+        values: Значения полей сортировки последнего объекта (последним идёт `id`).
+    Возвращаемое значение:
+        Строка курсора в формате base64 (url-safe).
+    """
+    payload = json.dumps({'o': order_by, 'v': jsonable_encoder(values)}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str, order_by: list[str]) -> list[Any]:
+    """
+    Декодирует курсор и возвращает сохранённые в нём значения.
+
+    Если курсор повреждён или был выдан для другого порядка сортировки,
+    выбрасывает HTTPException(400).
+
+    Параметры:
+        cursor: Строка курсора, полученная клиентом на предыдущей странице.
+        order_by: Текущий список полей сортировки.
+    Возвращаемое значение:
+        Список значений полей сортировки (последним идёт `id`).
+    """
+    try:
+        padding = '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(cursor + padding))
+        values = payload['v']
+        if payload['o'] != order_by or not isinstance(values, list):
+            raise ValueError
+    except (binascii.Error, ValueError, KeyError, TypeError, UnicodeDecodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=TEXT_ERROR_INVALID_CURSOR
+        )
+    return values
+
+
+async def paginate(
+    crud: 'CRUDBase',
+    session: AsyncSession,
+    response: Response,
+    query_params: Any,
+    filters: Optional[dict[str, Any]] = None,
+    order_by: list[str] | None = None,
+    company_id: int | None = None,
+    count_mode: CountMode | None = None,
+    options: Sequence[ExecutableOption] | None = None,
+) -> list[Any]:
+    """
+    Возвращает страницу объектов, выбирая режим пагинации по query-параметрам.
+
+    Назначение:
+        Если передан `cursor` или запрошена первая страница (skip=0), используется
+        курсорная пагинация, а курсор следующей страницы возвращается в заголовке
+        ответа NEXT_CURSOR_HEADER. Если передан только skip > 0, используется
+        OFFSET-пагинация для обратной совместимости.
+        Если передан count_mode, общее число объектов выборки возвращается
+        в заголовке ответа TOTAL_COUNT_HEADER.
+    Параметры:
+        crud: CRUD-объект модели.
+        session: Асинхронная сессия SQLAlchemy.
+        response: Объект ответа FastAPI, в который добавляется заголовок с курсором.
+        query_params: Схема с полями skip, limit и cursor.
+        filters: Словарь {имя_поля: значение} для фильтрации.
+        order_by: Список полей для сортировки; '-' в начале для убывания.
+        company_id: id компании, которой ограничивается выборка (см. CRUDBase.tenant_path).
+        count_mode: Способ подсчёта общего числа объектов; None - не считать.
+        options: Опции загрузки связей и выражений запроса (см. CRUDBase.get_multi).
+    Возвращаемое значение:
+        Список объектов модели.
+    """
+    total = next_cursor = None
+    if query_params.cursor is None and query_params.skip:
+        if count_mode is None:
+            return await crud.get_multi(
+                session,
+                query_params.skip,
+                query_params.limit,
+                filters=filters,
+                order_by=order_by,
+                options=options,
+                company_id=company_id,
+            )
+        objects, total = await crud.get_page(
+            session,
+            query_params.skip,
+            query_params.limit,
+            filters=filters,
+            order_by=order_by,
+            options=options,
+            company_id=company_id,
+            count_mode=count_mode,
+        )
+    elif count_mode is None:
+        objects, next_cursor = await crud.get_multi_by_cursor(
+            session,
+            query_params.cursor,
+            query_params.limit,
+            filters=filters,
+            order_by=order_by,
+            options=options,
+            company_id=company_id,
+        )
+    else:
+        objects, next_cursor, total = await crud.get_page_by_cursor(
+            session,
+            query_params.cursor,
+            query_params.limit,
+            filters=filters,
+            order_by=order_by,
+            options=options,
+            company_id=company_id,
+            count_mode=count_mode,
+        )
+    if total is not None:
+        response.headers[TOTAL_COUNT_HEADER] = str(total)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return objects
@@ -19,6 +19,18 @@ TITLE_COMMENTS_TEXT_CREATE: str = 'Новый комментарий к тред
 TITLE_COMMENTS_TEXT_UPDATE: str = 'Обновить комментарий к треду.'
 TITLE_MESSAGE_FEED_IMPORTANT: str = 'Важность треда.'
 TITLE_MESSAGE_FEED_TEXT: str = 'Название треда.'
+TITLE_THREADS_ORDERING: str = 'Сортировка тредов: -last_activity_at - сначала недавно активные.'
+TITLE_POLL_OPTIONS: str = 'Варианты голосования.'
+TITLE_POLL_OPTION: str = 'Id выбранного варианта.'
+TITLE_FILTER_NAME: str = 'Часть названия (без учёта регистра).'
+TITLE_FILTER_STATUS_IN: str = 'Один из статусов.'
+TITLE_FILTER_TYPE_IN: str = 'Один из типов проблемы.'
+TITLE_FILTER_DATE_FROM: str = 'Дата завершения не раньше.'
+TITLE_FILTER_DATE_TO: str = 'Дата завершения не позже.'
+TITLE_FILTER_DATE_BETWEEN: str = 'Дата завершения в диапазоне: две даты, от и до.'
+TITLE_SEARCH_QUERY: str = 'Поисковый запрос: слова, "фраза", -исключить, or.'
+TITLE_BULK_TASKS: str = 'Создаваемые задачи.'
+MAX_BULK_TASKS: int = 100  # Максимальное число задач в одном запросе на массовое создание
 
 # Константы к валидаторам
 VALID_WRONG_COMPANY: str = 'Разрешён доступ только к своей компании.'
@@ -29,3 +41,31 @@ VALID_COMMENT_NOT_OWNER: str = 'Вы можете изменять только
 VALID_LIKE_OWN_COMMENT: str = 'Нельзя менять рейтинг собственного комментария.'
 VALID_REPEATED_LIKE: str = 'Вы уже лайкнули данный комментарий.'
 VALID_NOT_LIKED_COMMENT: str = 'Вы не лайкали данный комментарий.'
+VALID_POLL_NOT_OWNER: str = 'Голосование может начать только автор треда.'
+VALID_POLL_EXISTS: str = 'В треде уже есть голосование.'
+VALID_POLL_NOT_FOUND: str = 'В треде нет голосования.'
+VALID_POLL_OPTION_NOT_FOUND: str = 'В голосовании треда нет такого варианта.'
+VALID_NOT_VOTED: str = 'Вы не голосовали в этом голосовании.'
+VALID_VOTE_CONFLICT: str = 'Голос изменён параллельным запросом. Попробуйте снова.'
+
+# Ограничения БД
+UQ_USER_COMMENT_LIKE: str = 'uq_user_comment_like'
+UQ_USER_POLL_VOTE: str = 'uq_user_poll_vote'
+UQ_POLL_OPTION_NAME: str = 'uq_poll_option_name'
+
+# Голосования в тредах
+MIN_POLL_OPTIONS: int = 2
+MAX_POLL_OPTIONS: int = 10
+VOTE_ATTEMPTS: int = 3  # Попыток записать голос при гонке с параллельным голосом
+
+# События ленты проблемы в реальном времени (Server-Sent Events)
+FEED_EVENTS_CHANNEL: str = 'feed_events'  # Канал NOTIFY событий тредов и комментариев
+FEED_EVENTS_MEDIA_TYPE: str = 'text/event-stream'
+FEED_EVENTS_KEEPALIVE: str = ': keepalive\n\n'  # SSE-комментарий, не дающий закрыть соединение
+VALID_FEED_EVENTS_DISABLED: str = 'События ленты в реальном времени отключены.'
+
+# Полнотекстовый поиск по проблемам, тредам и комментариям
+MAX_LENGTH_SEARCH_QUERY: int = 200
+SEARCH_HEADLINE_CONFIG: str = 'russian'  # Конфигурация разбора текста фрагмента
+SEARCH_HEADLINE_OPTIONS: str = 'MaxFragments=2, MaxWords=20, MinWords=5, FragmentDelimiter=" … "'
+SEARCH_ORDER_BY: list[str] = ['-rank', '-type', '-id']  # Порядок результатов и ключ курсора
@@ -4,6 +4,7 @@ from .meeting import meeting_crud
 from .message_feed import message_feed_crud
 from .problems import problem_crud
 from .task_crud import task_crud
+from .voting import voting_crud
 
 __all__ = [
     'comment_crud',
@@ -12,4 +13,5 @@ __all__ = [
     'problem_crud',
     'user_comment_association_crud',
     'task_crud',
+    'voting_crud',
 ]
@@ -1,44 +1,117 @@
-from typing import Type
+from typing import Any, Iterable, NamedTuple, Optional, Sequence, Type
 from uuid import UUID
 
-from sqlalchemy import Table
+from sqlalchemy import ARRAY, RowMapping, any_, bindparam, delete, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.database.models import BaseTabitModel
 
-# TODO В зависисмоти от выбора добавления списка участников во встречу изменить метод
-async def create_associations(
+
+class ChildRows(NamedTuple):
+    """Строки дочерней таблицы для объектов, создаваемых create_with_children.
+
+    Параметры:
+        model: Модель дочерней таблицы (ассоциации, файлы).
+        parent_field: Поле дочерней таблицы со ссылкой на id родительского объекта.
+        rows: Списки строк дочерней таблицы, по одному на каждый создаваемый объект
+            в том же порядке.
+    """
+
+    model: Type[BaseTabitModel]
+    parent_field: str
+    rows: Sequence[Sequence[dict[str, Any]]]
+
+
+async def create_with_children(
     session: AsyncSession,
-    association_model: Type[Table],
-    left_ids: list[UUID],
-    right_id: int,
-    status: bool | None = None,
-) -> None:
-    """Создание ассоциаций между сущностями.
+    model: Type[BaseTabitModel],
+    rows: Sequence[dict[str, Any]],
+    *children: ChildRows,
+) -> list[RowMapping]:
+    """Создание объектов вместе с дочерними строками в одной транзакции.
 
     Назначение:
-        Создает ассоциации между левыми и правыми сущностями через указанную модель.
-        Выполняет массовую вставку для повышения производительности.
-        Для ассоциаций с проблемами добавляет поле status.
-
+        Вставляет объекты одним запросом INSERT ... RETURNING, который возвращает все
+        столбцы созданных строк (в том числе id и значения по умолчанию), а затем
+        вставляет строки каждой дочерней таблицы одним пакетным запросом (executemany)
+        с id соответствующего родителя. Транзакция не фиксируется: коммит и откат
+        при ошибке выполняет вызывающий код.
     Параметры:
         session: Асинхронная сессия SQLAlchemy.
-        association_model: Модель ассоциативной таблицы.
-        left_ids: Список UUID левых сущностей (например, ID участников).
-        right_id: ID правой сущности (например, ID встречи или проблемы).
-        status: Статус ассоциации (используется только для проблем).
-
+        model: Модель создаваемых объектов.
+        rows: Значения полей создаваемых объектов.
+        children: Строки дочерних таблиц (ChildRows).
     Возвращаемое значение:
-        None
+        Строки созданных объектов в порядке rows, по ним строится ответ без
+        повторного чтения из БД.
     """
-    # Создаем базовые данные для ассоциаций
-    base_data = {'right_id': right_id}
+    table = model.__table__
+    result = await session.execute(
+        insert(table).returning(*table.c, sort_by_parameter_order=True), list(rows)
+    )
+    created = list(result.mappings())
+    for child in children:
+        child_rows = [
+            {**child_row, child.parent_field: parent['id']}
+            for parent, parent_rows in zip(created, child.rows)
+            for child_row in parent_rows
+        ]
+        if child_rows:
+            await session.execute(insert(child.model.__table__), child_rows)
+    return created
 
-    # Добавляем статус, если он указан
-    if status is not None:
-        base_data['status'] = status
 
-    # Создаем список ассоциаций для массовой вставки
-    associations = [{'left_id': left_id, **base_data} for left_id in left_ids]
+async def sync_associations(
+    session: AsyncSession,
+    association_model: Type[BaseTabitModel],
+    right_id: int,
+    left_ids: Iterable[UUID],
+    current_ids: Optional[Iterable[UUID]] = None,
+    **values: Any,
+) -> tuple[list[UUID], list[UUID]]:
+    """Синхронизация ассоциаций сущности с новым списком связанных объектов.
 
-    # Выполняем массовую вставку
-    await session.execute(association_model.__table__.insert(), associations)
+    Назначение:
+        Сравнивает текущие и новые связи и изменяет только разницу: лишние связи
+        удаляются одним запросом DELETE ... WHERE left_id = ANY(:removed), недостающие
+        добавляются одним многострочным INSERT ... ON CONFLICT DO NOTHING. Если набор
+        связей не изменился, запросы на изменение не выполняются. Подходит для
+        исполнителей задач, участников проблем и встреч, тегов пользователей: таблица
+        ассоциации должна иметь поля left_id и right_id с уникальным индексом по ним.
+        Транзакция не фиксируется.
+    Параметры:
+        session: Асинхронная сессия SQLAlchemy.
+        association_model: Модель ассоциативной таблицы.
+        right_id: ID правой сущности (например, ID задачи).
+        left_ids: Новый набор UUID левых сущностей (например, ID исполнителей).
+        current_ids: Текущий набор UUID левых сущностей, если он уже загружен;
+            иначе читается из БД.
+        values: Значения остальных полей добавляемых ассоциаций (например, status).
+    Возвращаемое значение:
+        Кортеж из списков добавленных и удалённых UUID.
+    """
+    table = association_model.__table__
+    if current_ids is None:
+        current_ids = await session.scalars(
+            select(table.c.left_id).where(table.c.right_id == right_id)
+        )
+    current = set(current_ids)
+    new_ids = list(dict.fromkeys(left_ids))
+    added = [left_id for left_id in new_ids if left_id not in current]
+    removed = list(current.difference(new_ids))
+    if removed:
+        await session.execute(
+            delete(table).where(
+                table.c.right_id == right_id,
+                table.c.left_id
+                == any_(bindparam('removed', removed, ARRAY(table.c.left_id.type))),
+            )
+        )
+    if added:
+        await session.execute(
+            pg_insert(table)
+            .values([{'left_id': left_id, 'right_id': right_id, **values} for left_id in added])
+            .on_conflict_do_nothing(index_elements=['right_id', 'left_id'])
+        )
+    return added, removed
@@ -1,6 +1,8 @@
 from uuid import UUID
 
 from fastapi import HTTPException, status
+from sqlalchemy import CTE, Update, case, delete, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -8,13 +10,22 @@ from src.constants import (
     DEFAULT_AUTO_COMMIT,
     TEXT_ERROR_SERVER_CREATE,
     TEXT_ERROR_SERVER_CREATE_LOG,
+    TEXT_ERROR_SERVER_DELETE,
+    TEXT_ERROR_SERVER_DELETE_LOG,
+    TEXT_ERROR_SERVER_UPDATE,
+    TEXT_ERROR_SERVER_UPDATE_LOG,
     TEXT_ERROR_UNIQUE,
     TEXT_ERROR_UNIQUE_CREATE_LOG,
 )
 from src.crud import CRUDBase
 from src.logger import logger
-from src.problems.crud import user_comment_association_crud
-from src.problems.models import AssociationUserComment, CommentFeed
+from src.problems.constants import (
+    UQ_USER_COMMENT_LIKE,
+    VALID_NOT_LIKED_COMMENT,
+    VALID_REPEATED_LIKE,
+)
+from src.problems.events import FeedEventType, publish_feed_event
+from src.problems.models import AssociationUserComment, CommentFeed, MessageFeed
 from src.problems.schemas import CommentCreate
 
 
@@ -31,6 +42,8 @@ class CRUDComment(CRUDBase):
         auto_commit: константа для автокоммитов, по умолчанию - True.
     """
 
+    tenant_path = ('message', 'problem', 'company_id')
+
     async def create(
         self,
         session: AsyncSession,
@@ -41,7 +54,9 @@ class CRUDComment(CRUDBase):
     ) -> CommentFeed:
         """
         Переопределённый метод create для создания объектов CommentFeed в БД.
-        Возвращает созданный объект из БД.
+        В той же транзакции обновляет сводку треда (число комментариев, последний
+        комментарий и последняя активность) и отправляет событие ленты проблемы
+        COMMENT_CREATED. Возвращает созданный объект из БД.
 
         Параметры:
             session: асинхронная сессия SQLAlchemy;
@@ -56,6 +71,16 @@ class CRUDComment(CRUDBase):
         db_obj = self.model(**obj_data)
         try:
             session.add(db_obj)
+            await session.flush()
+            problem_id = await session.scalar(self._comment_added(message_feed_id, user_id))
+            await publish_feed_event(
+                session,
+                FeedEventType.COMMENT_CREATED,
+                problem_id,
+                thread_id=message_feed_id,
+                comment_id=db_obj.id,
+                owner_id=user_id,
+            )
             if auto_commit:
                 await session.commit()
                 await session.refresh(db_obj)
@@ -75,53 +100,207 @@ class CRUDComment(CRUDBase):
             )
         return db_obj
 
-    async def like(self, comment: CommentFeed, user_id: UUID, session: AsyncSession):
+    async def remove(
+        self,
+        session: AsyncSession,
+        db_object: CommentFeed,
+        auto_commit: bool = DEFAULT_AUTO_COMMIT,
+    ) -> None:
         """
-        Функция для лайка комментариев.
-        Создаёт запись о лайке в связанной таблице и увеличивает рейтинг на 1.
+        Удаляет комментарий и в той же транзакции пересчитывает сводку треда.
 
         Параметры:
-            comment: объект модели CommentFeed;
-            user_id: UUID пользователя, сделавшего запрос;
-            session: асинхронная сессия SQLAlchemy.
+            session: асинхронная сессия SQLAlchemy;
+            db_object: удаляемый комментарий;
+            auto_commit: константа для автокоммитов, по умолчанию - True.
         """
         try:
-            await user_comment_association_crud.create(comment.id, user_id, session)
-            comment.rating += 1
-            session.add(comment)
-            await session.commit()
+            await session.delete(db_object)
+            await session.flush()
+            await session.execute(self._comment_removed(db_object.message_id))
+            if auto_commit:
+                await session.commit()
         except Exception as e:
             await session.rollback()
-            logger.error(f'{TEXT_ERROR_SERVER_CREATE_LOG} {self.model.__name__}: {e}')
+            logger.error(f'{TEXT_ERROR_SERVER_DELETE_LOG} {self.model.__name__}: {e}')
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=TEXT_ERROR_SERVER_CREATE,
+                detail=TEXT_ERROR_SERVER_DELETE,
+            )
+
+    @staticmethod
+    def _comment_added(message_feed_id: int, user_id: UUID) -> Update:
+        """
+        Запрос, обновляющий сводку треда после нового комментария:
+
+            UPDATE messagefeed SET comments_count = comments_count + 1,
+                last_comment_at = now(), last_comment_owner_id = :user_id,
+                last_activity_at = greatest(last_activity_at, now())
+            WHERE id = :message_feed_id RETURNING problem_id
+
+        Последний комментарий меняется, только если сохранённый не новее текущей
+        транзакции: параллельные комментарии обновляют тред по очереди (блокировка
+        строки), и более ранний не затирает более поздний.
+        """
+        newer = or_(
+            MessageFeed.last_comment_at.is_(None), MessageFeed.last_comment_at <= func.now()
+        )
+        return (
+            update(MessageFeed)
+            .where(MessageFeed.id == message_feed_id)
+            .values(
+                comments_count=MessageFeed.comments_count + 1,
+                last_comment_at=case((newer, func.now()), else_=MessageFeed.last_comment_at),
+                last_comment_owner_id=case(
+                    (newer, user_id), else_=MessageFeed.last_comment_owner_id
+                ),
+                last_activity_at=func.greatest(MessageFeed.last_activity_at, func.now()),
+                updated_at=MessageFeed.updated_at,
             )
+            .returning(MessageFeed.problem_id)
+            .execution_options(synchronize_session=False)
+        )
 
-    async def unlike(
-        self, user_comment_obj: AssociationUserComment, comment: CommentFeed, session: AsyncSession
-    ):
+    @staticmethod
+    def _comment_removed(message_feed_id: int) -> Update:
+        """
+        Запрос, обновляющий сводку треда после удаления комментария: уменьшает число
+        комментариев и берёт последний комментарий по индексу (message_id, id).
+        Если комментариев не осталось, последней активностью становится создание треда.
+        """
+        last_comment = (
+            select(CommentFeed)
+            .where(CommentFeed.message_id == message_feed_id)
+            .order_by(CommentFeed.id.desc())
+            .limit(1)
+            .subquery()
+        )
+        last_comment_at = select(last_comment.c.created_at).scalar_subquery()
+        return (
+            update(MessageFeed)
+            .where(MessageFeed.id == message_feed_id)
+            .values(
+                comments_count=MessageFeed.comments_count - 1,
+                last_comment_at=last_comment_at,
+                last_comment_owner_id=select(last_comment.c.owner_id).scalar_subquery(),
+                last_activity_at=func.coalesce(last_comment_at, MessageFeed.created_at),
+                updated_at=MessageFeed.updated_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    async def like(self, comment_id: int, user_id: UUID, session: AsyncSession) -> int:
+        """
+        Функция для лайка комментариев.
+        Одним запросом создаёт запись о лайке в связанной таблице и увеличивает рейтинг на 1:
+
+            WITH liked AS (
+                INSERT INTO associationusercomment ... ON CONFLICT DO NOTHING RETURNING right_id
+            )
+            UPDATE commentfeed SET rating = rating + 1
+            WHERE id IN (SELECT right_id FROM liked) RETURNING rating
+
+        Повторный лайк отсекается уникальным ограничением uq_user_comment_like: запись не
+        вставляется, рейтинг не меняется и выбрасывается ошибка HTTP 400.
+        Возвращает новый рейтинг комментария.
+
+        Параметры:
+            comment_id: id комментария;
+            user_id: UUID пользователя, сделавшего запрос;
+            session: асинхронная сессия SQLAlchemy.
+        """
+        liked = (
+            insert(AssociationUserComment)
+            .values(left_id=user_id, right_id=comment_id)
+            .on_conflict_do_nothing(constraint=UQ_USER_COMMENT_LIKE)
+            .returning(AssociationUserComment.right_id)
+            .cte('liked')
+        )
+        return await self._change_rating(
+            session, liked, self.model.rating + 1, VALID_REPEATED_LIKE, FeedEventType.COMMENT_LIKED
+        )
+
+    async def unlike(self, comment_id: int, user_id: UUID, session: AsyncSession) -> int:
         """
         Функция для снятия лайка с комментариев.
-        Удалёет запись о лайке в связанной таблице и уменьшает рейтинг на 1.
+        Одним запросом удаляет запись о лайке в связанной таблице и уменьшает рейтинг на 1.
+        Если лайка не было, рейтинг не меняется и выбрасывается ошибка HTTP 400.
+        Возвращает новый рейтинг комментария.
 
         Параметры:
-            user_comment_obj: объект модели AssociationUserComment;
-            comment: объект модели CommentFeed;
+            comment_id: id комментария;
+            user_id: UUID пользователя, сделавшего запрос;
             session: асинхронная сессия SQLAlchemy.
         """
+        unliked = (
+            delete(AssociationUserComment)
+            .where(
+                AssociationUserComment.left_id == user_id,
+                AssociationUserComment.right_id == comment_id,
+            )
+            .returning(AssociationUserComment.right_id)
+            .cte('unliked')
+        )
+        return await self._change_rating(
+            session,
+            unliked,
+            self.model.rating - 1,
+            VALID_NOT_LIKED_COMMENT,
+            FeedEventType.COMMENT_UNLIKED,
+        )
+
+    async def _change_rating(
+        self,
+        session: AsyncSession,
+        changed: CTE,
+        new_rating,
+        error_detail: str,
+        event_type: FeedEventType,
+    ) -> int:
+        """
+        Применяет изменение рейтинга к комментариям, id которых вернул изменяющий CTE,
+        отправляет событие ленты проблемы event_type и фиксирует транзакцию. Id проблемы
+        для события возвращает тот же UPDATE подзапросом к треду по первичному ключу.
+        Если CTE не вернул строк, выбрасывает HTTP 400 с error_detail.
+        """
+        query = (
+            update(self.model)
+            .where(self.model.id.in_(select(changed.c.right_id)))
+            .values(rating=new_rating, updated_at=func.now())
+            .returning(
+                self.model.id,
+                self.model.rating,
+                self.model.message_id,
+                select(MessageFeed.problem_id)
+                .where(MessageFeed.id == self.model.message_id)
+                .scalar_subquery()
+                .label('problem_id'),
+            )
+            .add_cte(changed)
+            .execution_options(synchronize_session=False)
+        )
         try:
-            await user_comment_association_crud.remove(user_comment_obj, session)
-            comment.rating -= 1
-            session.add(comment)
+            row = (await session.execute(query)).one_or_none()
+            if row is not None:
+                await publish_feed_event(
+                    session,
+                    event_type,
+                    row.problem_id,
+                    thread_id=row.message_id,
+                    comment_id=row.id,
+                    rating=row.rating,
+                )
             await session.commit()
         except Exception as e:
             await session.rollback()
-            logger.error(f'{TEXT_ERROR_SERVER_CREATE_LOG} {self.model.__name__}: {e}')
+            logger.error(f'{TEXT_ERROR_SERVER_UPDATE_LOG} {self.model.__name__}: {e}')
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=TEXT_ERROR_SERVER_CREATE,
+                detail=TEXT_ERROR_SERVER_UPDATE,
             )
+        if row is None:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error_detail)
+        return row.rating
 
 
 comment_crud = CRUDComment(CommentFeed)
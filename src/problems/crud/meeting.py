@@ -1,56 +1,63 @@
 from uuid import UUID
 
+from fastapi import HTTPException, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from src.constants import TEXT_ERROR_UNIQUE, TEXT_ERROR_UNIQUE_CREATE_LOG
 from src.crud import CRUDBase
-from src.problems.crud.association_utils import create_associations
+from src.logger import logger
+from src.problems.crud.association_utils import ChildRows, create_with_children
 from src.problems.models import AssociationUserMeeting, Meeting
-from src.problems.schemas.meeting import MeetingCreateSchema
+from src.problems.schemas.meeting import MeetingCreateSchema, MeetingResponseSchema
 
 
 # TODO Если участники встречи переносятся сюда автоматом из проблемы, то поправить этот метод
 class CRUDMeeting(CRUDBase):
     """CRUD операции для модели встречи."""
 
+    tenant_path = ('problem', 'company_id')
+
     async def create_with_members(
         self, session: AsyncSession, meeting_data: dict, members: list[UUID]
-    ) -> Meeting:
+    ) -> MeetingResponseSchema:
         """Создание встречи с участниками.
 
         Назначение:
-            Создает новую встречу и добавляет участников через ассоциативную таблицу.
+            Создает новую встречу (INSERT ... RETURNING) и одним пакетным запросом
+            добавляет участников через ассоциативную таблицу.
             Выполняет все операции в рамках одной транзакции.
         Параметры:
             session: Асинхронная сессия SQLAlchemy.
             meeting_data: Словарь с данными для создания встречи.
             members: Список UUID участников встречи.
         Возвращаемое значение:
-            Созданный объект встречи с обновленными данными.
+            Созданная встреча, собранная из вставленных данных без повторного запроса.
         """
+        meeting_data['members'] = members
+        meeting_model = MeetingCreateSchema(**meeting_data)
+        member_rows = [{'left_id': member_id} for member_id in members]
         try:
-            meeting_data['members'] = members
-            meeting_model = MeetingCreateSchema(**meeting_data)
-            created_meeting = await self.create(session, meeting_model)
-
-            # Создаем ассоциации участников с встречей
-            await create_associations(
-                session=session,
-                association_model=AssociationUserMeeting,
-                left_ids=members,
-                right_id=created_meeting.id,
+            (created_meeting,) = await create_with_children(
+                session,
+                self.model,
+                [meeting_model.model_dump()],
+                ChildRows(AssociationUserMeeting, 'right_id', [member_rows]),
             )
-
             await session.commit()
-            await session.refresh(created_meeting)
-            return created_meeting
-
-        except Exception as e:
+        except IntegrityError as e:
             await session.rollback()
-            raise e
+            logger.error(f'{TEXT_ERROR_UNIQUE_CREATE_LOG} {self.model.__name__}: {e}')
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=TEXT_ERROR_UNIQUE)
+        return MeetingResponseSchema.model_validate(dict(created_meeting))
 
     async def update_meeting(
-        self, session: AsyncSession, meeting_id: int, meeting_update: dict
+        self,
+        session: AsyncSession,
+        meeting_id: int,
+        meeting_update: dict,
+        company_id: int | None = None,
     ) -> Meeting:
         """Обновление встречи.
 
@@ -61,13 +68,16 @@ class CRUDMeeting(CRUDBase):
             session: Асинхронная сессия SQLAlchemy.
             meeting_id: ID встречи для обновления.
             meeting_update: Словарь с данными для обновления встречи.
+            company_id: ID компании, которой должна принадлежать встреча.
         Возвращаемое значение:
             Обновленный объект встречи.
         """
-        db_obj = await self.get_or_404(session, meeting_id)
+        db_obj = await self.get_or_404(session, meeting_id, company_id=company_id)
         return await self.update(session, db_obj, meeting_update)
 
-    async def delete_meeting(self, session: AsyncSession, meeting_id: int) -> None:
+    async def delete_meeting(
+        self, session: AsyncSession, meeting_id: int, company_id: int | None = None
+    ) -> None:
         """Удаление встречи.
 
         Назначение:
@@ -76,10 +86,11 @@ class CRUDMeeting(CRUDBase):
         Параметры:
             session: Асинхронная сессия SQLAlchemy.
             meeting_id: ID встречи для удаления.
+            company_id: ID компании, которой должна принадлежать встреча.
         Возвращаемое значение:
             None
         """
-        db_obj = await self.get_or_404(session, meeting_id)
+        db_obj = await self.get_or_404(session, meeting_id, company_id=company_id)
         await self.remove(session, db_obj)
 
     async def get_meeting(self, session: AsyncSession, **filters):
@@ -11,6 +11,7 @@ from src.constants import (
 )
 from src.crud import CRUDBase
 from src.logger import logger
+from src.problems.events import FeedEventType, publish_feed_event
 from src.problems.models import MessageFeed
 from src.problems.schemas.message_feed import MessageFeedCreate
 
@@ -18,6 +19,8 @@ from src.problems.schemas.message_feed import MessageFeedCreate
 class CRUDMessageFeed(CRUDBase):
     """CRUD для операций с моделями тредов к проблемам."""
 
+    tenant_path = ('problem', 'company_id')
+
     async def create(
         self,
         session: AsyncSession,
@@ -28,6 +31,7 @@ class CRUDMessageFeed(CRUDBase):
     ) -> MessageFeed:
         """
         Переопределённый метод create для создания объектов MesageFeed в БД.
+        В той же транзакции отправляет событие ленты проблемы THREAD_CREATED.
         Возвращает созданный объект из БД.
 
         Параметры:
@@ -43,6 +47,14 @@ class CRUDMessageFeed(CRUDBase):
         db_obj = self.model(**obj_data)
         try:
             session.add(db_obj)
+            await session.flush()
+            await publish_feed_event(
+                session,
+                FeedEventType.THREAD_CREATED,
+                problem_id,
+                thread_id=db_obj.id,
+                owner_id=user_id,
+            )
             if auto_commit:
                 await session.commit()
                 await session.refresh(db_obj)
@@ -1,56 +1,68 @@
 from uuid import UUID
 
+from fastapi import HTTPException, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.constants import TEXT_ERROR_UNIQUE, TEXT_ERROR_UNIQUE_CREATE_LOG
 from src.crud import CRUDBase
-from src.problems.crud.association_utils import create_associations
+from src.logger import logger
+from src.problems.crud.association_utils import ChildRows, create_with_children
 from src.problems.models import AssociationUserProblem, Problem
-from src.problems.schemas.problem import ProblemCreateSchema, ProblemUpdateSchema
+from src.problems.schemas.problem import (
+    ProblemCreateSchema,
+    ProblemResponseSchema,
+    ProblemUpdateSchema,
+)
 
 
 # TODO Надо доработать CRUD на получение проблем со списком участников
 class CRUDProblem(CRUDBase):
     """CRUD операции для модели проблемы."""
 
+    tenant_path = ('company_id',)
+    filter_fields = {'status': ('in',), 'type': ('in',), 'name': ('ilike',)}
+
     async def create_problem_with_members(
         self, session: AsyncSession, problem_data: dict, members: list[UUID]
-    ) -> Problem:
-        """Создание встречи с участниками.
+    ) -> ProblemResponseSchema:
+        """Создание проблемы с участниками.
 
         Назначение:
-            Создает новую проблемы и добавляет участников через ассоциативную таблицу.
+            Создает новую проблему (INSERT ... RETURNING) и одним пакетным запросом
+            добавляет участников через ассоциативную таблицу.
             Выполняет все операции в рамках одной транзакции.
         Параметры:
             session: Асинхронная сессия SQLAlchemy.
             problem_data: Словарь с данными для создания проблемы.
             members: Список UUID участников проблемы.
         Возвращаемое значение:
-            Созданный объект проблемы с обновленными данными.
+            Созданная проблема, собранная из вставленных данных без повторного запроса.
         """
+        problem_data['members'] = members
+        problem_model = ProblemCreateSchema(**problem_data)
+        # status=True - затычка, чтобы проверить создание проблемы со списком участников.
+        member_rows = [{'left_id': member_id, 'status': True} for member_id in members]
         try:
-            problem_data['members'] = members
-            problem_model = ProblemCreateSchema(**problem_data)
-            created_problem = await self.create(session, problem_model)
-
-            # Создаем ассоциации участников с встречей
-            await create_associations(
-                session=session,
-                association_model=AssociationUserProblem,
-                left_ids=members,
-                right_id=created_problem.id,
-                status=True,  # (Затычка, чтобы проверить создание проблемы со списком участников)
+            (created_problem,) = await create_with_children(
+                session,
+                self.model,
+                [problem_model.model_dump()],
+                ChildRows(AssociationUserProblem, 'right_id', [member_rows]),
             )
-
             await session.commit()
-            await session.refresh(created_problem)
-            return created_problem
-
-        except Exception as e:
+        except IntegrityError as e:
             await session.rollback()
-            raise e
+            logger.error(f'{TEXT_ERROR_UNIQUE_CREATE_LOG} {self.model.__name__}: {e}')
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=TEXT_ERROR_UNIQUE)
+        return ProblemResponseSchema.model_validate(dict(created_problem))
 
     async def update_problem(
-        self, session: AsyncSession, problem_id: int, problem_update: ProblemUpdateSchema
+        self,
+        session: AsyncSession,
+        problem_id: int,
+        problem_update: ProblemUpdateSchema,
+        company_id: int | None = None,
     ) -> Problem:
         """Обновление проблемы.
 
@@ -61,13 +73,16 @@ class CRUDProblem(CRUDBase):
             session: Асинхронная сессия SQLAlchemy.
             problem_id: ID проблемы для обновления.
             problem_update: Схема с данными для обновления проблемы.
+            company_id: ID компании, которой должна принадлежать проблема.
         Возвращаемое значение:
             Обновленный объект проблемы.
         """
-        db_obj = await self.get_or_404(session, problem_id)
+        db_obj = await self.get_or_404(session, problem_id, company_id=company_id)
         return await self.update(session, db_obj, problem_update)
 
-    async def delete_problem(self, session: AsyncSession, problem_id: int) -> None:
+    async def delete_problem(
+        self, session: AsyncSession, problem_id: int, company_id: int | None = None
+    ) -> None:
         """Удаление проблемы.
 
         Назначение:
@@ -76,10 +91,11 @@ class CRUDProblem(CRUDBase):
         Параметры:
             session: Асинхронная сессия SQLAlchemy.
             problem_id: ID проблемы для удаления.
+            company_id: ID компании, которой должна принадлежать проблема.
         Возвращаемое значение:
             None
         """
-        db_obj = await self.get_or_404(session, problem_id)
+        db_obj = await self.get_or_404(session, problem_id, company_id=company_id)
         await self.remove(session, db_obj)
 
 
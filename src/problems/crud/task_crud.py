@@ -1,12 +1,11 @@
-from typing import Union
+from typing import Any, Optional, Sequence, Union
 
 from fastapi import HTTPException, status
-from sqlalchemy import delete, select
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from src.companies.models import Company
 from src.constants import (
     DEFAULT_AUTO_COMMIT,
     TEXT_ERROR_SERVER_CREATE,
@@ -19,74 +18,83 @@ from src.constants import (
 )
 from src.crud import CRUDBase
 from src.logger import logger
-from src.problems.models import Problem, Task
+from src.problems.crud.association_utils import (
+    ChildRows,
+    create_with_children,
+    sync_associations,
+)
+from src.problems.models import Task
 from src.problems.models.association_models import AssociationUserTask
 from src.problems.models.file_path_models import FileTask
 from src.problems.schemas.task import TaskCreateSchema, TaskResponseSchema, TaskUpdateSchema
-from src.users.models import UserTabit
 
 
 class CRUDTask(CRUDBase):
     """CRUD операции для модели задачи."""
 
+    tenant_path = ('problem', 'company_id')
+    filter_fields = {
+        'date_completion': ('gt', 'gte', 'lt', 'lte', 'between'),
+        'status': ('in',),
+        'name': ('ilike',),
+    }
+
     async def get_by_company_and_problem(
-        self, session: AsyncSession, company_slug: str, problem_id: int
+        self,
+        session: AsyncSession,
+        company_id: int,
+        problem_id: int,
+        filters: Optional[dict[str, Any]] = None,
     ) -> list[TaskResponseSchema]:
         """
-        Получает все задачи по company_slug и problem_id.
+        Получает все задачи по company_id и problem_id.
 
         Args:
             session: Асинхронная сессия SQLAlchemy.
+            company_id: ID компании.
             problem_id: ID проблемы.
-            company_slug: Уникальный идентификатор компании.
+            filters: Фильтры вида {поле[__оператор]: значение} (см. filter_fields).
 
         Returns:
             TaskResponseSchema: Список задач для данной проблемы.
         """
         query = (
             select(self.model)
-            .join(self.model.problem)
-            .join(Problem.owner)
-            .join(UserTabit.company)
-            .where(Company.slug == company_slug)
             .where(self.model.problem_id == problem_id)
             .options(
                 selectinload(self.model.file),
                 selectinload(self.model.executors),
             )
         )
-        result = await session.execute(query)
+        query = self._apply_filters(query, filters or {})
+        result = await session.execute(self._apply_tenant(query, company_id))
         tasks = result.scalars().all()
         return [TaskResponseSchema.model_validate(task) for task in tasks]
 
     async def get_task_by_id(
         self,
         session: AsyncSession,
-        company_slug: str,
+        company_id: int,
         problem_id: int,
         task_id: int,
         as_object: bool = False,
-    ) -> Union[Task, TaskResponseSchema]:
+    ) -> Union[Task, TaskResponseSchema, None]:
         """
         Получает задачу по id с проверкой принадлежности к компании и проблеме.
 
         Args:
             session: Асинхронная сессия SQLAlchemy.
+            company_id: ID компании.
             problem_id: ID проблемы.
-            company_slug: Уникальный идентификатор компании.
             task_id: ID задачи.
             as_object: Данные для обновления задачи.
 
         Returns:
-            TaskResponseSchema: Конктетная задача.
+            TaskResponseSchema: Конктетная задача или None, если задача не найдена.
         """
         query = (
             select(self.model)
-            .join(self.model.problem)
-            .join(Problem.owner)
-            .join(UserTabit.company)
             .where(
-                Company.slug == company_slug,
                 self.model.problem_id == problem_id,
                 self.model.id == task_id,
             )
@@ -95,9 +103,9 @@ class CRUDTask(CRUDBase):
                 selectinload(self.model.executors),
             )
         )
-        result = await session.execute(query)
+        result = await session.execute(self._apply_tenant(query, company_id))
         task = result.scalar_one_or_none()
-        if as_object:
+        if task is None or as_object:
             return task  # type: ignore
         return TaskResponseSchema.model_validate(task)
 
@@ -120,27 +128,52 @@ class CRUDTask(CRUDBase):
         Raises:
             HTTPException: Если произошла ошибка при создании задачи.
         """
+        (task,) = await self.create_many(session, [obj_in], auto_commit)
+        return task
+
+    async def create_many(
+        self,
+        session: AsyncSession,
+        objs_in: Sequence[TaskCreateSchema],
+        auto_commit: bool = DEFAULT_AUTO_COMMIT,
+    ) -> list[TaskResponseSchema]:
+        """Создает задачи вместе с исполнителями и файлами в одной транзакции.
+
+        Задачи вставляются одним запросом INSERT ... RETURNING, исполнители и файлы -
+        пакетными запросами (executemany). Ответ собирается из вставленных данных
+        без повторного чтения задач из БД.
+
+        Args:
+            session: Асинхронная сессия SQLAlchemy.
+            objs_in: Данные для создания задач.
+            auto_commit: Автоматически коммитить изменения (по умолчанию True).
+
+        Returns:
+            list[TaskResponseSchema]: Созданные задачи в порядке objs_in.
+
+        Raises:
+            HTTPException: Если произошла ошибка при создании задач.
+        """
+        executors = [obj_in.executors or [] for obj_in in objs_in]
+        files = [obj_in.file or [] for obj_in in objs_in]
         try:
-            new_task = Task(**obj_in.model_dump(exclude={'executors', 'file'}))
-            session.add(new_task)
-            await session.flush()
-            if obj_in.file:
-                new_task.file = [FileTask(url=url, task_id=new_task.id) for url in obj_in.file]
-            if obj_in.executors:
-                associations = [
-                    AssociationUserTask(left_id=executor_id, right_id=new_task.id)
-                    for executor_id in obj_in.executors
-                ]
-                session.add_all(associations)
+            created = await create_with_children(
+                session,
+                self.model,
+                [obj_in.model_dump(exclude={'executors', 'file'}) for obj_in in objs_in],
+                ChildRows(
+                    AssociationUserTask,
+                    'right_id',
+                    [[{'left_id': executor_id} for executor_id in ids] for ids in executors],
+                ),
+                ChildRows(
+                    FileTask,
+                    'task_id',
+                    [[{'file_path': file_path} for file_path in paths] for paths in files],
+                ),
+            )
             if auto_commit:
                 await session.commit()
-                await session.refresh(new_task)
-            await session.execute(
-                select(Task)
-                .filter_by(id=new_task.id)
-                .options(selectinload(Task.executors), selectinload(Task.file))
-            )
-            return TaskResponseSchema.model_validate(new_task)
         except IntegrityError as e:
             await session.rollback()
             logger.error(f'{TEXT_ERROR_UNIQUE_CREATE_LOG} {self.model.__name__}: {e}')
@@ -155,6 +188,12 @@ class CRUDTask(CRUDBase):
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=TEXT_ERROR_SERVER_CREATE,
             )
+        return [
+            TaskResponseSchema.model_validate(
+                {**task, 'executors': task_executors, 'file': task_files or None}
+            )
+            for task, task_executors, task_files in zip(created, executors, files)
+        ]
 
     async def update(
         self,
@@ -184,12 +223,13 @@ class CRUDTask(CRUDBase):
             for field, value in update_data.items():
                 setattr(db_obj, field, value)
             if executors_data is not None:
-                await session.execute(
-                    delete(AssociationUserTask).where(AssociationUserTask.right_id == db_obj.id)
+                await sync_associations(
+                    session,
+                    AssociationUserTask,
+                    db_obj.id,
+                    executors_data,
+                    current_ids=[executor.left_id for executor in db_obj.executors],
                 )
-                for executor_id in executors_data:
-                    association = AssociationUserTask(left_id=executor_id, right_id=db_obj.id)
-                    session.add(association)
             # Увеличиваем счётчик передач, если дата завершения изменилась
             if db_obj.date_completion > old_date_completion:
                 db_obj.transfer_counter += 1
@@ -0,0 +1,291 @@
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy import (
+    ARRAY,
+    String,
+    and_,
+    bindparam,
+    case,
+    delete,
+    exists,
+    func,
+    literal,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.constants import (
+    TEXT_ERROR_SERVER_UPDATE,
+    TEXT_ERROR_SERVER_UPDATE_LOG,
+    TEXT_ERROR_UNIQUE,
+    TEXT_ERROR_UNIQUE_CREATE_LOG,
+)
+from src.crud import CRUDBase
+from src.logger import logger
+from src.problems.constants import (
+    UQ_USER_POLL_VOTE,
+    VALID_NOT_VOTED,
+    VALID_POLL_EXISTS,
+    VALID_POLL_NOT_FOUND,
+    VALID_POLL_OPTION_NOT_FOUND,
+    VALID_VOTE_CONFLICT,
+    VOTE_ATTEMPTS,
+)
+from src.problems.models import VotingByUser, VotingFeed
+from src.problems.schemas import PollOptionRead, PollRead
+
+
+class CRUDVoting(CRUDBase):
+    """
+    CRUD для голосований в тредах: варианты (VotingFeed) и голоса (VotingByUser).
+
+    Число голосов за вариант хранится в VotingFeed.votes_count и изменяется тем же
+    запросом, что записывает или удаляет голос, поэтому чтение результатов не считает
+    голоса и зависит только от числа вариантов.
+    """
+
+    tenant_path = ('message', 'problem', 'company_id')
+
+    async def create_poll(
+        self, session: AsyncSession, message_id: int, options: list[str]
+    ) -> PollRead:
+        """
+        Создаёт голосование в треде одним запросом:
+
+            INSERT INTO votingfeed (message_id, name)
+            SELECT :message_id, unnest(:options)
+            WHERE NOT EXISTS (SELECT 1 FROM votingfeed WHERE message_id = :message_id)
+            RETURNING id, name, votes_count
+
+        Если в треде уже есть голосование, выбрасывает HTTP 400.
+
+        Параметры:
+            session: асинхронная сессия SQLAlchemy;
+            message_id: id треда;
+            options: названия вариантов голосования.
+        """
+        query = (
+            insert(self.model)
+            .from_select(
+                ['message_id', 'name'],
+                select(
+                    literal(message_id),
+                    func.unnest(bindparam('options', options, ARRAY(String))),
+                ).where(~exists().where(self.model.message_id == message_id)),
+            )
+            .returning(self.model.id, self.model.name, self.model.votes_count)
+        )
+        try:
+            rows = (await session.execute(query)).all()
+            await session.commit()
+        except IntegrityError as e:
+            await session.rollback()
+            logger.error(f'{TEXT_ERROR_UNIQUE_CREATE_LOG} {self.model.__name__}: {e}')
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=TEXT_ERROR_UNIQUE)
+        if not rows:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=VALID_POLL_EXISTS)
+        return PollRead(
+            message_id=message_id,
+            options=[PollOptionRead.model_validate(row) for row in sorted(rows)],
+            total_votes=0,
+        )
+
+    async def get_results(self, session: AsyncSession, message_id: int, user_id: UUID) -> PollRead:
+        """
+        Возвращает результаты голосования треда и выбор пользователя одним запросом по
+        вариантам голосования, без подсчёта голосов. Если голосования нет - HTTP 404.
+
+        Параметры:
+            session: асинхронная сессия SQLAlchemy;
+            message_id: id треда;
+            user_id: UUID пользователя, сделавшего запрос.
+        """
+        user_vote = (
+            select(VotingByUser.voting_id)
+            .where(VotingByUser.user_id == user_id, VotingByUser.message_id == message_id)
+            .scalar_subquery()
+        )
+        rows = (
+            await session.execute(
+                select(
+                    self.model.id,
+                    self.model.name,
+                    self.model.votes_count,
+                    (self.model.id == user_vote).label('voted'),
+                )
+                .where(self.model.message_id == message_id)
+                .order_by(self.model.id)
+            )
+        ).all()
+        if not rows:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=VALID_POLL_NOT_FOUND)
+        return PollRead(
+            message_id=message_id,
+            options=[PollOptionRead.model_validate(row) for row in rows],
+            total_votes=sum(row.votes_count for row in rows),
+            user_vote=next((row.id for row in rows if row.voted), None),
+        )
+
+    async def vote(
+        self, session: AsyncSession, message_id: int, option_id: int, user_id: UUID
+    ) -> None:
+        """
+        Записывает или изменяет голос пользователя одним запросом:
+
+            WITH previous AS (
+                SELECT voting_id FROM votingbyuser
+                WHERE user_id = :user_id AND message_id = :message_id FOR UPDATE
+            ), vote AS (
+                INSERT INTO votingbyuser (user_id, message_id, voting_id)
+                SELECT :user_id, message_id, id FROM votingfeed
+                WHERE id = :option_id AND message_id = :message_id
+                ON CONFLICT ON CONSTRAINT uq_user_poll_vote DO UPDATE
+                SET voting_id = excluded.voting_id
+                WHERE votingbyuser.voting_id = (SELECT voting_id FROM previous)
+                  AND votingbyuser.voting_id <> excluded.voting_id
+                RETURNING voting_id
+            )
+            UPDATE votingfeed SET votes_count = votes_count + 1 для нового варианта
+                                  и votes_count - 1 для прежнего
+            FROM (
+                SELECT id FROM votingfeed
+                WHERE id IN (SELECT voting_id FROM vote)
+                   OR id IN (SELECT voting_id FROM previous) AND EXISTS (SELECT FROM vote)
+                ORDER BY id FOR UPDATE
+            ) AS locked
+            WHERE votingfeed.id = locked.id
+
+        Голос меняется, только если текущий выбор совпадает с прочитанным в previous:
+        если параллельный запрос того же пользователя успел проголосовать, запрос ничего
+        не меняет и повторяется (не более VOTE_ATTEMPTS раз), поэтому счётчики не
+        расходятся с голосами. Повторный голос за тот же вариант ничего не меняет.
+        Если варианта нет в голосовании треда, выбрасывает HTTP 404.
+
+        Параметры:
+            session: асинхронная сессия SQLAlchemy;
+            message_id: id треда;
+            option_id: id выбранного варианта;
+            user_id: UUID пользователя, сделавшего запрос.
+        """
+        user_vote = and_(VotingByUser.user_id == user_id, VotingByUser.message_id == message_id)
+        previous = (
+            select(VotingByUser.voting_id).where(user_vote).with_for_update().cte('previous')
+        )
+        inserted = insert(VotingByUser).from_select(
+            ['user_id', 'message_id', 'voting_id'],
+            select(
+                literal(user_id, VotingByUser.user_id.type),
+                self.model.message_id,
+                self.model.id,
+            ).where(self.model.id == option_id, self.model.message_id == message_id),
+        )
+        vote = (
+            inserted.on_conflict_do_update(
+                constraint=UQ_USER_POLL_VOTE,
+                set_={'voting_id': inserted.excluded.voting_id, 'updated_at': func.now()},
+                where=and_(
+                    VotingByUser.voting_id == select(previous.c.voting_id).scalar_subquery(),
+                    VotingByUser.voting_id != inserted.excluded.voting_id,
+                ),
+            )
+            .returning(VotingByUser.voting_id)
+            .cte('vote')
+        )
+        voted_for = self.model.id.in_(select(vote.c.voting_id))
+        # Строки вариантов блокируются по возрастанию id: иначе два пользователя,
+        # меняющие голос между одними и теми же вариантами навстречу друг другу,
+        # блокируют их в разном порядке и получают взаимную блокировку.
+        locked = (
+            select(self.model.id)
+            .where(
+                or_(
+                    voted_for,
+                    and_(
+                        self.model.id.in_(select(previous.c.voting_id)),
+                        exists(select(vote.c.voting_id)),
+                    ),
+                )
+            )
+            .order_by(self.model.id)
+            .with_for_update()
+            .subquery('locked')
+        )
+        changed_options = (
+            update(self.model)
+            .where(self.model.id == locked.c.id)
+            .values(
+                votes_count=self.model.votes_count + case((voted_for, 1), else_=-1),
+                updated_at=func.now(),
+            )
+            .returning(self.model.id)
+            .add_cte(previous, vote)
+        )
+        for _ in range(VOTE_ATTEMPTS):
+            if await self._change_votes(session, changed_options):
+                return
+            current = await session.scalar(select(VotingByUser.voting_id).where(user_vote))
+            if current == option_id:
+                return
+            option = await session.scalar(
+                select(self.model.id).where(
+                    self.model.id == option_id, self.model.message_id == message_id
+                )
+            )
+            if option is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND, detail=VALID_POLL_OPTION_NOT_FOUND
+                )
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=VALID_VOTE_CONFLICT)
+
+    async def unvote(self, session: AsyncSession, message_id: int, user_id: UUID) -> None:
+        """
+        Отзывает голос пользователя одним запросом: удаляет голос и уменьшает на 1 число
+        голосов выбранного варианта. Если пользователь не голосовал, выбрасывает HTTP 400.
+
+        Параметры:
+            session: асинхронная сессия SQLAlchemy;
+            message_id: id треда;
+            user_id: UUID пользователя, сделавшего запрос.
+        """
+        removed = (
+            delete(VotingByUser)
+            .where(VotingByUser.user_id == user_id, VotingByUser.message_id == message_id)
+            .returning(VotingByUser.voting_id)
+            .cte('removed')
+        )
+        changed_options = (
+            update(self.model)
+            .where(self.model.id.in_(select(removed.c.voting_id)))
+            .values(votes_count=self.model.votes_count - 1, updated_at=func.now())
+            .returning(self.model.id)
+            .add_cte(removed)
+        )
+        if not await self._change_votes(session, changed_options):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=VALID_NOT_VOTED)
+
+    async def _change_votes(self, session: AsyncSession, query) -> list[int]:
+        """
+        Выполняет запрос изменения голоса и счётчиков, фиксирует транзакцию и возвращает
+        id вариантов, счётчики которых изменились.
+        """
+        try:
+            changed = (
+                await session.scalars(query.execution_options(synchronize_session=False))
+            ).all()
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            logger.error(f'{TEXT_ERROR_SERVER_UPDATE_LOG} {self.model.__name__}: {e}')
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=TEXT_ERROR_SERVER_UPDATE,
+            )
+        return list(changed)
+
+
+voting_crud = CRUDVoting(VotingFeed)
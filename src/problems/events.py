@@ -0,0 +1,191 @@
+"""
+Модуль событий лент проблем в реальном времени.
+
+Содержит:
+- FeedEventType: типы событий ленты проблемы;
+- publish_feed_event: отправка события через Postgres NOTIFY в транзакции изменения;
+- FeedEventBroker: раздача событий подписчикам процесса (Server-Sent Events) из одного
+  соединения LISTEN на воркер (src.database.listener) через ограниченные очереди;
+- feed_broker: общий на процесс брокер, настроенный по Settings.
+"""
+
+import asyncio
+import json
+from enum import StrEnum
+from typing import Any, AsyncIterator
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from src.config import settings
+from src.database.listener import PgListener
+from src.logger import logger
+from src.problems.constants import FEED_EVENTS_CHANNEL, FEED_EVENTS_KEEPALIVE
+
+
+class FeedEventType(StrEnum):
+    """Типы событий ленты проблемы."""
+
+    THREAD_CREATED = 'thread_created'
+    COMMENT_CREATED = 'comment_created'
+    COMMENT_LIKED = 'comment_liked'
+    COMMENT_UNLIKED = 'comment_unliked'
+
+
+async def publish_feed_event(
+    session: AsyncSession, event_type: FeedEventType, problem_id: int, **data: Any
+) -> None:
+    """
+    Отправляет событие ленты проблемы в канал FEED_EVENTS_CHANNEL, если события включены
+    (feed_events_listen). NOTIFY выполняется в транзакции сессии: Postgres доставит
+    событие слушателям только после фиксации изменения и отбросит его при откате.
+    Событие содержит только идентификаторы, данные клиент читает обычными запросами.
+
+    Параметры:
+        session: асинхронная сессия SQLAlchemy с незафиксированным изменением;
+        event_type: тип события;
+        problem_id: id проблемы, подписчикам которой отправляется событие;
+        data: поля события (id треда, комментария и т.п.).
+    """
+    if not settings.feed_events_listen:
+        return
+    payload = json.dumps(
+        {'type': event_type, 'problem_id': problem_id, **data},
+        default=str,
+        separators=(',', ':'),
+    )
+    await session.execute(select(func.pg_notify(FEED_EVENTS_CHANNEL, payload)))
+
+
+class FeedEventBroker:
+    """
+    Раздаёт события лент проблем подписчикам текущего процесса.
+
+    Воркер держит одно соединение LISTEN; каждое событие кладётся в очереди подписчиков
+    проблемы без ожидания. Очередь подписчика ограничена queue_size событиями: клиент,
+    не успевающий читать, отключается (в его очередь кладётся None), а не замедляет
+    остальных и не копит события в памяти. EventSource клиента переподключается сам.
+    При потере соединения LISTEN потоки всех подписчиков завершаются (события до
+    переподключения потеряны), и до восстановления подписки новые не принимаются.
+    """
+
+    def __init__(self, queue_size: int, keepalive: float) -> None:
+        self.queue_size = queue_size
+        self.keepalive = keepalive
+        self.delivered = 0
+        self.dropped_subscribers = 0
+        self._subscribers: dict[int, set[asyncio.Queue]] = {}
+        self._listener = PgListener(FEED_EVENTS_CHANNEL, self._on_notify, self._close_all)
+
+    @property
+    def is_listening(self) -> bool:
+        """Подписан ли брокер на канал событий."""
+        return self._listener.is_listening
+
+    def subscribe(self, problem_id: int) -> asyncio.Queue:
+        """Создаёт очередь событий проблемы для нового подписчика."""
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.setdefault(problem_id, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, problem_id: int, queue: asyncio.Queue) -> None:
+        """Удаляет очередь подписчика; пустой набор подписчиков проблемы удаляется."""
+        queues = self._subscribers.get(problem_id)
+        if queues is None:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._subscribers[problem_id]
+
+    def _close(self, problem_id: int, queue: asyncio.Queue) -> None:
+        """Очищает очередь подписчика и кладёт в неё признак конца потока."""
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(None)
+        self.unsubscribe(problem_id, queue)
+
+    def _close_all(self) -> None:
+        """Завершает потоки всех подписчиков."""
+        for problem_id, queues in list(self._subscribers.items()):
+            for queue in list(queues):
+                self._close(problem_id, queue)
+
+    def publish_local(self, event: dict[str, Any]) -> None:
+        """
+        Кладёт событие в очереди подписчиков его проблемы. Подписчик с заполненной
+        очередью отключается.
+        """
+        problem_id = event['problem_id']
+        for queue in list(self._subscribers.get(problem_id, ())):
+            try:
+                queue.put_nowait(event)
+                self.delivered += 1
+            except asyncio.QueueFull:
+                self.dropped_subscribers += 1
+                self._close(problem_id, queue)
+
+    def _on_notify(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        """Обработчик NOTIFY о событии ленты."""
+        try:
+            event = json.loads(payload)
+        except ValueError:
+            logger.error(f'Некорректное событие ленты в канале {channel}: {payload}')
+            return
+        self.publish_local(event)
+
+    async def stream(self, problem_id: int) -> AsyncIterator[str]:
+        """
+        Поток событий проблемы в формате Server-Sent Events. Если событий нет дольше
+        keepalive секунд, отправляет комментарий, чтобы прокси не закрыли соединение.
+        Подписка снимается при отключении клиента или переполнении его очереди.
+        """
+        queue = self.subscribe(problem_id)
+        try:
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), self.keepalive)
+                except TimeoutError:
+                    yield FEED_EVENTS_KEEPALIVE
+                    continue
+                if event is None:
+                    return
+                data = json.dumps(event, separators=(',', ':'))
+                yield f'event: {event["type"]}\ndata: {data}\n\n'
+        finally:
+            self.unsubscribe(problem_id, queue)
+
+    async def start_listener(self, async_engine: AsyncEngine) -> None:
+        """
+        Подписывается на канал FEED_EVENTS_CHANNEL через отдельное соединение asyncpg,
+        которое восстанавливается после потери до вызова stop_listener.
+        """
+        await self._listener.start(async_engine)
+        logger.info(f'События лент подписаны на канал {FEED_EVENTS_CHANNEL}')
+
+    async def stop_listener(self) -> None:
+        """
+        Отписывается от канала, закрывает соединение подписки и завершает потоки
+        всех подписчиков.
+        """
+        await self._listener.stop()
+        self._close_all()
+
+    def get_metrics(self) -> dict[str, int]:
+        """
+        Возвращает счётчики брокера.
+
+        Поля ответа:
+            subscribers: число подписчиков процесса;
+            delivered: число событий, положенных в очереди подписчиков;
+            dropped_subscribers: число подписчиков, отключённых из-за переполнения очереди.
+        """
+        return {
+            'subscribers': sum(len(queues) for queues in self._subscribers.values()),
+            'delivered': self.delivered,
+            'dropped_subscribers': self.dropped_subscribers,
+        }
+
+
+feed_broker = FeedEventBroker(
+    settings.feed_events_queue_size, settings.feed_events_keepalive_seconds
+)
@@ -1,11 +1,12 @@
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.database.annotations import int_pk, int_pk_autoincrement
+from src.database.annotations import int_pk, int_pk_autoincrement, int_pk_identity
 from src.database.models import BaseTabitModel
+from src.problems.constants import UQ_USER_COMMENT_LIKE
 
 if TYPE_CHECKING:
     from src.problems.models import Meeting, Problem, Task
@@ -32,7 +33,11 @@ class AssociationUserProblem(BaseTabitModel):
         problem - Problem.
     """
 
-    id: Mapped[int_pk]
+    __table_args__ = (
+        Index('ix_associationuserproblem_right_id', 'right_id', 'left_id', unique=True),
+    )
+
+    id: Mapped[int_pk_identity]
     left_id: Mapped[UUID] = mapped_column(ForeignKey('usertabit.id'), primary_key=True)
     right_id: Mapped[int] = mapped_column(ForeignKey('problem.id'), primary_key=True)
     user: Mapped['UserTabit'] = relationship(back_populates='problems')
@@ -64,7 +69,11 @@ class AssociationUserMeeting(BaseTabitModel):
         meeting - Meeting.
     """
 
-    id: Mapped[int_pk]
+    __table_args__ = (
+        Index('ix_associationusermeeting_right_id', 'right_id', 'left_id', unique=True),
+    )
+
+    id: Mapped[int_pk_identity]
     left_id: Mapped[UUID] = mapped_column(ForeignKey('usertabit.id'), primary_key=True)
     right_id: Mapped[int] = mapped_column(ForeignKey('meeting.id'), primary_key=True)
     user: Mapped['UserTabit'] = relationship(back_populates='meetings')
@@ -94,6 +103,10 @@ class AssociationUserTask(BaseTabitModel):
         task - Task.
     """
 
+    __table_args__ = (
+        Index('ix_associationusertask_right_id', 'right_id', 'left_id', unique=True),
+    )
+
     id: Mapped[int_pk]
     left_id: Mapped[UUID] = mapped_column(
         ForeignKey('usertabit.id', ondelete='CASCADE'), nullable=False
@@ -125,8 +138,16 @@ class AssociationUserComment(BaseTabitModel):
 
     Связи (атрибут - Модель):
         user - UserTabit;
+
+    Ограничения:
+        uq_user_comment_like: пользователь может лайкнуть комментарий только один раз.
     """
 
+    __table_args__ = (
+        UniqueConstraint('left_id', 'right_id', name=UQ_USER_COMMENT_LIKE),
+        Index('ix_associationusercomment_right_id', 'right_id', 'left_id'),
+    )
+
     id: Mapped[int_pk_autoincrement]
     left_id: Mapped[UUID] = mapped_column(ForeignKey('usertabit.id'), primary_key=True)
     right_id: Mapped[int] = mapped_column(ForeignKey('commentfeed.id'), primary_key=True)
@@ -69,3 +69,11 @@ class StatusTask(StrEnum):
     IN_PROGRESS = 'В работе'
     NOT_ACCEPTED = 'Не принята'
     COMPLETED = 'Завершена'
+
+
+class SearchResultType(StrEnum):
+    """Типы объектов в результатах полнотекстового поиска."""
+
+    PROBLEM = 'problem'
+    THREAD = 'thread'
+    COMMENT = 'comment'
@@ -25,7 +25,7 @@ class FileProblem(BaseFileLink):
     """
 
     # TODO: Каскадное удаление не только записи в таблице, но и самого файла. Сложно.
-    problem_id: Mapped[int] = mapped_column(ForeignKey('problem.id'))
+    problem_id: Mapped[int] = mapped_column(ForeignKey('problem.id'), index=True)
     problem: Mapped['Problem'] = relationship(back_populates='file')
 
 
@@ -45,7 +45,7 @@ class FileMeeting(BaseFileLink):
     """
 
     # TODO: Каскадное удаление не только записи в таблице, но и самого файла. Сложно.
-    meeting_id: Mapped[int] = mapped_column(ForeignKey('meeting.id'))
+    meeting_id: Mapped[int] = mapped_column(ForeignKey('meeting.id'), index=True)
     meeting: Mapped['Meeting'] = relationship(back_populates='file')
 
 
@@ -65,7 +65,7 @@ class FileTask(BaseFileLink):
     """
 
     # TODO: Каскадное удаление не только записи в таблице, но и самого файла. Сложно.
-    task_id: Mapped[int] = mapped_column(ForeignKey('task.id'))
+    task_id: Mapped[int] = mapped_column(ForeignKey('task.id'), index=True)
     task: Mapped['Task'] = relationship(back_populates='file')
 
 
@@ -85,5 +85,5 @@ class FileMessage(BaseFileLink):
     """
 
     # TODO: Каскадное удаление не только записи в таблице, но и самого файла. Сложно.
-    message_id: Mapped[int] = mapped_column(ForeignKey('messagefeed.id'))
+    message_id: Mapped[int] = mapped_column(ForeignKey('messagefeed.id'), index=True)
     message: Mapped['MessageFeed'] = relationship(back_populates='file')
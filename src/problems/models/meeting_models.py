@@ -1,11 +1,18 @@
 from datetime import date
 from typing import TYPE_CHECKING, List
 
-from sqlalchemy import ForeignKey, String, Text
+from sqlalchemy import ForeignKey, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.constants import LENGTH_NAME_MEETING_PLACE
-from src.database.annotations import description, int_pk, int_zero, name_problem, owner
+from src.database.annotations import (
+    description,
+    int_pk,
+    int_pk_unique,
+    int_zero,
+    name_problem,
+    owner,
+)
 from src.database.models import BaseTabitModel
 from src.problems.models.enums import ResultMeetingEnum, StatusMeeting
 
@@ -42,6 +49,8 @@ class Meeting(BaseTabitModel):
         file - FileMeeting: к встречи могут быть прикреплены файлы.
     """
 
+    __table_args__ = (Index('ix_meeting_problem_id', 'problem_id', 'id'),)
+
     id: Mapped[int_pk]
     title: Mapped[name_problem]
     description: Mapped[description]
@@ -53,7 +62,7 @@ class Meeting(BaseTabitModel):
     status: Mapped['StatusMeeting']
     place: Mapped[str] = mapped_column(String(LENGTH_NAME_MEETING_PLACE), nullable=False)
     members: Mapped[List['AssociationUserMeeting']] = relationship(
-        back_populates='meeting', cascade='all, delete-orphan'
+        back_populates='meeting', cascade='all, delete-orphan', lazy='raise'
     )
     result: Mapped['ResultMeeting'] = relationship(
         back_populates='meeting', cascade='all, delete-orphan'
@@ -96,7 +105,7 @@ class ResultMeeting(BaseTabitModel):
         owner - UserTabit.
     """
 
-    id: Mapped[int_pk]
+    id: Mapped[int_pk_unique]
     meeting_id: Mapped[int] = mapped_column(ForeignKey('meeting.id'), primary_key=True)
     meeting: Mapped['Meeting'] = relationship(back_populates='result')
     owner_id: Mapped[owner]
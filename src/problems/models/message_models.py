@@ -1,10 +1,21 @@
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Optional
+from uuid import UUID
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index, String, UniqueConstraint, desc
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.database.annotations import comment_rating, int_pk, owner
+from src.constants import LENGTH_POLL_OPTION
+from src.database.annotations import (
+    comment_rating,
+    created_at,
+    int_pk,
+    int_zero,
+    owner,
+    search_vector_column,
+    timestamp_nullable,
+)
 from src.database.models import BaseTabitModel, BaseTag
+from src.problems.constants import UQ_POLL_OPTION_NAME, UQ_USER_POLL_VOTE
 
 if TYPE_CHECKING:
     from src.problems.models import FileMessage, Problem
@@ -24,24 +35,55 @@ class MessageFeed(BaseTabitModel):
         owner_id: Автор сообщения. Внешний ключ.
         text: Название треда.
         important: Есть возможность указать, что сообщение важное.
+        comments_count: Число комментариев к треду.
+        last_comment_at: Дата последнего комментария.
+        last_comment_owner_id: Автор последнего комментария. Внешний ключ.
+        last_activity_at: Дата последней активности: создания треда или последнего
+            комментария. По ней сортируется список тредов.
+        search_vector: Генерируемый tsvector текста треда (вес B) для полнотекстового поиска.
         created_at: Дата создания записи в таблице. Автозаполнение.
         updated_at: Дата изменения записи в таблице. Автозаполнение.
 
+    Поля comments_count, last_comment_at, last_comment_owner_id и last_activity_at
+    изменяются в той же транзакции, что создаёт или удаляет комментарий (CRUDComment).
+
     Связи (атрибут - Модель):
         problem - Problem;
         owner - UserTabit;
+        last_comment_owner - UserTabit;
         comments - CommentFeed: к сообщением можно оставлять комментарии;
         voting - VotingFeed: есть возможность в сообщение начать голосование - это варианты;
         file - FileMessage: к сообщению могут быть прикреплены файлы.
     """
 
+    __table_args__ = (
+        Index('ix_messagefeed_problem_id', 'problem_id', 'id'),
+        Index(
+            'ix_messagefeed_problem_id_last_activity_at',
+            'problem_id',
+            desc('last_activity_at'),
+            'id',
+        ),
+        Index('ix_messagefeed_search_vector', 'search_vector', postgresql_using='gin'),
+    )
+
     id: Mapped[int_pk]
     problem_id: Mapped[int] = mapped_column(ForeignKey('problem.id'))
     problem: Mapped['Problem'] = relationship(back_populates='messages')
     owner_id: Mapped[owner]
-    owner: Mapped['UserTabit'] = relationship(back_populates='messages')
+    owner: Mapped['UserTabit'] = relationship(
+        back_populates='messages', foreign_keys='MessageFeed.owner_id', lazy='raise'
+    )
     text: Mapped[str]
     important: Mapped[bool] = mapped_column(default=False)
+    comments_count: Mapped[int_zero] = mapped_column(server_default='0')
+    last_comment_at: Mapped[timestamp_nullable]
+    last_comment_owner_id: Mapped[Optional[UUID]] = mapped_column(ForeignKey('usertabit.id'))
+    last_comment_owner: Mapped[Optional['UserTabit']] = relationship(
+        foreign_keys='MessageFeed.last_comment_owner_id', lazy='raise'
+    )
+    last_activity_at: Mapped[created_at]
+    search_vector: Mapped[str] = search_vector_column(('text', 'B'))
     comments: Mapped[List['CommentFeed']] = relationship(
         back_populates='message', cascade='all, delete-orphan'
     )
@@ -74,6 +116,8 @@ class CommentFeed(BaseTabitModel):
         message_id: Идентификатор треда, к которому относится комментарий.
         owner_id: Автор комментария. Внешний ключ.
         text: Текст комментария.
+        search_vector: Генерируемый tsvector текста комментария (вес D) для
+            полнотекстового поиска.
         created_at: Дата создания записи в таблице. Автозаполнение.
         updated_at: Дата изменения записи в таблице. Автозаполнение.
 
@@ -82,13 +126,19 @@ class CommentFeed(BaseTabitModel):
         owner - UserTabit.
     """
 
+    __table_args__ = (
+        Index('ix_commentfeed_message_id', 'message_id', 'id'),
+        Index('ix_commentfeed_search_vector', 'search_vector', postgresql_using='gin'),
+    )
+
     id: Mapped[int_pk]
     message_id: Mapped[int] = mapped_column(ForeignKey('messagefeed.id'))
     message: Mapped['MessageFeed'] = relationship(back_populates='comments')
     owner_id: Mapped[owner]
-    owner: Mapped['UserTabit'] = relationship(back_populates='comments')
+    owner: Mapped['UserTabit'] = relationship(back_populates='comments', lazy='raise')
     text: Mapped[str]
     rating: Mapped[comment_rating]
+    search_vector: Mapped[str] = search_vector_column(('text', 'D'))
 
     def __repr__(self):
         return (
@@ -112,17 +162,25 @@ class VotingFeed(BaseTag):
         id: Идентификатор.
         name: Название варианта.
         message_id: Идентификатор сообщения, к которому относится вариант.
+        votes_count: Число голосов за вариант. Изменяется тем же запросом, что и голос.
         created_at: Дата создания записи в таблице. Автозаполнение.
         updated_at: Дата изменения записи в таблице. Автозаполнение.
 
     Связи (атрибут - Модель):
         message - MessageFeed;
         by_user - VotingByUser: связь к таблице с выборами этих вариантов.
+
+    Ограничения:
+        uq_poll_option_name: названия вариантов одного голосования не повторяются.
     """
 
+    __table_args__ = (UniqueConstraint('message_id', 'name', name=UQ_POLL_OPTION_NAME),)
+
+    name: Mapped[str] = mapped_column(String(LENGTH_POLL_OPTION))
     message_id: Mapped[int] = mapped_column(ForeignKey('messagefeed.id'))
     message: Mapped['MessageFeed'] = relationship(back_populates='voting')
-    by_user: Mapped['VotingByUser'] = relationship(
+    votes_count: Mapped[int_zero] = mapped_column(server_default='0')
+    by_user: Mapped[List['VotingByUser']] = relationship(
         back_populates='voting', cascade='all, delete-orphan'
     )
 
@@ -147,6 +205,7 @@ class VotingByUser(BaseTabitModel):
     Поля:
         id: Идентификатор.
         user_id: id голосовавшего пользователя. Внешний ключ.
+        message_id: Идентификатор сообщения с голосованием (копия VotingFeed.message_id).
         voting_id: Идентификатор варианта голосования.
         created_at: Дата создания записи в таблице. Автозаполнение.
         updated_at: Дата изменения записи в таблице. Автозаполнение.
@@ -154,11 +213,20 @@ class VotingByUser(BaseTabitModel):
     Связи (атрибут - Модель):
         user - UserTabit;
         voting - VotingFeed.
+
+    Ограничения:
+        uq_user_poll_vote: в одном голосовании пользователь выбирает один вариант.
     """
 
+    __table_args__ = (
+        UniqueConstraint('user_id', 'message_id', name=UQ_USER_POLL_VOTE),
+        Index('ix_votingbyuser_voting_id', 'voting_id'),
+    )
+
     id: Mapped[int_pk]
     user_id: Mapped[owner]
     user: Mapped['UserTabit'] = relationship(back_populates='voting_by')
+    message_id: Mapped[int] = mapped_column(ForeignKey('messagefeed.id'))
     voting_id: Mapped[int] = mapped_column(ForeignKey('votingfeed.id'))
     voting: Mapped['VotingFeed'] = relationship(back_populates='by_user')
 
@@ -1,9 +1,15 @@
 from typing import TYPE_CHECKING, List
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.database.annotations import description, int_pk, name_problem, owner
+from src.database.annotations import (
+    description,
+    int_pk,
+    name_problem,
+    owner,
+    search_vector_column,
+)
 from src.database.models import BaseTabitModel
 from src.problems.models.enums import ColorProblem, StatusProblem, TypeProblem
 
@@ -29,6 +35,8 @@ class Problem(BaseTabitModel):
         type: Проблема относится к определенному типу.
         status: Статус проблемы.
         owner_id: Автор проблемы. Внешний ключ.
+        search_vector: Генерируемый tsvector названия (вес A) и описания (вес C)
+            для полнотекстового поиска (src.problems.search).
         created_at: Дата создания записи в таблице. Автозаполнение.
         updated_at: Дата изменения записи в таблице. Автозаполнение.
 
@@ -41,6 +49,12 @@ class Problem(BaseTabitModel):
         file - FileProblem: к проблеме могут быть прикреплены файлы.
     """
 
+    __table_args__ = (
+        Index('ix_problem_company_id', 'company_id', 'id'),
+        Index('ix_problem_company_id_status', 'company_id', 'status'),
+        Index('ix_problem_search_vector', 'search_vector', postgresql_using='gin'),
+    )
+
     id: Mapped[int_pk]
     name: Mapped[name_problem]
     description: Mapped[description]
@@ -53,8 +67,9 @@ class Problem(BaseTabitModel):
     # Но вот если удалят компанию - должна удалятся. Можно реализовать за счет связей.
     owner_id: Mapped[owner]
     owner: Mapped['UserTabit'] = relationship(back_populates='problem_owner')
+    search_vector: Mapped[str] = search_vector_column(('name', 'A'), ('description', 'C'))
     members: Mapped[List['AssociationUserProblem']] = relationship(
-        back_populates='problem', cascade='all, delete-orphan'
+        back_populates='problem', cascade='all, delete-orphan', lazy='raise'
     )
     meetings: Mapped[List['Meeting']] = relationship(
         back_populates='problem', cascade='all, delete-orphan'
@@ -1,7 +1,7 @@
 from datetime import date
 from typing import TYPE_CHECKING, List
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.database.annotations import description, int_pk, int_zero, name_problem, owner
@@ -39,6 +39,11 @@ class Task(BaseTabitModel):
         file - FileTask: к задаче могут быть прикреплены файлы.
     """
 
+    __table_args__ = (
+        Index('ix_task_problem_id', 'problem_id', 'id'),
+        Index('ix_task_problem_id_date_completion', 'problem_id', 'date_completion'),
+    )
+
     id: Mapped[int_pk]
     name: Mapped[name_problem]
     description: Mapped[description]
@@ -48,7 +53,7 @@ class Task(BaseTabitModel):
     problem_id: Mapped[int] = mapped_column(ForeignKey('problem.id', ondelete='CASCADE'))
     problem: Mapped['Problem'] = relationship(back_populates='tasks')
     executors: Mapped[List['AssociationUserTask']] = relationship(
-        back_populates='task', cascade='all, delete-orphan'
+        back_populates='task', cascade='all, delete-orphan', lazy='raise'
     )
     status: Mapped['StatusTask']
     transfer_counter: Mapped[int_zero]  # Добавлено поле transfer_counter
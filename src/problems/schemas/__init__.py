@@ -1,7 +1,15 @@
 from .comments import CommentCreate, CommentRead, CommentUpdate
 from .enums import MeetingProblemSolution, MeetingResult, MeetingStatus
-from .message_feed import MessageFeedCreate, MessageFeedRead
-from .query_params import FeedsFilterSchema
+from .message_feed import MessageFeedCreate, MessageFeedRead, MessageFeedSummaryRead
+from .query_params import (
+    FeedsFilterSchema,
+    ProblemFilterSchema,
+    SearchQuerySchema,
+    TaskFilterSchema,
+    ThreadsFilterSchema,
+)
+from .search import SearchResultRead
+from .voting import PollCreate, PollOptionRead, PollRead, VoteCreate
 
 __all__ = [
     'CommentCreate',
@@ -13,4 +21,14 @@ __all__ = [
     'MeetingProblemSolution',
     'MessageFeedCreate',
     'MessageFeedRead',
+    'MessageFeedSummaryRead',
+    'PollCreate',
+    'PollOptionRead',
+    'PollRead',
+    'ProblemFilterSchema',
+    'SearchQuerySchema',
+    'SearchResultRead',
+    'TaskFilterSchema',
+    'ThreadsFilterSchema',
+    'VoteCreate',
 ]
@@ -1,9 +1,11 @@
 from datetime import datetime
+from typing import Optional
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
 
 from src.problems.constants import TITLE_COMMENTS_TEXT_CREATE, TITLE_COMMENTS_TEXT_UPDATE
+from src.users.schemas import UserShortSchema
 
 
 class CommentBase(BaseModel):
@@ -26,11 +28,12 @@ class CommentUpdate(CommentBase):
 
 
 class CommentRead(CommentBase):
-    """Схема комментария для ответов API."""
+    """Схема комментария для ответов API. Автор встраивается в поле author."""
 
     id: int
     message_id: int
     owner_id: UUID
+    author: Optional[UserShortSchema] = None
     rating: int
     created_at: datetime
     updated_at: datetime
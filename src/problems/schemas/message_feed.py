@@ -1,9 +1,11 @@
 from datetime import datetime
+from typing import Optional
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
 
 from src.problems.constants import TITLE_MESSAGE_FEED_IMPORTANT, TITLE_MESSAGE_FEED_TEXT
+from src.users.schemas import UserShortSchema
 
 
 class MessageFeedBase(BaseModel):
@@ -22,11 +24,25 @@ class MessageFeedCreate(MessageFeedBase):
 
 
 class MessageFeedRead(MessageFeedBase):
-    """Схема треда для ответов API."""
+    """Схема треда для ответов API. Автор встраивается в поле author."""
 
     id: int
     problem_id: int
     owner_id: UUID
+    author: Optional[UserShortSchema] = None
+    comments_count: int
+    last_comment_at: Optional[datetime]
+    last_comment_owner_id: Optional[UUID]
+    last_activity_at: datetime
     created_at: datetime
     updated_at: datetime
     model_config = ConfigDict(from_attributes=True)
+
+
+class MessageFeedSummaryRead(MessageFeedRead):
+    """
+    Схема треда в списке тредов проблемы: вместе со сводкой по комментариям
+    в поле last_comment_author встраивается автор последнего комментария.
+    """
+
+    last_comment_author: Optional[UserShortSchema] = None
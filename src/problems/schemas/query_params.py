@@ -3,9 +3,24 @@
 По-хорошему необходимо реализовать пагинацию в общем файле и применять её к эндпоинтам.
 """
 
+from datetime import date
+from typing import Literal, Optional
+
 from pydantic import BaseModel, Field
 
-from src.constants import DEFAULT_LIMIT, DEFAULT_SKIP
+from src.constants import DEFAULT_LIMIT, DEFAULT_SKIP, TITLE_CURSOR
+from src.problems.constants import (
+    MAX_LENGTH_SEARCH_QUERY,
+    TITLE_FILTER_DATE_BETWEEN,
+    TITLE_FILTER_DATE_FROM,
+    TITLE_FILTER_DATE_TO,
+    TITLE_FILTER_NAME,
+    TITLE_FILTER_STATUS_IN,
+    TITLE_FILTER_TYPE_IN,
+    TITLE_SEARCH_QUERY,
+    TITLE_THREADS_ORDERING,
+)
+from src.problems.models.enums import StatusProblem, StatusTask, TypeProblem
 
 
 class FeedsFilterSchema(BaseModel):
@@ -14,8 +29,62 @@ class FeedsFilterSchema(BaseModel):
 
     Используется для обработки query-параметров:
     пагинация, сортировка и фильтрация списка объектов.
+    Пагинация возможна либо через skip/limit, либо через курсор (cursor/limit).
+    Если передан cursor, параметр skip игнорируется.
     """
 
     skip: int = Field(DEFAULT_SKIP, ge=0, title='Пропустить n объектов')
     limit: int = Field(DEFAULT_LIMIT, ge=1, title='Лимитировать список объектов')
+    cursor: Optional[str] = Field(None, title=TITLE_CURSOR)
     # TODO добавить поля для сортировки и фильтрации
+
+
+class ThreadsFilterSchema(FeedsFilterSchema):
+    """
+    Параметры списка тредов проблемы: пагинация и сортировка.
+
+    Сортировка по последней активности выполняется по индексу
+    (problem_id, last_activity_at DESC, id).
+    """
+
+    ordering: Optional[Literal['-last_activity_at']] = Field(None, title=TITLE_THREADS_ORDERING)
+
+
+class SearchQuerySchema(BaseModel):
+    """
+    Параметры полнотекстового поиска: запрос в синтаксисе websearch_to_tsquery
+    и курсорная пагинация (cursor/limit). Курсор выдаётся в заголовке X-Next-Cursor.
+    """
+
+    q: str = Field(..., min_length=1, max_length=MAX_LENGTH_SEARCH_QUERY, title=TITLE_SEARCH_QUERY)
+    limit: int = Field(DEFAULT_LIMIT, ge=1, le=DEFAULT_LIMIT, title='Лимитировать список объектов')
+    cursor: Optional[str] = Field(None, title=TITLE_CURSOR)
+
+
+class ProblemFilterSchema(BaseModel):
+    """
+    Фильтры списка проблем под query-параметры.
+
+    Имена полей соответствуют ключам CRUDBase._apply_filters (поле__оператор),
+    поэтому model_dump(exclude_none=True) передаётся в get_multi как есть.
+    """
+
+    name__ilike: Optional[str] = Field(None, title=TITLE_FILTER_NAME)
+    status__in: Optional[list[StatusProblem]] = Field(None, title=TITLE_FILTER_STATUS_IN)
+    type__in: Optional[list[TypeProblem]] = Field(None, title=TITLE_FILTER_TYPE_IN)
+
+
+class TaskFilterSchema(BaseModel):
+    """
+    Фильтры списка задач под query-параметры.
+
+    Имена полей соответствуют ключам CRUDBase._apply_filters (поле__оператор).
+    """
+
+    name__ilike: Optional[str] = Field(None, title=TITLE_FILTER_NAME)
+    status__in: Optional[list[StatusTask]] = Field(None, title=TITLE_FILTER_STATUS_IN)
+    date_completion__gte: Optional[date] = Field(None, title=TITLE_FILTER_DATE_FROM)
+    date_completion__lte: Optional[date] = Field(None, title=TITLE_FILTER_DATE_TO)
+    date_completion__between: Optional[list[date]] = Field(
+        None, min_length=2, max_length=2, title=TITLE_FILTER_DATE_BETWEEN
+    )
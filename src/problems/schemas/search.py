@@ -0,0 +1,30 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+from src.problems.models.enums import SearchResultType
+
+
+class SearchResultRead(BaseModel):
+    """
+    Схема результата полнотекстового поиска.
+
+    Поля:
+        type: тип найденного объекта: проблема, тред или комментарий;
+        id: id найденного объекта;
+        problem_id: id проблемы, к которой относится объект;
+        thread_id: id треда (для тредов и комментариев);
+        rank: релевантность (ts_rank_cd), результаты отсортированы по её убыванию;
+        snippet: фрагменты текста с найденными словами, выделенными тегом <b>;
+        created_at: дата создания объекта.
+    """
+
+    type: SearchResultType
+    id: int
+    problem_id: int
+    thread_id: Optional[int]
+    rank: float
+    snippet: str
+    created_at: datetime
+    model_config = ConfigDict(from_attributes=True)
@@ -49,10 +49,17 @@ class TaskResponseSchema(TaskBaseSchema):
     @field_validator('executors', mode='before')
     def transform_executors(cls, executors):
         """Преобразует список объектов AssociationUserTask в список UUID."""
-        if executors and isinstance(executors[ZERO], object):
+        if executors and not isinstance(executors[ZERO], (UUID, str)):
             return [executor.left_id for executor in executors]
         return executors
 
+    @field_validator('file', mode='before')
+    def transform_file(cls, files):
+        """Преобразует список объектов FileTask в список путей к файлам."""
+        if files and not isinstance(files[ZERO], str):
+            return [file.file_path for file in files]
+        return files
+
     class Config:
         from_attributes = True
 
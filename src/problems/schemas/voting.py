@@ -1,35 +1,60 @@
-from uuid import UUID
+from typing import Annotated
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
 
+from src.constants import LENGTH_POLL_OPTION
+from src.problems.constants import (
+    MAX_POLL_OPTIONS,
+    MIN_POLL_OPTIONS,
+    TITLE_POLL_OPTION,
+    TITLE_POLL_OPTIONS,
+)
 
-class VotingBase(BaseModel):
-    """Базовая модель для голосования."""
+PollOptionName = Annotated[
+    str, StringConstraints(strip_whitespace=True, min_length=1, max_length=LENGTH_POLL_OPTION)
+]
 
-    text: str
-    message_id: int
 
+class PollCreate(BaseModel):
+    """Схема для создания голосования в треде."""
 
-class VotingCreate(VotingBase):
-    """Модель для создания голосования."""
+    options: list[PollOptionName] = Field(
+        ...,
+        min_length=MIN_POLL_OPTIONS,
+        max_length=MAX_POLL_OPTIONS,
+        title=TITLE_POLL_OPTIONS,
+    )
+    model_config = ConfigDict(extra='forbid')
 
-    pass
 
+class VoteCreate(BaseModel):
+    """Схема для голоса пользователя."""
 
-class VotingInDB(VotingBase):
-    """Модель голосования в базе данных с ID."""
+    option_id: int = Field(..., title=TITLE_POLL_OPTION)
+    model_config = ConfigDict(extra='forbid')
 
-    id: int
 
+class PollOptionRead(BaseModel):
+    """Схема варианта голосования для ответов API."""
 
-class VotingByUserCreate(BaseModel):
-    """Модель для голосования пользователя."""
+    id: int
+    name: str
+    votes_count: int
+    model_config = ConfigDict(from_attributes=True)
 
-    user_id: UUID
-    voting_id: int
 
+class PollRead(BaseModel):
+    """
+    Схема результатов голосования для ответов API.
 
-class VotingByUserInDB(VotingByUserCreate):
-    """Модель голосования пользователя в базе данных с ID."""
+    Поля:
+        message_id: id треда с голосованием;
+        options: варианты голосования с числом голосов;
+        total_votes: общее число голосов;
+        user_vote: id варианта, выбранного текущим пользователем (если он голосовал).
+    """
 
-    id: int
+    message_id: int
+    options: list[PollOptionRead]
+    total_votes: int
+    user_vote: int | None = None
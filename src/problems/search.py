@@ -0,0 +1,160 @@
+"""
+Модуль полнотекстового поиска по проблемам, тредам и комментариям компании.
+
+Тексты индексируются генерируемыми столбцами search_vector (см.
+src.database.annotations.search_vector_column) с GIN-индексами. Запрос разбирается
+теми же конфигурациями SEARCH_CONFIGS, результаты ранжируются ts_rank_cd и
+возвращаются страницами по курсору (src.pagination).
+"""
+
+from typing import Any, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import Row, and_, case, func, literal, null, select, tuple_, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.constants import SEARCH_CONFIGS, TEXT_ERROR_INVALID_CURSOR
+from src.pagination import decode_cursor, encode_cursor
+from src.problems.constants import (
+    SEARCH_HEADLINE_CONFIG,
+    SEARCH_HEADLINE_OPTIONS,
+    SEARCH_ORDER_BY,
+)
+from src.problems.models import CommentFeed, MessageFeed, Problem
+from src.problems.models.enums import SearchResultType
+
+
+def search_query(q: str) -> Any:
+    """
+    tsquery поискового запроса: запрос в синтаксисе websearch_to_tsquery, разобранный
+    каждой конфигурацией SEARCH_CONFIGS и объединённый через OR (||).
+    """
+    queries = [func.websearch_to_tsquery(config, q) for config in SEARCH_CONFIGS]
+    query = queries[0]
+    for other in queries[1:]:
+        query = query.op('||')(other)
+    return query
+
+
+def decode_search_cursor(cursor: str) -> tuple[float, str, int]:
+    """
+    Значения (rank, type, id) курсора страницы поиска. Если курсор повреждён или
+    значения не приводятся к типам ключа, выбрасывает HTTPException(400), как
+    CRUDBase._apply_cursor.
+    """
+    values = decode_cursor(cursor, SEARCH_ORDER_BY)
+    try:
+        if len(values) != len(SEARCH_ORDER_BY):
+            raise ValueError
+        rank, type_, id_ = values
+        return float(rank), str(type_), int(id_)
+    except (TypeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=TEXT_ERROR_INVALID_CURSOR
+        )
+
+
+async def search_feeds(
+    session: AsyncSession,
+    company_id: int,
+    q: str,
+    limit: int,
+    cursor: Optional[str] = None,
+) -> tuple[list[Row], Optional[str]]:
+    """
+    Ищет проблемы, треды и комментарии компании одним запросом:
+
+        SELECT page.*, ts_headline(текст объекта) FROM (
+            SELECT type, id, problem_id, thread_id, rank FROM (
+                SELECT 'problem', ... FROM problem WHERE company_id = :company_id
+                    AND search_vector @@ :query
+                UNION ALL
+                SELECT 'thread', ... FROM messagefeed JOIN problem ...
+                UNION ALL
+                SELECT 'comment', ... FROM commentfeed JOIN messagefeed JOIN problem ...
+            ) AS hits
+            WHERE (rank, type, id) < (:cursor)
+            ORDER BY rank DESC, type DESC, id DESC LIMIT :limit + 1
+        ) AS page LEFT JOIN problem / messagefeed / commentfeed ON id объекта
+
+    Совпадения находятся по GIN-индексам search_vector, ограничение по компании
+    применяется соединением с проблемой. Сортируются только ключи совпадений, а
+    фрагменты текста (ts_headline) строятся лишь для строк страницы.
+
+    Параметры:
+        session: асинхронная сессия SQLAlchemy;
+        company_id: id компании пользователя;
+        q: поисковый запрос;
+        limit: число результатов на странице;
+        cursor: курсор страницы, выданный предыдущим вызовом.
+    Возвращаемое значение:
+        Строки результатов (поля SearchResultRead) и курсор следующей страницы
+        (None, если страница последняя).
+    """
+    query = search_query(q)
+    hits = union_all(
+        select(
+            literal(SearchResultType.PROBLEM.value).label('type'),
+            Problem.id,
+            Problem.id.label('problem_id'),
+            null().label('thread_id'),
+            func.ts_rank_cd(Problem.search_vector, query).label('rank'),
+        ).where(Problem.company_id == company_id, Problem.search_vector.op('@@')(query)),
+        select(
+            literal(SearchResultType.THREAD.value),
+            MessageFeed.id,
+            MessageFeed.problem_id,
+            MessageFeed.id,
+            func.ts_rank_cd(MessageFeed.search_vector, query),
+        )
+        .join(Problem, Problem.id == MessageFeed.problem_id)
+        .where(Problem.company_id == company_id, MessageFeed.search_vector.op('@@')(query)),
+        select(
+            literal(SearchResultType.COMMENT.value),
+            CommentFeed.id,
+            MessageFeed.problem_id,
+            CommentFeed.message_id,
+            func.ts_rank_cd(CommentFeed.search_vector, query),
+        )
+        .join(MessageFeed, MessageFeed.id == CommentFeed.message_id)
+        .join(Problem, Problem.id == MessageFeed.problem_id)
+        .where(Problem.company_id == company_id, CommentFeed.search_vector.op('@@')(query)),
+    ).subquery('hits')
+
+    key = tuple_(hits.c.rank, hits.c.type, hits.c.id)
+    page = select(hits).order_by(hits.c.rank.desc(), hits.c.type.desc(), hits.c.id.desc())
+    if cursor is not None:
+        page = page.where(key < tuple_(*decode_search_cursor(cursor)))
+    page = page.limit(limit + 1).subquery('page')
+
+    is_problem = page.c.type == SearchResultType.PROBLEM.value
+    is_thread = page.c.type == SearchResultType.THREAD.value
+    is_comment = page.c.type == SearchResultType.COMMENT.value
+    document = case(
+        (is_problem, func.concat_ws(' ', Problem.name, Problem.description)),
+        (is_thread, MessageFeed.text),
+        else_=CommentFeed.text,
+    )
+    rows = (
+        await session.execute(
+            select(
+                page,
+                func.ts_headline(
+                    SEARCH_HEADLINE_CONFIG, document, query, SEARCH_HEADLINE_OPTIONS
+                ).label('snippet'),
+                func.coalesce(
+                    Problem.created_at, MessageFeed.created_at, CommentFeed.created_at
+                ).label('created_at'),
+            )
+            .outerjoin(Problem, and_(is_problem, Problem.id == page.c.id))
+            .outerjoin(MessageFeed, and_(is_thread, MessageFeed.id == page.c.id))
+            .outerjoin(CommentFeed, and_(is_comment, CommentFeed.id == page.c.id))
+            .order_by(page.c.rank.desc(), page.c.type.desc(), page.c.id.desc())
+        )
+    ).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(SEARCH_ORDER_BY, [last.rank, last.type, last.id])
+    return rows, next_cursor
@@ -0,0 +1,88 @@
+"""
+Модуль контекста запроса.
+
+Содержит:
+- RequestContext: пользователь, его компания и лицензия компании, загруженные при
+  аутентификации одним запросом к БД.
+- get_request_context: возвращает контекст текущего запроса.
+- get_context_company: компания по id из контекста или из БД.
+- RequestContextMiddleware: создаёт контекст на время обработки запроса.
+
+Контекст хранится в ContextVar: запросы обрабатываются в отдельных задачах asyncio,
+поэтому данные одного запроса не видны другим.
+"""
+
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.requests import Request
+
+from src.companies.models import Company
+from src.tabit_management.models import LicenseType
+from src.users.models import UserTabit
+
+
+@dataclass
+class RequestContext:
+    """
+    Объекты, загруженные за время обработки запроса.
+
+    Поля:
+        user: аутентифицированный пользователь компании;
+        company: компания пользователя;
+        license: лицензия компании (если назначена).
+    """
+
+    user: Optional[UserTabit] = None
+    company: Optional[Company] = None
+    license: Optional[LicenseType] = None
+
+    def get_company(self) -> Company | None:
+        """
+        Возвращает компанию пользователя, если она загружена и её атрибуты не истекли
+        после commit сессии: чтение истёкших атрибутов потребовало бы запроса к БД.
+        """
+        if self.company is None or inspect(self.company).expired_attributes:
+            return None
+        return self.company
+
+
+request_context: ContextVar[RequestContext | None] = ContextVar('request_context', default=None)
+
+
+def get_request_context() -> RequestContext:
+    """
+    Возвращает контекст текущего запроса.
+    Вне запроса (скрипты, прямые вызовы) возвращает пустой контекст, который нигде
+    не сохраняется.
+    """
+    return request_context.get() or RequestContext()
+
+
+async def get_context_company(session: AsyncSession, company_id: int) -> Company | None:
+    """
+    Возвращает компанию по id из контекста запроса, а если там другая компания или её
+    нет - загружает из БД.
+
+    Параметры:
+        session: асинхронная сессия SQLAlchemy;
+        company_id: id компании.
+    """
+    company = get_request_context().get_company()
+    if company is not None and company.id == company_id:
+        return company
+    return await session.get(Company, company_id)
+
+
+class RequestContextMiddleware:
+    """Middleware, создающий пустой контекст для каждого запроса и удаляющий его после ответа."""
+
+    async def __call__(self, request: Request, call_next, *args, **kwargs):
+        token = request_context.set(RequestContext())
+        try:
+            return await call_next(request)
+        finally:
+            request_context.reset(token)
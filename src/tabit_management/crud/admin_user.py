@@ -1,18 +1,17 @@
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 from uuid import UUID
 
 from fastapi import HTTPException, status
 from fastapi_users.exceptions import InvalidPasswordException, UserAlreadyExists, UserNotExists
 from fastapi_users.manager import BaseUserManager
 from sqlalchemy import select
-from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.base import ExecutableOption
 
 from src.constants import DEFAULT_LIMIT, DEFAULT_SKIP
 from src.crud import CRUDBase, UserCreateMixin
-from src.logger import logger
+from src.pagination import CountMode
 from src.tabit_management.constants import (
-    ERROR_INTERNAL_SERVER,
     ERROR_INVALID_PASSWORD,
     ERROR_USER_ALREADY_EXISTS,
     ERROR_USER_NOT_EXISTS,
@@ -21,6 +20,7 @@ from src.tabit_management.schemas.admin_company import (
     CompanyAdminCreateSchema,
     CompanyAdminUpdateSchema,
 )
+from src.tabit_management.utils import internal_server_error
 from src.users.models import UserTabit
 
 
@@ -34,6 +34,8 @@ class CRUDAdminUser(UserCreateMixin, CRUDBase):
         limit: int = DEFAULT_LIMIT,
         filters: Optional[dict[str, Any]] = None,
         order_by: list[str] | None = None,
+        options: Sequence[ExecutableOption] | None = None,
+        company_id: int | None = None,
     ) -> list[UserTabit]:
         """
         Переопределённый метод get_multi от CRUDBase. Возвращает список объектов UserTabit.
@@ -45,18 +47,52 @@ class CRUDAdminUser(UserCreateMixin, CRUDBase):
             limit: Максимальное число записей.
             filters: Словарь {имя_поля: значение} для фильтрации.
             order_by: Список полей для сортировки; '-' в начале для убывания.
+            options: Опции загрузки связей.
+            company_id: id компании, которой ограничивается выборка.
         """
-        try:
-            return await super().get_multi(session, skip, limit, filters, order_by)
-        except SQLAlchemyError as error:
-            logger.error(f'Эндпоинт gget_all_staff, ошибка бд: {error}')
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=ERROR_INTERNAL_SERVER
+        with internal_server_error('get_all_staff'):
+            return await super().get_multi(
+                session, skip, limit, filters, order_by, options, company_id
             )
-        except Exception as error:
-            logger.error(f'Эндпоинт get_all_staff, ошибка: {error}')
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=ERROR_INTERNAL_SERVER
+
+    async def get_page(
+        self,
+        session: AsyncSession,
+        skip: int = DEFAULT_SKIP,
+        limit: int = DEFAULT_LIMIT,
+        filters: Optional[dict[str, Any]] = None,
+        order_by: list[str] | None = None,
+        options: Sequence[ExecutableOption] | None = None,
+        company_id: int | None = None,
+        count_mode: CountMode = CountMode.EXACT,
+    ) -> tuple[list[UserTabit], int]:
+        """
+        Переопределённый метод get_page от CRUDBase с той же обработкой ошибок,
+        что и в get_multi. Параметры - как у CRUDBase.get_page.
+        """
+        with internal_server_error('get_all_staff'):
+            return await super().get_page(
+                session, skip, limit, filters, order_by, options, company_id, count_mode
+            )
+
+    async def get_page_by_cursor(
+        self,
+        session: AsyncSession,
+        cursor: str | None = None,
+        limit: int = DEFAULT_LIMIT,
+        filters: Optional[dict[str, Any]] = None,
+        order_by: list[str] | None = None,
+        options: Sequence[ExecutableOption] | None = None,
+        company_id: int | None = None,
+        count_mode: CountMode = CountMode.EXACT,
+    ) -> tuple[list[UserTabit], str | None, int]:
+        """
+        Переопределённый метод get_page_by_cursor от CRUDBase с той же обработкой ошибок,
+        что и в get_multi. Параметры - как у CRUDBase.get_page_by_cursor.
+        """
+        with internal_server_error('get_all_staff'):
+            return await super().get_page_by_cursor(
+                session, cursor, limit, filters, order_by, options, company_id, count_mode
             )
 
     async def get_by_telegram_username(
@@ -1,4 +1,4 @@
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.crud import CRUDBase
@@ -22,18 +22,5 @@ class CRUDLicenseType(CRUDBase):
         result = await session.execute(select(LicenseType).where(LicenseType.name == name))
         return result.scalar_one_or_none() is not None
 
-    async def get_total_count(self, session: AsyncSession) -> int:
-        """
-        Возвращает общее количество записей в таблице LicenseType.
-
-        Args:
-            session (AsyncSession): Асинхронная сессия SQLAlchemy.
-
-        Returns:
-            int: Общее количество записей в таблице LicenseType.
-        """
-        result = await session.execute(select(func.count()).select_from(self.model))
-        return result.scalar_one()
-
 
 license_type_crud = CRUDLicenseType(LicenseType)
@@ -3,7 +3,7 @@ from typing import List, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
-from src.constants import LENGTH_NAME_LICENSE, MIN_LENGTH_NAME, ZERO
+from src.constants import LENGTH_NAME_LICENSE, MIN_LENGTH_NAME, TITLE_CURSOR, ZERO
 from src.tabit_management.constants import (
     DEFAULT_LICENSE_TERM,
     DEFAULT_PAGE,
@@ -115,12 +115,14 @@ class LicenseTypeListResponseSchema(BaseModel):
         total (int): Общее количество записей.
         page (int): Текущая страница.
         page_size (int): Количество записей на странице.
+        next_cursor (Optional[str]): Курсор следующей страницы, если она есть.
     """
 
     items: List[LicenseTypeResponseSchema]
     total: int
     page: int
     page_size: int
+    next_cursor: Optional[str] = None
 
 
 class LicenseTypeFilterSchema(BaseModel):
@@ -132,6 +134,7 @@ class LicenseTypeFilterSchema(BaseModel):
         ordering (Optional[Literal]): Сортировка (по полям name, created_at, updated_at).
         page (Optional[int]): Номер страницы.
         page_size (Optional[int]): Количество записей на странице.
+        cursor (Optional[str]): Курсор следующей страницы. Если передан, page игнорируется.
     """
 
     name: Optional[str] = Field(None, description=FILTER_NAME_DESCRIPTION)
@@ -144,3 +147,4 @@ class LicenseTypeFilterSchema(BaseModel):
     page_size: Optional[int] = Field(
         DEFAULT_PAGE_SIZE, ge=MIN_PAGE_SIZE, le=MAX_PAGE_SIZE, description=PAGE_SIZE_DESCRIPTION
     )
+    cursor: Optional[str] = Field(None, description=TITLE_CURSOR)
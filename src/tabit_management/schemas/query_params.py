@@ -1,6 +1,8 @@
+from typing import Optional
+
 from pydantic import BaseModel, Field
 
-from src.constants import DEFAULT_LIMIT, DEFAULT_SKIP
+from src.constants import DEFAULT_LIMIT, DEFAULT_SKIP, TITLE_CURSOR
 
 
 class BaseFilterSchema(BaseModel):
@@ -9,10 +11,13 @@ class BaseFilterSchema(BaseModel):
 
     Используется для обработки query-параметров:
     пагинация, сортировка и фильтрация списка объектов.
+    Пагинация возможна либо через skip/limit, либо через курсор (cursor/limit).
+    Если передан cursor, параметр skip игнорируется.
     """
 
     skip: int = Field(DEFAULT_SKIP, ge=0, title='Пропустить n объектов')
     limit: int = Field(DEFAULT_LIMIT, ge=1, title='Лимитировать список объектов')
+    cursor: Optional[str] = Field(None, title=TITLE_CURSOR)
     # TODO добавить поля для сортировки и фильтрации
 
 
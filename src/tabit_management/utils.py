@@ -0,0 +1,34 @@
+from contextlib import contextmanager
+from typing import Iterator
+
+from fastapi import HTTPException, status
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.logger import logger
+from src.tabit_management.constants import ERROR_INTERNAL_SERVER
+
+
+@contextmanager
+def internal_server_error(endpoint: str) -> Iterator[None]:
+    """
+    Записывает в лог ошибки блока и заменяет их на HTTPException 500 с текстом
+    ERROR_INTERNAL_SERVER. HTTPException блока (например, о неверном курсоре)
+    пропускаются без изменений.
+
+    Параметры:
+        endpoint: Имя эндпоинта для сообщения в логе.
+    """
+    try:
+        yield
+    except HTTPException:
+        raise
+    except SQLAlchemyError as error:
+        logger.error(f'Эндпоинт {endpoint}, ошибка бд: {error}')
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=ERROR_INTERNAL_SERVER
+        )
+    except Exception as error:
+        logger.error(f'Эндпоинт {endpoint}, ошибка: {error}')
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=ERROR_INTERNAL_SERVER
+        )
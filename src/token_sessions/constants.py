@@ -0,0 +1,6 @@
+# Утверждение JWT с идентификатором сессии. Одинаково у access и refresh токенов одной пары.
+TOKEN_CLAIM_JTI: str = 'jti'
+# Длина jti в байтах до кодирования в hex.
+JTI_BYTES: int = 16
+# Длина хэша jti (sha256 в hex).
+LENGTH_JTI_HASH: int = 64
@@ -0,0 +1,161 @@
+from datetime import datetime
+from typing import Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import delete, func, insert, literal, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.crud import CRUDBase
+from src.token_sessions.models import TokenSession
+
+
+class CRUDTokenSession(CRUDBase):
+    """CRUD операций для модели сессий refresh-токенов."""
+
+    async def open(
+        self, session: AsyncSession, jti_hash: str, user_id: UUID, expires_at: datetime
+    ) -> None:
+        """
+        Создаёт сессию для новой пары токенов.
+
+        Параметры:
+            session: асинхронная сессия SQLAlchemy;
+            jti_hash: хэш jti пары токенов;
+            user_id: id пользователя, которому выданы токены;
+            expires_at: дата окончания действия refresh-токена.
+        """
+        await session.execute(
+            insert(self.model).values(jti_hash=jti_hash, user_id=user_id, expires_at=expires_at)
+        )
+        await session.commit()
+
+    async def rotate(
+        self,
+        session: AsyncSession,
+        old_jti_hash: str,
+        new_jti_hash: str,
+        expires_at: datetime,
+    ) -> Optional[UUID]:
+        """
+        Переводит действующую сессию на новую пару токенов одним запросом:
+
+            WITH rotated AS (
+                UPDATE tokensession SET revoked_at = now()
+                WHERE jti_hash = :old_jti_hash AND revoked_at IS NULL AND expires_at > now()
+                RETURNING user_id
+            )
+            INSERT INTO tokensession (jti_hash, user_id, expires_at)
+            SELECT :new_jti_hash, user_id, :expires_at FROM rotated RETURNING user_id
+
+        Запись прежнего jti остаётся отозванной до своего истечения, то есть не меньше
+        срока действия выданного с ним access-токена, поэтому такие токены отклоняются
+        так же, как токены отозванной сессии. Возвращает id пользователя сессии или None,
+        если сессия отозвана, истекла или уже переведена на другой jti (повторное
+        использование refresh-токена).
+
+        Параметры:
+            session: асинхронная сессия SQLAlchemy;
+            old_jti_hash: хэш jti предъявленного refresh-токена;
+            new_jti_hash: хэш jti новой пары токенов;
+            expires_at: дата окончания действия нового refresh-токена.
+        """
+        rotated = (
+            update(self.model)
+            .where(
+                self.model.jti_hash == old_jti_hash,
+                self.model.revoked_at.is_(None),
+                self.model.expires_at > func.now(),
+            )
+            .values(revoked_at=func.now(), updated_at=func.now())
+            .returning(self.model.user_id)
+            .cte('rotated')
+        )
+        user_id = await session.scalar(
+            insert(self.model)
+            .from_select(
+                ['jti_hash', 'user_id', 'expires_at'],
+                select(
+                    literal(new_jti_hash, self.model.jti_hash.type),
+                    rotated.c.user_id,
+                    literal(expires_at, self.model.expires_at.type),
+                ),
+            )
+            .returning(self.model.user_id)
+            .add_cte(rotated)
+        )
+        await session.commit()
+        return user_id
+
+    async def revoke(self, session: AsyncSession, jti_hash: str) -> None:
+        """
+        Отзывает сессию.
+
+        Параметры:
+            session: асинхронная сессия SQLAlchemy;
+            jti_hash: хэш jti пары токенов.
+        """
+        await session.execute(
+            update(self.model)
+            .where(self.model.jti_hash == jti_hash, self.model.revoked_at.is_(None))
+            .values(revoked_at=func.now())
+        )
+        await session.commit()
+
+    async def is_revoked(self, session: AsyncSession, jti_hash: str) -> bool:
+        """
+        Проверяет, отозвана ли сессия.
+
+        Параметры:
+            session: асинхронная сессия SQLAlchemy;
+            jti_hash: хэш jti пары токенов.
+        """
+        return bool(
+            await session.scalar(
+                select(self.model.revoked_at.is_not(None)).where(self.model.jti_hash == jti_hash)
+            )
+        )
+
+    async def get_revoked_hashes(
+        self, session: AsyncSession, since: Optional[datetime] = None
+    ) -> Sequence[str]:
+        """
+        Возвращает хэши jti отозванных и ещё не истекших сессий.
+
+        Параметры:
+            session: асинхронная сессия SQLAlchemy;
+            since: вернуть только сессии, отозванные после этой даты.
+        """
+        query = select(self.model.jti_hash).where(
+            self.model.revoked_at.is_not(None), self.model.expires_at > func.now()
+        )
+        if since is not None:
+            query = query.where(self.model.revoked_at > since)
+        return (await session.scalars(query)).all()
+
+    async def purge_expired(self, session: AsyncSession, batch_size: int) -> int:
+        """
+        Удаляет истекшие сессии пакетами по batch_size строк, фиксируя транзакцию после
+        каждого пакета, чтобы не держать долгих блокировок. Строки, заблокированные другим
+        воркером, пропускаются (FOR UPDATE SKIP LOCKED). Возвращает число удалённых строк.
+
+        Параметры:
+            session: асинхронная сессия SQLAlchemy;
+            batch_size: число строк в одном пакете.
+        """
+        batch = (
+            select(self.model.id)
+            .where(self.model.expires_at <= func.now())
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        deleted = 0
+        while True:
+            result = await session.execute(delete(self.model).where(self.model.id.in_(batch)))
+            await session.commit()
+            deleted += result.rowcount
+            if result.rowcount < batch_size:
+                return deleted
+
+
+token_session_crud = CRUDTokenSession(TokenSession)
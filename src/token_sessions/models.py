@@ -0,0 +1,39 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import Index, String
+from sqlalchemy.dialects.postgresql import TIMESTAMP
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.database.annotations import int_pk, timestamp_nullable
+from src.database.models import BaseTabitModel
+from src.token_sessions.constants import LENGTH_JTI_HASH
+
+
+class TokenSession(BaseTabitModel):
+    """
+    Модель сессий refresh-токенов.
+
+    Назначение:
+        Хранит выданные refresh-токены пользователей и администраторов сервиса. При обновлении
+        токенов запись прежнего jti отзывается (и хранится до истечения, не раньше
+        истечения access-токена прежней пары), а для нового jti создаётся новая запись;
+        при выходе из системы запись отзывается.
+
+    Поля:
+        id: Идентификатор.
+        jti_hash: sha256 от jti текущей пары токенов; сам jti не хранится.
+        user_id: id пользователя или администратора сервиса, которому выданы токены.
+        expires_at: Дата окончания действия refresh-токена.
+        revoked_at: Дата отзыва сессии (None - сессия действует).
+        created_at: Дата создания записи в таблице. Автозаполнение.
+        updated_at: Дата изменения записи в таблице. Автозаполнение.
+    """
+
+    id: Mapped[int_pk]
+    jti_hash: Mapped[str] = mapped_column(String(LENGTH_JTI_HASH), unique=True)
+    user_id: Mapped[UUID] = mapped_column(index=True)
+    expires_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True))
+    revoked_at: Mapped[timestamp_nullable]
+
+    __table_args__ = (Index('ix_tokensession_expires_at', 'expires_at'),)
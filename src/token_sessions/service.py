@@ -0,0 +1,256 @@
+"""
+Модуль хранилища сессий refresh-токенов.
+
+Содержит:
+- RevokedTokenFilter: фильтр Блума хэшей jti отозванных сессий.
+- TokenSessionStore: выдача, обновление (ротация) и отзыв сессий, проверка отзыва
+  access-токенов и периодическое обслуживание хранилища.
+- token_session_store: общее на процесс хранилище, настроенное по Settings.
+
+Проверка access-токена на отзыв обращается к БД, только если фильтр Блума допускает,
+что jti отозван: для подавляющего большинства запросов проверка выполняется в памяти.
+Отзывы текущего процесса попадают в фильтр сразу, отзывы других воркеров - при
+периодической синхронизации (token_session_sync_seconds).
+"""
+
+import asyncio
+import hashlib
+import secrets
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Iterator, Optional
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.config import settings
+from src.logger import logger
+from src.token_sessions.constants import JTI_BYTES
+from src.token_sessions.crud import token_session_crud
+
+
+class RevokedTokenFilter:
+    """
+    Фильтр Блума хэшей jti отозванных сессий.
+
+    Не даёт ложноотрицательных ответов: если хэш добавлен, might_contain вернёт True.
+    Ложноположительный ответ только приводит к проверке по БД.
+    """
+
+    def __init__(self, size_bits: int, hashes: int) -> None:
+        self.size_bits = size_bits
+        self.hashes = hashes
+        self.count = 0
+        self._bits = bytearray((size_bits + 7) // 8)
+
+    def _positions(self, jti_hash: str) -> Iterator[int]:
+        """
+        Возвращает номера битов хэша. Хэш jti - sha256, поэтому позиции вычисляются
+        двойным хэшированием по двум его 64-битным частям.
+        """
+        digest = bytes.fromhex(jti_hash)
+        first = int.from_bytes(digest[:8], 'big')
+        second = int.from_bytes(digest[8:16], 'big') | 1
+        for number in range(self.hashes):
+            yield (first + number * second) % self.size_bits
+
+    def add(self, jti_hash: str) -> None:
+        """Добавляет хэш jti в фильтр."""
+        for position in self._positions(jti_hash):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def might_contain(self, jti_hash: str) -> bool:
+        """Проверяет, мог ли хэш jti быть добавлен в фильтр."""
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(jti_hash)
+        )
+
+
+class TokenSessionStore:
+    """Хранилище сессий refresh-токенов с фильтром Блума отозванных сессий."""
+
+    def __init__(self, size_bits: int, hashes: int) -> None:
+        self.size_bits = size_bits
+        self.hashes = hashes
+        self.revoked = RevokedTokenFilter(size_bits, hashes)
+        self._synced_at: Optional[datetime] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def new_jti() -> str:
+        """Возвращает случайный jti для новой пары токенов."""
+        return secrets.token_hex(JTI_BYTES)
+
+    @staticmethod
+    def hash_jti(jti: str) -> str:
+        """Возвращает хэш jti, под которым сессия хранится в БД."""
+        return hashlib.sha256(jti.encode()).hexdigest()
+
+    @staticmethod
+    def _expires_at(lifetime_seconds: int) -> datetime:
+        """Возвращает дату окончания действия refresh-токена."""
+        return datetime.now(timezone.utc) + timedelta(seconds=lifetime_seconds)
+
+    async def open(
+        self, session: AsyncSession, jti: str, user_id: UUID, lifetime_seconds: int
+    ) -> None:
+        """
+        Создаёт сессию для токенов, выданных при входе в систему.
+
+        Параметры:
+            session: асинхронная сессия SQLAlchemy;
+            jti: jti новой пары токенов;
+            user_id: id пользователя;
+            lifetime_seconds: время жизни refresh-токена.
+        """
+        await token_session_crud.open(
+            session, self.hash_jti(jti), user_id, self._expires_at(lifetime_seconds)
+        )
+
+    async def rotate(
+        self,
+        session: AsyncSession,
+        old_jti: str,
+        new_jti: str,
+        lifetime_seconds: int,
+    ) -> Optional[UUID]:
+        """
+        Переводит сессию предъявленного refresh-токена на новую пару токенов. Прежний jti
+        отзывается и добавляется в фильтр отозванных, поэтому access-токены прежней пары
+        не принимаются. Возвращает id пользователя сессии или None, если refresh-токен
+        больше не действует.
+
+        Параметры:
+            session: асинхронная сессия SQLAlchemy;
+            old_jti: jti предъявленного refresh-токена;
+            new_jti: jti новой пары токенов;
+            lifetime_seconds: время жизни нового refresh-токена.
+        """
+        old_jti_hash = self.hash_jti(old_jti)
+        user_id = await token_session_crud.rotate(
+            session,
+            old_jti_hash,
+            self.hash_jti(new_jti),
+            self._expires_at(lifetime_seconds),
+        )
+        if user_id is not None:
+            self.revoked.add(old_jti_hash)
+        return user_id
+
+    async def revoke(self, session: AsyncSession, jti: str) -> None:
+        """
+        Отзывает сессию и добавляет её в фильтр отозванных.
+
+        Параметры:
+            session: асинхронная сессия SQLAlchemy;
+            jti: jti пары токенов.
+        """
+        jti_hash = self.hash_jti(jti)
+        await token_session_crud.revoke(session, jti_hash)
+        self.revoked.add(jti_hash)
+
+    async def is_revoked(self, session: AsyncSession, jti: str) -> bool:
+        """
+        Проверяет, отозвана ли сессия токена. Обращается к БД, только если хэш jti
+        есть в фильтре отозванных.
+
+        Параметры:
+            session: асинхронная сессия SQLAlchemy;
+            jti: jti из утверждений токена.
+        """
+        jti_hash = self.hash_jti(jti)
+        if not self.revoked.might_contain(jti_hash):
+            return False
+        return await token_session_crud.is_revoked(session, jti_hash)
+
+    async def sync(self, session: AsyncSession) -> None:
+        """
+        Добавляет в фильтр сессии, отозванные с прошлой синхронизации (в том числе
+        другими воркерами). Интервал берётся с запасом в token_session_sync_seconds,
+        чтобы не пропустить отзывы из транзакций, зафиксированных во время синхронизации.
+
+        Параметры:
+            session: асинхронная сессия SQLAlchemy.
+        """
+        synced_at = await session.scalar(select(func.now()))
+        since = self._synced_at
+        if since is not None:
+            since -= timedelta(seconds=settings.token_session_sync_seconds)
+        for jti_hash in await token_session_crud.get_revoked_hashes(session, since):
+            self.revoked.add(jti_hash)
+        self._synced_at = synced_at
+
+    async def rebuild(self, session: AsyncSession) -> None:
+        """
+        Пересобирает фильтр по отозванным и ещё не истекшим сессиям: из фильтра Блума
+        нельзя удалить элементы, поэтому истекшие сессии убираются только пересборкой.
+
+        Параметры:
+            session: асинхронная сессия SQLAlchemy.
+        """
+        synced_at = await session.scalar(select(func.now()))
+        revoked = RevokedTokenFilter(self.size_bits, self.hashes)
+        for jti_hash in await token_session_crud.get_revoked_hashes(session):
+            revoked.add(jti_hash)
+        self.revoked = revoked
+        self._synced_at = synced_at
+
+    async def run_maintenance(self, sessionmaker: async_sessionmaker) -> None:
+        """
+        Собирает фильтр отозванных сессий, затем периодически синхронизирует его, а раз в
+        token_session_purge_seconds удаляет истекшие сессии и пересобирает фильтр.
+        Ошибки (например, недоступность БД при запуске воркера) записываются в лог, и
+        шаг повторяется через token_session_sync_seconds: пока фильтр не собран,
+        повторяется первая сборка.
+
+        Параметры:
+            sessionmaker: фабрика асинхронных сессий.
+        """
+        purged_at: Optional[float] = None
+        while True:
+            try:
+                async with sessionmaker() as session:
+                    if purged_at is None:
+                        await self.rebuild(session)
+                        purged_at = time.monotonic()
+                    elif time.monotonic() - purged_at < settings.token_session_purge_seconds:
+                        await self.sync(session)
+                    else:
+                        purged_at = time.monotonic()
+                        deleted = await token_session_crud.purge_expired(
+                            session, settings.token_session_purge_batch_size
+                        )
+                        await self.rebuild(session)
+                        logger.info(f'Удалено истекших сессий refresh-токенов: {deleted}')
+            except Exception as error:
+                logger.error(f'Ошибка обслуживания сессий refresh-токенов: {error}')
+            await asyncio.sleep(settings.token_session_sync_seconds)
+
+    def start(self, sessionmaker: async_sessionmaker) -> None:
+        """Запускает run_maintenance фоновой задачей."""
+        self._task = asyncio.create_task(self.run_maintenance(sessionmaker))
+
+    async def stop(self) -> None:
+        """
+        Останавливает фоновую задачу обслуживания. Ошибка уже завершившейся задачи
+        записывается в лог и не мешает остановке приложения.
+        """
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        except Exception as error:
+            logger.error(f'Задача обслуживания сессий refresh-токенов завершилась: {error}')
+        self._task = None
+
+
+token_session_store = TokenSessionStore(
+    settings.token_revoked_filter_bits, settings.token_revoked_filter_hashes
+)
+"""Общее на процесс хранилище сессий refresh-токенов."""
@@ -0,0 +1,185 @@
+"""
+Модуль кэша пользователей компаний.
+
+Содержит:
+- UserCacheEntry: снимок пользователя, его компании и лицензии компании.
+- UserTokenCache: LRU-кэш с TTL внутри процесса по id пользователя и версии токена.
+- user_cache: общий на процесс кэш, настроенный по Settings.
+
+Запись кэша выдаётся только токену с той же версией, что и у пользователя в момент
+загрузки. Выход из системы, смена роли и деактивация увеличивают версию в БД
+(UserTabit.token_version), поэтому ранее выданные токены в кэш не попадают и отклоняются
+при проверке по БД. Любое изменение или удаление пользователя удаляет его запись из кэша
+текущего процесса; на остальных воркерах запись живёт не дольше user_cache_ttl_seconds.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+from uuid import UUID
+
+from sqlalchemy import event, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+
+from src.companies.models import Company
+from src.config import settings
+from src.database.models import BaseTabitModel
+from src.tabit_management.models import LicenseType
+from src.users.models import UserTabit
+
+
+def _snapshot(instance: BaseTabitModel) -> dict[str, Any]:
+    """Возвращает значения колонок загруженного объекта."""
+    return {
+        attribute.key: getattr(instance, attribute.key)
+        for attribute in inspect(instance).mapper.column_attrs
+    }
+
+
+async def _restore(
+    session: AsyncSession, model: type[BaseTabitModel], values: dict[str, Any]
+) -> BaseTabitModel:
+    """
+    Добавляет объект из снимка в сессию без обращения к БД: объект помечается как
+    загруженный из БД (detached) и объединяется с сессией через merge(load=False).
+    """
+    instance = model(**values)
+    make_transient_to_detached(instance)
+    return await session.merge(instance, load=False)
+
+
+@dataclass(frozen=True)
+class UserCacheEntry:
+    """
+    Снимок объектов, загружаемых при аутентификации пользователя компании.
+
+    Поля:
+        user: значения колонок пользователя;
+        company: значения колонок компании пользователя;
+        license: значения колонок лицензии компании (если назначена).
+    """
+
+    user: dict[str, Any]
+    company: dict[str, Any]
+    license: Optional[dict[str, Any]]
+
+    @classmethod
+    def from_objects(
+        cls, user: UserTabit, company: Company, license: Optional[LicenseType]
+    ) -> 'UserCacheEntry':
+        """Создаёт запись по загруженным объектам."""
+        return cls(_snapshot(user), _snapshot(company), _snapshot(license) if license else None)
+
+    @property
+    def user_id(self) -> UUID:
+        """id пользователя."""
+        return self.user['id']
+
+    @property
+    def token_version(self) -> int:
+        """Версия токенов пользователя на момент загрузки."""
+        return self.user['token_version']
+
+    @property
+    def company_slug(self) -> str:
+        """slug компании пользователя."""
+        return self.company['slug']
+
+    async def restore(
+        self, session: AsyncSession
+    ) -> tuple[UserTabit, Company, Optional[LicenseType]]:
+        """
+        Возвращает пользователя, компанию и лицензию, добавленные в сессию без запросов к БД.
+
+        Параметры:
+            session: асинхронная сессия SQLAlchemy текущего запроса.
+        """
+        return (
+            await _restore(session, UserTabit, self.user),
+            await _restore(session, Company, self.company),
+            await _restore(session, LicenseType, self.license) if self.license else None,
+        )
+
+
+class UserTokenCache:
+    """
+    LRU-кэш пользователей компаний с ограниченным временем жизни записей.
+
+    Запись хранится по id пользователя и выдаётся только для совпадающей версии токена.
+    Если во время загрузки из БД кэш был инвалидирован, результат не сохраняется, чтобы
+    не вернуть в кэш устаревшие данные.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.generation = 0
+        self._entries: OrderedDict[UUID, tuple[float, UserCacheEntry]] = OrderedDict()
+
+    def get(self, user_id: UUID, token_version: int) -> UserCacheEntry | None:
+        """
+        Возвращает неустаревшую запись пользователя с указанной версией токена.
+
+        Параметры:
+            user_id: id пользователя;
+            token_version: версия из утверждений токена.
+        """
+        cached = self._entries.get(user_id)
+        if cached is not None:
+            expires_at, entry = cached
+            if expires_at <= time.monotonic():
+                del self._entries[user_id]
+            elif entry.token_version == token_version:
+                self._entries.move_to_end(user_id)
+                self.hits += 1
+                return entry
+        self.misses += 1
+        return None
+
+    def put(self, entry: UserCacheEntry, generation: int) -> None:
+        """
+        Сохраняет запись, вытесняя давно не использованные сверх maxsize.
+
+        Параметры:
+            entry: запись кэша;
+            generation: значение generation перед загрузкой записи из БД.
+        """
+        if generation != self.generation:
+            return
+        self._entries[entry.user_id] = (time.monotonic() + self.ttl, entry)
+        self._entries.move_to_end(entry.user_id)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, *user_ids: UUID) -> None:
+        """Удаляет записи пользователей из кэша текущего процесса."""
+        self.generation += 1
+        for user_id in user_ids:
+            self._entries.pop(user_id, None)
+
+    def invalidate_company(self, *slugs: str) -> None:
+        """Удаляет записи сотрудников компаний с указанными slug."""
+        self.generation += 1
+        for user_id, (_, entry) in list(self._entries.items()):
+            if entry.company_slug in slugs:
+                del self._entries[user_id]
+
+    def clear(self) -> None:
+        """Очищает кэш текущего процесса."""
+        self.generation += 1
+        self._entries.clear()
+
+
+user_cache = UserTokenCache(maxsize=settings.user_cache_size, ttl=settings.user_cache_ttl_seconds)
+"""Общий на процесс кэш пользователей компаний."""
+
+
+@event.listens_for(UserTabit, 'after_update')
+@event.listens_for(UserTabit, 'after_delete')
+def _invalidate_user(mapper: Any, connection: Any, target: UserTabit) -> None:
+    """Удаляет из кэша пользователя, изменённого или удалённого через сессию."""
+    user_cache.invalidate(target.id)
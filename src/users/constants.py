@@ -20,3 +20,14 @@ title_updated_at_user: str = 'Дата обновления профиля по
 
 title_name_tag: str = 'Имя тэга'
 title_company_id_tag: str = 'id компании, в которой используется тэг'
+
+# Число паролей, хэшируемых одной задачей в пуле процессов
+PASSWORD_HASH_CHUNK_SIZE: int = 50
+
+# Дополнительные подписанные утверждения в JWT пользователей компаний.
+TOKEN_CLAIM_COMPANY_ID: str = 'company_id'
+TOKEN_CLAIM_ROLE: str = 'role'
+TOKEN_CLAIM_IS_ACTIVE: str = 'is_active'
+TOKEN_CLAIM_VERSION: str = 'ver'
+# Поля, изменение которых отзывает ранее выданные токены пользователя.
+TOKEN_REVOKING_FIELDS: tuple[str, ...] = ('role', 'is_active')
@@ -1,11 +1,78 @@
-from src.crud import CRUDBase
+from typing import Any, Iterable, Sequence
+
+from sqlalchemy import Row, String, any_, bindparam, func, select
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.crud import BatchLoader, CRUDBase
 from src.users.models import UserTabit
+from src.users.schemas import UserShortSchema
 
 
 class CRUDUsers(CRUDBase):
     """CRUD операций для модели пользователей."""
 
-    pass
+    filter_fields = {
+        'current_department_id': ('in',),
+        'role': ('in',),
+        'surname': ('ilike',),
+    }
+
+    async def get_existing_emails(self, session: AsyncSession, emails: Iterable[str]) -> set[str]:
+        """
+        Возвращает email (в нижнем регистре), которые уже заняты пользователями.
+        Проверка выполняется одним запросом WHERE lower(email) = ANY(:emails) без учёта
+        регистра, как и в fastapi-users.
+
+        Параметры:
+            session: асинхронная сессия SQLAlchemy;
+            emails: проверяемые email.
+        """
+        query = select(func.lower(self.model.email)).where(
+            func.lower(self.model.email)
+            == any_(bindparam('emails', [email.lower() for email in emails], ARRAY(String)))
+        )
+        return set((await session.scalars(query)).all())
+
+    async def count_by_company(self, session: AsyncSession, company_id: int) -> int:
+        """
+        Возвращает число сотрудников компании.
+
+        Параметры:
+            session: асинхронная сессия SQLAlchemy;
+            company_id: id компании.
+        """
+        return await session.scalar(
+            select(func.count()).where(self.model.company_id == company_id)
+        )
+
+    async def bulk_create(
+        self, session: AsyncSession, rows: Sequence[dict[str, Any]]
+    ) -> Sequence[Row]:
+        """
+        Добавляет пользователей пакетом INSERT ... ON CONFLICT DO NOTHING RETURNING id, email.
+        Строки, нарушающие ограничения уникальности, пропускаются и не попадают в результат.
+        Транзакция не фиксируется.
+
+        Параметры:
+            session: асинхронная сессия SQLAlchemy;
+            rows: данные добавляемых пользователей с уже вычисленным hashed_password.
+        """
+        query = (
+            insert(self.model).on_conflict_do_nothing().returning(self.model.id, self.model.email)
+        )
+        return (await session.execute(query, rows)).all()
+
+    def short_loader(self, session: AsyncSession) -> BatchLoader:
+        """
+        Возвращает пакетный загрузчик кратких данных пользователей (UserShortSchema):
+        авторов комментариев и тредов, исполнителей задач, участников встреч и т.д.
+
+        Параметры:
+            session: асинхронная сессия SQLAlchemy.
+        """
+        columns = [getattr(self.model, field) for field in UserShortSchema.model_fields]
+        return BatchLoader(session, self.model, columns)
 
 
 user_crud = CRUDUsers(UserTabit)
@@ -2,12 +2,12 @@ from datetime import date
 from typing import TYPE_CHECKING, List, Optional
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql.schema import UniqueConstraint
 
 from src.constants import LENGTH_TELEGRAM_USERNAME
-from src.database.annotations import int_pk, url_link_field
+from src.database.annotations import int_pk_unique, url_link_field
 from src.database.models import BaseTabitModel, BaseTag, BaseUser
 from src.users.models.enum import RoleUserTabit
 
@@ -47,7 +47,11 @@ class AssociationUserTags(BaseTabitModel):
         tag - TagUser.
     """
 
-    id: Mapped[int_pk]
+    __table_args__ = (
+        Index('ix_associationusertags_right_id', 'right_id', 'left_id', unique=True),
+    )
+
+    id: Mapped[int_pk_unique]
     left_id: Mapped[UUID] = mapped_column(ForeignKey('usertabit.id'), primary_key=True)
     right_id: Mapped[int] = mapped_column(ForeignKey('taguser.id'), primary_key=True)
     user: Mapped['UserTabit'] = relationship(back_populates='tags')
@@ -81,7 +85,7 @@ class TagUser(BaseTag):
     """
 
     user: Mapped[List['AssociationUserTags']] = relationship(back_populates='tag')
-    company_id: Mapped[int] = mapped_column(ForeignKey('company.id'))
+    company_id: Mapped[int] = mapped_column(ForeignKey('company.id'), index=True)
     company: Mapped['Company'] = relationship(back_populates='tags_users')
 
 
@@ -115,6 +119,8 @@ class UserTabit(BaseUser):
         last_department_id: id отдела, в котором работал пользователь до этого.
         department_transition_date: Последняя дата перехода из одного отдела в другой.
         employee_position: Позиция в коллективе, указывается админом компании.
+        token_version: Версия токенов пользователя. Увеличивается при выходе из системы,
+            смене роли и деактивации, после чего ранее выданные токены не принимаются.
         created_at: Дата создания записи в таблице. Автозаполнение.
         updated_at: Дата изменения записи в таблице. Автозаполнение.
 
@@ -173,7 +179,9 @@ class UserTabit(BaseUser):
     tasks: Mapped[List['AssociationUserTask']] = relationship(
         back_populates='user', cascade='all, delete-orphan'
     )
-    messages: Mapped[List['MessageFeed']] = relationship(back_populates='owner')
+    messages: Mapped[List['MessageFeed']] = relationship(
+        back_populates='owner', foreign_keys='MessageFeed.owner_id'
+    )
     comments: Mapped[List['CommentFeed']] = relationship(back_populates='owner')
     comments_likes: Mapped[List['AssociationUserComment']] = relationship(back_populates='user')
     voting_by: Mapped[List['VotingByUser']] = relationship(back_populates='user')
@@ -181,9 +189,14 @@ class UserTabit(BaseUser):
     department_transition_date: Mapped[Optional[date]]
     employee_position: Mapped[Optional[str]]
     avatar_link: Mapped[url_link_field]
+    token_version: Mapped[int] = mapped_column(default=0, server_default='0')
 
     __table_args__ = (
         UniqueConstraint('supervisor', 'current_department_id', name='unique_supervisor'),
+        Index('ix_usertabit_company_id', 'company_id', 'id'),
+        Index(
+            'ix_usertabit_company_id_current_department_id', 'company_id', 'current_department_id'
+        ),
     )
 
     # TODO: На уровне базы запретить ставить is_superuser = True.
@@ -8,5 +8,6 @@ from src.users.schemas.user import (  # noqa: F401
     UserCreateSchema,  # noqa: F401
     UserReadSchema,  # noqa: F401
     UserSchemaMixin,  # noqa: F401
+    UserShortSchema,  # noqa: F401
     UserUpdateSchema,  # noqa: F401
 )
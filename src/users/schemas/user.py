@@ -122,6 +122,20 @@ class UserReadSchema(BaseUser[UUID]):
     model_config = ConfigDict(from_attributes=True)
 
 
+class UserShortSchema(BaseModel):
+    """
+    Краткие данные пользователя, встраиваемые в ответы (автор комментария, треда и т.д.).
+    Загружаются пакетно для всей страницы (src.crud.BatchLoader).
+    """
+
+    id: UUID
+    name: str = Field(..., title=title_name_user)
+    surname: str = Field(..., title=title_surname_user)
+    avatar_link: Optional[str] = Field(None, title=title_avatar_link_user)
+    employee_position: Optional[str] = Field(None, title=title_employee_position_user)
+    model_config = ConfigDict(from_attributes=True)
+
+
 class UserCreateSchema(UserSchemaMixin, BaseUserCreate):
     """Схема для создание пользователя сервиса."""
 
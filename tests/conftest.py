@@ -1,5 +1,6 @@
 import uuid
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterator
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -8,14 +9,18 @@ import pytest_asyncio
 from fastapi_users.password import PasswordHelper
 from httpx import ASGITransport, AsyncClient
 from slugify import slugify
-from sqlalchemy import NullPool
+from sqlalchemy import NullPool, event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from src.companies.cache import company_cache
 from src.companies.models.models import Company
-from src.database.db_depends import get_async_session
+from src.database.db_depends import get_async_read_session, get_async_session
 from src.database.models import BaseTabitModel as Base
 from src.main import app_v1
+from src.problems.models import CommentFeed, MessageFeed, Problem
+from src.problems.models.enums import ColorProblem, StatusProblem, TypeProblem
 from src.tabit_management.models import LicenseType, TabitAdminUser
+from src.users.cache import user_cache
 from src.users.models import UserTabit
 from src.users.models.enum import RoleUserTabit
 from tests.constants import GOOD_PASSWORD, URL
@@ -40,6 +45,9 @@ def test_db(postgresql):
 
     pytest.db_engine = engine
     pytest.db_sessionmaker = TestingSessionLocal
+    # БД создаётся заново для каждого теста, поэтому записи кэша прошлых тестов неактуальны.
+    company_cache.clear()
+    user_cache.clear()
 
     return init_db
 
@@ -66,6 +74,7 @@ async def client(async_session):
             await session.close()
 
     app_v1.dependency_overrides[get_async_session] = override_get_async_session
+    app_v1.dependency_overrides[get_async_read_session] = override_get_async_session
 
     async with AsyncClient(transport=ASGITransport(app_v1), base_url='http://test') as ac:
         try:
@@ -84,6 +93,28 @@ async def make_entry_in_table(async_session: AsyncSession, payload: dict[str, An
     return new_entry
 
 
+@contextmanager
+def capture_statements(with_parameters: bool = False) -> Iterator[list[Any]]:
+    """
+    Контекстный менеджер, собирающий тексты выполненных SQL-запросов. С with_parameters
+    собирает пары (текст, параметры), пропуская пакетные executemany-запросы.
+    """
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if not with_parameters:
+            statements.append(statement)
+        elif not executemany:
+            statements.append((statement, parameters))
+
+    sync_engine = pytest.db_engine.sync_engine
+    event.listen(sync_engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(sync_engine, 'before_cursor_execute', before_cursor_execute)
+
+
 @pytest_asyncio.fixture
 async def license_for_test(async_session):
     """Фикстура, создающая тестовую лицензию с возможностью изменения полей."""
@@ -232,6 +263,57 @@ async def employee(employee_of_company):
     return await employee_of_company()
 
 
+@pytest_asyncio.fixture
+async def problem_for_test(async_session: AsyncSession):
+    """
+    Фикстура, создающая проблему в компании переданного пользователя.
+    """
+
+    async def _create_problem(owner, problem_data=None):
+        """Функция-обёртка для создания проблемы с изменяемыми параметрами."""
+        default_data = {
+            'name': f'Test Problem {uuid.uuid4().hex[:8]}',
+            'color': ColorProblem.RED,
+            'type': TypeProblem.A,
+            'status': StatusProblem.NEW,
+            'owner_id': owner.id,
+            'company_id': owner.company_id,
+        }
+        if problem_data:
+            default_data.update(problem_data)
+        return await make_entry_in_table(async_session, default_data, Problem)
+
+    return _create_problem
+
+
+@pytest_asyncio.fixture
+async def message_feed_for_test(async_session: AsyncSession):
+    """
+    Фикстура, создающая тред к переданной проблеме.
+    """
+
+    async def _create_message_feed(problem, owner):
+        """Функция-обёртка для создания треда."""
+        default_data = {'problem_id': problem.id, 'owner_id': owner.id, 'text': 'Тред'}
+        return await make_entry_in_table(async_session, default_data, MessageFeed)
+
+    return _create_message_feed
+
+
+@pytest_asyncio.fixture
+async def comment_for_test(async_session: AsyncSession):
+    """
+    Фикстура, создающая комментарий к переданному треду.
+    """
+
+    async def _create_comment(message_feed, owner):
+        """Функция-обёртка для создания комментария."""
+        default_data = {'message_id': message_feed.id, 'owner_id': owner.id, 'text': 'Комментарий'}
+        return await make_entry_in_table(async_session, default_data, CommentFeed)
+
+    return _create_comment
+
+
 async def get_token(client: AsyncClient, user, url: str, refresh: bool = False) -> dict[str, str]:
     """Функция для получения тела заголовка с Authorization переданного пользователя."""
 
@@ -5,16 +5,31 @@ from dataclasses import dataclass
 class URL:
     """Все пути используемые в тестах."""
 
+    ADMIN_COMPANIES_INFO: str = '/api/v1/admin/'
     ADMIN_AUTH: str = '/api/v1/admin/auth/'
     ADMIN_LOGIN: str = '/api/v1/admin/auth/login'
     ADMIN_LOGOUT: str = '/api/v1/admin/auth/logout'
     ADMIN_ME: str = '/api/v1/admin/auth/me'
     ADMIN_REFRESH: str = '/api/v1/admin/auth/refresh-token'
+    ADMIN_DB_POOL: str = '/api/v1/admin/db-pool'
+    ADMIN_PASSWORD_HASHER: str = '/api/v1/admin/password-hasher'
+    ADMIN_COMPANY_CACHE: str = '/api/v1/admin/company-cache'
     USER_LOGIN: str = '/api/v1/auth/login'
     USER_LOGOUT: str = '/api/v1/auth/logout'
+    USER_LOGOUT_ALL: str = '/api/v1/auth/logout-all'
     USER_REFRESH: str = '/api/v1/auth/refresh-token'
     COMPANIES_ENDPOINT: str = '/api/v1/admin/companies/'
     LICENSES_ENDPOINT: str = '/api/v1/admin/licenses/'
+    PROBLEM_FEEDS: str = '/api/v1/{company_slug}/problems/{problem_id}'
+    COMPANY_EMPLOYEES_EXPORT: str = '/api/v1/{company_slug}/employees/import'
+    COMPANY_EMPLOYEES_BULK: str = '/api/v1/{company_slug}/employees/bulk'
+    COMPANY_DEPARTMENTS_EXPORT: str = '/api/v1/{company_slug}/departments/import'
+    COMPANY_EMPLOYEES: str = '/api/v1/{company_slug}/employees'
+    COMPANY_DEPARTMENTS: str = '/api/v1/{company_slug}/departments'
+    COMPANY_PROBLEMS: str = '/api/v1/{company_slug}/problems'
+    COMPANY_SEARCH: str = '/api/v1/{company_slug}/search'
+    PROBLEM_MEETINGS: str = '/api/v1/{company_slug}/problems/{problem_id}/meetings'
+    PROBLEM_TASKS: str = '/api/v1/{company_slug}/problems/{problem_id}/tasks'
 
 
 GOOD_PASSWORD: str = 'string123STRING'
@@ -100,4 +115,3 @@ PAYLOAD_FOR_PATCH_ADMIN: tuple[dict, ...] = (
         'patronymic': 'Императрица',
     },
 )
-
@@ -0,0 +1,208 @@
+import asyncio
+import json
+import time
+import uuid
+
+import pytest
+import pytest_asyncio
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy import func, select
+
+from src.companies.constants import (
+    ERROR_BULK_DUPLICATE_EMAIL,
+    ERROR_BULK_EMPLOYEES_LIMIT,
+    ERROR_BULK_ROW_FORMAT,
+    ERROR_USER_ALREADY_EXISTS,
+)
+from src.logger import logger
+from src.users.models import UserTabit
+from tests.constants import GOOD_PASSWORD, URL
+
+BENCHMARK_EMPLOYEES: int = 20
+LOOP_TICK: float = 0.01
+
+
+def employee_row(**fields) -> dict[str, str]:
+    """Данные сотрудника для файла массового добавления."""
+    return {
+        'name': 'Брюс',
+        'surname': 'Ли',
+        'email': f'{uuid.uuid4().hex[:12]}@yandex.ru',
+        'password': GOOD_PASSWORD,
+        **fields,
+    }
+
+
+def make_csv(rows: list[dict[str, str]]) -> bytes:
+    """Сформирует CSV с заголовком из списка словарей с одинаковыми ключами."""
+    lines = [','.join(rows[0])] + [','.join(row.values()) for row in rows]
+    return '\n'.join(lines).encode()
+
+
+def make_jsonl(rows: list[dict | str]) -> bytes:
+    """Сформирует файл JSON lines, строки передаются как есть."""
+    return '\n'.join(
+        row if isinstance(row, str) else json.dumps(row, ensure_ascii=False) for row in rows
+    ).encode()
+
+
+@pytest_asyncio.fixture
+async def bulk_context(company_for_test, moderator_of_company, get_token_for_user):
+    """Фикстура, создающая компанию с админом и возвращающая URL и заголовки админа."""
+
+    async def _create(company_data=None):
+        company = await company_for_test(company_data)
+        admin = await moderator_of_company({'company_id': company.id})
+        return {
+            'company': company,
+            'admin': admin,
+            'url': URL.COMPANY_EMPLOYEES_BULK.format(company_slug=company.slug),
+            'headers': await get_token_for_user(admin),
+        }
+
+    return _create
+
+
+class TestBulkEmployees:
+    """
+    Тесты массового добавления сотрудников компании.
+
+    /api/v1/{company_slug}/employees/bulk
+    """
+
+    @pytest.mark.asyncio
+    async def test_bulk_csv_report(
+        self, client: AsyncClient, async_session, bulk_context, employee_of_company
+    ):
+        """Корректные строки сохраняются, для остальных возвращаются ошибки по строкам."""
+        context = await bulk_context()
+        existing = await employee_of_company()
+        rows = [
+            employee_row(),
+            employee_row(),
+            employee_row(password='short'),
+            employee_row(email='not-an-email'),
+            employee_row(email=existing.email.upper()),
+        ]
+        rows.append(employee_row(email=rows[0]['email']))
+
+        response = await client.post(
+            context['url'],
+            headers=context['headers'],
+            files={'file': ('employees.csv', make_csv(rows), 'text/csv')},
+        )
+
+        assert response.status_code == status.HTTP_200_OK, response.text
+        report = response.json()
+        assert report['created_count'] == 2
+        errors = {error['row']: error['errors'] for error in report['errors']}
+        assert set(errors) == {3, 4, 5, 6}
+        assert errors[5] == [ERROR_USER_ALREADY_EXISTS]
+        assert errors[6] == [ERROR_BULK_DUPLICATE_EMAIL]
+        created = (
+            await async_session.scalars(
+                select(UserTabit).where(UserTabit.id.in_(report['created_ids']))
+            )
+        ).all()
+        assert {user.email for user in created} == {rows[0]['email'], rows[1]['email']}
+        assert all(user.company_id == context['company'].id for user in created)
+        assert all(user.hashed_password != GOOD_PASSWORD for user in created)
+
+        response = await client.post(
+            URL.USER_LOGIN,
+            data={'username': rows[0]['email'], 'password': GOOD_PASSWORD},
+        )
+        assert response.status_code == status.HTTP_200_OK, response.text
+
+    @pytest.mark.asyncio
+    async def test_bulk_jsonl(self, client: AsyncClient, bulk_context):
+        """JSON lines: пустые строки пропускаются, некорректные попадают в отчёт."""
+        context = await bulk_context()
+        rows = [employee_row(employee_position='Инженер'), '', '{"name": ', '[1, 2]']
+
+        response = await client.post(
+            context['url'],
+            headers=context['headers'],
+            files={'file': ('employees.jsonl', make_jsonl(rows), 'application/x-ndjson')},
+        )
+
+        assert response.status_code == status.HTTP_200_OK, response.text
+        report = response.json()
+        assert report['created_count'] == 1
+        assert report['errors'] == [
+            {'row': 3, 'email': None, 'errors': [ERROR_BULK_ROW_FORMAT]},
+            {'row': 4, 'email': None, 'errors': [ERROR_BULK_ROW_FORMAT]},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_bulk_employees_limit(self, client: AsyncClient, async_session, bulk_context):
+        """Лимит сотрудников компании не превышается, лишние строки попадают в отчёт."""
+        context = await bulk_context({'max_employees_count': 3})
+        rows = [employee_row() for _ in range(4)]
+
+        response = await client.post(
+            context['url'],
+            headers=context['headers'],
+            files={'file': ('employees.jsonl', make_jsonl(rows), 'application/x-ndjson')},
+        )
+
+        assert response.status_code == status.HTTP_200_OK, response.text
+        report = response.json()
+        assert report['created_count'] == 2
+        assert [error['row'] for error in report['errors']] == [3, 4]
+        assert report['errors'][0]['errors'] == [ERROR_BULK_EMPLOYEES_LIMIT]
+        employees_count = await async_session.scalar(
+            select(func.count()).where(UserTabit.company_id == context['company'].id)
+        )
+        assert employees_count == 3
+
+    @pytest.mark.asyncio
+    async def test_bulk_unsupported_format(self, client: AsyncClient, bulk_context):
+        """Файл неподдерживаемого формата отклоняется целиком."""
+        context = await bulk_context()
+        response = await client.post(
+            context['url'],
+            headers=context['headers'],
+            files={'file': ('employees.xlsx', b'data', 'application/octet-stream')},
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST, response.text
+
+    @pytest.mark.benchmark
+    @pytest.mark.asyncio
+    async def test_bulk_benchmark(self, client: AsyncClient, bulk_context):
+        """
+        Бенчмарк добавления BENCHMARK_EMPLOYEES сотрудников одним запросом.
+        Пароли хэшируются в пуле процессов, поэтому цикл событий во время запроса не
+        блокируется: задержка тиков фоновой задачи остаётся много меньше времени запроса.
+        """
+        context = await bulk_context()
+        rows = [employee_row() for _ in range(BENCHMARK_EMPLOYEES)]
+        max_lag = 0.0
+        done = asyncio.Event()
+
+        async def ticker():
+            nonlocal max_lag
+            while not done.is_set():
+                tick = time.perf_counter()
+                await asyncio.sleep(LOOP_TICK)
+                max_lag = max(max_lag, time.perf_counter() - tick - LOOP_TICK)
+
+        ticker_task = asyncio.create_task(ticker())
+        start = time.perf_counter()
+        response = await client.post(
+            context['url'],
+            headers=context['headers'],
+            files={'file': ('employees.csv', make_csv(rows), 'text/csv')},
+        )
+        elapsed = time.perf_counter() - start
+        done.set()
+        await ticker_task
+        logger.info(
+            f'{BENCHMARK_EMPLOYEES} сотрудников добавлено за {elapsed:.3f} с, '
+            f'максимальная задержка цикла событий {max_lag:.3f} с'
+        )
+
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert response.json()['created_count'] == BENCHMARK_EMPLOYEES
+        assert max_lag < elapsed / 2
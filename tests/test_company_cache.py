@@ -0,0 +1,198 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException, status
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.companies.cache import CompanySlugCache, company_cache
+from src.config import settings
+from tests.constants import URL
+
+CONCURRENT_REQUESTS: int = 20
+NOTIFY_TIMEOUT: float = 5
+
+
+class TestCompanySlugCache:
+    """Тесты кэша компаний по slug."""
+
+    @pytest.mark.asyncio
+    async def test_hit_miss_and_single_load(self, async_session, company_for_test):
+        """Одновременные промахи выполняют один запрос, дальнейшие обращения - попадания."""
+        company = await company_for_test({'max_employees_count': 7})
+        cache = CompanySlugCache(maxsize=10, ttl=60)
+
+        entries = await asyncio.gather(
+            *(cache.get(async_session, company.slug) for _ in range(CONCURRENT_REQUESTS))
+        )
+
+        assert {entry.id for entry in entries} == {company.id}
+        assert entries[0].max_employees_count == 7
+        metrics = cache.get_metrics()
+        assert metrics['misses'] == 1
+        assert metrics['hits'] == CONCURRENT_REQUESTS - 1
+        assert metrics['hit_rate'] == (CONCURRENT_REQUESTS - 1) / CONCURRENT_REQUESTS
+
+    @pytest.mark.asyncio
+    async def test_single_load_after_lock_release(self, async_session, monkeypatch):
+        """
+        Запрос, пришедший между освобождением блокировки и пробуждением ожидающей задачи,
+        ждёт ту же блокировку, а не загружает slug параллельно с ней.
+        """
+        cache = CompanySlugCache(maxsize=10, ttl=60)
+        load = cache._load
+        loads = {'active': 0, 'max_active': 0}
+        late_requests = []
+
+        async def slow_load(session, slug):
+            loads['active'] += 1
+            loads['max_active'] = max(loads['max_active'], loads['active'])
+            await asyncio.sleep(0.01)
+            entry = await load(session, slug)
+            if not late_requests:
+                late_requests.append(
+                    asyncio.create_task(cache.get(session, slug, raise_404=False))
+                )
+            loads['active'] -= 1
+            return entry
+
+        monkeypatch.setattr(cache, '_load', slow_load)
+        await asyncio.gather(
+            *(cache.get(async_session, 'missing-slug', raise_404=False) for _ in range(2))
+        )
+        await asyncio.gather(*late_requests)
+        assert loads['max_active'] == 1
+        assert cache.get_metrics()['misses'] == 3
+        assert cache._locks == cache._lock_users == {}
+
+    @pytest.mark.asyncio
+    async def test_missing_company_ttl_and_lru(self, async_session, company_for_test):
+        """Отсутствующая компания не кэшируется, записи вытесняются по TTL и по размеру."""
+        cache = CompanySlugCache(maxsize=1, ttl=60)
+        with pytest.raises(HTTPException) as error:
+            await cache.get(async_session, 'missing-slug')
+        assert error.value.status_code == status.HTTP_404_NOT_FOUND
+        assert await cache.get(async_session, 'missing-slug', raise_404=False) is None
+        assert cache.get_metrics()['size'] == 0
+
+        first, second = await company_for_test(), await company_for_test()
+        await cache.get(async_session, first.slug)
+        await cache.get(async_session, second.slug)
+        await cache.get(async_session, first.slug)
+        assert cache.get_metrics()['misses'] == 5
+
+        cache.ttl = 0
+        await cache.get(async_session, second.slug)
+        await cache.get(async_session, second.slug)
+        assert cache.get_metrics()['misses'] == 7
+
+    @pytest.mark.asyncio
+    async def test_invalidation_during_load(self, async_session, company_for_test, monkeypatch):
+        """Результат загрузки, во время которой кэш инвалидирован, не сохраняется."""
+        company = await company_for_test()
+        cache = CompanySlugCache(maxsize=10, ttl=60)
+        load = cache._load
+
+        async def load_and_invalidate(session, slug):
+            entry = await load(session, slug)
+            cache.invalidate_local(slug)
+            return entry
+
+        monkeypatch.setattr(cache, '_load', load_and_invalidate)
+        assert (await cache.get(async_session, company.slug)).id == company.id
+        assert cache.get_metrics()['size'] == 0
+
+    @pytest.mark.asyncio
+    async def test_update_and_delete_invalidate(
+        self, client: AsyncClient, async_session, company_for_test, license_for_test, admin_token
+    ):
+        """Изменение и удаление компании админом сервиса сбрасывают запись кэша."""
+        company = await company_for_test()
+        license_type = await license_for_test()
+        url = f'{URL.COMPANIES_ENDPOINT}{company.slug}'
+        assert (await company_cache.get(async_session, company.slug)).license_id is None
+
+        response = await client.patch(
+            url,
+            json={
+                'license_id': license_type.id,
+                'start_license_time': datetime.now(timezone.utc).isoformat(),
+            },
+            headers=admin_token,
+        )
+        assert response.status_code == status.HTTP_200_OK, response.text
+        entry = await company_cache.get(async_session, company.slug)
+        assert entry.license_id == license_type.id
+        assert entry.end_license_time is not None
+
+        response = await client.delete(url, headers=admin_token)
+        assert response.status_code == status.HTTP_204_NO_CONTENT, response.text
+        assert await company_cache.get(async_session, company.slug, raise_404=False) is None
+
+    @pytest.mark.asyncio
+    async def test_listen_notify(self, async_session, company_for_test, monkeypatch):
+        """Инвалидация в одном процессе через NOTIFY сбрасывает запись кэша другого."""
+        monkeypatch.setattr(settings, 'company_cache_listen', True)
+        company = await company_for_test()
+        listener_engine = create_async_engine(
+            pytest.db_engine.url.set(drivername='postgresql+asyncpg')
+        )
+        other_worker_cache = CompanySlugCache(maxsize=10, ttl=60)
+        await other_worker_cache.start_listener(listener_engine)
+        try:
+            await other_worker_cache.get(async_session, company.slug)
+            assert other_worker_cache.get_metrics()['size'] == 1
+
+            await company_cache.invalidate(async_session, company.slug)
+            async with asyncio.timeout(NOTIFY_TIMEOUT):
+                while other_worker_cache.get_metrics()['size']:
+                    await asyncio.sleep(0.01)
+        finally:
+            await other_worker_cache.stop_listener()
+            await listener_engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_listener_reconnect(self, async_session, company_for_test, monkeypatch):
+        """
+        При потере соединения LISTEN кэш очищается, подписка восстанавливается, и
+        инвалидации других процессов снова доходят.
+        """
+        monkeypatch.setattr(settings, 'company_cache_listen', True)
+        monkeypatch.setattr(settings, 'listen_reconnect_seconds', 0.05)
+        company = await company_for_test()
+        listener_engine = create_async_engine(
+            pytest.db_engine.url.set(drivername='postgresql+asyncpg')
+        )
+        other_worker_cache = CompanySlugCache(maxsize=10, ttl=60)
+        await other_worker_cache.start_listener(listener_engine)
+        try:
+            await other_worker_cache.get(async_session, company.slug)
+            raw_connection = await other_worker_cache._listener._connection.get_raw_connection()
+            pid = raw_connection.driver_connection.get_server_pid()
+            await async_session.execute(select(func.pg_terminate_backend(pid)))
+            async with asyncio.timeout(NOTIFY_TIMEOUT):
+                while other_worker_cache.get_metrics()['size']:
+                    await asyncio.sleep(0.01)
+                while not other_worker_cache._listener.is_listening:
+                    await asyncio.sleep(0.01)
+
+            await other_worker_cache.get(async_session, company.slug)
+            await company_cache.invalidate(async_session, company.slug)
+            async with asyncio.timeout(NOTIFY_TIMEOUT):
+                while other_worker_cache.get_metrics()['size']:
+                    await asyncio.sleep(0.01)
+        finally:
+            await other_worker_cache.stop_listener()
+            await listener_engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_company_cache_endpoint(self, client: AsyncClient, superuser_token, admin_token):
+        """Счётчики кэша доступны только суперпользователю."""
+        response = await client.get(URL.ADMIN_COMPANY_CACHE, headers=superuser_token)
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert {'size', 'hits', 'misses', 'hit_rate'} <= response.json().keys()
+
+        response = await client.get(URL.ADMIN_COMPANY_CACHE, headers=admin_token)
+        assert response.status_code == status.HTTP_403_FORBIDDEN, response.text
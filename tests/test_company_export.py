@@ -0,0 +1,88 @@
+import csv
+import io
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+from src.companies.models import Department
+from tests.conftest import make_entry_in_table
+from tests.constants import URL
+
+
+def read_csv(response) -> list[dict[str, str]]:
+    """Разберёт CSV из тела ответа в список словарей."""
+    return list(csv.DictReader(io.StringIO(response.content.decode('utf-8-sig'))))
+
+
+class TestCompanyExport:
+    """
+    Тесты потоковой выгрузки сотрудников и отделов компании в CSV.
+
+    /api/v1/{company_slug}/employees/import
+    /api/v1/{company_slug}/departments/import
+    """
+
+    @pytest.mark.asyncio
+    async def test_export_employees(
+        self,
+        client: AsyncClient,
+        company_for_test,
+        employee_of_company,
+        moderator_of_company,
+        get_token_for_user,
+    ):
+        """Выгружаются все сотрудники только своей компании и без хэша пароля."""
+        company = await company_for_test()
+        moderator = await moderator_of_company({'company_id': company.id})
+        employees = [await employee_of_company({'company_id': company.id}) for _ in range(3)]
+        await employee_of_company()
+
+        response = await client.post(
+            URL.COMPANY_EMPLOYEES_EXPORT.format(company_slug=company.slug),
+            headers=await get_token_for_user(moderator),
+        )
+
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert response.headers['content-type'].startswith('text/csv')
+        assert 'employees_list.csv' in response.headers['content-disposition']
+        rows = read_csv(response)
+        assert {row['email'] for row in rows} == {user.email for user in (moderator, *employees)}
+        assert 'hashed_password' not in rows[0]
+        assert 'token_version' not in rows[0]
+
+    @pytest.mark.asyncio
+    async def test_export_departments(
+        self,
+        client: AsyncClient,
+        async_session,
+        company_for_test,
+        moderator_of_company,
+        get_token_for_user,
+    ):
+        """Выгружаются отделы компании, компания без отделов отдаёт только заголовок."""
+        company = await company_for_test()
+        headers = await get_token_for_user(await moderator_of_company({'company_id': company.id}))
+        await make_entry_in_table(
+            async_session,
+            {'name': 'Отдел продаж', 'company_id': company.id, 'slug': f'{company.slug}-d'},
+            Department,
+        )
+
+        response = await client.post(
+            URL.COMPANY_DEPARTMENTS_EXPORT.format(company_slug=company.slug), headers=headers
+        )
+
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert [row['name'] for row in read_csv(response)] == ['Отдел продаж']
+
+        empty_company = await company_for_test()
+        headers = await get_token_for_user(
+            await moderator_of_company({'company_id': empty_company.id})
+        )
+        response = await client.post(
+            URL.COMPANY_DEPARTMENTS_EXPORT.format(company_slug=empty_company.slug),
+            headers=headers,
+        )
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert read_csv(response) == []
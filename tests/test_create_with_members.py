@@ -0,0 +1,196 @@
+from datetime import date, timedelta
+from uuid import uuid4
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy import func, select, text
+
+from src.problems.constants import MAX_BULK_TASKS
+from src.problems.crud.association_utils import sync_associations
+from src.problems.models import AssociationUserProblem, Task
+from src.problems.models.enums import ColorProblem, StatusProblem, TypeProblem
+from src.problems.models.file_path_models import FileTask
+from tests.conftest import capture_statements
+from tests.constants import URL
+
+
+def task_payload(owner, number: int, executors=(), files=()) -> dict:
+    """Возвращает данные создаваемой задачи."""
+    return {
+        'name': f'Задача {number}',
+        'date_completion': str(date.today() + timedelta(days=number + 1)),
+        'owner_id': str(owner.id),
+        'executors': [str(executor.id) for executor in executors],
+        'file': list(files),
+    }
+
+
+class TestCreateWithMembers:
+    """
+    Тесты создания проблем, встреч и задач вместе с участниками и файлами
+    (src.problems.crud.association_utils.create_with_children).
+    """
+
+    @pytest.mark.asyncio
+    async def test_bulk_tasks(
+        self, client: AsyncClient, async_session, employee_of_company, problem_for_test
+    ):
+        """
+        Задачи, исполнители и файлы создаются тремя запросами INSERT, ответ собирается
+        без повторного чтения задач.
+        """
+        owner = await employee_of_company()
+        executor = await employee_of_company({'company_id': owner.company_id})
+        problem = await problem_for_test(owner)
+        payload = [
+            task_payload(owner, 1, executors=(owner, executor), files=('a.pdf', 'b.pdf')),
+            task_payload(owner, 2),
+            task_payload(owner, 3, executors=(executor,)),
+        ]
+        company_slug = (await problem.awaitable_attrs.company).slug
+        url = URL.PROBLEM_TASKS.format(company_slug=company_slug, problem_id=problem.id)
+        with capture_statements() as statements:
+            response = await client.post(f'{url}/bulk', json=payload)
+        assert response.status_code == status.HTTP_201_CREATED, response.text
+        tasks = response.json()
+        assert [task['name'] for task in tasks] == ['Задача 1', 'Задача 2', 'Задача 3']
+        assert tasks[0]['executors'] == [str(owner.id), str(executor.id)]
+        assert tasks[0]['file'] == ['a.pdf', 'b.pdf']
+        assert tasks[1]['executors'] == [] and 'file' not in tasks[1]
+        inserts = [statement for statement in statements if statement.startswith('INSERT')]
+        assert len(inserts) == 3
+        assert not any('FROM task' in statement for statement in statements)
+
+        response = await client.get(f'{url}/{tasks[0]["id"]}')
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert response.json()['file'] == ['a.pdf', 'b.pdf']
+        assert sorted(response.json()['executors']) == sorted([str(owner.id), str(executor.id)])
+
+    @pytest.mark.asyncio
+    async def test_bulk_tasks_atomic(
+        self, client: AsyncClient, async_session, employee_of_company, problem_for_test
+    ):
+        """Ошибка в одной задаче отменяет создание всех задач запроса."""
+        owner = await employee_of_company()
+        problem = await problem_for_test(owner)
+        company_slug = (await problem.awaitable_attrs.company).slug
+        url = URL.PROBLEM_TASKS.format(company_slug=company_slug, problem_id=problem.id)
+        unknown = type('User', (), {'id': uuid4()})
+        payload = [task_payload(owner, 1), task_payload(owner, 2, executors=(unknown,))]
+        response = await client.post(f'{url}/bulk', json=payload)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST, response.text
+        assert await async_session.scalar(select(func.count()).select_from(Task)) == 0
+        assert await async_session.scalar(select(func.count()).select_from(FileTask)) == 0
+
+        payload = [task_payload(owner, number) for number in range(MAX_BULK_TASKS + 1)]
+        response = await client.post(f'{url}/bulk', json=payload)
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    @pytest.mark.asyncio
+    async def test_problem_with_members(
+        self, client: AsyncClient, async_session, employee_of_company
+    ):
+        """Проблема и её участники создаются без повторного чтения проблемы."""
+        owner = await employee_of_company()
+        member = await employee_of_company({'company_id': owner.company_id})
+        company_slug = (await owner.awaitable_attrs.company).slug
+        payload = {
+            'name': 'Проблема',
+            'color': ColorProblem.RED.value,
+            'type': TypeProblem.A.value,
+            'status': StatusProblem.NEW.value,
+            'owner_id': str(owner.id),
+            'company_id': owner.company_id,
+            'members': [str(owner.id), str(member.id)],
+        }
+        with capture_statements() as statements:
+            response = await client.post(
+                URL.COMPANY_PROBLEMS.format(company_slug=company_slug), json=payload
+            )
+        assert response.status_code == status.HTTP_201_CREATED, response.text
+        assert not any('FROM problem' in statement for statement in statements)
+        members = await async_session.scalars(
+            select(AssociationUserProblem.left_id).where(
+                AssociationUserProblem.right_id == response.json()['id']
+            )
+        )
+        assert set(members) == {owner.id, member.id}
+
+    @pytest.mark.asyncio
+    async def test_update_executors_diff(
+        self, client: AsyncClient, employee_of_company, problem_for_test
+    ):
+        """При обновлении исполнителей задачи удаляются и добавляются только изменившиеся."""
+        owner = await employee_of_company()
+        first, second, third = [
+            await employee_of_company({'company_id': owner.company_id}) for _ in range(3)
+        ]
+        problem = await problem_for_test(owner)
+        company_slug = (await problem.awaitable_attrs.company).slug
+        url = URL.PROBLEM_TASKS.format(company_slug=company_slug, problem_id=problem.id)
+        response = await client.post(url, json=task_payload(owner, 1, executors=(first, second)))
+        assert response.status_code == status.HTTP_201_CREATED, response.text
+        url = f'{url}/{response.json()["id"]}'
+
+        executors = [str(second.id), str(third.id)]
+        with capture_statements() as statements:
+            response = await client.patch(url, json={'executors': executors})
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert sorted(response.json()['executors']) == sorted(executors)
+        changes = [
+            statement
+            for statement in statements
+            if statement.startswith(('INSERT', 'DELETE')) and 'associationusertask' in statement
+        ]
+        assert len(changes) == 2
+        assert 'ANY' in changes[0] and 'ON CONFLICT' in changes[1]
+
+        with capture_statements() as statements:
+            response = await client.patch(url, json={'executors': executors[::-1]})
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert not [
+            statement for statement in statements if statement.startswith(('INSERT', 'DELETE'))
+        ]
+
+    @pytest.mark.asyncio
+    async def test_sync_problem_members(
+        self, async_session, employee_of_company, problem_for_test
+    ):
+        """Помощник синхронизации читает текущие связи сам, если они не переданы."""
+        owner = await employee_of_company()
+        member = await employee_of_company({'company_id': owner.company_id})
+        problem = await problem_for_test(owner)
+        added, removed = await sync_associations(
+            async_session, AssociationUserProblem, problem.id, [owner.id, member.id], status=True
+        )
+        assert (added, removed) == ([owner.id, member.id], [])
+        added, removed = await sync_associations(
+            async_session, AssociationUserProblem, problem.id, [member.id]
+        )
+        assert (added, removed) == ([], [owner.id])
+        await async_session.commit()
+        members = await async_session.scalars(
+            select(AssociationUserProblem.left_id).where(
+                AssociationUserProblem.right_id == problem.id
+            )
+        )
+        assert list(members) == [member.id]
+
+    @pytest.mark.asyncio
+    async def test_association_id_identity(self, async_session):
+        """
+        id связей проблем и встреч создаётся из метаданных моделей тем же столбцом
+        GENERATED BY DEFAULT AS IDENTITY, что и в миграции 08.
+        """
+        rows = await async_session.execute(
+            text(
+                'SELECT table_name, identity_generation FROM information_schema.columns '
+                "WHERE column_name = 'id' AND table_name IN "
+                "('associationuserproblem', 'associationusermeeting')"
+            )
+        )
+        assert dict(rows.all()) == {
+            'associationuserproblem': 'BY DEFAULT',
+            'associationusermeeting': 'BY DEFAULT',
+        }
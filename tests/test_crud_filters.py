@@ -0,0 +1,167 @@
+from datetime import date, timedelta
+
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException, status
+from httpx import AsyncClient
+
+from src.problems.crud import problem_crud, task_crud
+from src.problems.models import Task
+from src.problems.models.enums import StatusProblem, StatusTask, TypeProblem
+from src.users.models.enum import RoleUserTabit
+from tests.conftest import make_entry_in_table
+from tests.constants import URL
+
+# TaskResponseSchema принимает только будущие даты завершения.
+DAY: date = date.today() + timedelta(days=10)
+
+
+@pytest_asyncio.fixture
+async def problem_with_tasks(
+    async_session, company_for_test, employee_of_company, problem_for_test
+):
+    """Фикстура, создающая проблему с задачами на DAY - 1, DAY и DAY + 1."""
+    company = await company_for_test()
+    employee = await employee_of_company({'company_id': company.id})
+    problem = await problem_for_test(employee)
+    tasks = {}
+    for name, days, task_status in (
+        ('Ранняя', -1, StatusTask.COMPLETED),
+        ('Средняя', 0, StatusTask.IN_PROGRESS),
+        ('Поздняя 100%', 1, StatusTask.NEW),
+    ):
+        tasks[name] = await make_entry_in_table(
+            async_session,
+            {
+                'name': name,
+                'problem_id': problem.id,
+                'owner_id': employee.id,
+                'date_completion': DAY + timedelta(days=days),
+                'status': task_status,
+            },
+            Task,
+        )
+    return {'company': company, 'problem': problem, 'tasks': tasks}
+
+
+class TestCRUDFilters:
+    """Тесты фильтров вида поле__оператор (CRUDBase._apply_filters)."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        'params, expected',
+        (
+            ({'date_completion__gte': DAY.isoformat()}, {'Средняя', 'Поздняя 100%'}),
+            ({'date_completion__lte': DAY.isoformat()}, {'Ранняя', 'Средняя'}),
+            (
+                {
+                    'date_completion__between': [
+                        (DAY - timedelta(days=1)).isoformat(),
+                        DAY.isoformat(),
+                    ]
+                },
+                {'Ранняя', 'Средняя'},
+            ),
+            ({'status__in': [StatusTask.NEW, StatusTask.COMPLETED]}, {'Ранняя', 'Поздняя 100%'}),
+            ({'name__ilike': 'средн'}, {'Средняя'}),
+            ({'name__ilike': '%'}, {'Поздняя 100%'}),
+        ),
+    )
+    async def test_task_filters(self, client: AsyncClient, problem_with_tasks, params, expected):
+        """Список задач фильтруется по дате завершения, статусам и названию."""
+        response = await client.get(
+            URL.PROBLEM_TASKS.format(
+                company_slug=problem_with_tasks['company'].slug,
+                problem_id=problem_with_tasks['problem'].id,
+            ),
+            params=params,
+        )
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert {task['name'] for task in response.json()} == expected
+
+    @pytest.mark.asyncio
+    async def test_between_requires_two_values(self, client: AsyncClient, problem_with_tasks):
+        """Фильтр __between принимает ровно две даты."""
+        response = await client.get(
+            URL.PROBLEM_TASKS.format(
+                company_slug=problem_with_tasks['company'].slug,
+                problem_id=problem_with_tasks['problem'].id,
+            ),
+            params={'date_completion__between': [DAY.isoformat()]},
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    @pytest.mark.asyncio
+    async def test_problem_filters(
+        self, client: AsyncClient, company_for_test, employee_of_company, problem_for_test
+    ):
+        """Список проблем фильтруется по статусам, типам и названию."""
+        company = await company_for_test()
+        employee = await employee_of_company({'company_id': company.id})
+        new = await problem_for_test(employee, {'name': 'Новая_проблема'})
+        in_progress = await problem_for_test(
+            employee,
+            {
+                'name': 'Проблема в работе',
+                'status': StatusProblem.IN_PROGRESS,
+                'type': TypeProblem.B,
+            },
+        )
+        url = URL.COMPANY_PROBLEMS.format(company_slug=company.slug)
+        for params, expected in (
+            ({'status__in': [StatusProblem.IN_PROGRESS]}, [in_progress.id]),
+            ({'type__in': [TypeProblem.A, TypeProblem.C]}, [new.id]),
+            ({'name__ilike': 'я_п'}, [new.id]),
+            ({}, [new.id, in_progress.id]),
+        ):
+            response = await client.get(url, params=params)
+            assert response.status_code == status.HTTP_200_OK, response.text
+            assert sorted(problem['id'] for problem in response.json()) == sorted(expected)
+
+    @pytest.mark.asyncio
+    async def test_employee_filters(
+        self,
+        client: AsyncClient,
+        company_for_test,
+        moderator_of_company,
+        employee_of_company,
+        get_token_for_user,
+    ):
+        """Список сотрудников фильтруется по фамилии и роли в пределах компании."""
+        company = await company_for_test()
+        moderator = await moderator_of_company({'company_id': company.id})
+        employee = await employee_of_company({'company_id': company.id, 'surname': 'Лимонов'})
+        await employee_of_company({'surname': 'Лимонов'})
+        url = URL.COMPANY_EMPLOYEES.format(company_slug=company.slug)
+        headers = await get_token_for_user(moderator)
+        for params, expected in (
+            ({'surname__ilike': 'лимон'}, [str(employee.id)]),
+            ({'role__in': [RoleUserTabit.ADMIN]}, [str(moderator.id)]),
+        ):
+            response = await client.get(url, params=params, headers=headers)
+            assert response.status_code == status.HTTP_200_OK, response.text
+            assert [user['id'] for user in response.json()] == expected
+
+    @pytest.mark.asyncio
+    async def test_operator_not_in_whitelist(self, async_session):
+        """Оператор, не разрешённый в filter_fields, отклоняется с кодом 400."""
+        for filters in ({'name__gt': 'a'}, {'owner_id__in': []}, {'status__unknown': 1}):
+            with pytest.raises(HTTPException) as error:
+                await problem_crud.get_multi(async_session, filters=filters)
+            assert error.value.status_code == status.HTTP_400_BAD_REQUEST
+
+    @pytest.mark.asyncio
+    async def test_offset_order_tiebreak(self, async_session, problem_with_tasks):
+        """Страницы skip/limit упорядочены по id при равных значениях полей сортировки."""
+        task_ids = sorted(task.id for task in problem_with_tasks['tasks'].values())
+        filters = {'problem_id': problem_with_tasks['problem'].id}
+        for order_by in (None, ['problem_id']):
+            pages = [
+                await task_crud.get_multi(
+                    async_session, skip, 1, filters=filters, order_by=order_by
+                )
+                for skip in range(len(task_ids))
+            ]
+            assert [task.id for page in pages for task in page] == task_ids, order_by
+        tasks, _ = await task_crud.get_page(async_session, filters=filters, order_by=['-id'])
+        assert [task.id for task in tasks] == task_ids[::-1]
@@ -0,0 +1,114 @@
+import time
+from contextlib import contextmanager
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, inspect, text
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import selectinload
+
+from src.companies.crud import company_crud
+from src.companies.models import Company
+from src.logger import logger
+from src.problems.models import CommentFeed, Meeting, MessageFeed, Problem, Task
+
+EMPLOYEES_COUNT: int = 50_000
+
+
+@contextmanager
+def count_queries():
+    """Контекстный менеджер, считающий выполненные запросы и полученные ими строки."""
+    stats = {'queries': 0, 'rows': 0}
+
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        stats['queries'] += 1
+        if cursor.description is not None:
+            stats['rows'] += cursor.rowcount
+
+    sync_engine = pytest.db_engine.sync_engine
+    event.listen(sync_engine, 'after_cursor_execute', after_cursor_execute)
+    try:
+        yield stats
+    finally:
+        event.remove(sync_engine, 'after_cursor_execute', after_cursor_execute)
+
+
+def loaded_bytes(*objects) -> int:
+    """Примерный объём данных загруженных объектов: сумма длин строковых значений колонок."""
+    return sum(
+        len(str(getattr(obj, column.key))) for obj in objects for column in obj.__table__.columns
+    )
+
+
+@pytest_asyncio.fixture
+async def big_company(async_session, company_for_test):
+    """Фикстура, создающая компанию с EMPLOYEES_COUNT сотрудниками."""
+    company = await company_for_test()
+    await async_session.execute(
+        text(
+            """
+            INSERT INTO usertabit (
+                id, name, surname, email, hashed_password, is_active, is_superuser,
+                is_verified, role, company_id
+            )
+            SELECT gen_random_uuid(), 'Брюс', 'Ли', 'big' || n || '@yandex.ru', 'hash',
+                true, false, false, 'EMPLOYEE', :company_id
+            FROM generate_series(1, :count) AS n
+            """
+        ),
+        {'company_id': company.id, 'count': EMPLOYEES_COUNT},
+    )
+    await async_session.commit()
+    return company
+
+
+class TestCompanyLoading:
+    """Бенчмарк загрузки компании с большим числом сотрудников."""
+
+    @pytest.mark.asyncio
+    async def test_employees_not_loaded_by_default(self, big_company):
+        """По умолчанию загружается только строка компании, обращение к employees запрещено."""
+        async with pytest.db_sessionmaker() as session:
+            with count_queries() as stats:
+                start = time.perf_counter()
+                company = await company_crud.get_by_slug(session, big_company.slug)
+                elapsed = time.perf_counter() - start
+            stats['bytes'] = loaded_bytes(company)
+            logger.info(f'Компания без сотрудников: {stats}, {elapsed:.3f} с')
+            assert stats['queries'] == 1
+            assert stats['rows'] == 1
+            with pytest.raises(InvalidRequestError):
+                company.employees
+
+    @pytest.mark.asyncio
+    async def test_employees_loaded_on_demand(self, big_company):
+        """Сотрудники загружаются отдельным запросом только при явном selectinload."""
+        async with pytest.db_sessionmaker() as session:
+            with count_queries() as stats:
+                start = time.perf_counter()
+                company = await company_crud.get_by_slug(
+                    session, big_company.slug, options=[selectinload(Company.employees)]
+                )
+                elapsed = time.perf_counter() - start
+            stats['bytes'] = loaded_bytes(company, *company.employees)
+            logger.info(f'Компания с сотрудниками: {stats}, {elapsed:.3f} с')
+            assert stats['queries'] == 2
+            assert stats['rows'] == EMPLOYEES_COUNT + 1
+            assert len(company.employees) == EMPLOYEES_COUNT
+
+
+@pytest.mark.parametrize(
+    'model, relationship',
+    (
+        (Company, 'employees'),
+        (Problem, 'members'),
+        (Meeting, 'members'),
+        (Task, 'executors'),
+        (MessageFeed, 'owner'),
+        (MessageFeed, 'last_comment_owner'),
+        (CommentFeed, 'owner'),
+    ),
+)
+def test_relationship_raise_on_lazy_load(model, relationship):
+    """Связи со списками участников и авторами лент загружаются только через options."""
+    assert inspect(model).relationships[relationship].lazy == 'raise'
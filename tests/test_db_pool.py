@@ -0,0 +1,48 @@
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy import exc, text
+
+from src.database.engine import create_engine, get_pool_metrics
+from tests.constants import URL
+
+
+class TestPoolMetrics:
+    """Тесты пула соединений с метриками."""
+
+    @pytest.mark.asyncio
+    async def test_checkout_and_timeout_metrics(self, async_session):
+        """Выдача соединения и таймаут ожидания учитываются в метриках пула."""
+        engine = create_engine(
+            pytest.db_engine.url.render_as_string(hide_password=False),
+            connect_args={},
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=0.1,
+        )
+        try:
+            async with engine.connect() as connection:
+                await connection.execute(text('SELECT 1'))
+                metrics = get_pool_metrics(engine)
+                assert metrics['checked_out'] == 1
+                with pytest.raises(exc.TimeoutError):
+                    await engine.connect().start()
+            metrics = get_pool_metrics(engine)
+        finally:
+            await engine.dispose()
+
+        assert metrics['pool_size'] == 1
+        assert metrics['checked_out'] == 0
+        assert metrics['checkouts'] == 1
+        assert metrics['timeouts'] == 1
+        assert metrics['checkout_seconds_max'] >= 0
+
+    @pytest.mark.asyncio
+    async def test_db_pool_endpoint(self, client: AsyncClient, superuser_token, admin_token):
+        """Метрики пула доступны только суперпользователю."""
+        response = await client.get(URL.ADMIN_DB_POOL, headers=superuser_token)
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert {'pool_size', 'checked_out', 'checkouts', 'timeouts'} <= response.json().keys()
+
+        response = await client.get(URL.ADMIN_DB_POOL, headers=admin_token)
+        assert response.status_code == status.HTTP_403_FORBIDDEN, response.text
@@ -0,0 +1,148 @@
+import pytest
+from fastapi import status
+from fastapi_users.jwt import decode_jwt
+from httpx import AsyncClient
+
+from src.config import settings
+from src.users.cache import UserCacheEntry, UserTokenCache
+from src.users.models.enum import RoleUserTabit
+from tests.conftest import capture_statements
+from tests.constants import GOOD_PASSWORD, URL
+
+
+class TestJWTClaims:
+    """Тесты утверждений JWT, кэша пользователей и отзыва токенов (UserTabit.token_version)."""
+
+    @pytest.mark.asyncio
+    async def test_token_claims(self, client: AsyncClient, company_for_test, moderator_of_company):
+        """Токены пользователя компании содержат id компании, роль, активность и версию."""
+        company = await company_for_test()
+        moderator = await moderator_of_company({'company_id': company.id})
+        response = await client.post(
+            URL.USER_LOGIN, data={'username': moderator.email, 'password': GOOD_PASSWORD}
+        )
+        for token in (response.json()['access_token'], response.json()['refresh_token']):
+            data = decode_jwt(
+                token,
+                settings.jwt_secret.get_secret_value(),
+                settings.jwt_token_audience,
+                algorithms=[settings.jwt_token_algorithm],
+            )
+            assert data['sub'] == str(moderator.id)
+            assert (data['company_id'], data['role'], data['is_active'], data['ver']) == (
+                company.id,
+                RoleUserTabit.ADMIN.name,
+                True,
+                0,
+            )
+
+    @pytest.mark.asyncio
+    async def test_cached_user_skips_database(
+        self, client: AsyncClient, company_for_test, moderator_of_company, get_token_for_user
+    ):
+        """Повторный запрос с тем же токеном не читает пользователя и компанию из БД."""
+        company = await company_for_test()
+        moderator = await moderator_of_company({'company_id': company.id})
+        headers = await get_token_for_user(moderator)
+        url = URL.COMPANY_EMPLOYEES.format(company_slug=company.slug)
+        for expected_reads in (1, 0):
+            with capture_statements() as statements:
+                response = await client.get(url, headers=headers)
+            assert response.status_code == status.HTTP_200_OK, response.text
+            assert [user['id'] for user in response.json()] == [str(moderator.id)]
+            identity_reads = [
+                statement for statement in statements if 'FROM usertabit JOIN company' in statement
+            ]
+            assert len(identity_reads) == expected_reads
+            assert not any('FROM company' in statement for statement in statements)
+
+    @pytest.mark.asyncio
+    async def test_logout_revokes_tokens(
+        self, client: AsyncClient, company_for_test, employee_of_company, get_token_for_user
+    ):
+        """
+        После выхода из системы токены этой сессии не принимаются, а токены других
+        сессий пользователя остаются действительными.
+        """
+        employee = await employee_of_company({'company_id': (await company_for_test()).id})
+        response = await client.post(
+            URL.USER_LOGIN, data={'username': employee.email, 'password': GOOD_PASSWORD}
+        )
+        access_headers, refresh_headers = (
+            {'Authorization': f'Bearer {response.json()[key]}'}
+            for key in ('access_token', 'refresh_token')
+        )
+        other_headers = await get_token_for_user(employee)
+        response = await client.post(URL.USER_LOGOUT, headers=access_headers)
+        assert response.status_code == status.HTTP_204_NO_CONTENT, response.text
+        for url, headers in (
+            (URL.USER_LOGOUT, access_headers),
+            (URL.USER_REFRESH, refresh_headers),
+        ):
+            response = await client.post(url, headers=headers)
+            assert response.status_code == status.HTTP_401_UNAUTHORIZED, url
+        response = await client.post(URL.USER_LOGOUT, headers=other_headers)
+        assert response.status_code == status.HTTP_204_NO_CONTENT, response.text
+
+    @pytest.mark.asyncio
+    async def test_logout_all_revokes_tokens(
+        self, client: AsyncClient, company_for_test, employee_of_company, get_token_for_user
+    ):
+        """Выход на всех устройствах отзывает токены всех сессий пользователя."""
+        employee = await employee_of_company({'company_id': (await company_for_test()).id})
+        access_headers = await get_token_for_user(employee)
+        other_headers = await get_token_for_user(employee)
+        response = await client.post(URL.USER_LOGOUT_ALL, headers=access_headers)
+        assert response.status_code == status.HTTP_204_NO_CONTENT, response.text
+        for headers in (access_headers, other_headers):
+            response = await client.post(URL.USER_LOGOUT, headers=headers)
+            assert response.status_code == status.HTTP_401_UNAUTHORIZED, response.text
+        response = await client.post(URL.USER_LOGOUT, headers=await get_token_for_user(employee))
+        assert response.status_code == status.HTTP_204_NO_CONTENT, response.text
+
+    @pytest.mark.asyncio
+    async def test_role_change_revokes_tokens(
+        self,
+        client: AsyncClient,
+        company_for_test,
+        moderator_of_company,
+        employee_of_company,
+        get_token_for_user,
+    ):
+        """Смена роли сотрудника отзывает его токены, в том числе уже закэшированные."""
+        company = await company_for_test()
+        moderator = await moderator_of_company({'company_id': company.id})
+        employee = await employee_of_company({'company_id': company.id})
+        employee_headers = await get_token_for_user(employee)
+        response = await client.get(f'/api/v1/{company.slug}', headers=employee_headers)
+        assert response.status_code == status.HTTP_403_FORBIDDEN, response.text
+
+        response = await client.patch(
+            f'{URL.COMPANY_EMPLOYEES.format(company_slug=company.slug)}/{employee.id}',
+            json={'role': RoleUserTabit.ADMIN},
+            headers=await get_token_for_user(moderator),
+        )
+        assert response.status_code == status.HTTP_200_OK, response.text
+        response = await client.get(f'/api/v1/{company.slug}', headers=employee_headers)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED, response.text
+        response = await client.get(
+            f'/api/v1/{company.slug}', headers=await get_token_for_user(employee)
+        )
+        assert response.status_code == status.HTTP_200_OK, response.text
+
+    def test_cache_entry_version_and_generation(self):
+        """Запись выдаётся только для своей версии и не сохраняется после инвалидации."""
+        entry = UserCacheEntry(
+            {'id': 'user', 'token_version': 1}, {'id': 1, 'slug': 'company'}, None
+        )
+        cache = UserTokenCache(maxsize=10, ttl=60)
+        generation = cache.generation
+        cache.invalidate('other')
+        cache.put(entry, generation)
+        assert cache.get('user', 1) is None
+
+        cache.put(entry, cache.generation)
+        assert cache.get('user', 0) is None
+        assert cache.get('user', 1) is entry
+        cache.invalidate_company('company')
+        assert cache.get('user', 1) is None
@@ -0,0 +1,128 @@
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy import event, text
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.companies.crud import company_crud
+from src.constants import TOTAL_COUNT_HEADER
+from src.pagination import CountMode
+from src.tabit_management.constants import ERROR_INTERNAL_SERVER
+from src.tabit_management.crud.admin_company import admin_company_crud
+from tests.constants import URL
+
+
+class TestPaginationTotal:
+    """Тесты подсчёта общего числа объектов списка (CRUDBase.get_page, get_page_by_cursor)."""
+
+    @pytest.mark.asyncio
+    async def test_licenses_total_in_page_query(self, client: AsyncClient, license_for_test):
+        """
+        Общее число лицензий учитывает фильтр, не зависит от страницы и считается
+        тем же запросом, что и страница.
+        """
+        licenses = [await license_for_test() for _ in range(5)]
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            if 'licensetype' in statement:
+                statements.append(statement)
+
+        sync_engine = pytest.db_engine.sync_engine
+        event.listen(sync_engine, 'before_cursor_execute', before_cursor_execute)
+        try:
+            response = await client.get(URL.LICENSES_ENDPOINT, params={'page_size': 2})
+            first_page = response.json()
+            for params, total in (
+                ({'page_size': 2, 'cursor': first_page['next_cursor']}, 5),
+                ({'page_size': 2, 'page': 3}, 5),
+                ({'page_size': 2, 'page': 4}, 5),
+                ({'name': licenses[0].name}, 1),
+            ):
+                response = await client.get(URL.LICENSES_ENDPOINT, params=params)
+                assert response.status_code == status.HTTP_200_OK, response.text
+                assert response.json()['total'] == total, params
+        finally:
+            event.remove(sync_engine, 'before_cursor_execute', before_cursor_execute)
+        assert first_page['total'] == 5
+        # Пустая страница 4 дополнительно считает лицензии отдельным запросом.
+        assert len(statements) == 6
+        assert sum('count(*) OVER ()' in statement for statement in statements) == 5
+
+    @pytest.mark.asyncio
+    async def test_feeds_total_header(
+        self,
+        client: AsyncClient,
+        company_for_test,
+        employee_of_company,
+        problem_for_test,
+        message_feed_for_test,
+        comment_for_test,
+        get_token_for_user,
+    ):
+        """Списки тредов и комментариев возвращают общее число в заголовке X-Total-Count."""
+        company = await company_for_test()
+        employee = await employee_of_company({'company_id': company.id})
+        problem = await problem_for_test(employee)
+        message_feeds = [await message_feed_for_test(problem, employee) for _ in range(3)]
+        await comment_for_test(message_feeds[0], employee)
+        base_url = URL.PROBLEM_FEEDS.format(company_slug=company.slug, problem_id=problem.id)
+        headers = await get_token_for_user(employee)
+        for params in ({}, {'limit': 1}, {'skip': 2}, {'skip': 5}):
+            response = await client.get(f'{base_url}/thread', params=params, headers=headers)
+            assert response.status_code == status.HTTP_200_OK, response.text
+            assert response.headers[TOTAL_COUNT_HEADER] == '3', params
+        response = await client.get(f'{base_url}/{message_feeds[0].id}/comments', headers=headers)
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert response.headers[TOTAL_COUNT_HEADER] == '1'
+
+    @pytest.mark.asyncio
+    async def test_estimated_count(self, async_session, company_for_test):
+        """
+        Оценка по pg_class.reltuples используется только для выборки без фильтров
+        и только при собранной статистике; иначе число считается точно.
+        """
+        companies = [await company_for_test() for _ in range(3)]
+        _, total = await company_crud.get_page(async_session, count_mode=CountMode.ESTIMATED)
+        assert total == 3
+
+        await async_session.execute(text('ANALYZE company'))
+        companies += [await company_for_test() for _ in range(2)]
+        objects, total = await company_crud.get_page(
+            async_session, limit=2, count_mode=CountMode.ESTIMATED
+        )
+        assert (len(objects), total) == (2, 3)
+        objects, next_cursor, total = await company_crud.get_page_by_cursor(
+            async_session, limit=2, count_mode=CountMode.ESTIMATED
+        )
+        assert (len(objects), bool(next_cursor), total) == (2, True, 3)
+        _, total = await company_crud.get_page(async_session, count_mode=CountMode.EXACT)
+        assert total == 5
+        _, total = await company_crud.get_page(
+            async_session, filters={'slug': companies[0].slug}, count_mode=CountMode.ESTIMATED
+        )
+        assert total == 1
+
+    @pytest.mark.asyncio
+    async def test_admin_list_errors_with_count(
+        self, client: AsyncClient, superuser_token, monkeypatch
+    ):
+        """
+        Ошибки БД списка компаний с подсчётом общего числа превращаются в ответ 500
+        обработкой CRUDAdminCompany, а ошибки курсора по-прежнему возвращают 400.
+        """
+        response = await client.get(
+            URL.ADMIN_COMPANIES_INFO, params={'cursor': 'invalid'}, headers=superuser_token
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST, response.text
+
+        async def failing_total(*args, **kwargs):
+            raise SQLAlchemyError('connection lost')
+
+        monkeypatch.setattr(admin_company_crud, '_get_estimated_total', failing_total)
+        for params in ({}, {'skip': 2}):
+            response = await client.get(
+                URL.ADMIN_COMPANIES_INFO, params=params, headers=superuser_token
+            )
+            assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR, params
+            assert response.json()['detail'] == ERROR_INTERNAL_SERVER
@@ -0,0 +1,118 @@
+import asyncio
+import math
+import time
+
+import pytest
+from fastapi import status
+from fastapi_users.password import PasswordHelper
+from httpx import AsyncClient
+
+from src.api.v1.auth.password import AsyncPasswordHelper, password_hasher
+from src.logger import logger
+from tests.constants import GOOD_PASSWORD, URL
+
+LOGIN_STORM_SIZE: int = 8
+PROBE_INTERVAL: float = 0.02
+
+
+def percentile(values: list[float], percent: int) -> float:
+    """Перцентиль по методу ближайшего ранга, работает и для одного значения."""
+    ordered = sorted(values)
+    return ordered[math.ceil(percent / 100 * len(ordered)) - 1]
+
+
+class TestAsyncPasswordHelper:
+    """Тесты хэширования паролей в пуле."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('executor_type', ['thread', 'process'])
+    async def test_hash_and_verify(self, executor_type):
+        """Хэш из пула совместим с PasswordHelper, метрики учитывают задачи и очередь."""
+        hasher = AsyncPasswordHelper(executor_type, workers=1)
+        try:
+            hashed, *many = await asyncio.gather(
+                hasher.hash(GOOD_PASSWORD), hasher.hash_many([GOOD_PASSWORD, 'other'])
+            )
+            assert PasswordHelper().verify_and_update(GOOD_PASSWORD, hashed)[0]
+            assert (await hasher.verify_and_update(GOOD_PASSWORD, many[0][0]))[0]
+            assert not (await hasher.verify_and_update(GOOD_PASSWORD, many[0][1]))[0]
+        finally:
+            hasher.executor.shutdown()
+
+        metrics = hasher.get_metrics()
+        assert metrics['executor'] == executor_type
+        assert metrics['tasks'] == 4
+        assert metrics['in_flight'] == metrics['queue_depth'] == 0
+        assert metrics['max_queue_depth'] == 1
+
+    @pytest.mark.asyncio
+    async def test_password_hasher_endpoint(
+        self, client: AsyncClient, superuser_token, admin_token
+    ):
+        """Метрики пула хэширования доступны только суперпользователю."""
+        response = await client.get(URL.ADMIN_PASSWORD_HASHER, headers=superuser_token)
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert {'executor', 'workers', 'queue_depth', 'tasks'} <= response.json().keys()
+
+        response = await client.get(URL.ADMIN_PASSWORD_HASHER, headers=admin_token)
+        assert response.status_code == status.HTTP_403_FORBIDDEN, response.text
+
+
+class TestLoginStorm:
+    """Бенчмарк задержки посторонних запросов во время массового входа пользователей."""
+
+    async def measure_probe_latency(self, client: AsyncClient, user, headers) -> list[float]:
+        """
+        Выполняет LOGIN_STORM_SIZE одновременных входов и, пока они идут, каждые
+        PROBE_INTERVAL секунд запрашивает эндпоинт, не связанный с паролями.
+        Возвращает время ответа каждого такого запроса.
+        """
+        latencies = []
+        storm_done = asyncio.Event()
+
+        async def login():
+            response = await client.post(
+                URL.USER_LOGIN, data={'username': user.email, 'password': GOOD_PASSWORD}
+            )
+            assert response.status_code == status.HTTP_200_OK, response.text
+
+        async def probe():
+            while not storm_done.is_set():
+                start = time.perf_counter()
+                response = await client.get(URL.ADMIN_DB_POOL, headers=headers)
+                latencies.append(time.perf_counter() - start)
+                assert response.status_code == status.HTTP_200_OK, response.text
+                await asyncio.sleep(PROBE_INTERVAL)
+
+        probe_task = asyncio.create_task(probe())
+        await asyncio.gather(*(login() for _ in range(LOGIN_STORM_SIZE)))
+        storm_done.set()
+        await probe_task
+        return latencies
+
+    @pytest.mark.benchmark
+    @pytest.mark.asyncio
+    async def test_login_storm_p99(
+        self, client: AsyncClient, monkeypatch, employee_of_company, superuser_token
+    ):
+        """
+        p99 задержки посторонних запросов при хэшировании в пуле меньше, чем при
+        хэшировании в цикле событий.
+        """
+        user = await employee_of_company()
+        offloaded = await self.measure_probe_latency(client, user, superuser_token)
+
+        async def run_blocking(func, *args):
+            return func(*args)
+
+        monkeypatch.setattr(password_hasher, '_run', run_blocking)
+        blocking = await self.measure_probe_latency(client, user, superuser_token)
+
+        p99_offloaded = percentile(offloaded, 99)
+        p99_blocking = percentile(blocking, 99)
+        logger.info(
+            f'{LOGIN_STORM_SIZE} одновременных входов: p99 посторонних запросов '
+            f'{p99_offloaded:.3f} с в пуле ({len(offloaded)} запросов), '
+            f'{p99_blocking:.3f} с в цикле событий ({len(blocking)} запросов)'
+        )
+        assert p99_offloaded < p99_blocking
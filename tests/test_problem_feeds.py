@@ -0,0 +1,728 @@
+import asyncio
+import time
+import uuid
+
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException, status
+from httpx import AsyncClient
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.config import settings
+from src.logger import logger
+from src.problems.constants import (
+    FEED_EVENTS_CHANNEL,
+    FEED_EVENTS_KEEPALIVE,
+    FEED_EVENTS_MEDIA_TYPE,
+)
+from src.problems.crud import comment_crud, voting_crud
+from src.problems.events import FeedEventBroker, FeedEventType, feed_broker
+from src.problems.models import AssociationUserComment, CommentFeed, VotingByUser, VotingFeed
+from src.users.crud.user import user_crud
+from src.users.models import UserTabit
+from src.users.models.enum import RoleUserTabit
+from tests.conftest import capture_statements
+from tests.constants import URL
+from tests.test_company_cache import NOTIFY_TIMEOUT
+
+PARALLEL_LIKERS: int = 200
+MAX_CONNECTIONS: int = 50
+
+
+@pytest_asyncio.fixture
+async def feed_context(
+    company_for_test,
+    employee_of_company,
+    problem_for_test,
+    message_feed_for_test,
+    comment_for_test,
+    get_token_for_user,
+):
+    """
+    Фикстура, создающая компанию с двумя сотрудниками, проблемой, тредом и комментарием
+    автора к этому треду.
+    """
+    company = await company_for_test()
+    author = await employee_of_company({'company_id': company.id})
+    reader = await employee_of_company({'company_id': company.id})
+    problem = await problem_for_test(author)
+    message_feed = await message_feed_for_test(problem, author)
+    comment = await comment_for_test(message_feed, author)
+    return {
+        'company': company,
+        'author': author,
+        'reader': reader,
+        'problem': problem,
+        'message_feed': message_feed,
+        'comment': comment,
+        'base_url': URL.PROBLEM_FEEDS.format(company_slug=company.slug, problem_id=problem.id),
+        'author_token': await get_token_for_user(author),
+        'reader_token': await get_token_for_user(reader),
+    }
+
+
+class TestFeedAccess:
+    """
+    Тесты проверки доступа к тредам и комментариям проблемы.
+
+    /api/v1/{company_slug}/problems/{problem_id}/...
+    """
+
+    @pytest.mark.asyncio
+    async def test_get_threads_and_comments(self, client: AsyncClient, feed_context):
+        """Сотрудник компании получает треды проблемы и комментарии треда."""
+        base_url = feed_context['base_url']
+        message_feed = feed_context['message_feed']
+        headers = feed_context['reader_token']
+
+        response = await client.get(f'{base_url}/thread', headers=headers)
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert [thread['id'] for thread in response.json()] == [message_feed.id]
+
+        response = await client.get(f'{base_url}/{message_feed.id}/comments', headers=headers)
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert [comment['id'] for comment in response.json()] == [feed_context['comment'].id]
+
+    @pytest.mark.asyncio
+    async def test_access_errors(
+        self,
+        client: AsyncClient,
+        feed_context,
+        employee_of_company,
+        problem_for_test,
+        message_feed_for_test,
+        comment_for_test,
+    ):
+        """Проверка кодов ответа при обращении к чужим или несуществующим объектам."""
+        company = feed_context['company']
+        problem = feed_context['problem']
+        message_feed = feed_context['message_feed']
+        author = feed_context['author']
+        base_url = feed_context['base_url']
+        headers = feed_context['reader_token']
+
+        other_employee = await employee_of_company()
+        other_problem = await problem_for_test(other_employee)
+        second_problem = await problem_for_test(author)
+        second_feed = await message_feed_for_test(second_problem, author)
+        second_comment = await comment_for_test(second_feed, author)
+
+        variants = (
+            (
+                URL.PROBLEM_FEEDS.format(company_slug='wrong-slug', problem_id=problem.id),
+                status.HTTP_403_FORBIDDEN,
+            ),
+            (
+                URL.PROBLEM_FEEDS.format(company_slug=company.slug, problem_id=other_problem.id),
+                status.HTTP_403_FORBIDDEN,
+            ),
+            (
+                URL.PROBLEM_FEEDS.format(company_slug=company.slug, problem_id=0),
+                status.HTTP_404_NOT_FOUND,
+            ),
+        )
+        for url, expected_status in variants:
+            response = await client.get(f'{url}/thread', headers=headers)
+            assert response.status_code == expected_status, f'{url}: {response.text}'
+
+        variants = (
+            (f'{base_url}/0/comments', status.HTTP_404_NOT_FOUND),
+            (f'{base_url}/{second_feed.id}/comments', status.HTTP_404_NOT_FOUND),
+            (
+                f'{base_url}/{message_feed.id}/comments/{second_comment.id}/like',
+                status.HTTP_404_NOT_FOUND,
+            ),
+            (f'{base_url}/{message_feed.id}/comments/0/like', status.HTTP_404_NOT_FOUND),
+        )
+        for url, expected_status in variants:
+            response = await client.get(url, headers=headers)
+            assert response.status_code == expected_status, f'{url}: {response.text}'
+
+
+class TestCommentLike:
+    """
+    Тесты лайков комментариев.
+
+    /api/v1/{company_slug}/problems/{problem_id}/{thread_id}/comments/{comment_id}/like
+    /api/v1/{company_slug}/problems/{problem_id}/{thread_id}/comments/{comment_id}/unlike
+    """
+
+    @pytest.mark.asyncio
+    async def test_like_and_unlike(self, client: AsyncClient, async_session, feed_context):
+        """Лайк, повторный лайк, снятие лайка и повторное снятие лайка."""
+        comment = feed_context['comment']
+        url = f'{feed_context["base_url"]}/{feed_context["message_feed"].id}/comments/{comment.id}'
+        headers = feed_context['reader_token']
+
+        response = await client.get(f'{url}/like', headers=headers)
+        assert response.status_code == status.HTTP_200_OK, response.text
+        response = await client.get(f'{url}/like', headers=headers)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST, response.text
+        rating = await async_session.scalar(
+            select(CommentFeed.rating).where(CommentFeed.id == comment.id)
+        )
+        assert rating == 1
+
+        response = await client.get(f'{url}/unlike', headers=headers)
+        assert response.status_code == status.HTTP_200_OK, response.text
+        response = await client.get(f'{url}/unlike', headers=headers)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST, response.text
+        likes = await async_session.scalars(
+            select(AssociationUserComment).where(AssociationUserComment.right_id == comment.id)
+        )
+        assert likes.all() == []
+
+    @pytest.mark.asyncio
+    async def test_like_own_comment(self, client: AsyncClient, feed_context):
+        """Автор не может лайкнуть свой комментарий."""
+        comment = feed_context['comment']
+        url = f'{feed_context["base_url"]}/{feed_context["message_feed"].id}/comments/{comment.id}'
+        response = await client.get(f'{url}/like', headers=feed_context['author_token'])
+        assert response.status_code == status.HTTP_400_BAD_REQUEST, response.text
+
+
+class TestCommentLikeConcurrency:
+    """Бенчмарк параллельных лайков одного комментария."""
+
+    @pytest.mark.asyncio
+    async def test_parallel_likes_keep_exact_rating(self, async_session, feed_context):
+        """
+        PARALLEL_LIKERS пользователей одновременно лайкают комментарий, а затем повторяют лайк.
+        Рейтинг должен совпасть с числом лайкнувших, повторные лайки должны быть отклонены.
+        """
+        comment = feed_context['comment']
+        user_ids = (
+            await async_session.scalars(
+                insert(UserTabit)
+                .values(
+                    [
+                        {
+                            'name': 'Брюс',
+                            'surname': 'Ли',
+                            'email': f'{uuid.uuid4().hex[:12]}@yandex.ru',
+                            'hashed_password': 'hash',
+                            'role': RoleUserTabit.EMPLOYEE,
+                            'company_id': feed_context['company'].id,
+                        }
+                        for _ in range(PARALLEL_LIKERS)
+                    ]
+                )
+                .returning(UserTabit.id)
+            )
+        ).all()
+        await async_session.commit()
+        semaphore = asyncio.Semaphore(MAX_CONNECTIONS)
+
+        async def like(user_id) -> bool:
+            async with semaphore, pytest.db_sessionmaker() as session:
+                try:
+                    await comment_crud.like(comment.id, user_id, session)
+                except HTTPException:
+                    return False
+                return True
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(like(user_id) for user_id in user_ids * 2))
+        elapsed = time.perf_counter() - start
+        logger.info(f'{len(results)} лайков за {elapsed:.3f} с')
+
+        assert results.count(True) == PARALLEL_LIKERS
+        rating = await async_session.scalar(
+            select(CommentFeed.rating).where(CommentFeed.id == comment.id)
+        )
+        likes = await async_session.scalar(
+            select(func.count()).where(AssociationUserComment.right_id == comment.id)
+        )
+        assert rating == likes == PARALLEL_LIKERS
+
+
+class TestThreadPoll:
+    """
+    Тесты голосований в тредах.
+
+    /api/v1/{company_slug}/problems/{problem_id}/{thread_id}/poll
+    /api/v1/{company_slug}/problems/{problem_id}/{thread_id}/poll/vote
+    """
+
+    @pytest.mark.asyncio
+    async def test_vote_change_and_unvote(self, client: AsyncClient, feed_context):
+        """Голос, повторный голос, смена голоса и отзыв голоса изменяют счётчики вариантов."""
+        url = f'{feed_context["base_url"]}/{feed_context["message_feed"].id}/poll'
+        author_headers = feed_context['author_token']
+        headers = feed_context['reader_token']
+
+        response = await client.get(url, headers=headers)
+        assert response.status_code == status.HTTP_404_NOT_FOUND, response.text
+        response = await client.post(
+            url, json={'options': ['За', 'Против']}, headers=author_headers
+        )
+        assert response.status_code == status.HTTP_201_CREATED, response.text
+        first, second = [option['id'] for option in response.json()['options']]
+        response = await client.post(url, json={'options': ['А', 'Б']}, headers=author_headers)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST, response.text
+
+        for option_id in (first, first):
+            response = await client.post(
+                f'{url}/vote', json={'option_id': option_id}, headers=headers
+            )
+            assert response.status_code == status.HTTP_200_OK, response.text
+        assert [option['votes_count'] for option in response.json()['options']] == [1, 0]
+        assert response.json()['user_vote'] == first
+
+        response = await client.post(
+            f'{url}/vote', json={'option_id': first}, headers=author_headers
+        )
+        response = await client.post(f'{url}/vote', json={'option_id': second}, headers=headers)
+        assert response.status_code == status.HTTP_200_OK, response.text
+        poll = response.json()
+        assert [option['votes_count'] for option in poll['options']] == [1, 1]
+        assert (poll['total_votes'], poll['user_vote']) == (2, second)
+
+        response = await client.delete(f'{url}/vote', headers=headers)
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert [option['votes_count'] for option in response.json()['options']] == [1, 0]
+        assert response.json()['user_vote'] is None
+        response = await client.delete(f'{url}/vote', headers=headers)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST, response.text
+
+    @pytest.mark.asyncio
+    async def test_poll_errors(self, client: AsyncClient, feed_context, message_feed_for_test):
+        """Голосование начинает только автор треда, голосовать можно только за его варианты."""
+        message_feed = feed_context['message_feed']
+        url = f'{feed_context["base_url"]}/{message_feed.id}/poll'
+        payload = {'options': ['За', 'Против']}
+        response = await client.post(url, json=payload, headers=feed_context['reader_token'])
+        assert response.status_code == status.HTTP_403_FORBIDDEN, response.text
+        response = await client.post(
+            url, json={'options': ['Один']}, headers=feed_context['author_token']
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY, response.text
+
+        second_feed = await message_feed_for_test(feed_context['problem'], feed_context['author'])
+        response = await client.post(
+            f'{feed_context["base_url"]}/{second_feed.id}/poll',
+            json=payload,
+            headers=feed_context['author_token'],
+        )
+        assert response.status_code == status.HTTP_201_CREATED, response.text
+        other_option = response.json()['options'][0]['id']
+        response = await client.post(url, json=payload, headers=feed_context['author_token'])
+        assert response.status_code == status.HTTP_201_CREATED, response.text
+        response = await client.post(
+            f'{url}/vote', json={'option_id': other_option}, headers=feed_context['reader_token']
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND, response.text
+
+    @pytest.mark.asyncio
+    async def test_results_without_counting(self, client: AsyncClient, feed_context):
+        """Результаты читаются одним запросом по вариантам, без подсчёта голосов."""
+        url = f'{feed_context["base_url"]}/{feed_context["message_feed"].id}/poll'
+        response = await client.post(
+            url, json={'options': ['За', 'Против']}, headers=feed_context['author_token']
+        )
+        assert response.status_code == status.HTTP_201_CREATED, response.text
+        with capture_statements() as statements:
+            response = await client.get(url, headers=feed_context['reader_token'])
+        assert response.status_code == status.HTTP_200_OK, response.text
+        polls = [statement for statement in statements if 'FROM votingfeed' in statement]
+        assert len(polls) == 1
+        assert 'count(' not in polls[0].lower()
+
+
+class TestThreadPollConcurrency:
+    """Параллельные голоса и смена голосов в одном голосовании."""
+
+    @pytest.mark.asyncio
+    async def test_parallel_votes_keep_exact_counts(self, async_session, feed_context):
+        """
+        PARALLEL_LIKERS пользователей одновременно голосуют и меняют голос. Счётчики
+        вариантов должны совпасть с числом сохранённых голосов.
+        """
+        poll = await voting_crud.create_poll(
+            async_session, feed_context['message_feed'].id, ['А', 'Б', 'В']
+        )
+        options = [option.id for option in poll.options]
+        user_ids = (
+            await async_session.scalars(
+                insert(UserTabit)
+                .values(
+                    [
+                        {
+                            'name': 'Брюс',
+                            'surname': 'Ли',
+                            'email': f'{uuid.uuid4().hex[:12]}@yandex.ru',
+                            'hashed_password': 'hash',
+                            'role': RoleUserTabit.EMPLOYEE,
+                            'company_id': feed_context['company'].id,
+                        }
+                        for _ in range(PARALLEL_LIKERS)
+                    ]
+                )
+                .returning(UserTabit.id)
+            )
+        ).all()
+        await async_session.commit()
+        semaphore = asyncio.Semaphore(MAX_CONNECTIONS)
+
+        async def vote(user_id, option_id) -> None:
+            async with semaphore, pytest.db_sessionmaker() as session:
+                await voting_crud.vote(session, poll.message_id, option_id, user_id)
+
+        votes = [
+            vote(user_id, options[(number + shift) % len(options)])
+            for shift in range(len(options))
+            for number, user_id in enumerate(user_ids)
+        ]
+        start = time.perf_counter()
+        await asyncio.gather(*votes)
+        logger.info(f'{len(votes)} голосов за {time.perf_counter() - start:.3f} с')
+
+        counts = dict(
+            (await async_session.execute(select(VotingFeed.id, VotingFeed.votes_count))).all()
+        )
+        stored = dict(
+            (
+                await async_session.execute(
+                    select(VotingByUser.voting_id, func.count()).group_by(VotingByUser.voting_id)
+                )
+            ).all()
+        )
+        assert sum(counts.values()) == PARALLEL_LIKERS
+        assert counts == {option_id: stored.get(option_id, 0) for option_id in options}
+
+
+class TestThreadSummary:
+    """
+    Тесты сводки тредов в списке тредов проблемы.
+
+    /api/v1/{company_slug}/problems/{problem_id}/thread
+    """
+
+    @pytest.mark.asyncio
+    async def test_summary_follows_comments(
+        self, client: AsyncClient, feed_context, problem_for_test, message_feed_for_test
+    ):
+        """Сводка треда обновляется при создании и удалении комментариев."""
+        author, reader = feed_context['author'], feed_context['reader']
+        problem = await problem_for_test(author)
+        message_feed = await message_feed_for_test(problem, author)
+        base_url = URL.PROBLEM_FEEDS.format(
+            company_slug=feed_context['company'].slug, problem_id=problem.id
+        )
+        headers = feed_context['reader_token']
+
+        response = await client.post(
+            f'{base_url}/{message_feed.id}/comments', json={'text': 'Ответ'}, headers=headers
+        )
+        assert response.status_code == status.HTTP_201_CREATED, response.text
+        comment_id = response.json()['id']
+        with capture_statements() as statements:
+            response = await client.get(f'{base_url}/thread', headers=headers)
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert not any('FROM commentfeed' in statement for statement in statements)
+        assert len([statement for statement in statements if 'FROM usertabit' in statement]) == 1
+        (thread,) = response.json()
+        assert (thread['author']['id'], thread['author']['name']) == (str(author.id), author.name)
+        assert thread['last_comment_author']['id'] == str(reader.id)
+        assert thread['last_comment_owner_id'] == str(reader.id)
+        assert thread['comments_count'] == 1
+        assert thread['last_activity_at'] == thread['last_comment_at']
+
+        response = await client.delete(
+            f'{base_url}/{message_feed.id}/comments/{comment_id}', headers=headers
+        )
+        assert response.status_code == status.HTTP_204_NO_CONTENT, response.text
+        (thread,) = (await client.get(f'{base_url}/thread', headers=headers)).json()
+        assert thread['comments_count'] == 0
+        assert thread['last_comment_owner_id'] is None
+        assert thread['last_comment_author'] is None
+        assert thread['last_comment_at'] is None
+        assert thread['last_activity_at'] == thread['created_at']
+
+    @pytest.mark.asyncio
+    async def test_order_by_last_activity(
+        self, client: AsyncClient, feed_context, message_feed_for_test
+    ):
+        """Треды сортируются по последней активности, курсор сохраняет этот порядок."""
+        base_url = feed_context['base_url']
+        headers = feed_context['reader_token']
+        first = feed_context['message_feed']
+        second = await message_feed_for_test(feed_context['problem'], feed_context['author'])
+        third = await message_feed_for_test(feed_context['problem'], feed_context['author'])
+        response = await client.post(
+            f'{base_url}/{first.id}/comments', json={'text': 'Ответ'}, headers=headers
+        )
+        assert response.status_code == status.HTTP_201_CREATED, response.text
+
+        params = {'ordering': '-last_activity_at', 'limit': 2}
+        response = await client.get(f'{base_url}/thread', params=params, headers=headers)
+        assert response.status_code == status.HTTP_200_OK, response.text
+        ids = [thread['id'] for thread in response.json()]
+        cursor = response.headers['X-Next-Cursor']
+        response = await client.get(
+            f'{base_url}/thread', params={**params, 'cursor': cursor}, headers=headers
+        )
+        assert response.status_code == status.HTTP_200_OK, response.text
+        ids += [thread['id'] for thread in response.json()]
+        assert ids[0] == first.id
+        assert sorted(ids[1:]) == sorted([second.id, third.id])
+        assert response.headers['X-Total-Count'] == '3'
+
+
+class TestEmbeddedAuthors:
+    """Тесты встраивания авторов в ответы тредов и комментариев (src.crud.BatchLoader)."""
+
+    @pytest.mark.asyncio
+    async def test_comment_authors_single_query(
+        self, client: AsyncClient, feed_context, comment_for_test
+    ):
+        """Авторы страницы комментариев загружаются одним запросом IN по уникальным id."""
+        message_feed = feed_context['message_feed']
+        author, reader = feed_context['author'], feed_context['reader']
+        for owner in (reader, author, reader):
+            await comment_for_test(message_feed, owner)
+        url = f'{feed_context["base_url"]}/{message_feed.id}/comments'
+        with capture_statements() as statements:
+            response = await client.get(url, headers=feed_context['reader_token'])
+        assert response.status_code == status.HTTP_200_OK, response.text
+        comments = response.json()
+        assert len(comments) == 4
+        authors = [
+            statement
+            for statement in statements
+            if 'FROM usertabit' in statement and 'ANY' in statement
+        ]
+        assert len(authors) == 1
+        for comment in comments:
+            owner = author if comment['owner_id'] == str(author.id) else reader
+            assert comment['author'] == {
+                'id': str(owner.id),
+                'name': owner.name,
+                'surname': owner.surname,
+                'avatar_link': owner.avatar_link,
+                'employee_position': owner.employee_position,
+            }
+
+        response = await client.post(
+            url, json={'text': 'Ответ'}, headers=feed_context['reader_token']
+        )
+        assert response.status_code == status.HTTP_201_CREATED, response.text
+        assert response.json()['author']['id'] == str(reader.id)
+
+    @pytest.mark.asyncio
+    async def test_batch_loader(self, async_session, feed_context):
+        """Загрузчик принимает одиночные ключи и списки ключей и кеширует загруженное."""
+        author, reader = feed_context['author'], feed_context['reader']
+        loader = user_crud.short_loader(async_session)
+        task = type('Task', (), {'executors': [reader.id, uuid.uuid4(), author.id]})()
+        comment = type('Comment', (), {'owner_id': author.id})()
+        with capture_statements() as statements:
+            await loader.attach([task], 'executors', 'executors_info')
+            await loader.attach([comment], 'owner_id', 'author')
+        assert len(statements) == 1
+        assert [user.id for user in task.executors_info] == [reader.id, author.id]
+        assert comment.author.surname == author.surname
+
+
+class TestFeedEvents:
+    """
+    Тесты событий ленты проблемы в реальном времени (src.problems.events).
+
+    /api/v1/{company_slug}/problems/{problem_id}/events
+    """
+
+    @pytest.mark.asyncio
+    async def test_broker_fan_out_and_overflow(self):
+        """
+        Событие получают все подписчики проблемы; подписчик с заполненной очередью
+        отключается, не мешая остальным.
+        """
+        broker = FeedEventBroker(queue_size=2, keepalive=60)
+        slow, fast = broker.subscribe(1), broker.subscribe(1)
+        other = broker.subscribe(2)
+        for comment_id in range(3):
+            broker.publish_local({'type': 'comment_created', 'problem_id': 1, 'id': comment_id})
+            assert fast.get_nowait()['id'] == comment_id
+        assert slow.get_nowait() is None
+        assert other.empty()
+        assert broker.get_metrics() == {
+            'subscribers': 2,
+            'delivered': 5,
+            'dropped_subscribers': 1,
+        }
+
+    @pytest.mark.asyncio
+    async def test_stream_format(self):
+        """Поток отдаёт события в формате SSE, keepalive при простое и снимает подписку."""
+        broker = FeedEventBroker(queue_size=2, keepalive=0.01)
+        stream = broker.stream(1)
+        assert await stream.__anext__() == FEED_EVENTS_KEEPALIVE
+        broker.publish_local({'type': 'thread_created', 'problem_id': 1, 'thread_id': 7})
+        assert await stream.__anext__() == (
+            'event: thread_created\n'
+            'data: {"type":"thread_created","problem_id":1,"thread_id":7}\n\n'
+        )
+        await stream.aclose()
+        assert broker.get_metrics()['subscribers'] == 0
+
+    @pytest.mark.asyncio
+    async def test_events_via_listen_notify(
+        self, client: AsyncClient, feed_context, problem_for_test, monkeypatch
+    ):
+        """
+        Создание треда, комментария и лайк доставляются подписчикам проблемы через
+        NOTIFY после фиксации транзакции; подписчики другой проблемы их не получают.
+        """
+        monkeypatch.setattr(settings, 'feed_events_listen', True)
+        other_problem = await problem_for_test(feed_context['author'])
+        listener_engine = create_async_engine(
+            pytest.db_engine.url.set(drivername='postgresql+asyncpg')
+        )
+        broker = FeedEventBroker(queue_size=10, keepalive=60)
+        await broker.start_listener(listener_engine)
+        try:
+            queue = broker.subscribe(feed_context['problem'].id)
+            other_queue = broker.subscribe(other_problem.id)
+            base_url, message_feed = feed_context['base_url'], feed_context['message_feed']
+            response = await client.post(
+                f'{base_url}/thread', json={'text': 'Тред'}, headers=feed_context['reader_token']
+            )
+            assert response.status_code == status.HTTP_201_CREATED, response.text
+            thread_id = response.json()['id']
+            response = await client.post(
+                f'{base_url}/{message_feed.id}/comments',
+                json={'text': 'Ответ'},
+                headers=feed_context['author_token'],
+            )
+            assert response.status_code == status.HTTP_201_CREATED, response.text
+            comment_id = response.json()['id']
+            comment = feed_context['comment']
+            for action in ('like', 'unlike'):
+                response = await client.get(
+                    f'{base_url}/{message_feed.id}/comments/{comment.id}/{action}',
+                    headers=feed_context['reader_token'],
+                )
+                assert response.status_code == status.HTTP_200_OK, response.text
+
+            events = []
+            async with asyncio.timeout(NOTIFY_TIMEOUT):
+                while len(events) < 4:
+                    events.append(await queue.get())
+        finally:
+            await broker.stop_listener()
+            await listener_engine.dispose()
+
+        problem_id = feed_context['problem'].id
+        assert events == [
+            {
+                'type': FeedEventType.THREAD_CREATED,
+                'problem_id': problem_id,
+                'thread_id': thread_id,
+                'owner_id': str(feed_context['reader'].id),
+            },
+            {
+                'type': FeedEventType.COMMENT_CREATED,
+                'problem_id': problem_id,
+                'thread_id': message_feed.id,
+                'comment_id': comment_id,
+                'owner_id': str(feed_context['author'].id),
+            },
+            {
+                'type': FeedEventType.COMMENT_LIKED,
+                'problem_id': problem_id,
+                'thread_id': message_feed.id,
+                'comment_id': comment.id,
+                'rating': 1,
+            },
+            {
+                'type': FeedEventType.COMMENT_UNLIKED,
+                'problem_id': problem_id,
+                'thread_id': message_feed.id,
+                'comment_id': comment.id,
+                'rating': 0,
+            },
+        ]
+        assert other_queue.get_nowait() is None  # Поток закрыт при остановке брокера.
+
+    @pytest.mark.asyncio
+    async def test_listener_reconnect(self, async_session, monkeypatch):
+        """
+        При потере соединения LISTEN потоки подписчиков завершаются и брокер не принимает
+        подписки; после переподключения события снова доставляются.
+        """
+        monkeypatch.setattr(settings, 'listen_reconnect_seconds', 0.05)
+        listener_engine = create_async_engine(
+            pytest.db_engine.url.set(drivername='postgresql+asyncpg')
+        )
+        broker = FeedEventBroker(queue_size=10, keepalive=60)
+        await broker.start_listener(listener_engine)
+        try:
+            queue = broker.subscribe(1)
+            raw_connection = await broker._listener._connection.get_raw_connection()
+            pid = raw_connection.driver_connection.get_server_pid()
+            await async_session.execute(select(func.pg_terminate_backend(pid)))
+            async with asyncio.timeout(NOTIFY_TIMEOUT):
+                assert await queue.get() is None
+            assert not broker.is_listening
+
+            async with asyncio.timeout(NOTIFY_TIMEOUT):
+                while not broker.is_listening:
+                    await asyncio.sleep(0.01)
+            queue = broker.subscribe(1)
+            await async_session.execute(
+                select(
+                    func.pg_notify(FEED_EVENTS_CHANNEL, '{"type":"thread_created","problem_id":1}')
+                )
+            )
+            await async_session.commit()
+            async with asyncio.timeout(NOTIFY_TIMEOUT):
+                assert await queue.get() == {'type': 'thread_created', 'problem_id': 1}
+        finally:
+            await broker.stop_listener()
+            await listener_engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_events_endpoint(self, client: AsyncClient, feed_context, monkeypatch):
+        """
+        Эндпоинт отдаёт поток SSE после проверки доступа к проблеме; пока брокер не
+        подписан на канал, возвращается HTTP 503.
+        """
+        url = f'{feed_context["base_url"]}/events'
+        response = await client.get(url, headers=feed_context['reader_token'])
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE, response.text
+
+        monkeypatch.setattr(settings, 'feed_events_listen', True)
+        listener_engine = create_async_engine(
+            pytest.db_engine.url.set(drivername='postgresql+asyncpg')
+        )
+        await feed_broker.start_listener(listener_engine)
+        try:
+            missing = feed_context['base_url'].replace(
+                f'/problems/{feed_context["problem"].id}', '/problems/0'
+            )
+            response = await client.get(f'{missing}/events', headers=feed_context['reader_token'])
+            assert response.status_code == status.HTTP_404_NOT_FOUND, response.text
+
+            stream = asyncio.create_task(client.get(url, headers=feed_context['reader_token']))
+            async with asyncio.timeout(NOTIFY_TIMEOUT):
+                while not feed_broker.get_metrics()['subscribers']:
+                    await asyncio.sleep(0.01)
+            message_feed = feed_context['message_feed']
+            response = await client.post(
+                f'{feed_context["base_url"]}/{message_feed.id}/comments',
+                json={'text': 'Ответ'},
+                headers=feed_context['author_token'],
+            )
+            assert response.status_code == status.HTTP_201_CREATED, response.text
+            async with asyncio.timeout(NOTIFY_TIMEOUT):
+                while not feed_broker.get_metrics()['delivered']:
+                    await asyncio.sleep(0.01)
+        finally:
+            await feed_broker.stop_listener()
+            await listener_engine.dispose()
+
+        response = await stream
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert response.headers['content-type'].startswith(FEED_EVENTS_MEDIA_TYPE)
+        assert response.text.startswith('event: comment_created\ndata: ')
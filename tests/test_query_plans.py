@@ -0,0 +1,239 @@
+from datetime import date
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy import bindparam, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.companies.models import Department
+from src.database.models import BaseTabitModel
+from src.problems.models import (
+    AssociationUserTask,
+    CommentFeed,
+    Meeting,
+    MessageFeed,
+    Problem,
+    Task,
+)
+from src.problems.models.enums import StatusMeeting, StatusTask
+from src.users.models import UserTabit
+from tests.conftest import capture_statements, make_entry_in_table
+from tests.constants import URL
+
+SEED_ROWS: int = 5_000
+SEEDED_TABLES: frozenset[str] = frozenset(
+    model.__tablename__
+    for model in (
+        UserTabit,
+        Department,
+        Problem,
+        MessageFeed,
+        CommentFeed,
+        Meeting,
+        Task,
+        AssociationUserTask,
+    )
+)
+
+
+def find_seq_scans(plan: dict[str, Any]) -> list[str]:
+    """Возвращает таблицы из SEEDED_TABLES, которые план читает последовательным сканированием."""
+    found = []
+    if plan['Node Type'] == 'Seq Scan' and plan['Relation Name'] in SEEDED_TABLES:
+        found.append(plan['Relation Name'])
+    for child in plan.get('Plans', []):
+        found.extend(find_seq_scans(child))
+    return found
+
+
+async def assert_no_seq_scans(session: AsyncSession, statements: list[tuple[str, Any]]) -> None:
+    """Выполняет EXPLAIN для каждого запроса и проверяет, что в планах нет Seq Scan."""
+    assert statements
+    connection = await session.connection()
+    for statement, parameters in statements:
+        result = await connection.exec_driver_sql(f'EXPLAIN (FORMAT JSON) {statement}', parameters)
+        plan = result.scalar()[0]['Plan']
+        assert not find_seq_scans(plan), f'Seq Scan в плане запроса:\n{statement}\n{plan}'
+
+
+async def clone_rows(
+    session: AsyncSession,
+    model: type[BaseTabitModel],
+    source_id: Any,
+    overrides: dict[str, str],
+    rows_from: str,
+    params: dict[str, Any] | None = None,
+) -> None:
+    """
+    Размножает запись source_id таблицы модели одним запросом INSERT ... SELECT.
+    Генерируемые столбцы вычисляются БД и не копируются.
+
+    Параметры:
+        session: асинхронная сессия SQLAlchemy;
+        model: модель таблицы;
+        source_id: id записи-образца;
+        overrides: SQL-выражения для столбцов, отличающихся от образца;
+        rows_from: источник строк (FROM и WHERE), по строке на копию;
+        params: параметры запроса.
+    """
+    table = model.__table__
+    columns = [
+        column.name
+        for column in table.columns
+        if (column.name != 'id' or overrides.get('id')) and column.computed is None
+    ]
+    values = [overrides.get(column, f'source.{column}') for column in columns]
+    query = text(
+        f'INSERT INTO {table.name} ({", ".join(columns)}) '
+        f'SELECT {", ".join(values)} FROM {table.name} AS source, {rows_from} '
+        f'{"AND" if " WHERE " in rows_from else "WHERE"} source.id = :source_id'
+    ).bindparams(bindparam('source_id', type_=table.c.id.type))
+    await session.execute(query, {**(params or {}), 'source_id': source_id})
+
+
+@pytest_asyncio.fixture
+async def seeded_company(
+    async_session: AsyncSession,
+    company_for_test,
+    moderator_of_company,
+    problem_for_test,
+    message_feed_for_test,
+    comment_for_test,
+    get_token_for_user,
+):
+    """
+    Фикстура, создающая небольшую тестовую компанию и соседнюю компанию с SEED_ROWS
+    сотрудниками, отделами, проблемами, тредами, комментариями, встречами и задачами.
+    После заполнения собирается статистика (ANALYZE), чтобы планировщик видел объёмы таблиц.
+    """
+    company = await company_for_test()
+    other_company = await company_for_test()
+    moderator = await moderator_of_company({'company_id': company.id})
+    problem = await problem_for_test(moderator)
+    message_feed = await message_feed_for_test(problem, moderator)
+    comment = await comment_for_test(message_feed, moderator)
+    department = await make_entry_in_table(
+        async_session,
+        {'name': 'Отдел', 'slug': 'seed-department', 'company_id': company.id},
+        Department,
+    )
+    meeting = await make_entry_in_table(
+        async_session,
+        {
+            'title': 'Встреча',
+            'problem_id': problem.id,
+            'owner_id': moderator.id,
+            'date_meeting': date.today(),
+            'status': StatusMeeting.NEW,
+            'place': 'Переговорная',
+        },
+        Meeting,
+    )
+    task = await make_entry_in_table(
+        async_session,
+        {
+            'name': 'Задача',
+            'problem_id': problem.id,
+            'owner_id': moderator.id,
+            'date_completion': date.today(),
+            'status': StatusTask.NEW,
+        },
+        Task,
+    )
+    executor = await make_entry_in_table(
+        async_session, {'left_id': moderator.id, 'right_id': task.id}, AssociationUserTask
+    )
+
+    series = {
+        'rows_from': 'generate_series(1, :count) AS n',
+        'params': {'count': SEED_ROWS, 'other_company_id': other_company.id},
+    }
+    await clone_rows(
+        async_session,
+        UserTabit,
+        moderator.id,
+        {
+            'company_id': ':other_company_id',
+            'id': 'gen_random_uuid()',
+            'email': "'seed' || n || '@yandex.ru'",
+        },
+        **series,
+    )
+    await clone_rows(
+        async_session,
+        Department,
+        department.id,
+        {'company_id': ':other_company_id', 'name': "'Отдел ' || n", 'slug': "'seed-' || n"},
+        **series,
+    )
+    await clone_rows(
+        async_session, Problem, problem.id, {'company_id': ':other_company_id'}, **series
+    )
+    # Дочерние записи размножаются по одной на каждую запись родителя, кроме родителя образца.
+    for model, source, column, parent in (
+        (MessageFeed, message_feed, 'problem_id', Problem),
+        (Meeting, meeting, 'problem_id', Problem),
+        (Task, task, 'problem_id', Problem),
+        (CommentFeed, comment, 'message_id', MessageFeed),
+        (AssociationUserTask, executor, 'right_id', Task),
+    ):
+        await clone_rows(
+            async_session,
+            model,
+            source.id,
+            {column: 'parent.id'},
+            f'{parent.__tablename__} AS parent WHERE parent.id <> :parent_id',
+            {'parent_id': getattr(source, column)},
+        )
+    await async_session.execute(text('ANALYZE'))
+    await async_session.commit()
+    return {
+        'company': company,
+        'problem': problem,
+        'message_feed': message_feed,
+        'token': await get_token_for_user(moderator),
+    }
+
+
+class TestListQueryPlans:
+    """
+    Проверка планов запросов списочных эндпоинтов: ни один запрос не должен читать
+    большие таблицы последовательным сканированием.
+    """
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        'url',
+        (
+            URL.COMPANY_EMPLOYEES,
+            URL.COMPANY_DEPARTMENTS,
+            URL.COMPANY_PROBLEMS,
+            URL.PROBLEM_FEEDS + '/thread',
+            URL.PROBLEM_FEEDS + '/thread?ordering=-last_activity_at',
+            URL.PROBLEM_FEEDS + '/{thread_id}/comments',
+            URL.PROBLEM_MEETINGS,
+            URL.PROBLEM_TASKS,
+            URL.COMPANY_SEARCH + '?q=Комментарий',
+        ),
+    )
+    async def test_no_seq_scans(self, client: AsyncClient, seeded_company, url: str):
+        """Запросы эндпоинта используют индексы при SEED_ROWS строк в соседней компании."""
+        url = url.format(
+            company_slug=seeded_company['company'].slug,
+            problem_id=seeded_company['problem'].id,
+            thread_id=seeded_company['message_feed'].id,
+        )
+        with capture_statements(with_parameters=True) as statements:
+            response = await client.get(url, headers=seeded_company['token'])
+        statements = [
+            (statement, parameters)
+            for statement, parameters in statements
+            if statement.lstrip().upper().startswith('SELECT')
+        ]
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert len(response.json()) == 1
+        async with pytest.db_sessionmaker() as session:
+            await assert_no_seq_scans(session, statements)
@@ -0,0 +1,80 @@
+import time
+
+import pytest
+from sqlalchemy import text
+from starlette.requests import Request
+from starlette.responses import Response
+
+from src.constants import PRIMARY_DB_COOKIE
+from src.database import db_depends
+from src.database.engine import create_engine
+
+
+def make_request(method: str = 'GET', cookie: str | None = None) -> Request:
+    """Создаёт объект запроса с указанным методом и cookie PRIMARY_DB_COOKIE."""
+    headers = [(b'cookie', f'{PRIMARY_DB_COOKIE}={cookie}'.encode())] if cookie else []
+    return Request({'type': 'http', 'method': method, 'headers': headers, 'path': '/'})
+
+
+@pytest.fixture
+def replica(monkeypatch):
+    """
+    Подменяет основную БД и реплику в db_depends движками тестовой БД.
+    Реплика указывает на недоступный порт, если передать available=False.
+    """
+
+    def _replica(available: bool = True):
+        url = pytest.db_engine.url
+        primary = create_engine(url.render_as_string(hide_password=False), connect_args={})
+        if not available:
+            url = url.set(port=1)
+        replica_engine = create_engine(url.render_as_string(hide_password=False), connect_args={})
+        monkeypatch.setattr(db_depends, 'engine', primary)
+        monkeypatch.setattr(db_depends, 'read_engine', replica_engine)
+        monkeypatch.setattr(db_depends.AsyncSessionLocal, 'kw', {'bind': primary})
+        monkeypatch.setattr(db_depends.AsyncReadSessionLocal, 'kw', {'bind': replica_engine})
+        return primary, replica_engine
+
+    return _replica
+
+
+async def get_bind(request: Request):
+    """Вернёт движок, к которому привязана сессия get_async_read_session."""
+    async for session in db_depends.get_async_read_session(request):
+        await session.execute(text('SELECT 1'))
+        return session.bind
+
+
+class TestReadSession:
+    """Тесты выбора БД для чтения."""
+
+    @pytest.mark.asyncio
+    async def test_read_from_replica(self, async_session, replica):
+        """Без недавней записи чтение идёт с реплики."""
+        _, replica_engine = replica()
+        assert await get_bind(make_request()) is replica_engine
+
+    @pytest.mark.asyncio
+    async def test_read_your_writes(self, async_session, replica):
+        """После записи клиент читает из основной БД, пока не истечёт cookie."""
+        primary, replica_engine = replica()
+        response = await db_depends.ReadYourWritesMiddleware()(
+            make_request('POST'), lambda request: _response()
+        )
+        cookie = response.headers['set-cookie']
+        assert cookie.startswith(PRIMARY_DB_COOKIE)
+
+        until = cookie.split(';')[0].split('=')[1]
+        assert await get_bind(make_request(cookie=until)) is primary
+        assert await get_bind(make_request(cookie=str(time.time() - 1))) is replica_engine
+
+    @pytest.mark.asyncio
+    async def test_fallback_to_primary(self, async_session, replica):
+        """Если реплика недоступна, чтение идёт из основной БД."""
+        primary, _ = replica(available=False)
+        assert await get_bind(make_request()) is primary
+
+
+async def _response() -> Response:
+    """Ответ успешного запроса на запись."""
+    return Response(status_code=201)
@@ -0,0 +1,79 @@
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+from src.request_context import get_request_context
+from src.users.cache import user_cache
+from tests.conftest import capture_statements
+from tests.constants import URL
+
+
+class TestRequestContext:
+    """Тесты контекста запроса: пользователь, компания и лицензия загружаются один раз."""
+
+    @pytest.mark.asyncio
+    async def test_company_router_single_identity_query(
+        self, client: AsyncClient, company_for_test, moderator_of_company, get_token_for_user
+    ):
+        """
+        Роутер компании (current_user_tabit и current_company_admin) загружает пользователя,
+        компанию и лицензию одним запросом и не перечитывает компанию.
+        """
+        company = await company_for_test()
+        moderator = await moderator_of_company({'company_id': company.id})
+        headers = await get_token_for_user(moderator)
+        for url in (
+            URL.COMPANY_EMPLOYEES.format(company_slug=company.slug),
+            f'/api/v1/{company.slug}',
+        ):
+            # Без кэша пользователей, который позволяет не обращаться к БД вовсе.
+            user_cache.clear()
+            with capture_statements() as statements:
+                response = await client.get(url, headers=headers)
+            assert response.status_code == status.HTTP_200_OK, response.text
+            company_reads = [statement for statement in statements if 'company.slug' in statement]
+            assert len(company_reads) == 1, company_reads
+            assert 'FROM usertabit JOIN company' in company_reads[0]
+            assert 'LEFT OUTER JOIN licensetype' in company_reads[0]
+
+    @pytest.mark.asyncio
+    async def test_feed_access_reads_company_from_context(
+        self,
+        client: AsyncClient,
+        company_for_test,
+        employee_of_company,
+        problem_for_test,
+        message_feed_for_test,
+        get_token_for_user,
+    ):
+        """Проверка доступа к тредам не загружает компанию пользователя повторно."""
+        company = await company_for_test()
+        employee = await employee_of_company({'company_id': company.id})
+        problem = await problem_for_test(employee)
+        await message_feed_for_test(problem, employee)
+        base_url = URL.PROBLEM_FEEDS.format(company_slug=company.slug, problem_id=problem.id)
+        headers = await get_token_for_user(employee)
+        with capture_statements() as statements:
+            response = await client.get(f'{base_url}/thread', headers=headers)
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert len(response.json()) == 1
+        company_reads = [statement for statement in statements if 'company.slug' in statement]
+        assert len(company_reads) == 1
+        assert 'FROM usertabit JOIN company' in company_reads[0]
+
+    @pytest.mark.asyncio
+    async def test_context_not_shared_between_requests(
+        self, client: AsyncClient, company_for_test, moderator_of_company, get_token_for_user
+    ):
+        """Каждый запрос получает свой контекст: данные прошлого запроса не используются."""
+        companies = [await company_for_test() for _ in range(2)]
+        tokens = [
+            await get_token_for_user(await moderator_of_company({'company_id': company.id}))
+            for company in companies
+        ]
+        for company, headers in zip(companies * 2, tokens * 2):
+            response = await client.get(f'/api/v1/{company.slug}', headers=headers)
+            assert response.status_code == status.HTTP_200_OK, response.text
+            assert response.json()['id'] == company.id
+        context = get_request_context()
+        assert (context.user, context.company, context.license) == (None, None, None)
@@ -0,0 +1,200 @@
+import statistics
+import time
+
+import pytest
+import pytest_asyncio
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy import text
+
+from src.constants import NEXT_CURSOR_HEADER
+from src.pagination import encode_cursor
+from src.problems.constants import SEARCH_ORDER_BY
+from src.problems.models import CommentFeed, MessageFeed
+from src.problems.models.enums import SearchResultType
+from src.problems.search import search_feeds
+from tests.conftest import make_entry_in_table
+from tests.constants import URL
+from tests.test_query_plans import clone_rows
+
+BENCHMARK_COMMENTS: int = 200_000
+BENCHMARK_RUNS: int = 20
+SEARCH_BUDGET_SECONDS: float = 0.05
+
+
+@pytest_asyncio.fixture
+async def search_context(
+    async_session,
+    company_for_test,
+    employee_of_company,
+    problem_for_test,
+    get_token_for_user,
+):
+    """
+    Фикстура, создающая компанию с проблемой, тредом и комментариями о бюджете и соседнюю
+    компанию с такой же проблемой.
+    """
+    company = await company_for_test()
+    user = await employee_of_company({'company_id': company.id})
+    stranger = await employee_of_company()
+    problem = await problem_for_test(
+        user,
+        {
+            'name': 'Согласование бюджета',
+            'description': 'Нужно согласовать бюджеты отделов на квартал',
+        },
+    )
+    await problem_for_test(stranger, {'name': 'Согласование бюджета'})
+    message_feed = await make_entry_in_table(
+        async_session,
+        {'problem_id': problem.id, 'owner_id': user.id, 'text': 'Обсуждаем бюджеты'},
+        MessageFeed,
+    )
+    comments = [
+        await make_entry_in_table(
+            async_session,
+            {'message_id': message_feed.id, 'owner_id': user.id, 'text': comment_text},
+            CommentFeed,
+        )
+        for comment_text in ('Бюджет утвердили вчера', 'Отпуск переносится')
+    ]
+    return {
+        'company': company,
+        'problem': problem,
+        'message_feed': message_feed,
+        'comments': comments,
+        'url': URL.COMPANY_SEARCH.format(company_slug=company.slug),
+        'token': await get_token_for_user(user),
+        'stranger_token': await get_token_for_user(stranger),
+    }
+
+
+class TestSearch:
+    """
+    Тесты полнотекстового поиска по проблемам, тредам и комментариям.
+
+    /api/v1/{company_slug}/search
+    """
+
+    @pytest.mark.asyncio
+    async def test_search_ranks_and_snippets(self, client: AsyncClient, search_context):
+        """
+        Находятся все формы слова в проблемах, тредах и комментариях своей компании;
+        совпадение в названии проблемы ранжируется выше, найденные слова выделены.
+        """
+        response = await client.get(
+            search_context['url'], params={'q': 'бюджет'}, headers=search_context['token']
+        )
+        assert response.status_code == status.HTTP_200_OK, response.text
+        results = response.json()
+        problem, message_feed = search_context['problem'], search_context['message_feed']
+        assert [(result['type'], result['id']) for result in results] == [
+            (SearchResultType.PROBLEM, problem.id),
+            (SearchResultType.THREAD, message_feed.id),
+            (SearchResultType.COMMENT, search_context['comments'][0].id),
+        ]
+        ranks = [result['rank'] for result in results]
+        assert ranks == sorted(ranks, reverse=True)
+        assert all(result['problem_id'] == problem.id for result in results)
+        assert [result['thread_id'] for result in results] == [None] + [message_feed.id] * 2
+        assert '<b>бюджета</b>' in results[0]['snippet']
+        assert results[2]['snippet'] == '<b>Бюджет</b> утвердили вчера'
+        assert NEXT_CURSOR_HEADER not in response.headers
+
+        response = await client.get(
+            search_context['url'],
+            params={'q': 'бюджет -квартал'},
+            headers=search_context['token'],
+        )
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert SearchResultType.PROBLEM not in [result['type'] for result in response.json()]
+
+    @pytest.mark.asyncio
+    async def test_search_pagination(self, client: AsyncClient, search_context):
+        """Страницы по курсору возвращают результаты в порядке релевантности без повторов."""
+        params = {'q': 'бюджет', 'limit': 2}
+        response = await client.get(
+            search_context['url'], params=params, headers=search_context['token']
+        )
+        assert response.status_code == status.HTTP_200_OK, response.text
+        first_page = response.json()
+        assert len(first_page) == 2
+        params['cursor'] = response.headers[NEXT_CURSOR_HEADER]
+
+        response = await client.get(
+            search_context['url'], params=params, headers=search_context['token']
+        )
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert [result['type'] for result in first_page + response.json()] == [
+            SearchResultType.PROBLEM,
+            SearchResultType.THREAD,
+            SearchResultType.COMMENT,
+        ]
+        assert NEXT_CURSOR_HEADER not in response.headers
+
+        for cursor in (
+            'broken',
+            encode_cursor(SEARCH_ORDER_BY, [0.1, SearchResultType.PROBLEM.value]),
+            encode_cursor(SEARCH_ORDER_BY, ['rank', SearchResultType.PROBLEM.value, 1]),
+            encode_cursor(SEARCH_ORDER_BY, [0.1, SearchResultType.PROBLEM.value, 'id']),
+        ):
+            params['cursor'] = cursor
+            response = await client.get(
+                search_context['url'], params=params, headers=search_context['token']
+            )
+            assert response.status_code == status.HTTP_400_BAD_REQUEST, response.text
+
+    @pytest.mark.asyncio
+    async def test_search_access(self, client: AsyncClient, search_context):
+        """Искать можно только в своей компании и только с непустым запросом."""
+        response = await client.get(
+            search_context['url'], params={'q': 'бюджет'}, headers=search_context['stranger_token']
+        )
+        assert response.status_code == status.HTTP_403_FORBIDDEN, response.text
+
+        response = await client.get(search_context['url'], headers=search_context['token'])
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY, response.text
+
+        response = await client.get(search_context['url'], params={'q': 'бюджет'})
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED, response.text
+
+
+class TestSearchBenchmark:
+    """
+    Время поиска по BENCHMARK_COMMENTS комментариям компании: медиана выборочного
+    запроса не должна превышать SEARCH_BUDGET_SECONDS.
+    """
+
+    @pytest.mark.benchmark
+    @pytest.mark.asyncio
+    async def test_search_latency(self, async_session, search_context):
+        """
+        Комментарии размножаются одним INSERT ... SELECT с разным текстом: каждый
+        содержит номер и одно из слов словаря, редкое слово - в каждом тысячном.
+        """
+        company, comment = search_context['company'], search_context['comments'][1]
+        await clone_rows(
+            async_session,
+            CommentFeed,
+            comment.id,
+            {
+                'text': (
+                    "'Комментарий ' || n || ' про ' || (ARRAY['сроки', 'релиз', 'дизайн', "
+                    "'тестирование', 'найм', 'отпуск', 'переезд', 'отчёт'])[n % 8 + 1] || "
+                    "CASE WHEN n % 1000 = 0 THEN ' аудит' ELSE '' END"
+                )
+            },
+            'generate_series(1, :count) AS n',
+            {'count': BENCHMARK_COMMENTS},
+        )
+        await async_session.execute(text('ANALYZE'))
+        await async_session.commit()
+
+        durations = []
+        for _ in range(BENCHMARK_RUNS):
+            started = time.perf_counter()
+            results, next_cursor = await search_feeds(async_session, company.id, 'аудит', 20)
+            durations.append(time.perf_counter() - started)
+        assert len(results) == 20
+        assert next_cursor is not None
+        assert statistics.median(durations) < SEARCH_BUDGET_SECONDS, durations
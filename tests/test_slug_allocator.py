@@ -0,0 +1,70 @@
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+from src.companies.crud import company_crud
+from src.companies.schemas import CompanyCreateSchema
+from src.constants import LENGTH_SLUG, SLUG_CANDIDATES
+from tests.conftest import capture_statements
+from tests.constants import URL
+
+
+class TestSlugAllocator:
+    """Тесты подбора свободного slug компаний и отделов (src.crud.SlugCreateMixin)."""
+
+    @pytest.mark.asyncio
+    async def test_allocate_slug_single_query(self, async_session, company_for_test):
+        """Занятость всех вариантов проверяется одним запросом, выбирается первый свободный."""
+        await company_for_test({'name': 'Acme', 'slug': 'acme'})
+        with capture_statements() as statements:
+            slug = await company_crud.allocate_slug(async_session, 'Acme')
+        assert len(statements) == 1
+        assert slug != 'acme' and slug.startswith('acme-')
+        assert await company_crud.allocate_slug(async_session, 'Other Name') == 'other-name'
+
+    def test_candidates_fit_column(self):
+        """Варианты slug длинного названия укладываются в длину столбца."""
+        candidates = company_crud._slug_candidates('Очень длинное название компании ' * 5)
+        assert len(candidates) == len(set(candidates)) == SLUG_CANDIDATES
+        assert all(len(candidate) <= LENGTH_SLUG for candidate in candidates)
+
+    @pytest.mark.asyncio
+    async def test_create_retries_on_conflict(self, async_session, company_for_test, monkeypatch):
+        """Если slug занят параллельным запросом, вставка не падает, а slug подбирается снова."""
+        await company_for_test({'name': 'Acme', 'slug': 'acme'})
+        allocated = iter(('acme', 'acme-free'))
+
+        async def allocate_slug(session, name, db_obj=None):
+            return next(allocated)
+
+        monkeypatch.setattr(company_crud, 'allocate_slug', allocate_slug)
+        company = await company_crud.create_with_slug(
+            async_session, CompanyCreateSchema(name='Acme'), 'Acme'
+        )
+        assert company.slug == 'acme-free'
+
+    @pytest.mark.asyncio
+    async def test_department_slug(
+        self, client: AsyncClient, company_for_test, moderator_of_company, get_token_for_user
+    ):
+        """
+        Отделы с одинаковым названием в разных компаниях получают разные slug, а при
+        переименовании отдел не конфликтует со своим же slug.
+        """
+        slugs = []
+        for _ in range(2):
+            company = await company_for_test()
+            headers = await get_token_for_user(
+                await moderator_of_company({'company_id': company.id})
+            )
+            url = URL.COMPANY_DEPARTMENTS.format(company_slug=company.slug)
+            response = await client.post(url, json={'name': 'Sales Team'}, headers=headers)
+            assert response.status_code == status.HTTP_201_CREATED, response.text
+            slugs.append(response.json()['slug'])
+        assert slugs[0] == 'sales-team' and slugs[1].startswith('sales-team-')
+
+        response = await client.patch(
+            f'{url}/{response.json()["id"]}', json={'name': 'Sales team'}, headers=headers
+        )
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert response.json()['slug'] == slugs[1]
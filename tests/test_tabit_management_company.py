@@ -1170,6 +1170,27 @@ class TestDeleteCompany:
 
         assert response.status_code == status.HTTP_204_NO_CONTENT, response.text
 
+    @pytest.mark.asyncio
+    async def test_delete_company_with_employees(
+        self, client: AsyncClient, superuser_token: str, company_for_test, employee_of_company
+    ):
+        """
+        Тест удаления компании с сотрудниками.
+
+        Сотрудники по умолчанию не загружаются вместе с компанией, эндпоинт удаления
+        должен загрузить их явно для каскадного удаления.
+        """
+        company = await company_for_test()
+        await employee_of_company({'company_id': company.id})
+
+        response = await client.delete(
+            f'{URL.COMPANIES_ENDPOINT}{company.slug}',
+            headers=superuser_token,
+            follow_redirects=False,
+        )
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT, response.text
+
     @pytest.mark.asyncio
     async def test_delete_company_not_found(self, client: AsyncClient, superuser_token: str):
         """
@@ -396,6 +396,52 @@ class TestGetLicense:
         assert result['total'] == len(licenses)
         assert len(result['items']) == 5
 
+    @pytest.mark.asyncio
+    async def test_get_licenses_cursor_pagination(self, client: AsyncClient, license_for_test):
+        """Тест получения списка лицензий с курсорной пагинацией.
+
+        Проверяет, что по курсору `next_cursor` API отдаёт следующую страницу без повторов,
+        а на последней странице `next_cursor` отсутствует.
+        """
+        licenses = [await license_for_test() for _ in range(12)]
+
+        response = await client.get(
+            URL.LICENSES_ENDPOINT, params={'page_size': 5, 'ordering': '-name'}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        result = response.json()
+        names = [license['name'] for license in result['items']]
+
+        while result['next_cursor']:
+            response = await client.get(
+                URL.LICENSES_ENDPOINT,
+                params={'page_size': 5, 'ordering': '-name', 'cursor': result['next_cursor']},
+            )
+            assert response.status_code == status.HTTP_200_OK
+            result = response.json()
+            names += [license['name'] for license in result['items']]
+
+        assert names == sorted((license.name for license in licenses), reverse=True)
+
+    @pytest.mark.asyncio
+    async def test_get_licenses_invalid_cursor(self, client: AsyncClient, license_for_test):
+        """Тест получения списка лицензий с некорректным курсором.
+
+        Проверяет, что API отклоняет повреждённый курсор и курсор, выданный для другой
+        сортировки, возвращая ошибку 400.
+        """
+        [await license_for_test() for _ in range(3)]
+
+        response = await client.get(URL.LICENSES_ENDPOINT, params={'cursor': 'not-a-cursor'})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        response = await client.get(URL.LICENSES_ENDPOINT, params={'page_size': 1})
+        cursor = response.json()['next_cursor']
+        response = await client.get(
+            URL.LICENSES_ENDPOINT, params={'cursor': cursor, 'ordering': 'name'}
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
     @pytest.mark.asyncio
     async def test_get_licenses_invalid_pagination(self, client: AsyncClient):
         """Тест получения списка лицензий с некорректными параметрами пагинации.
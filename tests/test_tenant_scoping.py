@@ -0,0 +1,128 @@
+from datetime import date
+
+import pytest
+import pytest_asyncio
+from fastapi import status
+from httpx import AsyncClient
+
+from src.problems.crud import comment_crud, meeting_crud, problem_crud
+from src.problems.models import Meeting, Task
+from src.problems.models.enums import StatusMeeting, StatusTask
+from tests.conftest import make_entry_in_table
+from tests.constants import URL
+
+
+@pytest_asyncio.fixture
+async def two_tenants(
+    async_session,
+    company_for_test,
+    employee_of_company,
+    problem_for_test,
+    message_feed_for_test,
+    comment_for_test,
+):
+    """
+    Фикстура, создающая две компании, в каждой - сотрудника, проблему, тред, комментарий,
+    встречу и задачу.
+    """
+    tenants = []
+    for _ in range(2):
+        company = await company_for_test()
+        employee = await employee_of_company({'company_id': company.id})
+        problem = await problem_for_test(employee)
+        message_feed = await message_feed_for_test(problem, employee)
+        meeting = await make_entry_in_table(
+            async_session,
+            {
+                'title': f'Встреча {problem.id}',
+                'problem_id': problem.id,
+                'owner_id': employee.id,
+                'date_meeting': date.today(),
+                'status': StatusMeeting.NEW,
+                'place': 'Переговорная',
+            },
+            Meeting,
+        )
+        task = await make_entry_in_table(
+            async_session,
+            {
+                'name': 'Задача',
+                'problem_id': problem.id,
+                'owner_id': employee.id,
+                'date_completion': date.today(),
+                'status': StatusTask.NEW,
+            },
+            Task,
+        )
+        tenants.append(
+            {
+                'company': company,
+                'problem': problem,
+                'message_feed': message_feed,
+                'comment': await comment_for_test(message_feed, employee),
+                'meeting': meeting,
+                'task': task,
+            }
+        )
+    return tenants
+
+
+class TestTenantScoping:
+    """Тесты ограничения выборок компанией (CRUDBase.tenant_path)."""
+
+    @pytest.mark.asyncio
+    async def test_problems_list_only_own_company(self, client: AsyncClient, two_tenants):
+        """Список проблем содержит только проблемы компании из пути."""
+        for tenant in two_tenants:
+            response = await client.get(
+                URL.COMPANY_PROBLEMS.format(company_slug=tenant['company'].slug)
+            )
+            assert response.status_code == status.HTTP_200_OK, response.text
+            assert [problem['id'] for problem in response.json()] == [tenant['problem'].id]
+
+    @pytest.mark.asyncio
+    async def test_foreign_objects_not_found(self, client: AsyncClient, two_tenants):
+        """Проблема, встреча и задача другой компании по slug своей компании не находятся."""
+        own, foreign = two_tenants
+        own_slug = own['company'].slug
+        problem_url = f'{URL.COMPANY_PROBLEMS}/{{problem_id}}'
+        urls = (
+            problem_url.format(company_slug=own_slug, problem_id=foreign['problem'].id),
+            URL.PROBLEM_MEETINGS.format(company_slug=own_slug, problem_id=foreign['problem'].id),
+            URL.PROBLEM_TASKS.format(company_slug=own_slug, problem_id=foreign['problem'].id),
+            URL.PROBLEM_MEETINGS.format(company_slug=own_slug, problem_id=own['problem'].id)
+            + f'/{foreign["meeting"].id}',
+            URL.PROBLEM_TASKS.format(company_slug=own_slug, problem_id=foreign['problem'].id)
+            + f'/{foreign["task"].id}',
+        )
+        for url in urls:
+            response = await client.get(url)
+            assert response.status_code == status.HTTP_404_NOT_FOUND, url
+
+        response = await client.get(
+            URL.PROBLEM_TASKS.format(company_slug=own_slug, problem_id=own['problem'].id)
+        )
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert [task['id'] for task in response.json()] == [own['task'].id]
+
+    @pytest.mark.asyncio
+    async def test_crud_methods_apply_tenant(self, async_session, two_tenants):
+        """Методы чтения CRUDBase с company_id не возвращают объекты другой компании."""
+        own, foreign = two_tenants
+        company_id = own['company'].id
+
+        assert await problem_crud.get(session=async_session, obj_id=own['problem'].id)
+        assert (
+            await problem_crud.get(async_session, foreign['problem'].id, company_id=company_id)
+            is None
+        )
+        meetings = await meeting_crud.get_multi(async_session, company_id=company_id)
+        assert [meeting.id for meeting in meetings] == [own['meeting'].id]
+        comments, _ = await comment_crud.get_multi_by_cursor(async_session, company_id=company_id)
+        assert [comment.id for comment in comments] == [own['comment'].id]
+        rows = [
+            row
+            async for partition in comment_crud.stream(async_session, company_id=company_id)
+            for row in partition
+        ]
+        assert [row.id for row in rows] == [own['comment'].id]
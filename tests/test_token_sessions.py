@@ -0,0 +1,153 @@
+import asyncio
+import hashlib
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy import func, select
+
+from src.config import settings
+from src.token_sessions.crud import token_session_crud
+from src.token_sessions.models import TokenSession
+from src.token_sessions.service import RevokedTokenFilter, TokenSessionStore
+from tests.conftest import capture_statements
+from tests.constants import GOOD_PASSWORD, URL
+
+
+async def login(client: AsyncClient, user, url: str) -> dict[str, dict[str, str]]:
+    """Входит в систему и возвращает заголовки авторизации с access и refresh токенами."""
+    response = await client.post(url, data={'username': user.email, 'password': GOOD_PASSWORD})
+    assert response.status_code == status.HTTP_200_OK, response.text
+    return {
+        key: {'Authorization': f'Bearer {response.json()[f"{key}_token"]}'}
+        for key in ('access', 'refresh')
+    }
+
+
+class TestTokenSessions:
+    """Тесты хранилища сессий refresh-токенов (src.token_sessions)."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_rotation(self, client: AsyncClient, admin, employee):
+        """Refresh-токен действует один раз: после обновления старый токен отклоняется."""
+        for user, login_url, refresh_url in (
+            (admin, URL.ADMIN_LOGIN, URL.ADMIN_REFRESH),
+            (employee, URL.USER_LOGIN, URL.USER_REFRESH),
+        ):
+            headers = await login(client, user, login_url)
+            response = await client.post(refresh_url, headers=headers['refresh'])
+            assert response.status_code == status.HTTP_200_OK, response.text
+            new_refresh = {'Authorization': f'Bearer {response.json()["refresh_token"]}'}
+            response = await client.post(refresh_url, headers=headers['refresh'])
+            assert response.status_code == status.HTTP_401_UNAUTHORIZED
+            response = await client.post(refresh_url, headers=new_refresh)
+            assert response.status_code == status.HTTP_200_OK, response.text
+
+    @pytest.mark.asyncio
+    async def test_rotation_revokes_previous_access(self, client: AsyncClient, admin):
+        """
+        После обновления токенов access-токен прежней пары отклоняется, а выход из
+        системы отзывает новую пару.
+        """
+        headers = await login(client, admin, URL.ADMIN_LOGIN)
+        response = await client.post(URL.ADMIN_REFRESH, headers=headers['refresh'])
+        assert response.status_code == status.HTTP_200_OK, response.text
+        new_access = {'Authorization': f'Bearer {response.json()["access_token"]}'}
+        response = await client.get(URL.ADMIN_ME, headers=headers['access'])
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        response = await client.get(URL.ADMIN_ME, headers=new_access)
+        assert response.status_code == status.HTTP_200_OK, response.text
+
+        response = await client.post(URL.ADMIN_LOGOUT, headers=new_access)
+        assert response.status_code == status.HTTP_204_NO_CONTENT, response.text
+        for access in (headers['access'], new_access):
+            response = await client.get(URL.ADMIN_ME, headers=access)
+            assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    @pytest.mark.asyncio
+    async def test_admin_logout_revokes_session(self, client: AsyncClient, admin):
+        """После выхода администратора токены его сессии не принимаются, другие сессии - да."""
+        headers = await login(client, admin, URL.ADMIN_LOGIN)
+        other_headers = await login(client, admin, URL.ADMIN_LOGIN)
+        response = await client.post(URL.ADMIN_LOGOUT, headers=headers['access'])
+        assert response.status_code == status.HTTP_204_NO_CONTENT, response.text
+        response = await client.get(URL.ADMIN_ME, headers=headers['access'])
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        response = await client.post(URL.ADMIN_REFRESH, headers=headers['refresh'])
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        response = await client.get(URL.ADMIN_ME, headers=other_headers['access'])
+        assert response.status_code == status.HTTP_200_OK, response.text
+
+    @pytest.mark.asyncio
+    async def test_access_check_without_database(self, client: AsyncClient, admin):
+        """Access-токен действующей сессии проверяется без запроса к таблице сессий."""
+        headers = await login(client, admin, URL.ADMIN_LOGIN)
+        with capture_statements() as statements:
+            response = await client.get(URL.ADMIN_ME, headers=headers['access'])
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert not [statement for statement in statements if 'tokensession' in statement]
+
+    @pytest.mark.asyncio
+    async def test_sync_and_purge(self, async_session):
+        """
+        Отзывы других воркеров попадают в фильтр при синхронизации; истекшие сессии
+        удаляются пакетами и убираются из фильтра пересборкой.
+        """
+        store = TokenSessionStore(size_bits=1 << 16, hashes=7)
+        now = datetime.now(timezone.utc)
+        active, expired = store.new_jti(), [store.new_jti() for _ in range(5)]
+        await store.open(async_session, active, uuid4(), lifetime_seconds=3_600)
+        for jti in expired:
+            await token_session_crud.open(
+                async_session, store.hash_jti(jti), uuid4(), now - timedelta(seconds=1)
+            )
+        await store.sync(async_session)
+        await token_session_crud.revoke(async_session, store.hash_jti(active))
+        assert not await store.is_revoked(async_session, active)
+        await store.sync(async_session)
+        assert await store.is_revoked(async_session, active)
+
+        assert await token_session_crud.purge_expired(async_session, batch_size=2) == 5
+        assert await async_session.scalar(select(func.count()).select_from(TokenSession)) == 1
+        await store.rebuild(async_session)
+        assert store.revoked.count == 1
+
+    @pytest.mark.asyncio
+    async def test_maintenance_retries_first_rebuild(self, monkeypatch):
+        """
+        Если БД недоступна при запуске, первая сборка фильтра повторяется, а задача
+        обслуживания продолжает работать и останавливается без ошибок.
+        """
+        monkeypatch.setattr(settings, 'token_session_sync_seconds', 0.01)
+        store = TokenSessionStore(size_bits=1 << 16, hashes=7)
+        calls = []
+        rebuilt = asyncio.Event()
+
+        async def rebuild(session):
+            calls.append(session)
+            if len(calls) == 1:
+                raise ConnectionRefusedError('БД недоступна')
+            rebuilt.set()
+
+        monkeypatch.setattr(store, 'rebuild', rebuild)
+        store.start(pytest.db_sessionmaker)
+        async with asyncio.timeout(5):
+            await rebuilt.wait()
+        assert len(calls) == 2
+        assert not store._task.done()
+        await store.stop()
+
+    def test_revoked_filter(self):
+        """Фильтр Блума не даёт ложноотрицательных ответов и редко ошибается в другую сторону."""
+        revoked = RevokedTokenFilter(size_bits=1 << 16, hashes=7)
+        added = [hashlib.sha256(str(number).encode()).hexdigest() for number in range(1_000)]
+        for jti_hash in added:
+            revoked.add(jti_hash)
+        assert all(revoked.might_contain(jti_hash) for jti_hash in added)
+        false_positives = sum(
+            revoked.might_contain(hashlib.sha256(f'other{number}'.encode()).hexdigest())
+            for number in range(10_000)
+        )
+        assert false_positives < 100